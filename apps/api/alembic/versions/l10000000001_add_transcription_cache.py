@@ -0,0 +1,47 @@
+"""add transcription_cache table
+
+Revision ID: l10000000001
+Revises: k10000000001
+Create Date: 2026-10-18 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "l10000000001"
+down_revision: Union[str, None] = "k10000000001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transcription_cache",
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("response", sa.JSON(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+    op.create_index(
+        op.f("ix_transcription_cache_expires_at"),
+        "transcription_cache",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_transcription_cache_expires_at"), table_name="transcription_cache"
+    )
+    op.drop_table("transcription_cache")
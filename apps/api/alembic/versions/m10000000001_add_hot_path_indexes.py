@@ -0,0 +1,79 @@
+"""add composite indexes for hot-path queries
+
+Revision ID: m10000000001
+Revises: l10000000001
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = "m10000000001"
+down_revision: Union[str, None] = "l10000000001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (テーブル名, インデックス名, 列)
+INDEXES = [
+    # ユーザー別の完了セッション集計（ポイント・統計・ストリーク）
+    ("sessions", "ix_sessions_user_ended", ["user_id", "ended_at"]),
+    # 期間ランキング（期間内にセッションを完了したユーザー）
+    ("sessions", "ix_sessions_ended_user", ["ended_at", "user_id"]),
+    # ランキング・自分の順位
+    ("users", "ix_users_total_points", ["total_points"]),
+    # 保存フレーズ一覧（新しい順）
+    ("saved_phrases", "ix_saved_phrases_user_created", ["user_id", "created_at"]),
+    # 復習期限が来た未完了アイテム
+    (
+        "review_items",
+        "ix_review_items_user_completed_due",
+        ["user_id", "is_completed", "due_at"],
+    ),
+]
+
+# (テーブル名, 制約名, 列) 既存DBには作成済みのはずだが、create_all で作ったDBには無い場合がある
+UNIQUE_CONSTRAINTS = [
+    (
+        "session_rounds",
+        "uq_session_rounds_session_id_round_index",
+        ["session_id", "round_index"],
+    ),
+    (
+        "user_shadowing_progress",
+        "uq_user_shadowing_progress_user_sentence",
+        ["user_id", "shadowing_sentence_id"],
+    ),
+]
+
+
+def _existing_index_names(inspector, table: str) -> set:
+    names = {ix["name"] for ix in inspector.get_indexes(table)}
+    names |= {uq["name"] for uq in inspector.get_unique_constraints(table)}
+    return names
+
+
+def upgrade() -> None:
+    inspector = inspect(op.get_bind())
+
+    for table, name, columns in UNIQUE_CONSTRAINTS:
+        if name not in _existing_index_names(inspector, table):
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.create_unique_constraint(name, columns)
+
+    for table, name, columns in INDEXES:
+        if name not in _existing_index_names(inspector, table):
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    inspector = inspect(op.get_bind())
+
+    # 一意制約は以前のリビジョンで作成済みのため残す
+    for table, name, _columns in reversed(INDEXES):
+        if name in _existing_index_names(inspector, table):
+            op.drop_index(name, table_name=table)
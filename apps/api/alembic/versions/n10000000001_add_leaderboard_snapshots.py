@@ -0,0 +1,61 @@
+"""add leaderboard_snapshots table
+
+Revision ID: n10000000001
+Revises: m10000000001
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "n10000000001"
+down_revision: Union[str, None] = "m10000000001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "leaderboard_snapshots",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("board", sa.String(length=16), nullable=False),
+        sa.Column("period_key", sa.String(length=16), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("points", sa.Integer(), nullable=False),
+        sa.Column(
+            "captured_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_leaderboard_snapshots_id"),
+        "leaderboard_snapshots",
+        ["id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_leaderboard_snapshots_board_period_rank",
+        "leaderboard_snapshots",
+        ["board", "period_key", "rank"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_leaderboard_snapshots_board_period_rank",
+        table_name="leaderboard_snapshots",
+    )
+    op.drop_index(
+        op.f("ix_leaderboard_snapshots_id"), table_name="leaderboard_snapshots"
+    )
+    op.drop_table("leaderboard_snapshots")
@@ -0,0 +1,63 @@
+"""add point_events ledger and user_daily_points buckets
+
+Revision ID: o10000000001
+Revises: n10000000001
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "o10000000001"
+down_revision: Union[str, None] = "n10000000001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "point_events",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("points", sa.Integer(), nullable=False),
+        sa.Column("reason", sa.String(length=32), nullable=False),
+        sa.Column("session_id", sa.Integer(), nullable=True),
+        sa.Column("awarded_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["session_id"], ["sessions.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_point_events_id"), "point_events", ["id"], unique=False)
+    op.create_index(
+        "ix_point_events_user_awarded",
+        "point_events",
+        ["user_id", "awarded_at"],
+        unique=False,
+    )
+
+    op.create_table(
+        "user_daily_points",
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("points", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "day"),
+    )
+    op.create_index(
+        "ix_user_daily_points_day_user",
+        "user_daily_points",
+        ["day", "user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_daily_points_day_user", table_name="user_daily_points")
+    op.drop_table("user_daily_points")
+    op.drop_index("ix_point_events_user_awarded", table_name="point_events")
+    op.drop_index(op.f("ix_point_events_id"), table_name="point_events")
+    op.drop_table("point_events")
@@ -0,0 +1,64 @@
+"""add user_stats counters and backfill them
+
+Revision ID: p10000000001
+Revises: o10000000001
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "p10000000001"
+down_revision: Union[str, None] = "o10000000001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL = sa.text(
+    """
+    INSERT INTO user_stats (
+        user_id,
+        total_sessions,
+        total_rounds,
+        review_items_total,
+        review_items_completed,
+        shadowing_completed
+    )
+    SELECT
+        u.id,
+        (SELECT COUNT(*) FROM sessions s
+            WHERE s.user_id = u.id AND s.ended_at IS NOT NULL),
+        (SELECT COALESCE(SUM(s.completed_rounds), 0) FROM sessions s
+            WHERE s.user_id = u.id AND s.ended_at IS NOT NULL),
+        (SELECT COUNT(*) FROM review_items r WHERE r.user_id = u.id),
+        (SELECT COUNT(*) FROM review_items r
+            WHERE r.user_id = u.id AND r.is_completed = :true),
+        (SELECT COUNT(*) FROM user_shadowing_progress p
+            WHERE p.user_id = u.id AND p.is_completed = :true)
+    FROM users u
+    """
+).bindparams(true=True)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_stats",
+        sa.Column("user_id", sa.String(length=36), nullable=False),
+        sa.Column("total_sessions", sa.Integer(), nullable=False),
+        sa.Column("total_rounds", sa.Integer(), nullable=False),
+        sa.Column("review_items_total", sa.Integer(), nullable=False),
+        sa.Column("review_items_completed", sa.Integer(), nullable=False),
+        sa.Column("shadowing_completed", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    # 既存ユーザーのカウンタを現在のデータから作成
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    op.drop_table("user_stats")
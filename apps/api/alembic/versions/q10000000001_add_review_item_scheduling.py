@@ -0,0 +1,38 @@
+"""add SM-2 scheduling columns to review_items
+
+Revision ID: q10000000001
+Revises: p10000000001
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "q10000000001"
+down_revision: Union[str, None] = "p10000000001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("review_items") as batch_op:
+        batch_op.add_column(
+            sa.Column("ease_factor", sa.Float(), nullable=False, server_default="2.5")
+        )
+        batch_op.add_column(
+            sa.Column("interval_days", sa.Integer(), nullable=False, server_default="0")
+        )
+        batch_op.add_column(
+            sa.Column("repetitions", sa.Integer(), nullable=False, server_default="0")
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("review_items") as batch_op:
+        batch_op.drop_column("repetitions")
+        batch_op.drop_column("interval_days")
+        batch_op.drop_column("ease_factor")
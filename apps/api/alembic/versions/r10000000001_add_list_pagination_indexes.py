@@ -0,0 +1,47 @@
+"""add indexes for keyset-paginated lists
+
+Revision ID: r10000000001
+Revises: q10000000001
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision: str = "r10000000001"
+down_revision: Union[str, None] = "q10000000001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (テーブル名, インデックス名, 列)
+INDEXES = [
+    # 復習履歴（完了日時の新しい順）
+    (
+        "review_items",
+        "ix_review_items_user_completed_at",
+        ["user_id", "is_completed", "completed_at"],
+    ),
+    # オリジナルシナリオ一覧（新しい順）
+    (
+        "custom_scenarios",
+        "ix_custom_scenarios_user_active_created",
+        ["user_id", "is_active", "created_at"],
+    ),
+]
+
+
+def upgrade() -> None:
+    inspector = inspect(op.get_bind())
+    for table, name, columns in INDEXES:
+        if name not in {ix["name"] for ix in inspector.get_indexes(table)}:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for table, name, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
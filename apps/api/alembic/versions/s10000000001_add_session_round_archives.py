@@ -0,0 +1,39 @@
+"""add session_round_archives for ended sessions' rounds
+
+Revision ID: s10000000001
+Revises: r10000000001
+Create Date: 2026-10-19 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "s10000000001"
+down_revision: Union[str, None] = "r10000000001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "session_round_archives",
+        sa.Column("session_id", sa.Integer(), nullable=False),
+        sa.Column("round_count", sa.Integer(), nullable=False),
+        sa.Column("payload", sa.LargeBinary(length=2**24), nullable=False),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["session_id"], ["sessions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("session_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("session_round_archives")
@@ -20,6 +20,13 @@ class Settings(BaseSettings):
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
 
+    # Read replica (optional). 読み取り専用のルートをレプリカに振り分ける
+    # CLOUD_SQL_USE_CONNECTOR=true のときは CLOUD_SQL_REPLICA_CONNECTION_NAME、それ以外は DATABASE_REPLICA_URL
+    DATABASE_REPLICA_URL: Optional[str] = None
+    CLOUD_SQL_REPLICA_CONNECTION_NAME: Optional[str] = None
+    # 書き込み後、このユーザーの読み取りをプライマリに向ける秒数（レプリカ遅延対策）
+    READ_YOUR_WRITES_SECONDS: int = 10
+
     # Security
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
@@ -64,11 +71,60 @@ class Settings(BaseSettings):
     GOOGLE_SPEECH_API_ENDPOINT: str = (
         "https://speech.googleapis.com/v1/speech:recognize"
     )
+    # Speech-to-Text routing (先頭から順に試し、429/5xx/タイムアウト時は次へフェイルオーバー)
+    STT_PROVIDER_ORDER: List[str] = ["whisper", "google"]
+    STT_PROVIDER_TIMEOUT_SECONDS: float = 20.0
+    # この秒数以下の短いクリップは計測レイテンシが最速のプロバイダへ送る（0で無効）
+    STT_LATENCY_ROUTING_MAX_SECONDS: float = 0.0
+    STT_FAILURE_THRESHOLD: int = 3  # 連続失敗でプロバイダを一時休止
+    STT_FAILURE_COOLDOWN_SECONDS: float = 30.0
+    # WebSocketストリーミング認識のバックエンド ("google" | "mock")
+    STT_STREAMING_PROVIDER: str = "google"
     # Google Cloud Text-to-Speech
     GOOGLE_TTS_LANGUAGE: str = "en-US"
     GOOGLE_TTS_VOICE: Optional[str] = "en-US-Neural2-A"
     GOOGLE_TTS_SPEAKING_RATE: float = 1.0
 
+    # Audio preprocessing (STT送信前のデコード・モノラル化・16kHz化・無音トリム)
+    # numpy が必要。webm/mp3 等のデコードや flac/opus への再エンコードには ffmpeg を使用する。
+    AUDIO_PREPROCESS_ENABLED: bool = False
+    AUDIO_PREPROCESS_SAMPLE_RATE: int = 16000
+    AUDIO_PREPROCESS_CODEC: str = "flac"  # "flac" | "opus" | "wav"
+    AUDIO_PREPROCESS_VAD_THRESHOLD_DB: float = -45.0
+    AUDIO_PREPROCESS_PADDING_MS: int = 200
+    AUDIO_PREPROCESS_WORKERS: int = 2
+
+    # Transcription cache (同一録音の再送時にSTT APIを再度呼ばない)
+    TRANSCRIPTION_CACHE_ENABLED: bool = True
+    TRANSCRIPTION_CACHE_TTL_SECONDS: int = 600
+    TRANSCRIPTION_CACHE_MAX_ENTRIES: int = 256  # プロセス内LRUの上限件数
+    TRANSCRIPTION_CACHE_SHARED: bool = True  # DBテーブルでワーカー間共有する
+
+    # Speaking scoring ("bag": 語順を問わない単語一致率 | "alignment": 1 - WER)
+    SPEECH_SCORING_MODE: str = "bag"
+    SPEECH_FUZZY_MATCHING: bool = False  # 同音異義語・綴りの近い語も一致とみなす
+
+    # Leaderboard (プロセス内ランキング)
+    LEADERBOARD_REFRESH_SECONDS: int = 60  # 他ワーカーでの付与を取り込むための再読み込み間隔
+    LEADERBOARD_SNAPSHOT_SIZE: int = 100  # スナップショットに保存する上位件数
+
+    # SQL monitoring (遅いクエリ・N+1 の検出)
+    SQL_SLOW_QUERY_MS: int = 200
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5  # 同じ形の文がこの回数以上でN+1として警告（0で無効）
+
+    # Event loop monitor (イベントループを止めている同期処理の検出)
+    LOOP_MONITOR_ENABLED: bool = False
+    LOOP_MONITOR_INTERVAL_MS: int = 50  # ハートビート間隔
+    LOOP_MONITOR_THRESHOLD_MS: int = 200  # これ以上の停止を報告する
+
+    # Session round archive (終了済みセッションのラウンドを圧縮アーカイブへ移す)
+    SESSION_ARCHIVE_AFTER_DAYS: int = 30  # 終了からこの日数を過ぎたセッションが対象
+    SESSION_ARCHIVE_BATCH_SIZE: int = 200  # 1トランザクションで移すセッション数
+
+    # Metrics (/metrics の Prometheus 形式メトリクス)
+    METRICS_MULTIPROC_DIR: Optional[str] = None  # 複数ワーカー時にスナップショットを共有するディレクトリ
+    METRICS_FLUSH_SECONDS: int = 15  # スナップショットの書き出し間隔
+
     REVENUECAT_SECRET_KEY: Optional[str] = None
 
     # Debug
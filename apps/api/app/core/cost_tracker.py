@@ -6,12 +6,21 @@ OpenAI、Google Cloud Speech-to-Text、Text-to-Speechの
 """
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
 import logging
 
+from app.core.metrics import (
+    API_COST_USD,
+    LLM_TOKENS,
+    STT_AUDIO_SECONDS,
+    TTS_CHARACTERS,
+    UPSTREAM_REQUEST_DURATION,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +31,7 @@ class ServiceType(str, Enum):
     GROQ = "groq"
     GOOGLE_STT = "google_stt"
     GOOGLE_TTS = "google_tts"
+    WHISPER = "whisper"
 
 
 # OpenAI料金（2024年12月時点、USD per 1K tokens）
@@ -54,6 +64,9 @@ GROQ_PRICING = {
 # Google Cloud Speech-to-Text料金（USD per 15秒単位）
 GOOGLE_STT_PRICE_PER_15_SEC = 0.006
 
+# OpenAI Whisper料金（USD per 分、秒単位で課金）
+WHISPER_PRICE_PER_MINUTE = 0.006
+
 # Google Cloud Text-to-Speech料金（USD per 1M文字）
 GOOGLE_TTS_PRICE_PER_1M_CHARS = 4.00
 
@@ -67,6 +80,13 @@ class CostResult:
     details: dict
 
 
+def _record_metrics(service: ServiceType, cost_usd: float, latency_ms: Optional[int]) -> None:
+    """/metrics 用に料金とレイテンシを記録する"""
+    API_COST_USD.labels(service.value).inc(cost_usd)
+    if latency_ms is not None:
+        UPSTREAM_REQUEST_DURATION.labels(service.value).observe(latency_ms / 1000)
+
+
 def calculate_openai_cost(
     model: str,
     input_tokens: int,
@@ -111,6 +131,10 @@ def calculate_openai_cost(
         },
     )
 
+    LLM_TOKENS.labels(ServiceType.OPENAI.value, model, "input").inc(input_tokens)
+    LLM_TOKENS.labels(ServiceType.OPENAI.value, model, "output").inc(output_tokens)
+    _record_metrics(ServiceType.OPENAI, total_cost, latency_ms)
+
     return CostResult(
         service=ServiceType.OPENAI,
         cost_usd=total_cost,
@@ -167,6 +191,10 @@ def calculate_groq_cost(
         },
     )
 
+    LLM_TOKENS.labels(ServiceType.GROQ.value, model, "input").inc(input_tokens)
+    LLM_TOKENS.labels(ServiceType.GROQ.value, model, "output").inc(output_tokens)
+    _record_metrics(ServiceType.GROQ, total_cost, latency_ms)
+
     return CostResult(
         service=ServiceType.GROQ,
         cost_usd=total_cost,
@@ -188,8 +216,8 @@ def calculate_google_stt_cost(
     Returns:
         CostResult: 料金計算結果
     """
-    # 15秒単位で切り上げ
-    billable_units = -(-int(audio_duration_seconds) // 15)  # ceiling division
+    # 15秒単位で切り上げ（15.4秒は2単位）
+    billable_units = math.ceil(audio_duration_seconds / 15)
     if billable_units < 1:
         billable_units = 1
 
@@ -211,6 +239,9 @@ def calculate_google_stt_cost(
         },
     )
 
+    STT_AUDIO_SECONDS.labels(ServiceType.GOOGLE_STT.value).inc(audio_duration_seconds)
+    _record_metrics(ServiceType.GOOGLE_STT, total_cost, latency_ms)
+
     return CostResult(
         service=ServiceType.GOOGLE_STT,
         cost_usd=total_cost,
@@ -218,6 +249,50 @@ def calculate_google_stt_cost(
     )
 
 
+def calculate_whisper_cost(
+    audio_duration_seconds: float,
+    latency_ms: Optional[int] = None,
+) -> CostResult:
+    """
+    OpenAI Whisper APIの料金を計算してログ出力する。
+
+    Args:
+        audio_duration_seconds: 音声の長さ（秒）
+        latency_ms: レイテンシ（ミリ秒）
+
+    Returns:
+        CostResult: 料金計算結果
+    """
+    # 秒単位で切り上げ
+    billable_seconds = max(1, math.ceil(audio_duration_seconds))
+    total_cost = billable_seconds / 60 * WHISPER_PRICE_PER_MINUTE
+
+    details = {
+        "audio_duration_seconds": round(audio_duration_seconds, 2),
+        "billable_seconds": billable_seconds,
+    }
+    if latency_ms is not None:
+        details["latency_ms"] = latency_ms
+
+    logger.info(
+        "API cost calculated",
+        extra={
+            "service": ServiceType.WHISPER.value,
+            "cost_usd": round(total_cost, 8),
+            **details,
+        },
+    )
+
+    STT_AUDIO_SECONDS.labels(ServiceType.WHISPER.value).inc(audio_duration_seconds)
+    _record_metrics(ServiceType.WHISPER, total_cost, latency_ms)
+
+    return CostResult(
+        service=ServiceType.WHISPER,
+        cost_usd=total_cost,
+        details=details,
+    )
+
+
 def calculate_google_tts_cost(
     character_count: int,
     latency_ms: Optional[int] = None,
@@ -249,6 +324,9 @@ def calculate_google_tts_cost(
         },
     )
 
+    TTS_CHARACTERS.labels(ServiceType.GOOGLE_TTS.value).inc(character_count)
+    _record_metrics(ServiceType.GOOGLE_TTS, total_cost, latency_ms)
+
     return CostResult(
         service=ServiceType.GOOGLE_TTS,
         cost_usd=total_cost,
@@ -1,11 +1,11 @@
-from fastapi import Depends, HTTPException, status, Request
+from fastapi import Depends, HTTPException, status, Request, WebSocket, WebSocketException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from app.db.session import get_db
+from app.db.session import SessionLocal, get_db, open_replica_session, set_session_user
 from app.core.config import settings
 from app.core.security import verify_token
 from models.database.models import User
-from typing import Optional
+from typing import Iterator, Optional
 from app.core.logging_config import get_logger
 import uuid
 
@@ -52,7 +52,7 @@ def _get_or_create_dev_user(db: Session) -> User:
     return user
 
 
-async def get_current_user(
+def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer),
     db: Session = Depends(get_db),
 ) -> User:
@@ -88,6 +88,8 @@ async def get_current_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        # このリクエストでの書き込みを read-your-writes の判定に使う
+        set_session_user(db, user.id)
         return user
 
     raise HTTPException(
@@ -97,7 +99,7 @@ async def get_current_user(
     )
 
 
-async def get_current_user_optional(
+def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer),
     db: Session = Depends(get_db),
 ) -> Optional[User]:
@@ -106,11 +108,62 @@ async def get_current_user_optional(
         return None
 
     try:
-        return await get_current_user(credentials, db)
+        return get_current_user(credentials, db)
     except HTTPException:
         return None
 
 
+def get_current_user_ws(websocket: WebSocket) -> User:
+    """WebSocket用の認証（Authorization ヘッダ、または ?token= クエリ）
+
+    ブラウザ等の WebSocket クライアントはヘッダを付与できないため、
+    クエリパラメータでのトークン指定も受け付ける。
+    get_db は接続が閉じるまでプールの接続を握り続けるため使わず、
+    ユーザーの読み込みだけの短いセッションで解決する（返すユーザーは DB から切り離し済み）。
+    """
+    token = websocket.query_params.get("token")
+    auth_header = websocket.headers.get("authorization")
+    if auth_header and auth_header.lower().startswith("bearer "):
+        token = auth_header.split(" ", 1)[1].strip()
+
+    payload = verify_token(token) if token else None
+    user_sub = payload.get("sub") if payload else None
+    user = None
+    if user_sub:
+        db = SessionLocal()
+        try:
+            user = db.query(User).filter(User.sub == user_sub).first()
+        finally:
+            db.close()
+    if not user:
+        raise WebSocketException(
+            code=status.WS_1008_POLICY_VIOLATION,
+            reason="Invalid authentication credentials",
+        )
+    return user
+
+
+def get_read_db(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> Iterator[Session]:
+    """読み取り専用ルート用のDBセッション
+
+    読み取りレプリカが設定されていればレプリカのセッションを返す。
+    レプリカ未設定・接続不可、またはユーザーが直近に書き込んでいる場合はプライマリ（db）を返す。
+    """
+    replica = open_replica_session(current_user.id)
+    if replica is None:
+        yield db
+        return
+    # 認証で使ったプライマリの接続をプールに返す（読み込み済みのユーザー属性はそのまま使える）
+    db.close()
+    try:
+        yield replica
+    finally:
+        replica.close()
+
+
 def require_auth(user: User = Depends(get_current_user)) -> User:
     """Require authentication (used for endpoints that need auth)"""
     return user
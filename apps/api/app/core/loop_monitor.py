@@ -0,0 +1,298 @@
+"""
+イベントループのブロッキング検知
+
+async 関数内の同期処理（同期DBアクセス・同期SDK呼び出し・巨大なペイロードのログ出力など）で
+イベントループが止まると、同じワーカーの全リクエストが待たされる。
+
+- ループ上のハートビートが一定間隔（LOOP_MONITOR_INTERVAL_MS）で時刻を記録する
+- 監視スレッドはハートビートが閾値（LOOP_MONITOR_THRESHOLD_MS）以上途絶えたら、
+  ループスレッドのスタックと実行中タスクのリクエスト情報（ルート・リクエストID）を取得する
+- ループ再開時に停止時間を確定し、構造化ログとカウンタ（get_loop_monitor_stats）に記録する
+
+監視スレッドはハートビートの時刻を見るだけなので、本番で常時有効にしても負荷はわずか。
+スタック取得は閾値を超えた停止1回につき1度だけ行う。
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.logging_config import get_logger, request_id_var
+
+logger = get_logger(__name__)
+
+# 実行中リクエストの ASGI scope（停止時にルートを特定するため）
+_scope_var: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "loop_monitor_scope", default=None
+)
+
+# 停止箇所の特定に使うアプリ側コードのルート（apps/api）
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STACK_LIMIT = 30
+RECENT_STALLS = 20
+# 集計する停止箇所の種類の上限（超えた分は "other" にまとめる）
+MAX_OFFENDERS = 200
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, float] = {
+    "stalls": 0,
+    "stalls_with_stack": 0,
+    "total_blocked_ms": 0,
+    "max_blocked_ms": 0,
+}
+_offenders: Dict[str, Dict[str, float]] = {}
+_recent: Deque[Dict[str, Any]] = deque(maxlen=RECENT_STALLS)
+
+_monitor: Optional["EventLoopMonitor"] = None
+
+
+class LoopMonitorMiddleware:
+    """実行中リクエストの scope をコンテキストに載せる ASGI ミドルウェア"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        token = _scope_var.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _scope_var.reset(token)
+
+
+class _Capture:
+    """監視スレッドが取得した停止中のスナップショット"""
+
+    __slots__ = ("tick", "stack", "location", "task", "request")
+
+    def __init__(self, tick: int, stack: List[str], location: Optional[str], task, request):
+        self.tick = tick
+        self.stack = stack
+        self.location = location
+        self.task = task
+        self.request = request
+
+
+class EventLoopMonitor:
+    """イベントループの停止を検知して報告する"""
+
+    def __init__(self, interval_ms: int, threshold_ms: int):
+        self.interval = interval_ms / 1000
+        self.threshold = threshold_ms / 1000
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._last_tick = 0.0
+        self._tick = 0
+        self._capture: Optional[_Capture] = None
+
+    def start(self) -> None:
+        """実行中のイベントループ上で監視を開始する"""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.perf_counter()
+        self._stopped.clear()
+        self._heartbeat_task = self._loop.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="event-loop-monitor", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        interval = self.interval
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(interval)
+            now = time.perf_counter()
+            with self._lock:
+                self._last_tick = now
+                capture = self._capture
+                if capture is not None and capture.tick != self._tick:
+                    capture = None
+                self._capture = None
+                self._tick += 1
+            lag = now - started - interval
+            if lag >= self.threshold:
+                _report(lag * 1000, self.threshold * 1000, capture)
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.interval):
+            with self._lock:
+                stalled = time.perf_counter() - self._last_tick >= self.threshold
+                if self._capture is not None or not stalled:
+                    continue
+                tick = self._tick
+            capture = self._snapshot(tick)
+            with self._lock:
+                # 取得中にループが再開していたら破棄する
+                if tick == self._tick:
+                    self._capture = capture
+
+    def _snapshot(self, tick: int) -> _Capture:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        summary = traceback.extract_stack(frame, limit=STACK_LIMIT) if frame else []
+        task = asyncio.current_task(self._loop) if self._loop else None
+        return _Capture(
+            tick=tick,
+            stack=[f"{f.filename}:{f.lineno} {f.name}" for f in summary],
+            location=_app_location(summary),
+            task=_task_name(task),
+            request=_task_request(task),
+        )
+
+
+def _app_location(summary) -> Optional[str]:
+    """スタックのうち最も内側にあるアプリ側コードの位置"""
+    for frame in reversed(summary):
+        path = os.path.abspath(frame.filename)
+        if path.startswith(_APP_ROOT) and "site-packages" not in path:
+            return f"{os.path.relpath(path, _APP_ROOT)}:{frame.lineno} {frame.name}"
+    if summary:
+        frame = summary[-1]
+        return f"{frame.filename}:{frame.lineno} {frame.name}"
+    return None
+
+
+def _task_name(task) -> Optional[str]:
+    if task is None:
+        return None
+    coro = task.get_coro()
+    return getattr(coro, "__qualname__", None) or task.get_name()
+
+
+def _task_request(task) -> Dict[str, Any]:
+    # Task.get_context は Python 3.12 以降
+    get_context = getattr(task, "get_context", None)
+    if get_context is None:
+        return {}
+    context = get_context()
+    info: Dict[str, Any] = {"request_id": context.get(request_id_var)}
+    scope = context.get(_scope_var)
+    if scope:
+        endpoint = scope.get("endpoint")
+        info.update(
+            method=scope.get("method"),
+            path=scope.get("path"),
+            endpoint=getattr(endpoint, "__qualname__", None) if endpoint else None,
+        )
+    return info
+
+
+def _report(blocked_ms: float, threshold_ms: float, capture: Optional[_Capture]) -> None:
+    blocked_ms = round(blocked_ms, 1)
+    location = capture.location if capture else None
+    request = capture.request if capture else {}
+    record: Dict[str, Any] = {
+        "blocked_ms": blocked_ms,
+        "threshold_ms": threshold_ms,
+        "location": location,
+        "task": capture.task if capture else None,
+        "method": request.get("method"),
+        "path": request.get("path"),
+        "endpoint": request.get("endpoint"),
+        "request_id": request.get("request_id"),
+    }
+
+    with _stats_lock:
+        _stats["stalls"] += 1
+        if capture is not None:
+            _stats["stalls_with_stack"] += 1
+        _stats["total_blocked_ms"] += blocked_ms
+        _stats["max_blocked_ms"] = max(_stats["max_blocked_ms"], blocked_ms)
+        key = location or "unknown"
+        if key not in _offenders and len(_offenders) >= MAX_OFFENDERS:
+            key = "other"
+        offender = _offenders.setdefault(key, {"count": 0, "total_ms": 0, "max_ms": 0})
+        offender["count"] += 1
+        offender["total_ms"] += blocked_ms
+        offender["max_ms"] = max(offender["max_ms"], blocked_ms)
+        _recent.append(record)
+
+    logger.warning(
+        "Event loop blocked",
+        extra={**record, "stack": capture.stack if capture else None},
+    )
+
+
+def get_loop_monitor_stats(top: int = 10) -> Dict[str, Any]:
+    """停止回数・停止時間の累計と、停止時間の合計が大きい箇所の上位を返す"""
+    with _stats_lock:
+        stats: Dict[str, Any] = dict(_stats)
+        offenders = sorted(
+            ({"location": k, **v} for k, v in _offenders.items()),
+            key=lambda o: o["total_ms"],
+            reverse=True,
+        )
+        stats["top_offenders"] = offenders[:top]
+        stats["recent"] = list(_recent)
+    stats["enabled"] = _monitor is not None
+    return stats
+
+
+def reset_loop_monitor_stats() -> None:
+    """統計を破棄する（テスト用）"""
+    with _stats_lock:
+        for key in _stats:
+            _stats[key] = 0
+        _offenders.clear()
+        _recent.clear()
+
+
+async def start_loop_monitor(
+    interval_ms: Optional[int] = None,
+    threshold_ms: Optional[int] = None,
+) -> EventLoopMonitor:
+    """監視を開始する（アプリ起動時に呼ぶ）"""
+    global _monitor
+    if _monitor is not None:
+        return _monitor
+    monitor = EventLoopMonitor(
+        interval_ms or settings.LOOP_MONITOR_INTERVAL_MS,
+        threshold_ms or settings.LOOP_MONITOR_THRESHOLD_MS,
+    )
+    monitor.start()
+    _monitor = monitor
+    logger.info(
+        "Event loop monitor started",
+        extra={
+            "interval_ms": int(monitor.interval * 1000),
+            "threshold_ms": int(monitor.threshold * 1000),
+        },
+    )
+    return monitor
+
+
+async def stop_loop_monitor() -> None:
+    """監視を停止する（アプリ終了時に呼ぶ）"""
+    global _monitor
+    monitor, _monitor = _monitor, None
+    if monitor is not None:
+        await monitor.stop()
@@ -0,0 +1,459 @@
+"""
+Prometheus 形式のメトリクス
+
+プロセス内のレジストリにカウンタ・ゲージ・ヒストグラムを持ち、/metrics で
+Prometheus のテキスト形式（0.0.4）として返す。
+
+- 記録はラベル値ごとの子（初回の labels() で作成）に対して行う。ヒストグラムのバケット配列は
+  子の作成時に確保するため、記録時は bisect と加算だけ（取るのは子ごとのロックのみ）
+- スクレイプ時点の値（DBプール・キャッシュなど）は register_collector の関数で集める
+- METRICS_MULTIPROC_DIR を設定すると、各ワーカーが METRICS_FLUSH_SECONDS ごとに
+  スナップショットをディレクトリに書き出し、/metrics は全ワーカー分を合算して返す
+  （ゲージは書き出しが途絶えたワーカーの分を除く）
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# 複数ワーカーの合算方法
+AGGREGATE_SUM = "sum"
+AGGREGATE_PER_WORKER = "per_worker"  # 合算せず pid ラベルを付けてワーカーごとに出す
+
+# スナップショット形式: {name: {"kind", "documentation", "labelnames", "aggregate",
+#                               "buckets", "samples": [[ラベル値のリスト, 値], ...]}}
+# ヒストグラムの値は [バケットごとの件数（+Inf を含む）, 合計]
+Family = Dict[str, Any]
+
+_SNAPSHOT_PREFIX = "metrics-"
+_SNAPSHOT_SUFFIX = ".json"
+
+
+class _Value:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+    def get(self) -> float:
+        return self.value
+
+
+class _HistogramValue:
+    __slots__ = ("_lock", "_bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self._lock = threading.Lock()
+        self._bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        # le は上限を含むため bisect_left（value == 上限 はそのバケット）
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def get(self) -> List[Any]:
+        with self._lock:
+            return [list(self.counts), self.sum]
+
+
+class Metric:
+    """ラベル付きメトリクスのファミリー"""
+
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        aggregate: str = AGGREGATE_SUM,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.aggregate = aggregate
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+
+    def labels(self, *values: str):
+        """ラベル値に対応する子を返す（記録する側で保持して使い回してよい）
+
+        Raises:
+            ValueError: ラベル値の数がラベル名と一致しない場合
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {values!r}"
+                )
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def snapshot(self) -> Family:
+        return family(
+            self.kind,
+            self.documentation,
+            [[list(key), child.get()] for key, child in list(self._children.items())],
+            labelnames=self.labelnames,
+            aggregate=self.aggregate,
+        )
+
+    def _new_child(self):
+        return _Value()
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._children[()].inc(amount)
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._children[()].inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._children[()].dec(amount)
+
+    def set(self, value: float) -> None:
+        self._children[()].set(value)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def observe(self, value: float) -> None:
+        self._children[()].observe(value)
+
+    def snapshot(self) -> Family:
+        snapshot = super().snapshot()
+        snapshot["buckets"] = list(self.buckets)
+        return snapshot
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+
+def family(
+    kind: str,
+    documentation: str,
+    samples: List[List[Any]],
+    labelnames: Sequence[str] = (),
+    aggregate: str = AGGREGATE_SUM,
+) -> Family:
+    """スナップショット形式のファミリー（コレクタの戻り値にも使う）"""
+    return {
+        "kind": kind,
+        "documentation": documentation,
+        "labelnames": list(labelnames),
+        "aggregate": aggregate,
+        "samples": samples,
+    }
+
+
+class MetricsRegistry:
+    """メトリクスとスクレイプ時のコレクタの登録先"""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], Dict[str, Family]]] = []
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        aggregate: str = AGGREGATE_SUM,
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, aggregate))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], Dict[str, Family]]) -> None:
+        """スクレイプ時に呼ばれ、{名前: family(...)} を返す関数を登録する"""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def snapshot(self) -> Dict[str, Family]:
+        """このプロセスの全メトリクス"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        families = {metric.name: metric.snapshot() for metric in metrics}
+        for collector in collectors:
+            try:
+                families.update(collector())
+            except Exception:
+                # 1つのコレクタの失敗でスクレイプ全体を落とさない
+                logger.exception("Metrics collector failed: %r", collector)
+        return families
+
+    def render(self) -> str:
+        """Prometheus テキスト形式（マルチワーカー時は全ワーカーの合算）"""
+        directory = settings.METRICS_MULTIPROC_DIR
+        if not directory:
+            return format_text(self.snapshot())
+        write_snapshot(directory)
+        return format_text(merge_snapshots(read_snapshots(directory)))
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name} already registered as {existing.kind}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+
+registry = MetricsRegistry()
+
+
+# --- マルチワーカーの合算 -------------------------------------------------
+
+
+def write_snapshot(directory: Optional[str] = None) -> None:
+    """このワーカーのスナップショットを書き出す（書き込み途中のファイルは読まれない）"""
+    directory = directory or settings.METRICS_MULTIPROC_DIR
+    if not directory:
+        return
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{_SNAPSHOT_PREFIX}{os.getpid()}{_SNAPSHOT_SUFFIX}")
+    payload = {"written_at": time.time(), "metrics": registry.snapshot()}
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def read_snapshots(directory: str) -> List[Tuple[str, Dict[str, Family], bool]]:
+    """(pid, ファミリー, 直近に書き出されたか) のリスト"""
+    stale_after = settings.METRICS_FLUSH_SECONDS * 3
+    now = time.time()
+    snapshots = []
+    for entry in os.scandir(directory):
+        name = entry.name
+        if not (name.startswith(_SNAPSHOT_PREFIX) and name.endswith(_SNAPSHOT_SUFFIX)):
+            continue
+        try:
+            with open(entry.path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            logger.warning("Skipping unreadable metrics snapshot %s", entry.path)
+            continue
+        pid = name[len(_SNAPSHOT_PREFIX) : -len(_SNAPSHOT_SUFFIX)]
+        fresh = now - payload.get("written_at", 0) <= stale_after
+        snapshots.append((pid, payload.get("metrics", {}), fresh))
+    return snapshots
+
+
+def merge_snapshots(
+    snapshots: Iterable[Tuple[str, Dict[str, Family], bool]],
+) -> Dict[str, Family]:
+    """ワーカーごとのスナップショットを合算する
+
+    カウンタ・ヒストグラムは終了したワーカーの分も含めて合計する（単調増加を保つ）。
+    ゲージは直近に書き出したワーカーの分だけを使う。
+    """
+    merged: Dict[str, Family] = {}
+    merged_samples: Dict[str, Dict[Tuple[str, ...], Any]] = {}
+    for pid, families, fresh in snapshots:
+        for name, fam in families.items():
+            if fam["kind"] == "gauge" and not fresh:
+                continue
+            per_worker = fam.get("aggregate") == AGGREGATE_PER_WORKER
+            if name not in merged:
+                labelnames = list(fam["labelnames"]) + (["pid"] if per_worker else [])
+                merged[name] = {**fam, "labelnames": labelnames}
+                merged_samples[name] = {}
+            samples = merged_samples[name]
+            for labels, value in fam["samples"]:
+                key = tuple(labels) + ((pid,) if per_worker else ())
+                current = samples.get(key)
+                samples[key] = value if current is None else _add(current, value)
+    for name, fam in merged.items():
+        fam["samples"] = [[list(key), value] for key, value in merged_samples[name].items()]
+    return merged
+
+
+def _add(left: Any, right: Any) -> Any:
+    if isinstance(left, list):
+        counts = [a + b for a, b in zip(left[0], right[0])]
+        return [counts, left[1] + right[1]]
+    return left + right
+
+
+_flusher: Optional[threading.Thread] = None
+_flusher_stop = threading.Event()
+
+
+def start_metrics_flusher() -> None:
+    """METRICS_FLUSH_SECONDS ごとにスナップショットを書き出すスレッドを開始する"""
+    global _flusher
+    if not settings.METRICS_MULTIPROC_DIR or _flusher is not None:
+        return
+    _flusher_stop.clear()
+
+    def _run() -> None:
+        while not _flusher_stop.wait(settings.METRICS_FLUSH_SECONDS):
+            try:
+                write_snapshot()
+            except Exception:
+                logger.exception("Failed to write metrics snapshot")
+
+    _flusher = threading.Thread(target=_run, name="metrics-flusher", daemon=True)
+    _flusher.start()
+
+
+def stop_metrics_flusher() -> None:
+    """書き出しスレッドを止め、最後のスナップショットを書き出す"""
+    global _flusher
+    if _flusher is None:
+        return
+    _flusher_stop.set()
+    _flusher.join(timeout=5)
+    _flusher = None
+    try:
+        write_snapshot()
+    except Exception:
+        logger.exception("Failed to write final metrics snapshot")
+
+
+# --- テキスト形式 ---------------------------------------------------------
+
+
+def format_text(families: Dict[str, Family]) -> str:
+    lines: List[str] = []
+    for name in sorted(families):
+        fam = families[name]
+        kind = fam["kind"]
+        labelnames = fam["labelnames"]
+        lines.append(f"# HELP {name} {_escape(fam['documentation'], quote=False)}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in sorted(fam["samples"], key=lambda sample: sample[0]):
+            pairs = list(zip(labelnames, labels))
+            if kind != "histogram":
+                lines.append(f"{name}{_labels(pairs)} {_number(value)}")
+                continue
+            counts, total = value
+            cumulative = 0
+            for bound, count in zip([*fam["buckets"], math.inf], counts):
+                cumulative += count
+                le_value = "+Inf" if bound == math.inf else repr(float(bound))
+                le = _labels(pairs + [("le", le_value)])
+                lines.append(f"{name}_bucket{le} {cumulative}")
+            lines.append(f"{name}_sum{_labels(pairs)} {_number(total)}")
+            lines.append(f"{name}_count{_labels(pairs)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+def _labels(pairs: List[Tuple[str, Any]]) -> str:
+    if not pairs:
+        return ""
+    inner = ",".join(f'{key}="{_escape(str(value))}"' for key, value in pairs)
+    return "{" + inner + "}"
+
+
+def _escape(value: str, quote: bool = True) -> str:
+    value = value.replace("\\", "\\\\").replace("\n", "\\n")
+    return value.replace('"', '\\"') if quote else value
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(float(value))
+    return repr(float(value))
+
+
+# --- アプリのメトリクス -----------------------------------------------------
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being processed"
+)
+UPSTREAM_REQUEST_DURATION = registry.histogram(
+    "upstream_request_duration_seconds",
+    "Latency of successful upstream AI provider calls",
+    ("service",),
+)
+UPSTREAM_ERRORS = registry.counter(
+    "upstream_errors_total", "Failed upstream AI provider calls", ("service",)
+)
+LLM_TOKENS = registry.counter(
+    "llm_tokens_total", "LLM tokens used", ("service", "model", "direction")
+)
+TTS_CHARACTERS = registry.counter(
+    "tts_characters_total", "Characters sent to text-to-speech", ("service",)
+)
+STT_AUDIO_SECONDS = registry.counter(
+    "stt_audio_seconds_total", "Seconds of audio sent to speech-to-text", ("service",)
+)
+API_COST_USD = registry.counter(
+    "api_cost_usd_total", "Estimated upstream API cost in USD", ("service",)
+)
@@ -12,7 +12,10 @@ from typing import Callable
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.core.config import settings
 from app.core.logging_config import get_logger, set_request_id
+from app.core.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT
+from app.db.query_stats import finish_request_stats, start_request_stats
 
 logger = get_logger(__name__)
 
@@ -23,16 +26,19 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
     - リクエストIDの生成と伝播
     - リクエスト/レスポンスのログ出力
-    - 処理時間の計測
+    - 処理時間の計測（/metrics のルート別ヒストグラム・処理中リクエスト数にも記録）
+    - SQL発行数・DB時間の集計（本番以外はレスポンスヘッダにも出力）
     """
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         # リクエストIDを生成（クライアントから渡された場合はそれを使用）
         request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())[:8]
         set_request_id(request_id)
+        query_stats = start_request_stats()
 
         # リクエスト開始時刻
         start_time = time.perf_counter()
+        HTTP_REQUESTS_IN_FLIGHT.inc()
 
         # リクエスト情報をログ
         logger.info(
@@ -49,7 +55,10 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
         except Exception as exc:
             # 例外発生時のログ
-            duration_ms = int((time.perf_counter() - start_time) * 1000)
+            elapsed = time.perf_counter() - start_time
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            _observe(request, 500, elapsed)
+            duration_ms = int(elapsed * 1000)
             logger.error(
                 "Request failed with exception",
                 extra={
@@ -63,10 +72,17 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             raise
 
         # 処理時間を計算
-        duration_ms = int((time.perf_counter() - start_time) * 1000)
+        elapsed = time.perf_counter() - start_time
+        HTTP_REQUESTS_IN_FLIGHT.dec()
+        _observe(request, response.status_code, elapsed)
+        duration_ms = int(elapsed * 1000)
 
         # レスポンスにリクエストIDを追加
         response.headers["X-Request-ID"] = request_id
+        if settings.ENVIRONMENT != "production":
+            response.headers["X-DB-Query-Count"] = str(query_stats.count)
+            response.headers["X-DB-Time-Ms"] = f"{query_stats.total_ms:.1f}"
+        finish_request_stats(query_stats, request.method, request.url.path)
 
         # レスポンス情報をログ
         log_level = "warning" if response.status_code >= 400 else "info"
@@ -77,7 +93,16 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 "path": request.url.path,
                 "status_code": response.status_code,
                 "duration_ms": duration_ms,
+                "db_query_count": query_stats.count,
+                "db_time_ms": round(query_stats.total_ms, 1),
             },
         )
 
         return response
+
+
+def _observe(request: Request, status_code: int, elapsed: float) -> None:
+    """ルートのテンプレート（/sessions/{session_id} など）単位で処理時間を記録する"""
+    route = request.scope.get("route")
+    path = getattr(route, "path", None) or "unmatched"
+    HTTP_REQUEST_DURATION.labels(request.method, path, str(status_code)).observe(elapsed)
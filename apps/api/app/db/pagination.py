@@ -0,0 +1,84 @@
+"""
+キーセット（カーソル）ページネーション
+
+(並び順の列, id) の組で「前ページの最後の行より後」を絞り込むため、
+OFFSET と違って深いページでも先頭ページと同じコストで取得できる。
+カーソルは (値, id) を JSON にして base64url でエンコードした不透明な文字列。
+"""
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+
+class InvalidCursorError(ValueError):
+    """カーソルが壊れている・別の一覧のものである"""
+
+
+def encode_cursor(value: datetime, row_id: int) -> str:
+    payload = json.dumps([value.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(value), int(row_id)
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+
+
+def paginate(
+    query: Query,
+    sort_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+    entity: Optional[Callable[[Any], Any]] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """(sort_column, id_column) の順で limit 件を取得し、次ページのカーソルを返す
+
+    sort_column は NULL を含まないこと。最後のページでは次のカーソルは None。
+    複数の列を取得するクエリでは entity に行からモデルを取り出す関数を渡す。
+
+    Raises:
+        InvalidCursorError: cursor を解釈できない場合
+    """
+    if cursor:
+        value, row_id = decode_cursor(cursor)
+        # 先頭の範囲条件（>= / <=）でインデックスの範囲走査にする
+        if descending:
+            query = query.filter(
+                and_(
+                    sort_column <= value,
+                    or_(sort_column < value, id_column < row_id),
+                )
+            )
+        else:
+            query = query.filter(
+                and_(
+                    sort_column >= value,
+                    or_(sort_column > value, id_column > row_id),
+                )
+            )
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = entity(rows[-1]) if entity else rows[-1]
+    return rows, encode_cursor(
+        getattr(last, sort_column.key), getattr(last, id_column.key)
+    )
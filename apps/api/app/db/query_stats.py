@@ -0,0 +1,156 @@
+"""
+SQL 発行数・DB時間の計測
+
+全 Engine の cursor 実行イベントにフックし、
+- リクエストごとの発行数・合計DB時間（RequestLoggingMiddleware がリクエスト開始時に集計を開始）
+- 同じ形の文の繰り返し（N+1 の疑い）
+- 閾値（SQL_SLOW_QUERY_MS）を超えた遅いクエリ（パラメータは型のみ出力）
+を記録する。
+
+テストでは track_queries() で任意の区間の発行数を数えられる。
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_START_KEY = "query_stats_started"
+# ログに出す文の最大長
+_STATEMENT_PREVIEW = 500
+
+
+class QueryStats:
+    """発行されたSQLの集計"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.shapes: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        # 同期ルート・run_db のワーカースレッドからも呼ばれる
+        with self._lock:
+            self.count += 1
+            self.total_ms += duration_ms
+            self.shapes[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold 回以上発行された同じ形の文（N+1 の疑い）"""
+        return [(s, n) for s, n in self.shapes.most_common() if n >= threshold]
+
+    def describe(self) -> str:
+        lines = [f"{self.count} queries, {self.total_ms:.1f}ms"]
+        lines += [f"  {n}x {s}" for s, n in self.shapes.most_common()]
+        return "\n".join(lines)
+
+
+_request_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "request_query_stats", default=None
+)
+_trackers: List[QueryStats] = []
+_installed = False
+
+
+def start_request_stats() -> QueryStats:
+    """現在のリクエストの集計を開始する（ミドルウェアから呼ぶ）"""
+    stats = QueryStats()
+    _request_stats.set(stats)
+    return stats
+
+
+def finish_request_stats(stats: QueryStats, method: str, path: str) -> None:
+    """N+1 の疑いがあれば警告する"""
+    threshold = settings.SQL_N_PLUS_ONE_THRESHOLD
+    if threshold <= 0:
+        return
+    for statement, count in stats.repeated(threshold):
+        logger.warning(
+            "Probable N+1 query",
+            extra={
+                "method": method,
+                "path": path,
+                "repeat_count": count,
+                "statement": statement[:_STATEMENT_PREVIEW],
+                "query_count": stats.count,
+            },
+        )
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """ブロック内でプロセス全体に発行されたSQLを集計する（テスト用）"""
+    stats = QueryStats()
+    _trackers.append(stats)
+    try:
+        yield stats
+    finally:
+        _trackers.remove(stats)
+
+
+def _redact(parameters) -> object:
+    """パラメータの値は出さず、型名だけを残す"""
+    if isinstance(parameters, dict):
+        return {k: type(v).__name__ for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (list, tuple, dict)):
+            return f"<{len(parameters)} parameter sets>"
+        return [type(v).__name__ for v in parameters]
+    return type(parameters).__name__
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get(_START_KEY)
+    if not starts:
+        return
+    duration_ms = (time.perf_counter() - starts.pop()) * 1000
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.record(statement, duration_ms)
+    for tracker in _trackers:
+        tracker.record(statement, duration_ms)
+
+    if duration_ms >= settings.SQL_SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query",
+            extra={
+                "duration_ms": round(duration_ms, 1),
+                "statement": statement[:_STATEMENT_PREVIEW],
+                "parameters": _redact(parameters),
+            },
+        )
+
+
+def _handle_error(exception_context) -> None:
+    conn = exception_context.connection
+    starts = conn.info.get(_START_KEY) if conn is not None else None
+    if starts:
+        starts.pop()
+
+
+def install_query_hooks() -> None:
+    """全 Engine に計測フックを登録する（複数回呼んでも1度だけ）"""
+    global _installed
+    if _installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    _installed = True
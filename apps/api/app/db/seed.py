@@ -0,0 +1,168 @@
+"""
+シナリオ・シャドーイング文のシードデータの投入
+
+内容は seed_content.json（テーブルごとに列名と行の配列）に持ち、
+テーブルごとに1回の SELECT で既存行と突き合わせ、追加分は INSERT、変更分は
+UPDATE をそれぞれ executemany でまとめて1トランザクションで適用する。
+
+適用したファイルのハッシュを seed_states に記録し、同じ内容なら
+seed_states の主キー読み込み1回で終わる。既存行は削除しない
+（ユーザーの進捗がシャドーイング文を参照しているため）。
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.db.upsert import bulk_upsert
+from models.database.models import (
+    DifficultyLevel,
+    Scenario,
+    ScenarioCategory,
+    SeedState,
+    ShadowingSentence,
+)
+
+SEED_PATH = Path(__file__).with_name("seed_content.json")
+SEED_NAME = "content"
+
+# シードで管理する列（audio_url・is_active など運用中に変わる列は触らない）
+SCENARIO_COLUMNS = ("name", "category", "difficulty", "description")
+SHADOWING_COLUMNS = ("key_phrase", "sentence_en", "sentence_ja", "difficulty")
+
+
+@dataclass
+class SeedResult:
+    """シード適用結果"""
+
+    content_hash: str
+    skipped: bool = False
+    inserted: Dict[str, int] = field(default_factory=dict)
+    updated: Dict[str, int] = field(default_factory=dict)
+
+
+def _rows(table_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    columns = table_data["columns"]
+    return [dict(zip(columns, row)) for row in table_data["rows"]]
+
+
+def _changed(existing, row: Dict[str, Any], columns: Iterable[str]) -> bool:
+    return any(getattr(existing, column) != row[column] for column in columns)
+
+
+def apply_seed(db: Session, path: Path = SEED_PATH, force: bool = False) -> SeedResult:
+    """シードファイルの内容をDBに反映する（force=True ならハッシュが同じでも突き合わせる）"""
+    raw = path.read_bytes()
+    content_hash = hashlib.sha256(raw).hexdigest()
+    if not force:
+        state = db.get(SeedState, SEED_NAME)
+        if state is not None and state.content_hash == content_hash:
+            return SeedResult(content_hash=content_hash, skipped=True)
+
+    data = json.loads(raw)
+    result = SeedResult(content_hash=content_hash)
+    try:
+        scenario_ids = _sync_scenarios(db, _rows(data["scenarios"]), result)
+        _sync_shadowing_sentences(
+            db, _rows(data["shadowing_sentences"]), scenario_ids, result
+        )
+        bulk_upsert(
+            db,
+            SeedState.__table__,
+            [
+                {
+                    "name": SEED_NAME,
+                    "content_hash": content_hash,
+                    "applied_at": datetime.now(timezone.utc),
+                }
+            ],
+            conflict_columns=["name"],
+            update=lambda cols, new: {
+                "content_hash": new.content_hash,
+                "applied_at": new.applied_at,
+            },
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return result
+
+
+def _sync_scenarios(
+    db: Session, rows: List[Dict[str, Any]], result: SeedResult
+) -> Set[int]:
+    """シナリオを id で突き合わせる。存在するシナリオ id を返す"""
+    table = Scenario.__table__
+    existing = {
+        row.id: row
+        for row in db.execute(select(table.c.id, *(table.c[c] for c in SCENARIO_COLUMNS)))
+    }
+    inserts, updates = [], []
+    for row in rows:
+        row = {
+            **row,
+            "category": ScenarioCategory(row["category"]),
+            "difficulty": DifficultyLevel(row["difficulty"]),
+        }
+        current = existing.get(row["id"])
+        if current is None:
+            inserts.append({**row, "is_active": True})
+        elif _changed(current, row, SCENARIO_COLUMNS):
+            updates.append({"_id": row["id"], **{c: row[c] for c in SCENARIO_COLUMNS}})
+
+    _apply(db, table, inserts, updates)
+    result.inserted["scenarios"] = len(inserts)
+    result.updated["scenarios"] = len(updates)
+    return set(existing) | {row["id"] for row in rows}
+
+
+def _sync_shadowing_sentences(
+    db: Session,
+    rows: List[Dict[str, Any]],
+    scenario_ids: Set[int],
+    result: SeedResult,
+) -> None:
+    """シャドーイング文を (scenario_id, order_index) で突き合わせる（id は変えない）"""
+    table = ShadowingSentence.__table__
+    existing: Dict[Tuple[int, int], Any] = {}
+    for row in db.execute(
+        select(
+            table.c.id,
+            table.c.scenario_id,
+            table.c.order_index,
+            *(table.c[c] for c in SHADOWING_COLUMNS),
+        ).order_by(table.c.id)
+    ):
+        # 同じ位置に重複がある場合は古い行を正とする
+        existing.setdefault((row.scenario_id, row.order_index), row)
+
+    inserts, updates = [], []
+    for row in rows:
+        if row["scenario_id"] not in scenario_ids:
+            continue
+        row = {**row, "difficulty": DifficultyLevel(row["difficulty"])}
+        current = existing.get((row["scenario_id"], row["order_index"]))
+        if current is None:
+            inserts.append(row)
+        elif _changed(current, row, SHADOWING_COLUMNS):
+            updates.append({"_id": current.id, **{c: row[c] for c in SHADOWING_COLUMNS}})
+
+    _apply(db, table, inserts, updates)
+    result.inserted["shadowing_sentences"] = len(inserts)
+    result.updated["shadowing_sentences"] = len(updates)
+
+
+def _apply(db: Session, table, inserts: List[dict], updates: List[dict]) -> None:
+    if inserts:
+        db.execute(insert(table), inserts)
+    if updates:
+        db.execute(update(table).where(table.c.id == bindparam("_id")), updates)
+
@@ -5,9 +5,21 @@ sys.path.append(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 )
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import threading
+import time
+from typing import Callable, Dict, Optional, TypeVar
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
 from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.db.query_stats import install_query_hooks
+
+T = TypeVar("T")
+
+logger = get_logger(__name__)
 
 # Initialized only when CLOUD_SQL_USE_CONNECTOR is enabled.
 _cloud_sql_connector = None
@@ -50,12 +62,13 @@ def _engine_kwargs(database_url: str) -> dict:
     return kwargs
 
 
-def _create_cloud_sql_connector_engine():
+def _create_cloud_sql_connector_engine(connection_name: Optional[str] = None):
     """
     Build SQLAlchemy engine using cloud-sql-python-connector.
 
     This is recommended for Cloud Run because it avoids manual SSL cert management
     and supports private/public IP and IAM DB auth.
+    The connector is shared between the primary and the read replica engines.
     """
     global _cloud_sql_connector
     from google.cloud.sql.connector import Connector, IPTypes  # type: ignore
@@ -68,7 +81,7 @@ def _create_cloud_sql_connector_engine():
             "PyMySQL is required when CLOUD_SQL_USE_CONNECTOR=true"
         ) from e
 
-    connection_name = _require(
+    connection_name = connection_name or _require(
         settings.CLOUD_SQL_CONNECTION_NAME, "CLOUD_SQL_CONNECTION_NAME"
     )
     db_name = _require(settings.DB_NAME, "DB_NAME")
@@ -77,7 +90,8 @@ def _create_cloud_sql_connector_engine():
     ip_type_raw = (settings.CLOUD_SQL_IP_TYPE or "private").lower()
     ip_type = IPTypes.PRIVATE if ip_type_raw == "private" else IPTypes.PUBLIC
 
-    _cloud_sql_connector = Connector()
+    if _cloud_sql_connector is None:
+        _cloud_sql_connector = Connector()
 
     def getconn():
         return _cloud_sql_connector.connect(
@@ -105,10 +119,135 @@ engine = (
     else create_engine(settings.DATABASE_URL, **_engine_kwargs(settings.DATABASE_URL))
 )
 
+# SQL発行数・DB時間の計測フック（全 Engine 共通）
+install_query_hooks()
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def _create_replica_engine():
+    """読み取りレプリカの Engine（未設定なら None）"""
+    if settings.CLOUD_SQL_USE_CONNECTOR:
+        if not settings.CLOUD_SQL_REPLICA_CONNECTION_NAME:
+            return None
+        return _create_cloud_sql_connector_engine(
+            settings.CLOUD_SQL_REPLICA_CONNECTION_NAME
+        )
+    if not settings.DATABASE_REPLICA_URL:
+        return None
+    return create_engine(
+        settings.DATABASE_REPLICA_URL, **_engine_kwargs(settings.DATABASE_REPLICA_URL)
+    )
+
+
+# 読み取りレプリカ（任意）。プライマリとは別のコネクションプールを持つ
+replica_engine = _create_replica_engine()
+ReplicaSessionLocal = (
+    sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+    if replica_engine is not None
+    else None
+)
+
+# Session.info のキー
+SESSION_USER_KEY = "user_id"
+_REPLICA_KEY = "replica"
+_HAS_WRITES_KEY = "has_writes"
+
+# ユーザーID -> 最後に書き込みをコミットした時刻（time.monotonic）
+# プロセス内の記録のため、別インスタンスでの書き込み直後はレプリカ遅延が見える場合がある
+_recent_writes: Dict[str, float] = {}
+_recent_writes_lock = threading.Lock()
+_RECENT_WRITES_PRUNE_SIZE = 10_000
+
+
+def mark_user_write(user_id: str) -> None:
+    """ユーザーの書き込みを記録する（READ_YOUR_WRITES_SECONDS の間は読み取りをプライマリへ）"""
+    now = time.monotonic()
+    with _recent_writes_lock:
+        _recent_writes[user_id] = now
+        if len(_recent_writes) > _RECENT_WRITES_PRUNE_SIZE:
+            window = settings.READ_YOUR_WRITES_SECONDS
+            for key in [k for k, at in _recent_writes.items() if now - at >= window]:
+                del _recent_writes[key]
+
+
+def wrote_recently(user_id: str) -> bool:
+    with _recent_writes_lock:
+        written_at = _recent_writes.get(user_id)
+        if written_at is None:
+            return False
+        if time.monotonic() - written_at < settings.READ_YOUR_WRITES_SECONDS:
+            return True
+        del _recent_writes[user_id]
+        return False
+
+
+def clear_recent_writes() -> None:
+    with _recent_writes_lock:
+        _recent_writes.clear()
+
+
+def set_session_user(db: Session, user_id: str) -> None:
+    """このセッションでの書き込みを user_id の書き込みとして記録させる"""
+    db.info[SESSION_USER_KEY] = user_id
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session, flush_context) -> None:
+    session.info[_HAS_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _do_orm_execute(orm_execute_state) -> None:
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[_HAS_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session) -> None:
+    user_id = session.info.get(SESSION_USER_KEY)
+    if session.info.pop(_HAS_WRITES_KEY, False) and user_id is not None:
+        mark_user_write(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session) -> None:
+    session.info.pop(_HAS_WRITES_KEY, None)
+
+
+def open_replica_session(user_id: Optional[str] = None) -> Optional[Session]:
+    """読み取りレプリカのセッションを開く
+
+    次の場合は None（呼び出し側はプライマリを使う）:
+    - レプリカが設定されていない
+    - user_id が READ_YOUR_WRITES_SECONDS 以内に書き込んでいる
+    - レプリカに接続できない
+    """
+    if ReplicaSessionLocal is None:
+        return None
+    if user_id is not None and wrote_recently(user_id):
+        return None
+    replica = ReplicaSessionLocal()
+    replica.info[_REPLICA_KEY] = True
+    try:
+        replica.connection()
+    except SQLAlchemyError:
+        logger.warning("Read replica unavailable, falling back to primary", exc_info=True)
+        replica.close()
+        return None
+    return replica
+
+
+def write_bind(db: Session):
+    """db で読んだデータを書き戻す先（レプリカのセッションならプライマリの Engine）"""
+    return engine if db.info.get(_REPLICA_KEY) else db.get_bind()
+
+
 def get_db():
     """Dependency to get database session"""
     db = SessionLocal()
@@ -116,3 +255,13 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def run_db(fn: Callable[..., T], *args, **kwargs) -> T:
+    """同期のDB処理をスレッドプールで実行する（async 関数からイベントループを塞がないため）
+
+    本番の Cloud SQL Connector は pymysql のみ対応で非同期ドライバを使えないため、
+    Session はそのまま同期で扱い、DBに触れる区間だけをワーカースレッドに逃がす。
+    同じ Session を複数の run_db で並行に使わないこと（Session はスレッドセーフではない）。
+    """
+    return await run_in_threadpool(fn, *args, **kwargs)
@@ -0,0 +1,61 @@
+"""
+方言ごとの一括 UPSERT 文の組み立て
+
+本番は MySQL（Cloud SQL）、ローカル・テストは SQLite なので、
+ON DUPLICATE KEY UPDATE / ON CONFLICT DO UPDATE を同じ呼び出し方で使えるようにする。
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Sequence
+
+from sqlalchemy import Table
+from sqlalchemy.orm import Session
+
+# (テーブル列, 挿入しようとした値) -> {列名: 更新式}
+UpdateBuilder = Callable[[Any, Any], Dict[str, Any]]
+
+
+def build_upsert(
+    dialect_name: str,
+    table: Table,
+    rows: List[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update: UpdateBuilder,
+):
+    """一意キー衝突時に update の式で更新する INSERT 文を返す
+
+    MySQL は SET 句を左から評価するため、update の式は自分自身の列以外の
+    （同じ文で更新される）列を参照しないこと。
+    """
+    if dialect_name == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        stmt = mysql_insert(table).values(rows)
+        return stmt.on_duplicate_key_update(update(table.c, stmt.inserted))
+
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise ValueError(f"UPSERT is not supported for dialect: {dialect_name}")
+
+    stmt = dialect_insert(table).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=list(conflict_columns),
+        set_=update(table.c, stmt.excluded),
+    )
+
+
+def bulk_upsert(
+    db: Session,
+    table: Table,
+    rows: List[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update: UpdateBuilder,
+) -> None:
+    """rows を1文でまとめて UPSERT する（コミットは呼び出し側）"""
+    if not rows:
+        return
+    stmt = build_upsert(db.get_bind().dialect.name, table, rows, conflict_columns, update)
+    db.execute(stmt)
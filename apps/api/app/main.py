@@ -2,7 +2,13 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.core.logging_config import setup_logging, get_logger
+from app.core.metrics import start_metrics_flusher, stop_metrics_flusher
 from app.core.middleware import RequestLoggingMiddleware
+from app.core.loop_monitor import (
+    LoopMonitorMiddleware,
+    start_loop_monitor,
+    stop_loop_monitor,
+)
 from app.routers.auth import router as auth_router
 from app.routers.sessions import router as sessions_router
 from app.routers.reviews import router as reviews_router
@@ -15,7 +21,11 @@ from app.routers.subscriptions import router as subscriptions_router
 from app.routers.shadowing import router as shadowing_router
 from app.routers.custom_scenarios import router as custom_scenarios_router
 from app.services.ai import initialize_providers
-from app.db.session import close_cloud_sql_connector
+from app.services.ai.stt_factory import initialize_stt_providers
+from app.db.session import SessionLocal, close_cloud_sql_connector
+from app.services.audio import shutdown_preprocess_executor
+from app.services.content import reload_catalog
+from app.services.review.phonetic_index import index_shadowing_sentences
 from app.db.migrations import upgrade_head
 import os
 
@@ -34,6 +44,10 @@ app = FastAPI(
 # リクエストロギングミドルウェア
 app.add_middleware(RequestLoggingMiddleware)
 
+# イベントループ停止時にブロック中のリクエストを特定するためのミドルウェア
+if settings.LOOP_MONITOR_ENABLED:
+    app.add_middleware(LoopMonitorMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -90,13 +104,32 @@ async def startup_event():
     #     logger.exception("Database migration on startup failed")
     #     raise
     # initialize_providers()
+    initialize_stt_providers()
     logger.info("AI providers initialized")
+    if settings.LOOP_MONITOR_ENABLED:
+        await start_loop_monitor()
+    # 複数ワーカー時は /metrics で合算するためのスナップショットを定期的に書き出す
+    start_metrics_flusher()
+    # 静的コンテンツカタログを読み込み、シャドーイング文の発音キーを事前計算する
+    db = SessionLocal()
+    try:
+        reload_catalog(db)
+        index_shadowing_sentences(db)
+    except Exception:
+        # カタログ・インデックスは初回リクエスト時にも読み込まれるため起動は継続する
+        logger.exception("Failed to warm content catalog")
+    finally:
+        db.close()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    await stop_loop_monitor()
+    stop_metrics_flusher()
     # Ensure Cloud SQL Python Connector is closed (if used).
     close_cloud_sql_connector()
+    # 音声前処理のプロセスプールを終了
+    shutdown_preprocess_executor()
 
 
 @app.get("/")
@@ -29,6 +29,10 @@ from .sick_leave import SICK_LEAVE_PROMPT
 from .common_rules import get_common_conversation_rules
 from .conversation_system import get_conversation_system_prompt
 from .scenario_goals import SCENARIO_GOALS, get_goals_for_scenario
+from .scenario_initial_messages import (
+    SCENARIO_INITIAL_MESSAGES,
+    get_initial_message_for_scenario,
+)
 from .custom_scenario import (
     get_custom_scenario_prompt,
     get_custom_scenario_initial_message,
@@ -177,6 +181,7 @@ def get_available_combinations() -> list[tuple[str, str]]:
 __all__ = [
     "SCENARIO_PROMPTS",
     "SCENARIO_GOALS",
+    "SCENARIO_INITIAL_MESSAGES",
     "CATEGORY_DIFFICULTY_PROMPTS",
     "CATEGORY_PROMPTS",
     "DIFFICULTY_PROMPTS",
@@ -189,6 +194,7 @@ __all__ = [
     "get_common_conversation_rules",
     "get_conversation_system_prompt",
     "get_goals_for_scenario",
+    "get_initial_message_for_scenario",
     # カスタムシナリオ用
     "get_custom_scenario_prompt",
     "get_custom_scenario_initial_message",
@@ -0,0 +1,39 @@
+"""
+シナリオごとの初期メッセージ（AIの最初の発話）定義
+"""
+
+from typing import Dict, Optional
+
+
+SCENARIO_INITIAL_MESSAGES: Dict[int, str] = {
+    # 1–5: 既存シナリオ
+    1: "Hi, I'm the airline staff. Let's check you in for your flight. Where are you flying today?",
+    2: "Hi, thanks for joining the meeting. Could you briefly introduce yourself and your role?",
+    3: "Welcome to our restaurant! Are you ready to order, or would you like some recommendations?",
+    4: "Thanks for joining this online business call. What would you like to achieve in this negotiation?",
+    5: "Welcome to our hotel. Do you have a reservation, or would you like to book a room today?",
+    # 6–10: 旅行系シナリオ
+    6: "Let’s plan your perfect vacation together. What kind of trip are you dreaming about?",
+    7: "You’re showing a foreign friend around Japan today. Where would you like to take them first?",
+    8: "You’ve just arrived at immigration. The officer is asking you questions. How will you respond?",
+    9: "You’re talking with a friend about your next trip. Where do you want to go and why?",
+    10: "You’ve lost your wallet while traveling. How would you explain the situation to the police?",
+    # 11–14: 日常会話シナリオ
+    11: "You’re calling customer service about a problem. How would you start the conversation?",
+    12: "You’re chatting with a barista at a stylish cafe. What would you like to order today?",
+    13: "You want to get tickets for a show. How would you ask about available seats?",
+    14: "You’re talking with someone in the park. How would you start a light, friendly conversation?",
+    # 15–21: ビジネスシナリオ
+    15: "You need to reschedule a meeting. How would you politely ask to change the time?",
+    16: "You’re setting up a new meeting. Who would you like to invite and what is the purpose?",
+    17: "You’re leading a meeting. How would you open the session and share the agenda?",
+    18: "You’re negotiating contract terms. What is the most important point you want to discuss first?",
+    19: "You’re presenting customer survey results. What key finding would you like to share first?",
+    20: "Your project is delayed and you must apologize. How would you explain the situation?",
+    21: "You’re calling your manager to say you’re sick. How would you explain your condition and absence?",
+}
+
+
+def get_initial_message_for_scenario(scenario_id: int) -> Optional[str]:
+    """指定されたシナリオIDの初期メッセージを返す"""
+    return SCENARIO_INITIAL_MESSAGES.get(scenario_id)
@@ -1,26 +1,40 @@
 from __future__ import annotations
 
 import io
+import json
 import logging
-from typing import Optional
+from typing import AsyncIterator, List, Optional
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
 from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.core.deps import get_current_user
-# from app.services.ai.google_speech_provider import (
-#     GoogleSpeechProvider,
-#     TranscriptionResponse,
-# )
-# After
-from app.services.ai.whisper_provider import (
-    WhisperProvider,
-    TranscriptionResponse,
-)
+from app.core.deps import get_current_user, get_current_user_ws, get_db
+from app.services.ai.google_speech_provider import GoogleSpeechProvider
 from app.services.ai.google_tts_provider import GoogleTTSProvider
+from app.services.ai.mock_speech_provider import MockStreamingSpeechProvider
+from app.services.ai.stt_factory import stt_cache_namespace, transcribe_with_failover
+from app.services.ai.stt_registry import STTProviderRegistry
+from app.services.ai.types import (
+    SpeechProviderUnavailableError,
+    StreamingSpeechProvider,
+    StreamingTranscript,
+)
+from app.services.audio import get_or_transcribe
 from models.database.models import User
+from models.schemas.schemas import TranscriptionResponse
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +46,7 @@ async def transcribe_audio(
     audio_file: UploadFile = File(..., description="音声ファイル"),
     language: Optional[str] = "en",
     current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
 ) -> TranscriptionResponse:
     """
     音声ファイルをテキストに変換する
@@ -53,14 +68,24 @@ async def transcribe_audio(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="音声ファイルが空です"
             )
 
-        # Google Speech-to-Textで音声認識
-        async with WhisperProvider() as whisper_provider:
-            result = await whisper_provider.transcribe_audio(
+        async def _transcribe() -> TranscriptionResponse:
+            # STT_PROVIDER_ORDER に従って認識（障害時は次のプロバイダへ切り替え）
+            return await transcribe_with_failover(
                 audio_file=audio_content,
-                language=language,
                 filename=audio_file.filename or "audio.webm",
+                language=language,
             )
 
+        # 同じ録音の再送はキャッシュから返す
+        result = await get_or_transcribe(
+            audio_content,
+            language,
+            model=stt_cache_namespace(),
+            transcribe=_transcribe,
+            response_model=TranscriptionResponse,
+            db=db,
+        )
+
         logger.info(
             f"Audio transcription completed for user {current_user.id}: "
             f"duration={result.duration:.2f}s, text_length={len(result.text)}"
@@ -69,6 +94,11 @@ async def transcribe_audio(
 
         return result
 
+    except SpeechProviderUnavailableError as e:
+        logger.error(f"All STT providers failed for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
+        )
     except ValueError as e:
         logger.warning(f"Audio transcription validation error: {e}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -80,6 +110,129 @@ async def transcribe_audio(
         )
 
 
+def _create_streaming_provider() -> StreamingSpeechProvider:
+    """設定に応じたストリーミング認識プロバイダを生成する"""
+    if settings.STT_STREAMING_PROVIDER == "mock":
+        return MockStreamingSpeechProvider()
+    return GoogleSpeechProvider()
+
+
+def _transcript_message(transcript: StreamingTranscript) -> dict:
+    return {
+        "type": "final" if transcript.is_final else "partial",
+        "text": transcript.text,
+        "confidence": transcript.confidence,
+        "stability": transcript.stability,
+        "words": [
+            {
+                "word": w.word,
+                "start_seconds": w.start_seconds,
+                "end_seconds": w.end_seconds,
+            }
+            for w in transcript.words
+        ],
+    }
+
+
+@router.websocket("/stream")
+async def stream_transcription(
+    websocket: WebSocket,
+    current_user: User = Depends(get_current_user_ws),
+) -> None:
+    """
+    録音中の音声をストリーミングで認識する
+
+    プロトコル:
+        1. クライアント → {"type": "start", "language": "en-US",
+           "encoding": "webm_opus", "sample_rate_hz": 48000}（省略可）
+        2. クライアント → 音声チャンク（バイナリフレーム）を録音しながら送信
+        3. クライアント → {"type": "stop"} で送信終了
+        サーバー → {"type": "partial" | "final", "text", "words", ...} を逐次送信し、
+        最後に {"type": "end", "text": 確定テキスト全体} を送って切断する。
+    """
+    await websocket.accept()
+
+    options: dict = {}
+    pending_audio: Optional[bytes] = None
+    first = await websocket.receive()
+    if first.get("type") == "websocket.disconnect":
+        return
+    if first.get("text"):
+        try:
+            options = json.loads(first["text"])
+        except json.JSONDecodeError:
+            await websocket.send_json({"type": "error", "detail": "不正な開始メッセージです"})
+            await websocket.close(code=status.WS_1003_UNSUPPORTED_DATA)
+            return
+    else:
+        pending_audio = first.get("bytes")
+
+    # クライアントが切断したら以降の送信・close は行わない
+    client_gone = False
+
+    async def _audio_chunks() -> AsyncIterator[bytes]:
+        nonlocal client_gone
+        if options.get("type") == "stop":
+            return
+        if pending_audio:
+            yield pending_audio
+        while True:
+            message = await websocket.receive()
+            if message.get("type") == "websocket.disconnect":
+                client_gone = True
+                return
+            if message.get("bytes"):
+                yield message["bytes"]
+            elif message.get("text"):
+                try:
+                    control = json.loads(message["text"])
+                except json.JSONDecodeError:
+                    continue
+                if control.get("type") == "stop":
+                    return
+
+    final_segments: List[str] = []
+    try:
+        async with _create_streaming_provider() as provider:
+            async for transcript in provider.stream_transcribe(
+                _audio_chunks(),
+                language=options.get("language"),
+                encoding=options.get("encoding") or "webm_opus",
+                sample_rate_hz=options.get("sample_rate_hz"),
+            ):
+                if client_gone:
+                    raise WebSocketDisconnect()
+                if transcript.is_final and transcript.text:
+                    final_segments.append(transcript.text)
+                await websocket.send_json(_transcript_message(transcript))
+
+        if client_gone:
+            raise WebSocketDisconnect()
+        await websocket.send_json({"type": "end", "text": " ".join(final_segments)})
+        await websocket.close()
+    except WebSocketDisconnect:
+        logger.info(f"Streaming transcription disconnected for user {current_user.id}")
+    except ValueError as e:
+        logger.warning(f"Streaming transcription error for user {current_user.id}: {e}")
+        await _send_error_and_close(websocket, str(e), client_gone)
+    except Exception as e:
+        logger.error(f"Streaming transcription failed for user {current_user.id}: {e}")
+        await _send_error_and_close(
+            websocket, "音声認識処理中にエラーが発生しました", client_gone
+        )
+
+
+async def _send_error_and_close(websocket: WebSocket, detail: str, client_gone: bool) -> None:
+    """エラーを通知して閉じる（クライアントが切断済みなら何もしない）"""
+    if client_gone:
+        return
+    try:
+        await websocket.send_json({"type": "error", "detail": detail})
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+    except WebSocketDisconnect:
+        pass
+
+
 class TTSRequest(BaseModel):
     text: str
     voice_profile: Optional[str] = None
@@ -154,5 +307,6 @@ async def health_check() -> JSONResponse:
             "service": "audio_transcription",
             "supported_formats": ["wav", "flac", "mp3", "m4a", "ogg", "opus", "webm"],
             "max_file_size": "60MB",
+            "stt_providers": STTProviderRegistry.health_snapshot(),
         }
     )
@@ -2,9 +2,10 @@ from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
 from fastapi.responses import RedirectResponse, JSONResponse
 from fastapi.security import HTTPBearer
 from sqlalchemy.orm import Session
-from app.db.session import get_db
+from app.db.session import get_db, run_db
 from app.core.config import settings
-from app.core.deps import get_current_user, get_current_user_optional
+from app.core.deps import get_current_user, get_current_user_optional, get_read_db
+from app.services.leaderboard import remove_user
 from datetime import timedelta
 import uuid
 
@@ -37,14 +38,51 @@ security = HTTPBearer()
 logger = logging.getLogger(__name__)
 
 
+def _find_user_by_sub(db: Session, sub: str) -> Optional[User]:
+    return db.query(User).filter(User.sub == sub).first()
+
+
+def _get_or_create_user(db: Session, sub: str, name: str, email: str) -> User:
+    """sub に対応するユーザーを返す（存在しなければ作成する）
+
+    同期のDB処理なので、async のエンドポイントからは run_db 経由で呼ぶ。
+    """
+    user = _find_user_by_sub(db, sub)
+    if not user:
+        user = User(
+            id=str(uuid.uuid4()),  # Generate UUID for new user
+            sub=sub,
+            name=name,
+            email=email,
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+    return user
+
+
+def _sync_apple_user(
+    db: Session, apple_sub: str, full_name: Optional[str], apple_email: str
+) -> User:
+    """Apple ユーザーを作成し、初回以降に届いた氏名で仮の表示名を置き換える"""
+    user = _find_user_by_sub(db, apple_sub)
+    if not user:
+        return _get_or_create_user(db, apple_sub, full_name or "Apple User", apple_email)
+    if full_name and user.name == "Apple User":
+        user.name = full_name
+        db.commit()
+        db.refresh(user)
+    return user
+
+
 @router.get("/me", response_model=UserSchema)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+def get_current_user_info(current_user: User = Depends(get_current_user)):
     """Get current user information"""
     return current_user
 
 
 @router.patch("/me", response_model=UserSchema)
-async def update_current_user_info(
+def update_current_user_info(
     payload: UserUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -73,8 +111,8 @@ async def update_current_user_info(
 
 
 @router.get("/me/stats", response_model=UserStatsResponse)
-async def get_user_stats(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+def get_user_stats(
+    current_user: User = Depends(get_current_user), db: Session = Depends(get_read_db)
 ):
     """Get user statistics including streak information"""
     from app.services.streak.streak_service import StreakService
@@ -166,18 +204,13 @@ async def exchange_token(request: Request, db: Session = Depends(get_db)):
             "picture": "https://via.placeholder.com/150",
         }
 
-        user = db.query(User).filter(User.sub == mock_user_data["sub"]).first()
-
-        if not user:
-            user = User(
-                id=str(uuid.uuid4()),  # Generate UUID for new user
-                sub=mock_user_data["sub"],
-                name=mock_user_data["name"],
-                email=mock_user_data["email"],
-            )
-            db.add(user)
-            db.commit()
-            db.refresh(user)
+        user = await run_db(
+            _get_or_create_user,
+            db,
+            mock_user_data["sub"],
+            mock_user_data["name"],
+            mock_user_data["email"],
+        )
 
         access_token = create_access_token({"sub": user.sub})
         refresh_token = create_refresh_token({"sub": user.sub})
@@ -268,17 +301,13 @@ async def exchange_token(request: Request, db: Session = Depends(get_db)):
             detail="Google user info missing identifier",
         )
 
-    user = db.query(User).filter(User.sub == sub).first()
-    if not user:
-        user = User(
-            id=str(uuid.uuid4()),  # Generate UUID for new user
-            sub=sub,
-            name=profile.get("name") or profile.get("given_name") or "Google User",
-            email=profile.get("email") or "",
-        )
-        db.add(user)
-        db.commit()
-        db.refresh(user)
+    user = await run_db(
+        _get_or_create_user,
+        db,
+        sub,
+        profile.get("name") or profile.get("given_name") or "Google User",
+        profile.get("email") or "",
+    )
 
     access_token = create_access_token({"sub": user.sub})
 
@@ -345,7 +374,7 @@ async def refresh_access_token(request: Request, db: Session = Depends(get_db)):
             )
 
         # Verify user still exists
-        user = db.query(User).filter(User.sub == sub).first()
+        user = await run_db(_find_user_by_sub, db, sub)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -424,7 +453,7 @@ async def refresh_access_token(request: Request, db: Session = Depends(get_db)):
             detail="Google user info missing identifier",
         )
 
-    user = db.query(User).filter(User.sub == sub).first()
+    user = await run_db(_find_user_by_sub, db, sub)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -530,22 +559,7 @@ async def apple_token_exchange(request: Request, db: Session = Depends(get_db)):
     apple_email = payload.get("email") or ""
     full_name = body.get("full_name")
 
-    user = db.query(User).filter(User.sub == apple_sub).first()
-    if not user:
-        name = full_name or "Apple User"
-        user = User(
-            id=str(uuid.uuid4()),
-            sub=apple_sub,
-            name=name,
-            email=apple_email,
-        )
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-    elif full_name and user.name == "Apple User":
-        user.name = full_name
-        db.commit()
-        db.refresh(user)
+    user = await run_db(_sync_apple_user, db, apple_sub, full_name, apple_email)
 
     access_token = create_access_token({"sub": user.sub})
     refresh_token = create_refresh_token({"sub": user.sub})
@@ -564,7 +578,7 @@ async def apple_token_exchange(request: Request, db: Session = Depends(get_db)):
 
 
 @router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_current_user(
+def delete_current_user(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -576,8 +590,10 @@ async def delete_current_user(
             detail="User not found",
         )
     logger.info("Deleting user account: user_id=%s", user.id)
+    user_id = user.id
     db.delete(user)
     db.commit()
+    remove_user(user_id)
 
 
 @router.get("/health")
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, date
+from typing import Optional
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
 from app.core.deps import get_current_user, get_db
+from app.db.pagination import InvalidCursorError, paginate
+from app.db.session import run_db
 from app.services.ai.generate_custom_goals import generate_custom_scenario_goals
 from models.database.models import (
     User,
@@ -79,6 +82,13 @@ def get_creation_limit(
     )
 
 
+def _save_custom_scenario(db: Session, custom_scenario: CustomScenarioModel) -> CustomScenarioModel:
+    db.add(custom_scenario)
+    db.commit()
+    db.refresh(custom_scenario)
+    return custom_scenario
+
+
 @router.post("", response_model=CustomScenario, status_code=status.HTTP_201_CREATED)
 async def create_custom_scenario(
     payload: CustomScenarioCreate,
@@ -96,7 +106,7 @@ async def create_custom_scenario(
 
     # 日次制限チェック
     daily_limit = PRO_USER_DAILY_LIMIT
-    created_today = get_created_today_count(db, current_user.id)
+    created_today = await run_db(get_created_today_count, db, current_user.id)
 
     if created_today >= daily_limit:
         limit_type = "Pro" if is_pro else "無料"
@@ -129,36 +139,54 @@ async def create_custom_scenario(
         is_active=True,
     )
 
-    db.add(custom_scenario)
-    db.commit()
-    db.refresh(custom_scenario)
-
-    return custom_scenario
+    return await run_db(_save_custom_scenario, db, custom_scenario)
 
 
 @router.get("", response_model=CustomScenarioListResponse)
 def list_custom_scenarios(
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """自分のオリジナルシナリオ一覧を取得する"""
-    query = (
-        db.query(CustomScenarioModel)
-        .filter(
-            CustomScenarioModel.user_id == current_user.id,
-            CustomScenarioModel.is_active == True,
-        )
-        .order_by(CustomScenarioModel.created_at.desc())
+    """自分のオリジナルシナリオ一覧を新しい順に取得する
+
+    total_count は先頭ページ（cursor なし）でのみ返す。
+    """
+    query = db.query(CustomScenarioModel).filter(
+        CustomScenarioModel.user_id == current_user.id,
+        CustomScenarioModel.is_active == True,
     )
+    try:
+        custom_scenarios, next_cursor = paginate(
+            query,
+            CustomScenarioModel.created_at,
+            CustomScenarioModel.id,
+            limit,
+            cursor,
+            descending=True,
+        )
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
 
-    total_count = query.count()
-    custom_scenarios = query.offset(offset).limit(limit).all()
+    total_count = None
+    if cursor is None:
+        total_count = (
+            db.query(func.count(CustomScenarioModel.id))
+            .filter(
+                CustomScenarioModel.user_id == current_user.id,
+                CustomScenarioModel.is_active == True,
+            )
+            .scalar()
+        )
 
     return CustomScenarioListResponse(
         custom_scenarios=custom_scenarios,
         total_count=total_count,
+        next_cursor=next_cursor,
     )
 
 
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+from typing import Dict
+
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.logging_config import get_logger
-from app.db.session import get_db, engine
+from app.core.loop_monitor import get_loop_monitor_stats
+from app.core.metrics import AGGREGATE_PER_WORKER, Family, family, registry
+from app.db.session import get_db, engine, replica_engine
+from app.services.audio import get_cache_stats, get_preprocess_stats
+from app.services.content import get_catalog
 
 logger = get_logger(__name__)
 
@@ -42,6 +49,14 @@ def db_health_check(db: Session = Depends(get_db)):
             status_code=503, detail="Database connectivity check failed"
         ) from exc
 
+@router.get("/health/content")
+def content_health_check(db: Session = Depends(get_db)):
+    """
+    静的コンテンツカタログの状態（content_hash でワーカー間・デプロイ間の差異を確認できる）
+    """
+    return get_catalog(db).summary()
+
+
 @router.get("/debug/pool")
 async def pool_status():
     try:
@@ -56,4 +71,83 @@ async def pool_status():
         logger.exception("Pool status check failed: %s", exc)
         raise HTTPException(
             status_code=503, detail="Pool status check failed"
-        ) from exc
\ No newline at end of file
+        ) from exc
+
+
+@router.get("/debug/event-loop")
+async def event_loop_status():
+    """イベントループの停止回数と、停止時間の合計が大きい箇所（LOOP_MONITOR_ENABLED 時）"""
+    return get_loop_monitor_stats()
+
+
+def _collect_runtime_metrics() -> Dict[str, Family]:
+    """スクレイプ時点のDBプール・キャッシュ・イベントループの状態"""
+    pools = {"primary": engine.pool}
+    if replica_engine is not None:
+        pools["replica"] = replica_engine.pool
+    checked_out, overflow = [], []
+    for name, pool in pools.items():
+        # QueuePool 以外（SQLite のメモリDBなど）は数えられない
+        if hasattr(pool, "checkedout") and hasattr(pool, "overflow"):
+            checked_out.append([[name], pool.checkedout()])
+            overflow.append([[name], pool.overflow()])
+
+    cache = get_cache_stats()
+    hits = cache["hits"] + cache["shared_hits"]
+    lookups = hits + cache["misses"]
+    preprocess = get_preprocess_stats()
+    loop = get_loop_monitor_stats(top=0)
+
+    return {
+        "db_pool_checked_out": family(
+            "gauge", "Database connections currently checked out", checked_out, ("pool",)
+        ),
+        "db_pool_overflow": family(
+            "gauge", "Database connections opened beyond pool_size", overflow, ("pool",)
+        ),
+        "transcription_cache_requests_total": family(
+            "counter",
+            "Transcription cache lookups by result",
+            [
+                [["hit"], cache["hits"]],
+                [["shared_hit"], cache["shared_hits"]],
+                [["miss"], cache["misses"]],
+                [["coalesced"], cache["coalesced"]],
+            ],
+            ("result",),
+        ),
+        "transcription_cache_entries": family(
+            "gauge", "Entries in the in-process transcription cache", [[[], cache["entries"]]]
+        ),
+        # 比率は合算できないためワーカーごとに出す（全体は requests_total から計算する）
+        "transcription_cache_hit_ratio": family(
+            "gauge",
+            "Transcription cache hit ratio of this worker",
+            [[[], hits / lookups if lookups else 0.0]],
+            aggregate=AGGREGATE_PER_WORKER,
+        ),
+        "audio_preprocess_bytes_saved_total": family(
+            "counter",
+            "Bytes removed from uploaded audio by preprocessing",
+            [[[], preprocess["bytes_saved"]]],
+        ),
+        "event_loop_stalls_total": family(
+            "counter", "Event loop stalls detected by the loop monitor", [[[], loop["stalls"]]]
+        ),
+        "event_loop_blocked_seconds_total": family(
+            "counter",
+            "Time the event loop was blocked by synchronous work",
+            [[[], loop["total_blocked_ms"] / 1000]],
+        ),
+    }
+
+
+registry.register_collector(_collect_runtime_metrics)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Prometheus 形式のメトリクス（METRICS_MULTIPROC_DIR 設定時は全ワーカーの合算）"""
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
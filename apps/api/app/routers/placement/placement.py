@@ -6,251 +6,17 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_db, require_pro_user
+from app.prompts.placement_questions import PlacementQuestionSchema
+from app.services.content import PLACEMENT_QUESTIONS as QUESTIONS, get_placement_question
+from app.services.review.phonetic_index import phonetic_index
 from app.services.review.review_service import ReviewService
 from models.database.models import User
 from models.schemas.schemas import DifficultyLevel
 
 router = APIRouter(tags=["placement"])
 
-
-class PlacementQuestionSchema:
-    """静的に管理するレベル判定テストの質問定義."""
-
-    def __init__(
-        self,
-        id: int,
-        qtype: str,
-        prompt: str,
-        scenario_hint: str,
-        target_sentence: Optional[str] = None,  # Speaking用: ユーザーが読み上げる文
-        audio_text: Optional[str] = None,  # Listening用: TTS読み上げテキスト
-        puzzle_words: Optional[List[str]] = None,  # Listening用: 並べ替え単語リスト
-    ) -> None:
-        self.id = id
-        self.type = qtype  # "listening" | "speaking"
-        self.prompt = prompt
-        self.scenario_hint = scenario_hint
-        self.target_sentence = target_sentence
-        self.audio_text = audio_text
-        self.puzzle_words = puzzle_words or []
-
-
-QUESTIONS: List[PlacementQuestionSchema] = [
-    # 旅行系（listening/speaking）
-    PlacementQuestionSchema(
-        id=1,
-        qtype="listening",
-        prompt="音声を聞いて、単語を正しい順番に並べてください。",
-        scenario_hint="空港チェックイン・搭乗前",
-        audio_text="I'm about to board my flight to New York.",
-        puzzle_words=[
-            "I'm",
-            "about",
-            "to",
-            "board",
-            "my",
-            "flight",
-            "to",
-            "New",
-            "York.",
-        ],
-    ),
-    PlacementQuestionSchema(
-        id=2,
-        qtype="speaking",
-        prompt="チェックインカウンターで荷物を預けたいと伝えてください。",
-        scenario_hint="空港チェックイン・荷物預け",
-        target_sentence="I'd like to drop off my baggage, please.",
-    ),
-    PlacementQuestionSchema(
-        id=3,
-        qtype="listening",
-        prompt="音声を聞いて、単語を正しい順番に並べてください。",
-        scenario_hint="空港・ルールの説明",
-        audio_text="We're supposed to check in two hours before departure.",
-        puzzle_words=[
-            "We're",
-            "supposed",
-            "to",
-            "check",
-            "in",
-            "two",
-            "hours",
-            "before",
-            "departure.",
-        ],
-    ),
-    PlacementQuestionSchema(
-        id=4,
-        qtype="speaking",
-        prompt="ビーチリゾートで一週間過ごしたいと伝えてください。",
-        scenario_hint="最高のバケーション",
-        target_sentence="I'd love to spend a week at a beach resort.",
-    ),
-    PlacementQuestionSchema(
-        id=5,
-        qtype="speaking",
-        prompt="友達に京都を訪れることを提案してください。",
-        scenario_hint="日本を案内する",
-        target_sentence="Why don't we visit Kyoto? It's a beautiful city.",
-    ),
-    # 日常会話系
-    PlacementQuestionSchema(
-        id=6,
-        qtype="speaking",
-        prompt="警察に財布を紛失したことを報告してください。",
-        scenario_hint="財布を無くして警察に相談",
-        target_sentence="Excuse me, I lost my wallet and I'd like to report it.",
-    ),
-    PlacementQuestionSchema(
-        id=7,
-        qtype="listening",
-        prompt="音声を聞いて、単語を正しい順番に並べてください。",
-        scenario_hint="カスタマーサービスに相談",
-        audio_text="I'd like to ask about a problem with my order.",
-        puzzle_words=[
-            "I'd",
-            "like",
-            "to",
-            "ask",
-            "about",
-            "a",
-            "problem",
-            "with",
-            "my",
-            "order.",
-        ],
-    ),
-    PlacementQuestionSchema(
-        id=8,
-        qtype="speaking",
-        prompt="カフェで季節限定ドリンクを試してみたいと伝えてください。",
-        scenario_hint="おしゃれカフェで店員と雑談",
-        target_sentence="I feel like trying the seasonal drink today.",
-    ),
-    PlacementQuestionSchema(
-        id=9,
-        qtype="listening",
-        prompt="音声を聞いて、単語を正しい順番に並べてください。",
-        scenario_hint="ショーチケットを入手",
-        audio_text="I'm looking for two tickets for tonight's show.",
-        puzzle_words=[
-            "I'm",
-            "looking",
-            "for",
-            "two",
-            "tickets",
-            "for",
-            "tonight's",
-            "show.",
-        ],
-    ),
-    PlacementQuestionSchema(
-        id=10,
-        qtype="speaking",
-        prompt="公園で天気について軽く話しかけてください。",
-        scenario_hint="公園で雑談",
-        target_sentence="What a lovely day, isn't it?",
-    ),
-    # ビジネス系
-    PlacementQuestionSchema(
-        id=11,
-        qtype="speaking",
-        prompt="急用ができたのでミーティングをリスケしたいと伝えてください。",
-        scenario_hint="ミーティングをリスケする",
-        target_sentence="Something urgent came up. Could we reschedule the meeting?",
-    ),
-    PlacementQuestionSchema(
-        id=12,
-        qtype="speaking",
-        prompt="来週30分のミーティングを設定したいと伝えてください。",
-        scenario_hint="ミーティングを立てる",
-        target_sentence="Are you available for a 30-minute meeting next week?",
-    ),
-    PlacementQuestionSchema(
-        id=13,
-        qtype="listening",
-        prompt="音声を聞いて、単語を正しい順番に並べてください。",
-        scenario_hint="会議を進行する",
-        audio_text="Let's move on to the next agenda item.",
-        puzzle_words=["Let's", "move", "on", "to", "the", "next", "agenda", "item."],
-    ),
-    PlacementQuestionSchema(
-        id=14,
-        qtype="speaking",
-        prompt="契約延長の条件として割引を提案してください。",
-        scenario_hint="契約条件の交渉",
-        target_sentence="If you extend the contract, we're willing to offer a discount.",
-    ),
-    PlacementQuestionSchema(
-        id=15,
-        qtype="speaking",
-        prompt="調査結果の主要な発見を共有したいと伝えてください。",
-        scenario_hint="顧客満足度の調査結果をプレゼン",
-        target_sentence="I'd like to share the key findings from the survey.",
-    ),
-    # レベル境界を測るための少し難しめの質問
-    PlacementQuestionSchema(
-        id=16,
-        qtype="listening",
-        prompt="音声を聞いて、単語を正しい順番に並べてください。",
-        scenario_hint="プロジェクトの遅延を謝罪する",
-        audio_text="We've been trying to catch up with the schedule.",
-        puzzle_words=[
-            "We've",
-            "been",
-            "trying",
-            "to",
-            "catch",
-            "up",
-            "with",
-            "the",
-            "schedule.",
-        ],
-    ),
-    PlacementQuestionSchema(
-        id=17,
-        qtype="speaking",
-        prompt="遅延をお詫びし、再発防止策を説明してください。",
-        scenario_hint="プロジェクトの遅延を謝罪する",
-        target_sentence="I apologize for the delay. We'll make sure it doesn't happen again.",
-    ),
-    PlacementQuestionSchema(
-        id=18,
-        qtype="listening",
-        prompt="音声を聞いて、単語を正しい順番に並べてください。",
-        scenario_hint="体調不良で休む",
-        audio_text="I'm not feeling well today and need to take the day off.",
-        puzzle_words=[
-            "I'm",
-            "not",
-            "feeling",
-            "well",
-            "today",
-            "and",
-            "need",
-            "to",
-            "take",
-            "the",
-            "day",
-            "off.",
-        ],
-    ),
-    PlacementQuestionSchema(
-        id=19,
-        qtype="speaking",
-        prompt="病欠の連絡とタスクの引き継ぎを伝えてください。",
-        scenario_hint="体調不良で休む・引き継ぎ",
-        target_sentence="I need to call in sick today. I'll hand over my tasks.",
-    ),
-    PlacementQuestionSchema(
-        id=20,
-        qtype="speaking",
-        prompt="新しい話題を切り出してください。",
-        scenario_hint="ビジネスミーティング全般",
-        target_sentence="If I may, I'd like to bring up a new topic.",
-    ),
-]
+# 採点時にトークン列・発音キーを再計算しないよう事前にインデックスする
+phonetic_index.add_many(q.target_sentence for q in QUESTIONS)
 
 
 # --- Pydantic モデル ---
@@ -308,10 +74,7 @@ class PlacementSubmitRequest(BaseModel):
 
 def _get_question_by_id(question_id: int) -> Optional[PlacementQuestionSchema]:
     """IDで問題を取得"""
-    for q in QUESTIONS:
-        if q.id == question_id:
-            return q
-    return None
+    return get_placement_question(question_id)
 
 
 def _calculate_total_score(answers: List[dict]) -> int:
@@ -435,7 +198,7 @@ async def evaluate_listening(
 
 
 @router.post("/submit")
-async def submit_placement_answers(
+def submit_placement_answers(
     payload: PlacementSubmitRequest,
     current_user: User = Depends(require_pro_user),
     db: Session = Depends(get_db),
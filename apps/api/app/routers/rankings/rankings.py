@@ -1,13 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, desc
 from typing import Literal, Optional
-from datetime import datetime, timedelta, timezone
-import pytz
 import logging
 
-from app.core.deps import get_db, get_current_user
-from models.database.models import User, Session as SessionModel
+from app.core.deps import get_current_user, get_read_db
+from app.services.leaderboard import get_leaderboard
+from models.database.models import User
 from models.schemas.schemas import (
     UserPointsResponse,
     RankingsResponse,
@@ -22,8 +20,8 @@ router = APIRouter(tags=["rankings"])
 
 
 @router.get("/users/me/points", response_model=UserPointsResponse)
-async def get_user_points(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+def get_user_points(
+    current_user: User = Depends(get_current_user), db: Session = Depends(get_read_db)
 ):
     """Get current user's points summary"""
     try:
@@ -47,7 +45,7 @@ async def get_user_points(
 
 
 @router.get("/rankings", response_model=RankingsResponse)
-async def get_rankings(
+def get_rankings(
     limit: int = Query(
         default=20, ge=1, le=100, description="Number of rankings to return"
     ),
@@ -55,66 +53,41 @@ async def get_rankings(
         default="all_time", description="Ranking period"
     ),
     current_user: Optional[User] = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get rankings (top N users)"""
     try:
-        # 期間フィルタの設定
-        jst = pytz.timezone("Asia/Tokyo")
-        now_jst = datetime.now(jst)
-        now_utc = now_jst.astimezone(timezone.utc)
-
-        if period == "weekly":
-            period_start = (
-                (now_jst - timedelta(days=now_jst.weekday()))
-                .replace(hour=0, minute=0, second=0, microsecond=0)
-                .astimezone(timezone.utc)
+        leaderboard = get_leaderboard(db)
+        top = leaderboard.top(period, limit)
+
+        # 表示名・ストリークは上位N件だけ主キーで取得
+        users = {}
+        if top:
+            rows = (
+                db.query(User.id, User.name, User.current_streak)
+                .filter(User.id.in_([user_id for user_id, _points in top]))
+                .all()
             )
-        elif period == "monthly":
-            period_start = now_jst.replace(
-                day=1, hour=0, minute=0, second=0, microsecond=0
-            ).astimezone(timezone.utc)
-        else:
-            period_start = None
-
-        # ランキングクエリ
-        query = db.query(User).filter(User.total_points > 0)
-
-        # 期間フィルタ適用（all_timeの場合は全期間）
-        if period_start:
-            # 期間内にセッション完了したユーザーのみを対象
-            user_ids_with_sessions = (
-                db.query(SessionModel.user_id)
-                .filter(
-                    and_(
-                        SessionModel.ended_at.is_not(None),
-                        SessionModel.ended_at >= period_start,
-                    )
-                )
-                .distinct()
-                .subquery()
-            )
-            query = query.filter(
-                User.id.in_(db.query(user_ids_with_sessions.c.user_id))
-            )
-
-        # ポイント順でソート
-        users = query.order_by(desc(User.total_points)).limit(limit).all()
+            users = {row.id: row for row in rows}
 
         rankings = []
-        for rank, user in enumerate(users, start=1):
+        for user_id, points in top:
+            user = users.get(user_id)
+            if user is None:
+                # 退会済み（次回の再読み込みでランキングから外れる）
+                continue
             rankings.append(
                 RankingEntry(
-                    rank=rank,
-                    user_id=user.id,
+                    rank=len(rankings) + 1,
+                    user_id=user_id,
                     user_name=user.name,
-                    total_points=user.total_points or 0,
+                    total_points=points,
                     current_streak=user.current_streak or 0,
                 )
             )
 
         # 総ユーザー数（ポイントを持っているユーザー）
-        total_users = db.query(User).filter(User.total_points > 0).count()
+        total_users = leaderboard.size("all_time")
 
         return RankingsResponse(
             rankings=rankings,
@@ -129,33 +102,17 @@ async def get_rankings(
 
 
 @router.get("/rankings/me", response_model=MyRankingResponse)
-async def get_my_ranking(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+def get_my_ranking(
+    current_user: User = Depends(get_current_user), db: Session = Depends(get_read_db)
 ):
     """Get current user's ranking"""
     try:
         user_points = current_user.total_points or 0
 
-        # 自分よりポイントが高いユーザー数をカウント
-        rank = (
-            db.query(func.count(User.id))
-            .filter(User.total_points > user_points)
-            .scalar()
-        ) + 1
-
-        # 総ユーザー数
-        total_users = db.query(User).filter(User.total_points > 0).count()
-
-        # 次のランクまでのポイント差を計算
-        next_user = (
-            db.query(User)
-            .filter(User.total_points > user_points)
-            .order_by(User.total_points.asc())
-            .first()
+        # 自分より多いユーザー数・1つ上の順位とのポイント差・総ユーザー数
+        rank, points_to_next_rank, total_users = get_leaderboard(db).rank_of(
+            "all_time", user_points
         )
-        points_to_next_rank = None
-        if next_user:
-            points_to_next_rank = (next_user.total_points or 0) - user_points
 
         return MyRankingResponse(
             rank=rank,
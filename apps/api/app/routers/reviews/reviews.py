@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_db, require_pro_user
+from app.core.deps import get_db, get_read_db, require_pro_user
+from app.db.pagination import InvalidCursorError
+from app.db.session import run_db
+from app.services.review.phonetic_index import phonetic_index
 from app.services.review.review_service import ReviewService
 from app.services.review.review_question_service import ReviewQuestionService
 from models.database.models import User, ReviewItem as ReviewItemModel
@@ -35,19 +40,29 @@ def _get_cache_key(user_id: int, review_id: int) -> str:
 
 @router.get("/next", response_model=ReviewNextResponse)
 def get_next_reviews(
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
     current_user: User = Depends(require_pro_user),
     db: Session = Depends(get_db),
 ):
+    """期限が来た未完了の復習アイテムを復習期限の早い順に返す（total_count はその件数）"""
     service = ReviewService(db)
-    items = service.get_due_items(current_user.id)
+    try:
+        items, next_cursor = service.get_due_items(current_user.id, limit, cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
     total = service.count_due_items(current_user.id)
-    return ReviewNextResponse(review_items=items, total_count=total)
+    return ReviewNextResponse(
+        review_items=items, total_count=total, next_cursor=next_cursor
+    )
 
 
 @router.get("/stats", response_model=ReviewStatsResponse)
 def get_review_stats(
     current_user: User = Depends(require_pro_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """累計の復習完了率を取得する"""
     service = ReviewService(db)
@@ -79,6 +94,14 @@ def complete_review(
         ) from exc
 
 
+def _get_review_item(db: Session, review_id: int, user_id: str):
+    return (
+        db.query(ReviewItemModel)
+        .filter(ReviewItemModel.id == review_id, ReviewItemModel.user_id == user_id)
+        .first()
+    )
+
+
 @router.get("/{review_id}/questions", response_model=ReviewQuestionsResponse)
 async def get_review_questions(
     review_id: int,
@@ -87,13 +110,7 @@ async def get_review_questions(
 ):
     """復習アイテムに対するスピーキング・リスニング問題を生成する"""
     # 復習アイテムを取得
-    item = (
-        db.query(ReviewItemModel)
-        .filter(
-            ReviewItemModel.id == review_id, ReviewItemModel.user_id == current_user.id
-        )
-        .first()
-    )
+    item = await run_db(_get_review_item, db, review_id, current_user.id)
 
     if not item:
         raise HTTPException(
@@ -127,6 +144,7 @@ async def get_review_questions(
         "speaking_target": speaking.target_sentence,
         "listening_words": listening.puzzle_words,
     }
+    phonetic_index.add(speaking.target_sentence)
 
     return ReviewQuestionsResponse(
         review_item_id=item.id,
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from app.core.deps import get_current_user, get_db, require_pro_user
+from app.core.deps import get_current_user, get_db, get_read_db, require_pro_user
+from app.db.pagination import InvalidCursorError, paginate
 from models.database.models import (
     User,
     SavedPhrase as SavedPhraseModel,
@@ -94,12 +95,15 @@ def create_saved_phrase(
 
 @router.get("", response_model=SavedPhrasesListResponse)
 def list_saved_phrases(
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
-    """保存した表現一覧を取得する"""
+    """保存した表現一覧を新しい順に取得する
+
+    total_count は先頭ページ（cursor なし）でのみ返す。
+    """
     query = (
         db.query(
             SavedPhraseModel,
@@ -109,11 +113,30 @@ def list_saved_phrases(
         .outerjoin(SessionModel, SessionModel.id == SavedPhraseModel.session_id)
         .outerjoin(ScenarioModel, ScenarioModel.id == SessionModel.scenario_id)
         .filter(SavedPhraseModel.user_id == current_user.id)
-        .order_by(SavedPhraseModel.created_at.desc())
     )
+    try:
+        rows, next_cursor = paginate(
+            query,
+            SavedPhraseModel.created_at,
+            SavedPhraseModel.id,
+            limit,
+            cursor,
+            descending=True,
+            entity=lambda row: row[0],
+        )
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
 
-    total_count = query.count()
-    rows = query.offset(offset).limit(limit).all()
+    total_count = None
+    if cursor is None:
+        # 結合は件数に影響しないため saved_phrases のインデックスだけで数える
+        total_count = (
+            db.query(func.count(SavedPhraseModel.id))
+            .filter(SavedPhraseModel.user_id == current_user.id)
+            .scalar()
+        )
     saved_phrases = []
     for sp, scenario_id, scenario_name in rows:
         saved_phrases.append(
@@ -135,6 +158,7 @@ def list_saved_phrases(
     return SavedPhrasesListResponse(
         saved_phrases=saved_phrases,
         total_count=total_count,
+        next_cursor=next_cursor,
     )
 
 
@@ -142,7 +166,7 @@ def list_saved_phrases(
 def get_saved_phrase(
     saved_phrase_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """保存した表現を取得する"""
     saved_phrase = (
@@ -250,7 +274,7 @@ def check_saved_phrase(
     session_id: int,
     round_index: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """特定のセッション・ラウンドの保存状態を確認する"""
     saved_phrase = (
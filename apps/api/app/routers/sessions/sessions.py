@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, Optional
+import json
 import logging
 
 from app.core.deps import get_db, get_current_user
@@ -14,13 +16,14 @@ from models.schemas.schemas import (
     SessionStatusResponse,
 )
 from app.services.conversation.session_service import SessionService
+from app.services.conversation.voice_turn_service import VoiceTurnService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 @router.post("/start", response_model=SessionStartResponse)
-async def start_session(
+def start_session(
     session_data: SessionCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -99,8 +102,57 @@ async def process_turn(
         )
 
 
+@router.post("/{session_id}/voice-turn")
+async def process_voice_turn(
+    session_id: int,
+    audio_file: UploadFile = File(..., description="ユーザー発話の音声ファイル"),
+    language: Optional[str] = Form("en"),
+    synthesize: bool = Form(True),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    音声ターンを1リクエストで処理する（文字起こし → ターン処理 → 読み上げ音声）
+
+    /audio/transcribe → /sessions/{id}/turn → /audio/tts の3往復を置き換える。
+    レスポンスは Server-Sent Events で、準備できた順に次のイベントを送る:
+        transcript: 認識テキスト
+        reply: AI応答テキスト（ゴール判定より先に送信）
+        turn: TurnResponse 全体
+        audio: 読み上げ音声（base64 MP3）/ audio_error: 音声合成失敗
+        error: 処理失敗（status, detail）
+        done: 正常終了
+    """
+    audio_content = await audio_file.read()
+    if not audio_content:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="音声ファイルが空です"
+        )
+
+    events = VoiceTurnService(db).run(
+        session_id=session_id,
+        user_id=current_user.id,
+        audio=audio_content,
+        filename=audio_file.filename or "audio.webm",
+        language=language,
+        synthesize=synthesize,
+    )
+
+    async def _event_stream() -> AsyncIterator[str]:
+        async for item in events:
+            payload = json.dumps(item.data, ensure_ascii=False)
+            yield f"event: {item.event}\ndata: {payload}\n\n"
+        logger.info(f"Voice turn processed for session {session_id}")
+
+    return StreamingResponse(
+        _event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/{session_id}/extend", response_model=SessionStatusResponse)
-async def extend_session(
+def extend_session(
     session_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -151,7 +203,7 @@ async def end_session(
 
 
 @router.get("/{session_id}/status", response_model=SessionStatusResponse)
-async def get_session_status(
+def get_session_status(
     session_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
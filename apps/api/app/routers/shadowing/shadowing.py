@@ -11,12 +11,17 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
-from app.core.deps import get_db, get_current_user
+from app.core.deps import get_db, get_current_user, get_read_db
+from app.services.content import ContentCatalog, ScenarioEntry, get_catalog
 from app.services.review.review_service import ReviewService
+from app.services.shadowing import (
+    ScenarioProgress,
+    ShadowingProgressService,
+    ShadowingSentenceNotFoundError,
+)
+from app.services.stats import UserStatsService
 from models.database.models import (
     User,
-    Scenario,
-    ShadowingSentence,
     UserShadowingProgress,
     UserInstantTranslationProgress,
 )
@@ -32,6 +37,8 @@ from models.schemas.schemas import (
     ShadowingProgressResponse,
     ScenarioProgressSummary,
     ShadowingWordMatch,
+    ShadowingBatchRequest,
+    ShadowingBatchResponse,
 )
 
 router = APIRouter()
@@ -41,7 +48,7 @@ router = APIRouter()
 def get_scenario_shadowing(
     scenario_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     指定シナリオのシャドーイング文一覧を取得
@@ -49,21 +56,18 @@ def get_scenario_shadowing(
     - シナリオに紐づく全てのシャドーイング文を返す
     - ユーザーの進捗情報も含む
     """
+    catalog = get_catalog(db)
+
     # シナリオの存在確認
-    scenario = db.query(Scenario).filter(Scenario.id == scenario_id).first()
+    scenario = catalog.get_scenario(scenario_id)
     if not scenario:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Scenario not found",
         )
 
-    # シャドーイング文を取得
-    sentences = (
-        db.query(ShadowingSentence)
-        .filter(ShadowingSentence.scenario_id == scenario_id)
-        .order_by(ShadowingSentence.order_index)
-        .all()
-    )
+    # シャドーイング文を取得（order_index 順）
+    sentences = catalog.shadowing_for_scenario(scenario_id)
 
     # ユーザーの進捗を取得
     sentence_ids = [s.id for s in sentences]
@@ -123,7 +127,7 @@ def get_scenario_shadowing(
                 sentence_en=sentence.sentence_en,
                 sentence_ja=sentence.sentence_ja,
                 order_index=sentence.order_index,
-                difficulty=sentence.difficulty.value if hasattr(sentence.difficulty, 'value') else sentence.difficulty,
+                difficulty=sentence.difficulty,
                 audio_url=sentence.audio_url,
                 user_progress=user_progress,
                 instant_translation_progress=instant_translation_progress,
@@ -153,11 +157,7 @@ def record_shadowing_attempt(
     - 80点以上で完了とみなす
     """
     # シャドーイング文の存在確認
-    sentence = (
-        db.query(ShadowingSentence)
-        .filter(ShadowingSentence.id == sentence_id)
-        .first()
-    )
+    sentence = get_catalog(db).get_shadowing_sentence(sentence_id)
     if not sentence:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -195,8 +195,9 @@ def record_shadowing_attempt(
         is_new_best = True
 
     # 80点以上で完了とみなす
-    if request.score >= 80:
+    if request.score >= 80 and not progress.is_completed:
         progress.is_completed = True
+        UserStatsService(db).increment(current_user.id, shadowing_completed=1)
 
     db.commit()
     db.refresh(progress)
@@ -225,11 +226,7 @@ def evaluate_shadowing_speech(
     - 80点以上で完了とみなす
     """
     # シャドーイング文の存在確認
-    sentence = (
-        db.query(ShadowingSentence)
-        .filter(ShadowingSentence.id == sentence_id)
-        .first()
-    )
+    sentence = get_catalog(db).get_shadowing_sentence(sentence_id)
     if not sentence:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -273,8 +270,9 @@ def evaluate_shadowing_speech(
         is_new_best = True
 
     # 80点以上で完了とみなす
-    if eval_result.score >= 80:
+    if eval_result.score >= 80 and not progress.is_completed:
         progress.is_completed = True
+        UserStatsService(db).increment(current_user.id, shadowing_completed=1)
 
     db.commit()
     db.refresh(progress)
@@ -309,11 +307,7 @@ def evaluate_instant_translation(
     - 80点以上で完了とみなす
     """
     # シャドーイング文の存在確認
-    sentence = (
-        db.query(ShadowingSentence)
-        .filter(ShadowingSentence.id == sentence_id)
-        .first()
-    )
+    sentence = get_catalog(db).get_shadowing_sentence(sentence_id)
     if not sentence:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -378,10 +372,41 @@ def evaluate_instant_translation(
     )
 
 
+@router.post("/scenarios/{scenario_id}/attempts", response_model=ShadowingBatchResponse)
+def record_shadowing_attempts_batch(
+    scenario_id: int,
+    request: ShadowingBatchRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    シャドーイング・瞬間英作の練習結果をまとめて記録
+
+    - 1回の練習分（またはオフライン練習分）を1リクエストで送信できる
+    - 発話認識結果はサーバー側で採点、スコアのみの結果はそのまま記録
+    - 進捗はモードごとに一括 UPSERT（1トランザクション）
+    - 結果は送信順に返す（同じ文の複数回は送信順に反映）
+    """
+    service = ShadowingProgressService(db)
+    try:
+        results = service.record_attempts(
+            user_id=current_user.id,
+            scenario_id=scenario_id,
+            attempts=request.attempts,
+        )
+    except ShadowingSentenceNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+
+    return ShadowingBatchResponse(scenario_id=scenario_id, results=results)
+
+
 @router.get("/progress", response_model=ShadowingProgressResponse)
 def get_shadowing_progress(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     シャドーイング全体の進捗を取得（ホーム画面用）
@@ -391,107 +416,38 @@ def get_shadowing_progress(
     - 今日の練習回数
     - 最近練習したシナリオ一覧
     """
-    # 全シナリオ数（シャドーイング文があるもののみ）
-    scenarios_with_shadowing = (
-        db.query(Scenario.id)
-        .join(ShadowingSentence)
-        .distinct()
-        .all()
-    )
-    total_scenarios = len(scenarios_with_shadowing)
-
-    # 全シャドーイング文数
-    total_sentences = db.query(ShadowingSentence).count()
-
-    # ユーザーの進捗データを取得
-    user_progress = (
-        db.query(UserShadowingProgress)
-        .filter(UserShadowingProgress.user_id == current_user.id)
-        .all()
-    )
-
-    # 練習したシナリオ数と完了した文数を計算
-    practiced_sentence_ids = {p.shadowing_sentence_id for p in user_progress}
-    completed_sentences = sum(1 for p in user_progress if p.is_completed)
-
-    # 練習したシナリオIDを取得
-    practiced_scenarios = set()
-    if practiced_sentence_ids:
-        sentences_with_scenario = (
-            db.query(ShadowingSentence.scenario_id)
-            .filter(ShadowingSentence.id.in_(practiced_sentence_ids))
-            .distinct()
-            .all()
-        )
-        practiced_scenarios = {s[0] for s in sentences_with_scenario}
+    catalog = get_catalog(db)
 
-    # 今日の練習回数
+    # シナリオごとの進捗を1クエリで集計
     today_start = datetime.combine(date.today(), datetime.min.time())
-    today_practice_count = sum(
-        1 for p in user_progress
-        if p.last_practiced_at and p.last_practiced_at >= today_start
+    progress_by_scenario = ShadowingProgressService(db).scenario_progress(
+        current_user.id, since=today_start
     )
 
+    # 練習したシナリオ（カタログにあるもののみ）
+    practiced = [
+        progress
+        for scenario_id, progress in progress_by_scenario.items()
+        if scenario_id in catalog.shadowing_ids_by_scenario
+    ]
+
     # 最近練習したシナリオ（最大5件）
+    practiced.sort(key=lambda p: p.last_practiced_at or datetime.min, reverse=True)
     recent_scenarios: List[ScenarioProgressSummary] = []
-
-    if practiced_scenarios:
-        # 各シナリオごとの進捗を計算
-        for scenario_id in practiced_scenarios:
-            scenario = db.query(Scenario).filter(Scenario.id == scenario_id).first()
-            if not scenario:
-                continue
-
-            # シナリオのシャドーイング文数
-            scenario_sentences = (
-                db.query(ShadowingSentence)
-                .filter(ShadowingSentence.scenario_id == scenario_id)
-                .all()
-            )
-            scenario_sentence_ids = [s.id for s in scenario_sentences]
-
-            # ユーザーの進捗
-            scenario_progress = [
-                p for p in user_progress
-                if p.shadowing_sentence_id in scenario_sentence_ids
-            ]
-            completed_in_scenario = sum(1 for p in scenario_progress if p.is_completed)
-            last_practiced = max(
-                (p.last_practiced_at for p in scenario_progress if p.last_practiced_at),
-                default=None,
-            )
-
-            progress_percent = (
-                int(completed_in_scenario / len(scenario_sentences) * 100)
-                if scenario_sentences else 0
-            )
-
-            recent_scenarios.append(
-                ScenarioProgressSummary(
-                    scenario_id=scenario_id,
-                    scenario_name=scenario.name,
-                    category=scenario.category.value if hasattr(scenario.category, 'value') else scenario.category,
-                    difficulty=scenario.difficulty.value if hasattr(scenario.difficulty, 'value') else scenario.difficulty,
-                    total_sentences=len(scenario_sentences),
-                    completed_sentences=completed_in_scenario,
-                    progress_percent=progress_percent,
-                    last_practiced_at=last_practiced,
-                )
-            )
-
-        # 最終練習日時でソートして上位5件
-        recent_scenarios.sort(
-            key=lambda x: x.last_practiced_at or datetime.min,
-            reverse=True,
-        )
-        recent_scenarios = recent_scenarios[:5]
+    for progress in practiced[:5]:
+        scenario = catalog.get_scenario(progress.scenario_id)
+        recent_scenarios.append(_scenario_summary(catalog, scenario, progress))
 
     return ShadowingProgressResponse(
-        total_scenarios=total_scenarios,
-        practiced_scenarios=len(practiced_scenarios),
-        total_sentences=total_sentences,
-        completed_sentences=completed_sentences,
-        today_practice_count=today_practice_count,
+        total_scenarios=len(catalog.shadowing_ids_by_scenario),
+        practiced_scenarios=len(practiced),
+        total_sentences=len(catalog.shadowing_sentences),
+        completed_sentences=sum(
+            p.completed_sentences for p in progress_by_scenario.values()
+        ),
+        today_practice_count=sum(
+            p.practiced_since for p in progress_by_scenario.values()
+        ),
         recent_scenarios=recent_scenarios,
     )
 
@@ -500,71 +456,45 @@ def get_shadowing_progress(
 def get_all_scenarios_with_progress(
     category: Optional[str] = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     全シナリオのシャドーイング進捗一覧を取得
 
     - オプションでカテゴリフィルタ可能
     """
-    # シャドーイング文があるシナリオを取得
-    query = (
-        db.query(Scenario)
-        .join(ShadowingSentence)
-        .distinct()
-    )
-
-    if category:
-        query = query.filter(Scenario.category == category)
+    catalog = get_catalog(db)
 
-    scenarios = query.order_by(Scenario.id).all()
+    # シャドーイング文があるシナリオを取得
+    scenarios = catalog.scenarios_with_shadowing(category or None)
 
-    # ユーザーの全進捗を取得
-    user_progress = (
-        db.query(UserShadowingProgress)
-        .filter(UserShadowingProgress.user_id == current_user.id)
-        .all()
+    # シナリオごとの進捗を1クエリで集計
+    today_start = datetime.combine(date.today(), datetime.min.time())
+    progress_by_scenario = ShadowingProgressService(db).scenario_progress(
+        current_user.id, since=today_start
     )
-    progress_by_sentence = {p.shadowing_sentence_id: p for p in user_progress}
-
-    result: List[ScenarioProgressSummary] = []
-
-    for scenario in scenarios:
-        # シナリオのシャドーイング文
-        sentences = (
-            db.query(ShadowingSentence)
-            .filter(ShadowingSentence.scenario_id == scenario.id)
-            .all()
-        )
-
-        completed_count = 0
-        last_practiced = None
-
-        for sentence in sentences:
-            progress = progress_by_sentence.get(sentence.id)
-            if progress:
-                if progress.is_completed:
-                    completed_count += 1
-                if progress.last_practiced_at:
-                    if last_practiced is None or progress.last_practiced_at > last_practiced:
-                        last_practiced = progress.last_practiced_at
-
-        progress_percent = (
-            int(completed_count / len(sentences) * 100)
-            if sentences else 0
-        )
-
-        result.append(
-            ScenarioProgressSummary(
-                scenario_id=scenario.id,
-                scenario_name=scenario.name,
-                category=scenario.category.value if hasattr(scenario.category, 'value') else scenario.category,
-                difficulty=scenario.difficulty.value if hasattr(scenario.difficulty, 'value') else scenario.difficulty,
-                total_sentences=len(sentences),
-                completed_sentences=completed_count,
-                progress_percent=progress_percent,
-                last_practiced_at=last_practiced,
-            )
-        )
 
-    return result
+    return [
+        _scenario_summary(catalog, scenario, progress_by_scenario.get(scenario.id))
+        for scenario in scenarios
+    ]
+
+
+def _scenario_summary(
+    catalog: ContentCatalog,
+    scenario: ScenarioEntry,
+    progress: Optional[ScenarioProgress],
+) -> ScenarioProgressSummary:
+    """シナリオ1件分の進捗サマリー"""
+    total = len(catalog.shadowing_ids_by_scenario.get(scenario.id, ()))
+    completed = progress.completed_sentences if progress else 0
+    return ScenarioProgressSummary(
+        scenario_id=scenario.id,
+        scenario_name=scenario.name,
+        category=scenario.category,
+        difficulty=scenario.difficulty,
+        total_sentences=total,
+        completed_sentences=completed,
+        progress_percent=int(completed / total * 100) if total else 0,
+        last_practiced_at=progress.last_practiced_at if progress else None,
+    )
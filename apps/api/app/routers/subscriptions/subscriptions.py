@@ -2,6 +2,7 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, Request, status
 from sqlalchemy.orm import Session
 from app.core.deps import get_db
+from app.db.session import run_db
 from app.services.subscription.subscription_service import SubscriptionService
 from app.core.deps import verify_revenuecat_webhook
 from app.core.logging_config import get_logger
@@ -98,7 +99,7 @@ async def process_revenuecat_webhook(request: Request, db: Session = Depends(get
         )
 
     subscription_service = SubscriptionService(db)
-    user = subscription_service.get_user_by_app_user_id(app_user_id)
+    user = await run_db(subscription_service.get_user_by_app_user_id, app_user_id)
     if not user:
         logger.warning(f"User with app_user_id {app_user_id} not found")
         return JSONResponse(
@@ -106,10 +107,10 @@ async def process_revenuecat_webhook(request: Request, db: Session = Depends(get
         )
 
     if event_type in {"INITIAL_PURCHASE", "RENEWAL", "UNCANCELLATION", "TRANSFER"}:
-        subscription_service.update_user_subscription(user.id, is_pro=True)
+        await run_db(subscription_service.update_user_subscription, user.id, is_pro=True)
         logger.info(f"User {user.id} subscribed to Pro (event_type={event_type})")
     elif event_type in {"CANCELLATION", "CANCELLED", "EXPIRATION", "EXPIRED"}:
-        subscription_service.update_user_subscription(user.id, is_pro=False)
+        await run_db(subscription_service.update_user_subscription, user.id, is_pro=False)
         logger.info(f"User {user.id} unsubscribed from Pro")
     else:
         logger.warning(f"Unknown event type: {event_type}")
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import argparse
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.conversation.round_archive import SessionArchiveService
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Move rounds of long-ended sessions from session_rounds into compressed archives."
+    )
+    parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=settings.SESSION_ARCHIVE_AFTER_DAYS,
+        help="Archive sessions ended more than this many days ago (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.SESSION_ARCHIVE_BATCH_SIZE,
+        help="Sessions moved per transaction (default: %(default)s)",
+    )
+    return parser.parse_args()
+
+
+def run() -> int:
+    args = parse_args()
+    db = SessionLocal()
+    try:
+        archived = SessionArchiveService(db).archive_ended_sessions(
+            older_than_days=args.older_than_days, batch_size=args.batch_size
+        )
+    finally:
+        db.close()
+
+    print(f"{archived} session(s) archived")
+    return 0
+
+
+def main() -> int:
+    try:
+        return run()
+    except Exception as exc:
+        print(f"Session archiving failed: {exc!r}")
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
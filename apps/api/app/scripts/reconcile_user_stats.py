@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import argparse
+
+from app.db.session import SessionLocal
+from app.services.stats import UserStatsService
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Recompute user_stats counters from sessions / review items / shadowing progress."
+    )
+    parser.add_argument(
+        "--user-id",
+        action="append",
+        dest="user_ids",
+        help="Only reconcile this user (repeatable). Default: all users",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report mismatches without writing",
+    )
+    return parser.parse_args()
+
+
+def run() -> int:
+    args = parse_args()
+    db = SessionLocal()
+    try:
+        mismatches = UserStatsService(db).reconcile(args.user_ids, fix=not args.dry_run)
+    finally:
+        db.close()
+
+    for user_id, stored, expected in mismatches:
+        print(f"{user_id}: stored={stored or None} expected={expected}")
+    action = "found" if args.dry_run else "fixed"
+    print(f"{len(mismatches)} mismatched user(s) {action}")
+    return 0
+
+
+def main() -> int:
+    try:
+        return run()
+    except Exception as exc:
+        print(f"User stats reconciliation failed: {exc!r}")
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import argparse
+
+from app.db.session import SessionLocal
+from app.services.leaderboard import save_snapshots
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Save the top of each leaderboard to leaderboard_snapshots, "
+            "including the final ranking of periods that have just ended. "
+            "Run from a single scheduled job (e.g. hourly)."
+        )
+    )
+    return parser.parse_args()
+
+
+def run() -> int:
+    parse_args()
+    db = SessionLocal()
+    try:
+        saved = save_snapshots(db)
+    finally:
+        db.close()
+
+    for board, period_key in saved:
+        print(f"snapshot saved: {board} {period_key}")
+    return 0
+
+
+def main() -> int:
+    try:
+        return run()
+    except Exception as exc:
+        print(f"Leaderboard snapshot failed: {exc!r}")
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
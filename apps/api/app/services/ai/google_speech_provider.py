@@ -1,49 +1,33 @@
 from __future__ import annotations
 
 import asyncio
-import io
 import os
-import wave
-from typing import List, Optional
+import queue
+from typing import AsyncIterator, Iterator, List, Optional
 
 from google.api_core import exceptions as google_exceptions
 from google.cloud import speech
-from pydantic import BaseModel, Field
 
 from app.core.config import settings
 from app.core.logging_config import get_logger
 from app.core.cost_tracker import calculate_google_stt_cost
+from app.services.audio.preprocessing import preprocess_audio
+from app.services.audio.probe import AudioProbe, AudioProbeError, probe_audio
+from app.services.ai.types import (
+    SpeechProviderUnavailableError,
+    StreamingTranscript,
+    WordTimeOffset,
+)
+from models.schemas.schemas import TranscriptionAlternative, TranscriptionResponse
 
 logger = get_logger(__name__)
 
 
-class TranscriptionAlternative(BaseModel):
-    text: str
-    confidence: Optional[float] = None
-
-
-class TranscriptionResponse(BaseModel):
-    text: str
-    confidence: Optional[float] = None
-    language: Optional[str] = None
-    duration: Optional[float] = None
-    alternatives: List[TranscriptionAlternative] = Field(default_factory=list)
-
-
 class GoogleSpeechProvider:
     """Google Cloud Speech-to-Text provider."""
 
     _MAX_FILE_SIZE_BYTES = 60 * 1024 * 1024  # 60MB
     _MIN_FILE_SIZE_BYTES = 1 * 1024  # 1KB
-    _ALLOWED_EXTENSIONS = {
-        ".wav",
-        ".flac",
-        ".mp3",
-        ".m4a",
-        ".ogg",
-        ".opus",
-        ".webm",
-    }
 
     def __init__(self) -> None:
         # credentials_path = settings.GOOGLE_APPLICATION_CREDENTIALS or os.environ.get(
@@ -74,10 +58,17 @@ class GoogleSpeechProvider:
     ) -> TranscriptionResponse:
         """Transcribe audio bytes via Google Cloud Speech-to-Text."""
 
-        self._validate_audio_file(filename, audio_file)
+        # サイズ・形式の検証（ヘッダのみで軽いため、デコード・再エンコードを伴う前処理より先に行う）
+        probe = self._validate_audio_file(filename, audio_file)
+
+        # 前処理（有効時のみ）: モノラル16kHz化・無音トリムで送信サイズと課金秒数を削減
+        prepared = await preprocess_audio(audio_file, filename)
+        if prepared.applied:
+            audio_file, filename = prepared.audio, prepared.filename
+            probe = self._validate_audio_file(filename, audio_file)
 
-        encoding = self._detect_encoding(filename)
-        language_code = language or "en-US"
+        encoding = self._detect_encoding(probe)
+        language_code = self._to_language_code(language)
 
         config_kwargs = {
             "language_code": language_code,
@@ -91,7 +82,10 @@ class GoogleSpeechProvider:
         if encoding != speech.RecognitionConfig.AudioEncoding.ENCODING_UNSPECIFIED:
             config_kwargs["encoding"] = encoding
 
-        sample_rate = self._guess_sample_rate_hz(audio_file, encoding)
+        sample_rate = self._guess_sample_rate_hz(probe, encoding)
+        if sample_rate is None and prepared.applied:
+            # OGG_OPUS はサンプルレート指定が必須のため、前処理時のレートを使う
+            sample_rate = prepared.sample_rate
         if sample_rate:
             config_kwargs["sample_rate_hertz"] = sample_rate
 
@@ -113,7 +107,17 @@ class GoogleSpeechProvider:
         except google_exceptions.InvalidArgument as exc:
             raise ValueError("音声ファイルの形式がサポートされていません") from exc
         except google_exceptions.ResourceExhausted as exc:
-            raise ValueError("Google Speech-to-Textの利用制限に達しました") from exc
+            raise SpeechProviderUnavailableError(
+                "Google Speech-to-Textの利用制限に達しました"
+            ) from exc
+        except (
+            google_exceptions.ServerError,
+            google_exceptions.DeadlineExceeded,
+            google_exceptions.RetryError,
+        ) as exc:
+            raise SpeechProviderUnavailableError(
+                "Google Speech-to-Textが一時的に利用できません"
+            ) from exc
         except google_exceptions.GoogleAPICallError as exc:
             raise ValueError("音声認識処理に失敗しました") from exc
         except Exception as exc:  # pragma: no cover
@@ -122,8 +126,8 @@ class GoogleSpeechProvider:
         duration = asyncio.get_running_loop().time() - start_time
         latency_ms = int(duration * 1000)
 
-        # 音声時間を推定（WAVの場合は正確に計算、それ以外はファイルサイズから推定）
-        audio_duration_seconds = self._estimate_audio_duration(audio_file, encoding)
+        # 課金対象の音声時間（コンテナヘッダから取得、取れない場合はファイルサイズから推定）
+        audio_duration_seconds = self._estimate_audio_duration(audio_file, probe)
 
         # 料金計算
         calculate_google_stt_cost(
@@ -167,75 +171,204 @@ class GoogleSpeechProvider:
             alternatives=alternatives,
         )
 
-    def _validate_audio_file(self, filename: str, audio_file: bytes) -> None:
+    _STREAMING_ENCODINGS = {
+        "linear16": speech.RecognitionConfig.AudioEncoding.LINEAR16,
+        "flac": speech.RecognitionConfig.AudioEncoding.FLAC,
+        "ogg_opus": speech.RecognitionConfig.AudioEncoding.OGG_OPUS,
+        "webm_opus": speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
+        "mp3": speech.RecognitionConfig.AudioEncoding.MP3,
+    }
+
+    async def stream_transcribe(
+        self,
+        audio_chunks: AsyncIterator[bytes],
+        language: Optional[str] = None,
+        encoding: str = "webm_opus",
+        sample_rate_hz: Optional[int] = None,
+    ) -> AsyncIterator[StreamingTranscript]:
+        """録音中の音声チャンクをストリーミング認識し、途中結果・確定結果を順次返す。
+
+        gRPC の streaming_recognize は同期イテレータのため、ワーカースレッドで実行し
+        asyncio.Queue 経由でイベントループへ結果を受け渡す。
+        """
+        audio_encoding = self._STREAMING_ENCODINGS.get((encoding or "").lower())
+        if audio_encoding is None:
+            allowed = ", ".join(sorted(self._STREAMING_ENCODINGS))
+            raise ValueError(f"サポートされていないエンコーディングです。対応形式: {allowed}")
+
+        config_kwargs = {
+            "encoding": audio_encoding,
+            "language_code": language or "en-US",
+            "enable_automatic_punctuation": True,
+            "enable_word_time_offsets": True,
+            "model": "latest_long",
+        }
+        if sample_rate_hz:
+            config_kwargs["sample_rate_hertz"] = sample_rate_hz
+
+        streaming_config = speech.StreamingRecognitionConfig(
+            config=speech.RecognitionConfig(**config_kwargs),
+            interim_results=True,
+        )
+
+        loop = asyncio.get_running_loop()
+        request_queue: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        result_queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        audio_end_seconds = 0.0
+
+        def _requests() -> Iterator[speech.StreamingRecognizeRequest]:
+            while True:
+                chunk = request_queue.get()
+                if chunk is None:
+                    return
+                yield speech.StreamingRecognizeRequest(audio_content=chunk)
+
+        def _consume() -> None:
+            try:
+                responses = self._client.streaming_recognize(
+                    config=streaming_config, requests=_requests()
+                )
+                for response in responses:
+                    for result in response.results:
+                        loop.call_soon_threadsafe(result_queue.put_nowait, result)
+            except Exception as exc:  # noqa: BLE001
+                loop.call_soon_threadsafe(result_queue.put_nowait, exc)
+            finally:
+                loop.call_soon_threadsafe(result_queue.put_nowait, done)
+
+        async def _pump() -> None:
+            try:
+                async for chunk in audio_chunks:
+                    if chunk:
+                        request_queue.put(chunk)
+            finally:
+                request_queue.put(None)
+
+        start_time = loop.time()
+        pump_task = asyncio.create_task(_pump())
+        consumer = asyncio.create_task(asyncio.to_thread(_consume))
+
+        try:
+            while True:
+                item = await result_queue.get()
+                if item is done:
+                    break
+                if isinstance(item, google_exceptions.GoogleAPICallError):
+                    raise ValueError("ストリーミング音声認識に失敗しました") from item
+                if isinstance(item, Exception):
+                    raise ValueError(
+                        "ストリーミング音声認識中に予期せぬエラーが発生しました"
+                    ) from item
+
+                transcript = self._to_streaming_transcript(item)
+                if transcript is None:
+                    continue
+                end_time = getattr(item, "result_end_time", None)
+                if end_time is not None:
+                    audio_end_seconds = max(
+                        audio_end_seconds, _duration_seconds(end_time)
+                    )
+                yield transcript
+        finally:
+            # クライアント切断時も gRPC ストリームを確実に閉じる
+            request_queue.put(None)
+            pump_task.cancel()
+            await asyncio.gather(pump_task, consumer, return_exceptions=True)
+
+            if audio_end_seconds > 0:
+                calculate_google_stt_cost(
+                    audio_duration_seconds=audio_end_seconds,
+                    latency_ms=int((loop.time() - start_time) * 1000),
+                )
+
+    @staticmethod
+    def _to_streaming_transcript(result) -> Optional[StreamingTranscript]:
+        if not result.alternatives:
+            return None
+
+        primary = result.alternatives[0]
+        words = [
+            WordTimeOffset(
+                word=info.word,
+                start_seconds=_duration_seconds(info.start_time),
+                end_seconds=_duration_seconds(info.end_time),
+            )
+            for info in (primary.words if result.is_final else [])
+        ]
+        return StreamingTranscript(
+            text=primary.transcript.strip(),
+            is_final=bool(result.is_final),
+            confidence=(primary.confidence or None) if result.is_final else None,
+            stability=None if result.is_final else (result.stability or None),
+            words=words,
+        )
+
+    def _validate_audio_file(self, filename: str, audio_file: bytes) -> AudioProbe:
+        """サイズと中身（コンテナヘッダ）を検証し、解析結果を返す"""
         if len(audio_file) < self._MIN_FILE_SIZE_BYTES:
             raise ValueError("音声ファイルが小さすぎます")
 
         if len(audio_file) > self._MAX_FILE_SIZE_BYTES:
             raise ValueError("音声ファイルが大きすぎます（最大60MB）")
 
-        extension = self._extract_extension(filename)
-        if extension not in self._ALLOWED_EXTENSIONS:
-            allowed = ", ".join(
-                sorted(ext.strip(".") for ext in self._ALLOWED_EXTENSIONS)
-            )
+        # 拡張子ではなく中身で判定する（形式違いのファイルをAPI送信前に弾く）
+        try:
+            probe = probe_audio(audio_file)
+        except AudioProbeError as exc:
+            raise ValueError(str(exc)) from exc
+
+        if (probe.container, probe.codec) not in self._SUPPORTED_CODECS:
             raise ValueError(
-                f"サポートされていないファイル形式です。対応形式: {allowed}"
+                f"サポートされていない音声形式です（{probe.container}/{probe.codec}）"
             )
+        return probe
+
+    # (コンテナ, コーデック) -> Speech-to-Text のエンコーディング
+    _SUPPORTED_CODECS = {
+        ("wav", "pcm"): speech.RecognitionConfig.AudioEncoding.LINEAR16,
+        ("wav", "mulaw"): speech.RecognitionConfig.AudioEncoding.MULAW,
+        ("flac", "flac"): speech.RecognitionConfig.AudioEncoding.FLAC,
+        ("mp3", "mp3"): speech.RecognitionConfig.AudioEncoding.MP3,
+        ("ogg", "opus"): speech.RecognitionConfig.AudioEncoding.OGG_OPUS,
+        ("webm", "opus"): speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
+    }
 
-    def _detect_encoding(self, filename: str) -> speech.RecognitionConfig.AudioEncoding:
-        extension = self._extract_extension(filename)
-
-        mapping = {
-            ".wav": speech.RecognitionConfig.AudioEncoding.LINEAR16,
-            ".flac": speech.RecognitionConfig.AudioEncoding.FLAC,
-            ".mp3": speech.RecognitionConfig.AudioEncoding.MP3,
-            ".ogg": speech.RecognitionConfig.AudioEncoding.OGG_OPUS,
-            ".opus": speech.RecognitionConfig.AudioEncoding.OGG_OPUS,
-            ".webm": speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
-        }
-
-        return mapping.get(
-            extension, speech.RecognitionConfig.AudioEncoding.ENCODING_UNSPECIFIED
+    def _detect_encoding(
+        self, probe: AudioProbe
+    ) -> speech.RecognitionConfig.AudioEncoding:
+        return self._SUPPORTED_CODECS.get(
+            (probe.container, probe.codec),
+            speech.RecognitionConfig.AudioEncoding.ENCODING_UNSPECIFIED,
         )
 
-    def _extract_extension(self, filename: str) -> str:
-        if "." not in filename:
-            return ""
-        return f".{filename.lower().rsplit('.', 1)[-1]}"
+    # Whisper 形式（ISO-639-1）の言語指定を BCP-47 に変換する
+    _DEFAULT_REGIONS = {"en": "en-US", "ja": "ja-JP"}
+
+    def _to_language_code(self, language: Optional[str]) -> str:
+        if not language:
+            return "en-US"
+        return self._DEFAULT_REGIONS.get(language.lower(), language)
 
     def _guess_sample_rate_hz(
         self,
-        audio_file: bytes,
+        probe: AudioProbe,
         encoding: speech.RecognitionConfig.AudioEncoding,
     ) -> Optional[int]:
-        if encoding != speech.RecognitionConfig.AudioEncoding.LINEAR16:
+        if encoding not in (
+            speech.RecognitionConfig.AudioEncoding.LINEAR16,
+            speech.RecognitionConfig.AudioEncoding.MULAW,
+            speech.RecognitionConfig.AudioEncoding.FLAC,
+        ):
             return None
+        return probe.sample_rate
 
-        try:
-            with wave.open(io.BytesIO(audio_file)) as wav_file:
-                return wav_file.getframerate()
-        except Exception:
-            return None
+    def _estimate_audio_duration(self, audio_file: bytes, probe: AudioProbe) -> float:
+        """音声ファイルの長さを返す（秒）"""
+        if probe.duration_seconds is not None:
+            return probe.duration_seconds
 
-    def _estimate_audio_duration(
-        self,
-        audio_file: bytes,
-        encoding: speech.RecognitionConfig.AudioEncoding,
-    ) -> float:
-        """音声ファイルの長さを推定する（秒）"""
-        # WAVファイルの場合は正確に計算
-        if encoding == speech.RecognitionConfig.AudioEncoding.LINEAR16:
-            try:
-                with wave.open(io.BytesIO(audio_file)) as wav_file:
-                    frames = wav_file.getnframes()
-                    rate = wav_file.getframerate()
-                    if rate > 0:
-                        return frames / rate
-            except Exception:
-                pass
-
-        # その他の形式はファイルサイズから概算（平均ビットレート128kbps想定）
+        # ヘッダに長さが無い場合はファイルサイズから概算（平均ビットレート128kbps想定）
         # 128kbps = 16KB/sec
         estimated_bitrate_kbps = 128
         file_size_kb = len(audio_file) / 1024
@@ -255,3 +388,13 @@ class GoogleSpeechProvider:
         )
         if callable(transport_close):
             await asyncio.to_thread(transport_close)
+
+
+def _duration_seconds(value) -> float:
+    """proto-plus の Duration（timedelta）を秒に変換する"""
+    if value is None:
+        return 0.0
+    total_seconds = getattr(value, "total_seconds", None)
+    if callable(total_seconds):
+        return float(total_seconds())
+    return float(getattr(value, "seconds", 0)) + getattr(value, "nanos", 0) / 1e9
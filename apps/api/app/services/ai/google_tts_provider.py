@@ -8,7 +8,8 @@ from typing import Optional
 from google.api_core import exceptions as google_exceptions
 from google.cloud import texttospeech
 
-from app.core.cost_tracker import calculate_google_tts_cost
+from app.core.cost_tracker import ServiceType, calculate_google_tts_cost
+from app.core.metrics import UPSTREAM_ERRORS
 
 logger = logging.getLogger(__name__)
 
@@ -71,16 +72,19 @@ class GoogleTTSProvider:
                 audio_config=audio_config,
             )
         except google_exceptions.GoogleAPICallError as exc:
+            UPSTREAM_ERRORS.labels(ServiceType.GOOGLE_TTS.value).inc()
             logger.error(f"Google Text-to-Speech APIの呼び出しに失敗しました")
             raise ValueError(
                 f"error message: {str(exc.message)}"
             ) from exc
         except google_exceptions.RetryError as exc:
+            UPSTREAM_ERRORS.labels(ServiceType.GOOGLE_TTS.value).inc()
             logger.error(f"Google Text-to-Speech APIの再試行が上限に達しました")
             raise ValueError(
                 f"error message: {str(exc.message)}"
             ) from exc
         except Exception as exc:  # pragma: no cover
+            UPSTREAM_ERRORS.labels(ServiceType.GOOGLE_TTS.value).inc()
             raise ValueError(f"error message: {str(exc.message)}") from exc
 
         latency_ms = int((time.perf_counter() - start_time) * 1000)
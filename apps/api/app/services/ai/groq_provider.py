@@ -7,7 +7,8 @@ import httpx
 
 from app.core.config import settings
 from app.core.logging_config import get_logger
-from app.core.cost_tracker import calculate_groq_cost
+from app.core.cost_tracker import ServiceType, calculate_groq_cost
+from app.core.metrics import UPSTREAM_ERRORS
 from models.schemas.schemas import DifficultyLevel, ScenarioCategory
 
 from .types import ConversationProvider, ConversationResponse
@@ -104,13 +105,16 @@ class GroqConversationProvider(ConversationProvider):
                 should_end_session,
             ) = self._parse_response(content)
         except httpx.ReadTimeout as exc:
+            UPSTREAM_ERRORS.labels(ServiceType.GROQ.value).inc()
             # OpenAI側のタイムアウトはアプリ側で扱いやすいように TimeoutError にラップして伝播させる
             logger.warning("Groq request timed out: %s", exc)
             raise TimeoutError("Groq request timed out") from exc
         except httpx.HTTPError as exc:
+            UPSTREAM_ERRORS.labels(ServiceType.GROQ.value).inc()
             logger.exception("HTTP error while calling Groq: %s", exc)
             raise
         except Exception as exc:  # noqa: BLE001
+            UPSTREAM_ERRORS.labels(ServiceType.GROQ.value).inc()
             logger.exception("Failed to generate AI response via Groq: %s", exc)
             raise
 
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import AsyncIterator, List, Optional
+
+from .types import StreamingSpeechProvider, StreamingTranscript, WordTimeOffset
+
+MOCK_TRANSCRIPT = "I would like to check in for my flight to New York."
+
+# モックで1単語あたりに割り当てる発話時間（秒）
+_SECONDS_PER_WORD = 0.4
+
+
+class MockStreamingSpeechProvider(StreamingSpeechProvider):
+    """Google ストリーミング認識のローカル代替（開発・テスト用）。
+
+    受信したチャンクごとに固定文の単語を1つずつ進めた途中結果を返し、
+    音声の終端で単語タイムスタンプ付きの確定結果を返す。
+    """
+
+    def __init__(self, transcript: str = MOCK_TRANSCRIPT) -> None:
+        self._words = transcript.split()
+
+    async def stream_transcribe(
+        self,
+        audio_chunks: AsyncIterator[bytes],
+        language: Optional[str] = None,
+        encoding: str = "webm_opus",
+        sample_rate_hz: Optional[int] = None,
+    ) -> AsyncIterator[StreamingTranscript]:
+        received = 0
+        async for chunk in audio_chunks:
+            if not chunk:
+                continue
+            received += 1
+            yield StreamingTranscript(
+                text=" ".join(self._words[: min(received, len(self._words))]),
+                is_final=False,
+                stability=0.5,
+            )
+
+        if received == 0:
+            return
+
+        words: List[WordTimeOffset] = [
+            WordTimeOffset(
+                word=word,
+                start_seconds=round(i * _SECONDS_PER_WORD, 3),
+                end_seconds=round((i + 1) * _SECONDS_PER_WORD, 3),
+            )
+            for i, word in enumerate(self._words)
+        ]
+        yield StreamingTranscript(
+            text=" ".join(self._words),
+            is_final=True,
+            confidence=0.9,
+            words=words,
+        )
+
+    async def __aenter__(self) -> "MockStreamingSpeechProvider":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
@@ -7,7 +7,8 @@ import httpx
 
 from app.core.config import settings
 from app.core.logging_config import get_logger
-from app.core.cost_tracker import calculate_openai_cost
+from app.core.cost_tracker import ServiceType, calculate_openai_cost
+from app.core.metrics import UPSTREAM_ERRORS
 from models.schemas.schemas import DifficultyLevel, ScenarioCategory
 
 from .types import ConversationProvider, ConversationResponse
@@ -106,13 +107,16 @@ class OpenAIConversationProvider(ConversationProvider):
                 should_end_session,
             ) = self._parse_response(content)
         except httpx.ReadTimeout as exc:
+            UPSTREAM_ERRORS.labels(ServiceType.OPENAI.value).inc()
             # OpenAI側のタイムアウトはアプリ側で扱いやすいように TimeoutError にラップして伝播させる
             logger.warning("OpenAI request timed out: %s", exc)
             raise TimeoutError("OpenAI request timed out") from exc
         except httpx.HTTPError as exc:
+            UPSTREAM_ERRORS.labels(ServiceType.OPENAI.value).inc()
             logger.exception("HTTP error while calling OpenAI: %s", exc)
             raise
         except Exception as exc:  # noqa: BLE001
+            UPSTREAM_ERRORS.labels(ServiceType.OPENAI.value).inc()
             logger.exception("Failed to generate AI response via OpenAI: %s", exc)
             raise
 
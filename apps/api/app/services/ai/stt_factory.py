@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import Optional
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.services.audio.probe import try_probe_audio
+from models.schemas.schemas import TranscriptionResponse
+from .google_speech_provider import GoogleSpeechProvider
+from .stt_registry import STTProviderRegistry
+from .types import SpeechProviderUnavailableError
+from .whisper_provider import WhisperProvider
+
+logger = get_logger(__name__)
+
+
+def _google_speech_configured() -> bool:
+    """Google の認証情報（ADC）が使える環境か（鍵ファイル指定、または Cloud Run 上）"""
+    return bool(os.environ.get("GOOGLE_APPLICATION_CREDENTIALS") or os.environ.get("K_SERVICE"))
+
+
+def initialize_stt_providers() -> None:
+    """設定済みのSTTプロバイダを登録する（アプリ起動時に呼ぶ）"""
+    if settings.OPENAI_API_KEY:
+        STTProviderRegistry.register("whisper", WhisperProvider)
+    if _google_speech_configured():
+        STTProviderRegistry.register("google", GoogleSpeechProvider)
+
+
+def stt_cache_namespace() -> str:
+    """認識結果キャッシュのキーに含めるルーティング設定"""
+    return "stt:" + ",".join(settings.STT_PROVIDER_ORDER)
+
+
+async def transcribe_with_failover(
+    audio_file: bytes,
+    filename: str,
+    language: Optional[str] = None,
+) -> TranscriptionResponse:
+    """
+    ルーティング方針に従ってSTTプロバイダを選び、音声を認識する
+
+    429 / 5xx / タイムアウトなどプロバイダ側の障害時は次のプロバイダへ切り替える。
+    音声形式不正など入力起因のエラー（ValueError）は切り替えずにそのまま送出する。
+    """
+    probe = try_probe_audio(audio_file)
+    candidates = STTProviderRegistry.route(probe.duration_seconds if probe else None)
+    if not candidates:
+        raise SpeechProviderUnavailableError("利用可能な音声認識プロバイダがありません")
+
+    last_error: Optional[SpeechProviderUnavailableError] = None
+    for name in candidates:
+        start_time = time.perf_counter()
+        try:
+            provider = STTProviderRegistry.get_provider(name)()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("STT provider %s could not be initialized: %s", name, exc)
+            STTProviderRegistry.record_failure(name)
+            last_error = SpeechProviderUnavailableError(str(exc))
+            continue
+
+        try:
+            async with provider:
+                result = await asyncio.wait_for(
+                    provider.transcribe_audio(
+                        audio_file=audio_file, filename=filename, language=language
+                    ),
+                    timeout=settings.STT_PROVIDER_TIMEOUT_SECONDS,
+                )
+        except SpeechProviderUnavailableError as exc:
+            logger.warning("STT provider %s unavailable: %s", name, exc)
+            STTProviderRegistry.record_failure(name)
+            last_error = exc
+            continue
+        except asyncio.TimeoutError:
+            logger.warning("STT provider %s timed out", name)
+            STTProviderRegistry.record_failure(name)
+            last_error = SpeechProviderUnavailableError("音声認識がタイムアウトしました")
+            continue
+
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        STTProviderRegistry.record_success(name, latency_ms)
+        if last_error is not None:
+            logger.info("STT request served by fallback provider %s", name)
+        result.provider = name
+        return result
+
+    assert last_error is not None
+    raise last_error
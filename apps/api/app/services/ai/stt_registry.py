@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Type
+
+from app.core.config import settings
+from app.core.cost_tracker import ServiceType
+from app.core.metrics import UPSTREAM_ERRORS
+from .types import SpeechToTextProvider
+
+# レイテンシ移動平均の平滑化係数
+_LATENCY_EWMA_ALPHA = 0.3
+
+# /metrics の service ラベル（料金計算と同じ名前に揃える）
+_METRIC_SERVICES = {
+    "whisper": ServiceType.WHISPER.value,
+    "google": ServiceType.GOOGLE_STT.value,
+}
+
+
+@dataclass
+class ProviderHealth:
+    """STTプロバイダごとの稼働状況"""
+
+    latency_ms: Optional[float] = None  # 成功時レイテンシの指数移動平均
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    unavailable_until: float = 0.0  # time.monotonic() 基準
+
+    def to_dict(self) -> dict:
+        return {
+            "latency_ms": round(self.latency_ms) if self.latency_ms is not None else None,
+            "successes": self.successes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "available": self.unavailable_until <= time.monotonic(),
+        }
+
+
+class STTProviderRegistry:
+    """Registry to manage speech-to-text providers with health-aware routing."""
+
+    _providers: Dict[str, Type[SpeechToTextProvider]] = {}
+    _health: Dict[str, ProviderHealth] = {}
+
+    @classmethod
+    def register(cls, name: str, provider_cls: Type[SpeechToTextProvider]) -> None:
+        cls._providers[name] = provider_cls
+        cls._health.setdefault(name, ProviderHealth())
+
+    @classmethod
+    def get_provider(cls, name: str) -> Type[SpeechToTextProvider]:
+        provider_cls = cls._providers.get(name)
+        if not provider_cls:
+            raise ValueError(f"STT provider '{name}' is not registered")
+        return provider_cls
+
+    @classmethod
+    def registered(cls) -> List[str]:
+        return list(cls._providers)
+
+    @classmethod
+    def record_success(cls, name: str, latency_ms: float) -> None:
+        health = cls._health.setdefault(name, ProviderHealth())
+        health.successes += 1
+        health.consecutive_failures = 0
+        health.unavailable_until = 0.0
+        if health.latency_ms is None:
+            health.latency_ms = latency_ms
+        else:
+            health.latency_ms += _LATENCY_EWMA_ALPHA * (latency_ms - health.latency_ms)
+
+    @classmethod
+    def record_failure(cls, name: str) -> None:
+        health = cls._health.setdefault(name, ProviderHealth())
+        health.failures += 1
+        health.consecutive_failures += 1
+        UPSTREAM_ERRORS.labels(_METRIC_SERVICES.get(name, name)).inc()
+        if health.consecutive_failures >= settings.STT_FAILURE_THRESHOLD:
+            # 連続失敗したプロバイダは一定時間ルーティング対象から外す
+            health.unavailable_until = (
+                time.monotonic() + settings.STT_FAILURE_COOLDOWN_SECONDS
+            )
+
+    @classmethod
+    def is_available(cls, name: str) -> bool:
+        health = cls._health.get(name)
+        return health is None or health.unavailable_until <= time.monotonic()
+
+    @classmethod
+    def route(cls, audio_duration_seconds: Optional[float] = None) -> List[str]:
+        """試行するプロバイダ名を優先順に返す
+
+        STT_PROVIDER_ORDER の順を基本とし、休止中のプロバイダは後回しにする。
+        STT_LATENCY_ROUTING_MAX_SECONDS 以下の短いクリップは計測レイテンシの速い順に並べる。
+        """
+        configured = [
+            name for name in settings.STT_PROVIDER_ORDER if name in cls._providers
+        ]
+        healthy = [name for name in configured if cls.is_available(name)]
+        # 全プロバイダが休止中の場合も、リクエスト自体は試す（半開状態）
+        resting = [name for name in configured if name not in healthy]
+
+        max_seconds = settings.STT_LATENCY_ROUTING_MAX_SECONDS
+        if (
+            max_seconds > 0
+            and audio_duration_seconds is not None
+            and audio_duration_seconds <= max_seconds
+        ):
+            healthy.sort(key=cls._measured_latency)
+        return healthy + resting
+
+    @classmethod
+    def health_snapshot(cls) -> Dict[str, dict]:
+        return {name: cls._health[name].to_dict() for name in cls._providers}
+
+    @classmethod
+    def clear(cls) -> None:
+        """Reset provider registry (primarily for testing)."""
+        cls._providers.clear()
+        cls._health.clear()
+
+    @classmethod
+    def _measured_latency(cls, name: str) -> float:
+        latency = cls._health[name].latency_ms
+        return latency if latency is not None else math.inf
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Optional, Protocol
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Protocol
+
+if TYPE_CHECKING:  # pragma: no cover
+    from models.schemas.schemas import TranscriptionResponse
 
 
 @dataclass
@@ -30,3 +33,54 @@ class ConversationProvider(Protocol):
         goals_info: Optional[dict] = None,  # ゴール誘導用
     ) -> ConversationResponse:
         ...
+
+
+@dataclass
+class WordTimeOffset:
+    word: str
+    start_seconds: float
+    end_seconds: float
+
+
+@dataclass
+class StreamingTranscript:
+    text: str
+    is_final: bool
+    confidence: Optional[float] = None
+    stability: Optional[float] = None
+    words: List[WordTimeOffset] = field(default_factory=list)
+
+
+class StreamingSpeechProvider(Protocol):
+    def stream_transcribe(
+        self,
+        audio_chunks: AsyncIterator[bytes],
+        language: Optional[str] = None,
+        encoding: str = "webm_opus",
+        sample_rate_hz: Optional[int] = None,
+    ) -> AsyncIterator[StreamingTranscript]:
+        ...
+
+
+class SpeechToTextProvider(Protocol):
+    async def transcribe_audio(
+        self,
+        audio_file: bytes,
+        filename: str,
+        language: Optional[str] = None,
+    ) -> "TranscriptionResponse":
+        ...
+
+    async def __aenter__(self) -> "SpeechToTextProvider":
+        ...
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        ...
+
+
+class SpeechProviderUnavailableError(ValueError):
+    """STTプロバイダが一時的に利用できない（429 / 5xx / タイムアウト / 接続失敗）。
+
+    ValueError を継承しているため既存のエラーハンドリングはそのまま動作し、
+    STTレジストリはこの例外を受けて次のプロバイダへフェイルオーバーする。
+    """
@@ -1,26 +1,19 @@
 import asyncio
 import logging
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import Optional
 import httpx
 
 from app.core.config import settings
+from app.core.cost_tracker import calculate_whisper_cost
+from app.services.audio.preprocessing import preprocess_audio
+from app.services.audio.probe import AudioProbe, AudioProbeError, probe_audio
+from app.services.ai.types import SpeechProviderUnavailableError
+from models.schemas.schemas import TranscriptionResponse
 
 logger = logging.getLogger(__name__)
 
 WHISPER_API_URL = "https://api.openai.com/v1/audio/transcriptions"
 
-class TranscriptionAlternative(BaseModel):
-    text: str
-    confidence: Optional[float] = None
-
-class TranscriptionResponse(BaseModel):
-    text: str
-    confidence: Optional[float] = None
-    language: Optional[str] = "en"
-    duration: Optional[float] = None
-    alternatives: List[TranscriptionAlternative] = Field(default_factory=list)
-
 
 class WhisperProvider:
     def __init__(self) -> None:
@@ -42,8 +35,17 @@ class WhisperProvider:
         start_time = asyncio.get_event_loop().time()
 
         try:
-            # ファイル形式の検証
-            self._validate_audio_file(filename, audio_file)
+            # ファイル形式の検証（ヘッダのみで軽いため、デコード・再エンコードを伴う前処理より先に行う）
+            probe = self._validate_audio_file(filename, audio_file)
+
+            # 前処理（有効時のみ）: モノラル16kHz化・無音トリムで送信サイズと課金秒数を削減
+            prepared = await preprocess_audio(audio_file, filename)
+            if prepared.applied:
+                audio_file, filename = prepared.audio, prepared.filename
+                probe = self._validate_audio_file(filename, audio_file)
+
+            # Whisperは拡張子で形式を判定するため、中身に合わせて補正
+            filename = self._normalize_filename(filename, probe)
 
             # リクエストデータの準備
             files = {"file": (filename, audio_file, self._get_content_type(filename))}
@@ -53,7 +55,8 @@ class WhisperProvider:
             }
 
             if language:
-                data["language"] = language
+                # Whisper は ISO-639-1（"en"）のみ受け付けるため地域部分を落とす
+                data["language"] = language.split("-")[0].lower()
 
             response = await self._client.post(WHISPER_API_URL, files=files, data=data)
             response.raise_for_status()
@@ -61,6 +64,13 @@ class WhisperProvider:
             result = response.json()
             duration = asyncio.get_event_loop().time() - start_time
 
+            audio_duration_seconds = probe.duration_seconds or result.get("duration")
+            if audio_duration_seconds:
+                calculate_whisper_cost(
+                    audio_duration_seconds=float(audio_duration_seconds),
+                    latency_ms=int(duration * 1000),
+                )
+
             return TranscriptionResponse(
                 text=result.get("text", ""),
                 confidence=result.get("confidence"),
@@ -86,44 +96,64 @@ class WhisperProvider:
             elif e.response.status_code == 401:
                 raise ValueError("API認証に失敗しました。設定を確認してください。")
             elif e.response.status_code == 429:
-                raise ValueError(
+                raise SpeechProviderUnavailableError(
                     "APIの利用制限に達しました。しばらく待ってから再試行してください。"
                 )
+            elif e.response.status_code >= 500:
+                raise SpeechProviderUnavailableError(
+                    f"音声認識に失敗しました: {e.response.status_code}"
+                )
             else:
                 raise ValueError(f"音声認識に失敗しました: {e.response.status_code}")
         except httpx.TimeoutException:
             logger.error("Whisper API timeout")
-            raise ValueError(
+            raise SpeechProviderUnavailableError(
                 "音声認識の処理時間が長すぎます。ファイルサイズを小さくして再試行してください。"
             )
         except httpx.ConnectError:
             logger.error("Whisper API connection error")
-            raise ValueError(
+            raise SpeechProviderUnavailableError(
                 "音声認識サービスに接続できません。ネットワーク接続を確認してください。"
             )
         except Exception as exc:
             logger.exception("Failed to transcribe audio via Whisper: %s", exc)
             raise ValueError(f"音声認識処理中にエラーが発生しました: {str(exc)}")
 
-    def _validate_audio_file(self, filename: str, audio_file: bytes) -> None:
-        """音声ファイルの検証"""
+    # Whisper が受け付けるコンテナ
+    _ALLOWED_CONTAINERS = {"mp3", "wav", "mp4", "flac", "webm", "ogg"}
+
+    def _validate_audio_file(self, filename: str, audio_file: bytes) -> AudioProbe:
+        """音声ファイルの検証（拡張子ではなくコンテナヘッダで判定）"""
         # ファイルサイズチェック（25MB制限）
         max_size = 25 * 1024 * 1024  # 25MB
         if len(audio_file) > max_size:
             raise ValueError(f"音声ファイルが大きすぎます（最大25MB）")
 
-        # ファイル形式チェック
-        allowed_extensions = {".mp3", ".wav", ".m4a", ".flac", ".webm", ".mp4"}
-        file_ext = filename.lower().split(".")[-1] if "." in filename else ""
-        if f".{file_ext}" not in allowed_extensions:
-            raise ValueError(
-                f"サポートされていないファイル形式です。対応形式: {', '.join(allowed_extensions)}"
-            )
-
         # 最小サイズチェック（空ファイル防止）
         if len(audio_file) < 1024:  # 1KB
             raise ValueError("音声ファイルが小さすぎます")
 
+        # ファイル形式チェック
+        try:
+            probe = probe_audio(audio_file)
+        except AudioProbeError as exc:
+            raise ValueError(str(exc)) from exc
+        if probe.container not in self._ALLOWED_CONTAINERS:
+            allowed = ", ".join(sorted(self._ALLOWED_CONTAINERS))
+            raise ValueError(f"サポートされていないファイル形式です。対応形式: {allowed}")
+        return probe
+
+    def _normalize_filename(self, filename: str, probe: AudioProbe) -> str:
+        """拡張子がコンテナと一致しない場合は中身に合わせて付け替える"""
+        stem, _, ext = filename.rpartition(".")
+        if not stem:
+            stem, ext = filename or "audio", ""
+        ext = f".{ext.lower()}" if ext else ""
+        equivalents = {".m4a": {".m4a", ".mp4"}, ".ogg": {".ogg", ".opus"}}
+        if ext in equivalents.get(probe.extension, {probe.extension}):
+            return filename
+        return f"{stem}{probe.extension}"
+
     def _get_content_type(self, filename: str) -> str:
         """ファイル名からContent-Typeを取得"""
         ext = filename.lower().split(".")[-1] if "." in filename else ""
@@ -134,6 +164,7 @@ class WhisperProvider:
             "flac": "audio/flac",
             "webm": "audio/webm",
             "mp4": "audio/mp4",
+            "ogg": "audio/ogg",
         }
         return content_types.get(ext, "audio/mpeg")
 
@@ -0,0 +1,12 @@
+from .preprocessing import (  # noqa: F401
+    PreprocessResult,
+    get_preprocess_stats,
+    preprocess_audio,
+    shutdown_preprocess_executor,
+)
+from .probe import AudioProbe, AudioProbeError, probe_audio, try_probe_audio  # noqa: F401
+from .transcription_cache import (  # noqa: F401
+    build_cache_key,
+    get_cache_stats,
+    get_or_transcribe,
+)
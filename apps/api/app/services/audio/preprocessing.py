@@ -0,0 +1,430 @@
+"""
+音声前処理モジュール
+
+STTプロバイダ（Whisper / Google Speech-to-Text）へ送信する前に、
+クライアントが録音した音声を以下の手順で軽量化する。
+
+1. PCMへデコード（WAVは標準ライブラリ、それ以外は ffmpeg）
+2. モノラル化（チャンネル平均）
+3. 16kHzへリサンプリング
+4. エネルギーベースVAD（NumPyでフレーム単位にベクトル化）で前後の無音をトリム
+5. コンパクトなコーデック（flac / opus、ffmpeg が無ければ 16bit WAV）へ再エンコード
+
+CPU負荷の高い処理はプロセスプールで実行し、イベントループを塞がない。
+numpy が未インストール、またはデコードに失敗した場合は元の音声をそのまま返す。
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import io
+import multiprocessing
+import shutil
+import subprocess
+import threading
+import time
+import wave
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
+logger = get_logger(__name__)
+
+# VADのフレーム長（ミリ秒）
+_VAD_FRAME_MS = 30
+# サイズが増える場合でも、これ以上トリムできたなら前処理結果を採用する（秒）
+_MIN_TRIM_SECONDS = 0.5
+# ffmpeg 呼び出しのタイムアウト（秒）
+_FFMPEG_TIMEOUT_SECONDS = 30
+
+_EXTENSION_BY_CODEC = {"flac": ".flac", "opus": ".ogg", "wav": ".wav"}
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, float] = {
+    "processed": 0,
+    "skipped": 0,
+    "bytes_in": 0,
+    "bytes_out": 0,
+    "seconds_trimmed": 0.0,
+}
+
+
+@dataclass
+class PreprocessResult:
+    """前処理結果"""
+
+    audio: bytes
+    filename: str
+    original_bytes: int
+    processed_bytes: int
+    applied: bool = False
+    sample_rate: Optional[int] = None
+    original_duration_seconds: Optional[float] = None
+    processed_duration_seconds: Optional[float] = None
+
+    @property
+    def bytes_saved(self) -> int:
+        return max(0, self.original_bytes - self.processed_bytes)
+
+
+def is_available() -> bool:
+    """前処理に必要な numpy が利用可能かを返す"""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_preprocess_stats() -> Dict[str, float]:
+    """プロセス内の累計統計（処理件数・削減バイト数など）を返す"""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["bytes_saved"] = max(0, stats["bytes_in"] - stats["bytes_out"])
+    return stats
+
+
+def shutdown_preprocess_executor() -> None:
+    """プロセスプールを終了する（アプリ終了時に呼び出す）"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def _get_executor() -> Optional[Executor]:
+    """プロセスプールを遅延生成する。workers=0 の場合はスレッド実行にする"""
+    global _executor
+    workers = settings.AUDIO_PREPROCESS_WORKERS
+    if workers <= 0:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            # fork はスレッドを持つ親プロセスで安全でないため spawn を使用
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+async def preprocess_audio(audio: bytes, filename: str) -> PreprocessResult:
+    """
+    STT送信前の音声前処理を行う。
+
+    無効化されている場合や処理できない形式の場合は、元の音声をそのまま返す。
+    例外は送出しない（前処理の失敗で音声認識自体を失敗させない）。
+
+    Args:
+        audio: アップロードされた音声データ
+        filename: 元のファイル名（拡張子で形式を判定するため）
+
+    Returns:
+        PreprocessResult: 前処理結果（applied=False の場合は元データ）
+    """
+    passthrough = PreprocessResult(
+        audio=audio,
+        filename=filename,
+        original_bytes=len(audio),
+        processed_bytes=len(audio),
+    )
+
+    if not settings.AUDIO_PREPROCESS_ENABLED or not audio:
+        return passthrough
+
+    if not is_available():
+        logger.warning("Audio preprocessing enabled but numpy is not installed")
+        return passthrough
+
+    job = functools.partial(
+        _preprocess_sync,
+        audio,
+        settings.AUDIO_PREPROCESS_SAMPLE_RATE,
+        settings.AUDIO_PREPROCESS_CODEC,
+        settings.AUDIO_PREPROCESS_VAD_THRESHOLD_DB,
+        settings.AUDIO_PREPROCESS_PADDING_MS,
+    )
+
+    start_time = time.perf_counter()
+    try:
+        executor = _get_executor()
+        if executor is None:
+            output = await asyncio.to_thread(job)
+        else:
+            output = await asyncio.get_running_loop().run_in_executor(executor, job)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(
+            "Audio preprocessing failed, sending original audio",
+            extra={"audio_filename": filename, "error": str(exc)},
+        )
+        _record_skip()
+        return passthrough
+
+    if output is None:
+        _record_skip()
+        return passthrough
+
+    encoded, extension, original_duration, processed_duration = output
+    trimmed_seconds = original_duration - processed_duration
+    if len(encoded) >= len(audio) and trimmed_seconds < _MIN_TRIM_SECONDS:
+        # 既に圧縮済みの入力（webm/opus等）で効果が無い場合は元データを送る
+        _record_skip()
+        return passthrough
+
+    result = PreprocessResult(
+        audio=encoded,
+        filename=_replace_extension(filename, extension),
+        original_bytes=len(audio),
+        processed_bytes=len(encoded),
+        applied=True,
+        sample_rate=settings.AUDIO_PREPROCESS_SAMPLE_RATE,
+        original_duration_seconds=original_duration,
+        processed_duration_seconds=processed_duration,
+    )
+    _record_processed(result)
+
+    logger.info(
+        "Audio preprocessed",
+        extra={
+            "original_bytes": result.original_bytes,
+            "processed_bytes": result.processed_bytes,
+            "bytes_saved": result.bytes_saved,
+            "original_duration_seconds": round(original_duration, 2),
+            "processed_duration_seconds": round(processed_duration, 2),
+            "duration_ms": int((time.perf_counter() - start_time) * 1000),
+        },
+    )
+    return result
+
+
+def _record_processed(result: PreprocessResult) -> None:
+    with _stats_lock:
+        _stats["processed"] += 1
+        _stats["bytes_in"] += result.original_bytes
+        _stats["bytes_out"] += result.processed_bytes
+        _stats["seconds_trimmed"] += max(
+            0.0,
+            (result.original_duration_seconds or 0.0)
+            - (result.processed_duration_seconds or 0.0),
+        )
+
+
+def _record_skip() -> None:
+    with _stats_lock:
+        _stats["skipped"] += 1
+
+
+def _replace_extension(filename: str, extension: str) -> str:
+    stem = filename.rsplit(".", 1)[0] if "." in filename else filename
+    return f"{stem or 'audio'}{extension}"
+
+
+# --- ワーカープロセスで実行される同期処理 ---
+
+
+def _preprocess_sync(
+    audio: bytes,
+    sample_rate: int,
+    codec: str,
+    threshold_db: float,
+    padding_ms: int,
+) -> Optional[Tuple[bytes, str, float, float]]:
+    """
+    デコード→モノラル化→リサンプリング→無音トリム→再エンコードを行う。
+
+    Returns:
+        (エンコード済み音声, 拡張子, 元の長さ秒, 処理後の長さ秒)。
+        処理できない場合や全区間が無音の場合は None。
+    """
+    decoded = None
+    if audio[:4] == b"RIFF" and audio[8:12] == b"WAVE":
+        try:
+            decoded = _decode_wav(audio)
+        except (wave.Error, EOFError, ValueError):
+            decoded = None
+
+    if decoded is None:
+        if shutil.which("ffmpeg") is None:
+            return None
+        decoded = _decode_with_ffmpeg(audio, sample_rate)
+
+    samples, source_rate = decoded
+    if source_rate <= 0 or samples.shape[0] == 0:
+        return None
+
+    original_duration = samples.shape[0] / source_rate
+    mono = samples.mean(axis=1) if samples.shape[1] > 1 else samples[:, 0]
+    mono = _resample(mono, source_rate, sample_rate)
+
+    trimmed = _trim_silence(mono, sample_rate, threshold_db, padding_ms)
+    if trimmed is None or trimmed.size == 0:
+        return None
+
+    encoded, extension = _encode(trimmed, sample_rate, codec)
+    return encoded, extension, original_duration, trimmed.size / sample_rate
+
+
+def _decode_wav(audio: bytes) -> Tuple["np.ndarray", int]:
+    """PCM WAVを float32 の (サンプル数, チャンネル数) 配列へデコードする"""
+    import numpy as np
+
+    with wave.open(io.BytesIO(audio)) as wav_file:
+        channels = wav_file.getnchannels()
+        sample_width = wav_file.getsampwidth()
+        rate = wav_file.getframerate()
+        frames = wav_file.readframes(wav_file.getnframes())
+
+    if sample_width == 1:
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif sample_width == 2:
+        samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+    elif sample_width == 3:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        ints = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        ints = np.where(ints & 0x800000, ints - 0x1000000, ints)
+        samples = ints.astype(np.float32) / 8388608.0
+    elif sample_width == 4:
+        samples = np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {sample_width}")
+
+    usable = samples.size - (samples.size % channels)
+    return samples[:usable].reshape(-1, channels), rate
+
+
+def _decode_with_ffmpeg(audio: bytes, sample_rate: int) -> Tuple["np.ndarray", int]:
+    """ffmpeg で任意形式をモノラル16bit PCMへデコードする（リサンプリングも同時に行う）"""
+    import numpy as np
+
+    command = [
+        shutil.which("ffmpeg") or "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        "pipe:0",
+        "-f",
+        "s16le",
+        "-acodec",
+        "pcm_s16le",
+        "-ac",
+        "1",
+        "-ar",
+        str(sample_rate),
+        "pipe:1",
+    ]
+    completed = subprocess.run(
+        command,
+        input=audio,
+        capture_output=True,
+        timeout=_FFMPEG_TIMEOUT_SECONDS,
+        check=True,
+    )
+    samples = np.frombuffer(completed.stdout, dtype="<i2").astype(np.float32) / 32768.0
+    return samples.reshape(-1, 1), sample_rate
+
+
+def _resample(mono: "np.ndarray", source_rate: int, target_rate: int) -> "np.ndarray":
+    """線形補間でリサンプリングする（ダウンサンプリング時は移動平均で簡易ローパス）"""
+    import numpy as np
+
+    if source_rate == target_rate or mono.size == 0:
+        return mono.astype(np.float32, copy=False)
+
+    if target_rate < source_rate:
+        width = int(np.ceil(source_rate / target_rate))
+        if width > 1:
+            kernel = np.full(width, 1.0 / width, dtype=np.float32)
+            mono = np.convolve(mono, kernel, mode="same")
+
+    target_length = int(round(mono.size * target_rate / source_rate))
+    positions = np.arange(target_length, dtype=np.float64) * (source_rate / target_rate)
+    return np.interp(positions, np.arange(mono.size), mono).astype(np.float32)
+
+
+def _trim_silence(
+    mono: "np.ndarray",
+    sample_rate: int,
+    threshold_db: float,
+    padding_ms: int,
+) -> Optional["np.ndarray"]:
+    """
+    フレームごとのRMSエネルギー(dBFS)で発話区間を検出し、前後の無音を除去する。
+
+    全フレームが閾値未満の場合は None を返す。
+    """
+    import numpy as np
+
+    frame_length = max(1, sample_rate * _VAD_FRAME_MS // 1000)
+    frame_count = mono.size // frame_length
+    if frame_count == 0:
+        return mono
+
+    frames = mono[: frame_count * frame_length].reshape(frame_count, frame_length)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1))
+    energy_db = 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+    voiced = np.flatnonzero(energy_db > threshold_db)
+    if voiced.size == 0:
+        return None
+
+    padding = padding_ms * sample_rate // 1000
+    start = max(0, int(voiced[0]) * frame_length - padding)
+    end = min(mono.size, (int(voiced[-1]) + 1) * frame_length + padding)
+    return mono[start:end]
+
+
+def _encode(mono: "np.ndarray", sample_rate: int, codec: str) -> Tuple[bytes, str]:
+    """モノラル音声をエンコードする。ffmpeg が無い場合は16bit WAVにフォールバック"""
+    import numpy as np
+
+    pcm = (np.clip(mono, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+
+    ffmpeg_path = shutil.which("ffmpeg")
+    if codec in ("flac", "opus") and ffmpeg_path:
+        if codec == "flac":
+            codec_args = ["-c:a", "flac", "-f", "flac"]
+        else:
+            codec_args = ["-c:a", "libopus", "-b:a", "24k", "-application", "voip", "-f", "ogg"]
+        command = [
+            ffmpeg_path,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-f",
+            "s16le",
+            "-ar",
+            str(sample_rate),
+            "-ac",
+            "1",
+            "-i",
+            "pipe:0",
+            *codec_args,
+            "pipe:1",
+        ]
+        completed = subprocess.run(
+            command,
+            input=pcm,
+            capture_output=True,
+            timeout=_FFMPEG_TIMEOUT_SECONDS,
+            check=True,
+        )
+        return completed.stdout, _EXTENSION_BY_CODEC[codec]
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm)
+    return buffer.getvalue(), ".wav"
@@ -0,0 +1,567 @@
+"""
+音声コンテナのヘッダ解析モジュール
+
+デコードせずにコンテナのヘッダだけを読み、コーデック・サンプルレート・チャンネル数・
+再生時間を取得する。対応形式: WAV / FLAC / Ogg(Opus, Vorbis) / WebM(Matroska) /
+MP4(M4A) / MP3。
+
+STTプロバイダへ送る前の形式検証（拡張子ではなく中身で判定）と、
+課金対象となる音声秒数の算出に使用する。
+"""
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Optional, Tuple, Union
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Ogg: 末尾ページを探す範囲（最大ページ長 + 余裕）
+_OGG_TAIL_BYTES = 70 * 1024
+
+
+class AudioProbeError(ValueError):
+    """音声コンテナを認識できない"""
+
+
+@dataclass(frozen=True)
+class AudioProbe:
+    """ヘッダ解析結果"""
+
+    container: str  # "wav" | "flac" | "ogg" | "webm" | "mp4" | "mp3"
+    codec: str
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    duration_seconds: Optional[float] = None
+
+    @property
+    def extension(self) -> str:
+        """コンテナに対応する拡張子（先頭ドット付き）"""
+        return {"mp4": ".m4a"}.get(self.container, f".{self.container}")
+
+
+def probe_audio(data: BytesLike) -> AudioProbe:
+    """
+    音声データのコンテナヘッダを解析する
+
+    Raises:
+        AudioProbeError: 対応していない、またはヘッダが壊れている場合
+    """
+    view = memoryview(data).cast("B")
+    for matches, parser in _PROBES:
+        if matches(view):
+            try:
+                return parser(view)
+            except (struct.error, IndexError, ValueError) as exc:
+                raise AudioProbeError(
+                    f"音声ファイルのヘッダが不正です: {exc}"
+                ) from exc
+    raise AudioProbeError("音声ファイルの形式を認識できません")
+
+
+def try_probe_audio(data: BytesLike) -> Optional[AudioProbe]:
+    """probe_audio の例外を送出しない版"""
+    try:
+        return probe_audio(data)
+    except AudioProbeError:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# WAV
+# ---------------------------------------------------------------------------
+
+_WAV_CODECS = {1: "pcm", 3: "pcm_float", 6: "alaw", 7: "mulaw", 0xFFFE: "pcm"}
+
+
+def _is_wav(view: memoryview) -> bool:
+    return view[0:4] == b"RIFF" and view[8:12] == b"WAVE"
+
+
+def _probe_wav(view: memoryview) -> AudioProbe:
+    offset = 12
+    fmt: Optional[Tuple[int, int, int, int, int]] = None
+    data_size: Optional[int] = None
+    while offset + 8 <= len(view):
+        chunk_id = bytes(view[offset : offset + 4])
+        (size,) = struct.unpack_from("<I", view, offset + 4)
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            fmt = struct.unpack_from("<HHIIH", view, body)
+        elif chunk_id == b"data":
+            # ストリーミング書き出しでサイズ未確定（0 / 0xFFFFFFFF）の場合は実データ長を使う
+            data_size = min(size, len(view) - body) if size else len(view) - body
+            break
+        offset = body + size + (size & 1)
+
+    if fmt is None:
+        raise ValueError("fmt チャンクがありません")
+    audio_format, channels, sample_rate, byte_rate, _ = fmt
+    duration = data_size / byte_rate if data_size is not None and byte_rate else None
+    return AudioProbe(
+        container="wav",
+        codec=_WAV_CODECS.get(audio_format, f"wav_{audio_format:#x}"),
+        sample_rate=sample_rate,
+        channels=channels,
+        duration_seconds=duration,
+    )
+
+
+# ---------------------------------------------------------------------------
+# FLAC
+# ---------------------------------------------------------------------------
+
+
+def _is_flac(view: memoryview) -> bool:
+    return view[0:4] == b"fLaC"
+
+
+def _probe_flac(view: memoryview) -> AudioProbe:
+    # 最初のメタデータブロックは必ず STREAMINFO（34バイト）
+    if view[4] & 0x7F != 0:
+        raise ValueError("STREAMINFO がありません")
+    info = bytes(view[8:42])
+    if len(info) < 18:
+        raise ValueError("STREAMINFO が短すぎます")
+    packed = int.from_bytes(info[10:18], "big")
+    sample_rate = packed >> 44
+    channels = ((packed >> 41) & 0x7) + 1
+    total_samples = packed & 0xFFFFFFFFF
+    duration = total_samples / sample_rate if sample_rate and total_samples else None
+    return AudioProbe(
+        container="flac",
+        codec="flac",
+        sample_rate=sample_rate,
+        channels=channels,
+        duration_seconds=duration,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Ogg (Opus / Vorbis)
+# ---------------------------------------------------------------------------
+
+
+def _is_ogg(view: memoryview) -> bool:
+    return view[0:4] == b"OggS"
+
+
+def _probe_ogg(view: memoryview) -> AudioProbe:
+    segments = view[26]
+    payload = 27 + segments
+    head = bytes(view[payload : payload + 19])
+
+    if head.startswith(b"OpusHead"):
+        channels = head[9]
+        (pre_skip,) = struct.unpack_from("<H", head, 10)
+        # Opus のグラニュール位置は入力レートに関係なく常に48kHz
+        granule = _last_ogg_granule(view)
+        duration = (
+            max(0, granule - pre_skip) / 48000 if granule is not None else None
+        )
+        (input_rate,) = struct.unpack_from("<I", head, 12)
+        return AudioProbe(
+            container="ogg",
+            codec="opus",
+            sample_rate=input_rate or 48000,
+            channels=channels,
+            duration_seconds=duration,
+        )
+
+    if head.startswith(b"\x01vorbis"):
+        channels = head[11]
+        (sample_rate,) = struct.unpack_from("<I", head, 12)
+        granule = _last_ogg_granule(view)
+        duration = granule / sample_rate if granule is not None and sample_rate else None
+        return AudioProbe(
+            container="ogg",
+            codec="vorbis",
+            sample_rate=sample_rate,
+            channels=channels,
+            duration_seconds=duration,
+        )
+
+    raise ValueError("未対応の Ogg コーデックです")
+
+
+def _last_ogg_granule(view: memoryview) -> Optional[int]:
+    tail_start = max(0, len(view) - _OGG_TAIL_BYTES)
+    tail = bytes(view[tail_start:])
+    position = tail.rfind(b"OggS")
+    while position != -1:
+        if position + 14 <= len(tail):
+            (granule,) = struct.unpack_from("<q", tail, position + 6)
+            if granule >= 0:
+                return granule
+        position = tail.rfind(b"OggS", 0, position)
+    return None
+
+
+# ---------------------------------------------------------------------------
+# WebM / Matroska
+# ---------------------------------------------------------------------------
+
+_EBML_HEADER = 0x1A45DFA3
+_MKV_SEGMENT = 0x18538067
+_MKV_INFO = 0x1549A966
+_MKV_TIMECODE_SCALE = 0x2AD7B1
+_MKV_DURATION = 0x4489
+_MKV_TRACKS = 0x1654AE6B
+_MKV_TRACK_ENTRY = 0xAE
+_MKV_TRACK_TYPE = 0x83
+_MKV_CODEC_ID = 0x86
+_MKV_AUDIO = 0xE1
+_MKV_SAMPLING_FREQUENCY = 0xB5
+_MKV_CHANNELS = 0x9F
+_MKV_CLUSTER = 0x1F43B675
+_MKV_CLUSTER_TIMECODE = 0xE7
+_MKV_SIMPLE_BLOCK = 0xA3
+_MKV_BLOCK_GROUP = 0xA0
+_MKV_BLOCK = 0xA1
+# クラスタの子要素（サイズ不定クラスタの終端判定に使う）
+_MKV_CLUSTER_CHILDREN = {
+    _MKV_CLUSTER_TIMECODE,
+    _MKV_SIMPLE_BLOCK,
+    _MKV_BLOCK_GROUP,
+    0xA7,  # Position
+    0xAB,  # PrevSize
+    0x5854,  # SilentTracks
+}
+
+_MKV_CODECS = {
+    "A_OPUS": "opus",
+    "A_VORBIS": "vorbis",
+    "A_AAC": "aac",
+    "A_MPEG/L3": "mp3",
+    "A_FLAC": "flac",
+    "A_PCM/INT/LIT": "pcm",
+}
+
+
+def _is_matroska(view: memoryview) -> bool:
+    return len(view) >= 4 and int.from_bytes(view[0:4], "big") == _EBML_HEADER
+
+
+def _read_vint(view: memoryview, offset: int, keep_marker: bool) -> Tuple[int, int, bool]:
+    """EBML可変長整数を読む。(値, 長さ, サイズ不定か) を返す"""
+    first = view[offset]
+    length = 1
+    mask = 0x80
+    while length <= 8 and not first & mask:
+        mask >>= 1
+        length += 1
+    if length > 8:
+        raise ValueError("EBML 可変長整数が不正です")
+    value = first if keep_marker else first & (mask - 1)
+    for i in range(1, length):
+        value = (value << 8) | view[offset + i]
+    unknown = not keep_marker and value == (1 << (7 * length)) - 1
+    return value, length, unknown
+
+
+def _iter_ebml(
+    view: memoryview, start: int, end: int
+) -> Iterator[Tuple[int, int, int, bool]]:
+    """(要素ID, データ開始位置, データ終了位置, サイズ不定か) を列挙する"""
+    offset = start
+    while offset < end:
+        element_id, id_length, _ = _read_vint(view, offset, keep_marker=True)
+        size, size_length, unknown = _read_vint(view, offset + id_length, False)
+        data_start = offset + id_length + size_length
+        data_end = end if unknown else min(end, data_start + size)
+        yield element_id, data_start, data_end, unknown
+        offset = data_end
+
+
+def _ebml_uint(view: memoryview, start: int, end: int) -> int:
+    return int.from_bytes(view[start:end], "big")
+
+
+def _ebml_float(view: memoryview, start: int, end: int) -> float:
+    return struct.unpack_from(">f" if end - start == 4 else ">d", view, start)[0]
+
+
+def _probe_matroska(view: memoryview) -> AudioProbe:
+    timecode_scale = 1_000_000
+    duration_ticks: Optional[float] = None
+    codec = "unknown"
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    last_timecode: Optional[int] = None
+
+    for element_id, seg_start, seg_end, _ in _iter_ebml(view, 0, len(view)):
+        if element_id != _MKV_SEGMENT:
+            continue
+        offset = seg_start
+        while offset < seg_end:
+            child_id, id_len, _ = _read_vint(view, offset, keep_marker=True)
+            size, size_len, unknown = _read_vint(view, offset + id_len, False)
+            start = offset + id_len + size_len
+            end = seg_end if unknown else min(seg_end, start + size)
+
+            if child_id == _MKV_INFO:
+                for info_id, s, e, _ in _iter_ebml(view, start, end):
+                    if info_id == _MKV_TIMECODE_SCALE:
+                        timecode_scale = _ebml_uint(view, s, e)
+                    elif info_id == _MKV_DURATION:
+                        duration_ticks = _ebml_float(view, s, e)
+            elif child_id == _MKV_TRACKS:
+                track = _first_audio_track(view, start, end)
+                if track is not None:
+                    codec, sample_rate, channels = track
+            elif child_id == _MKV_CLUSTER:
+                if duration_ticks is not None:
+                    break
+                end, cluster_last = _scan_cluster(view, start, end, unknown)
+                if cluster_last is not None:
+                    last_timecode = max(last_timecode or 0, cluster_last)
+            offset = end
+        break
+
+    duration: Optional[float] = None
+    if duration_ticks is not None:
+        duration = duration_ticks * timecode_scale / 1e9
+    elif last_timecode is not None:
+        # MediaRecorder の WebM は Duration を持たないため最終ブロックの時刻で代用
+        duration = last_timecode * timecode_scale / 1e9
+
+    return AudioProbe(
+        container="webm",
+        codec=codec,
+        sample_rate=sample_rate,
+        channels=channels,
+        duration_seconds=duration,
+    )
+
+
+def _first_audio_track(
+    view: memoryview, start: int, end: int
+) -> Optional[Tuple[str, Optional[int], Optional[int]]]:
+    for entry_id, s, e, _ in _iter_ebml(view, start, end):
+        if entry_id != _MKV_TRACK_ENTRY:
+            continue
+        track_type: Optional[int] = None
+        codec_id = ""
+        sample_rate: Optional[int] = None
+        channels: Optional[int] = None
+        for field_id, fs, fe, _ in _iter_ebml(view, s, e):
+            if field_id == _MKV_TRACK_TYPE:
+                track_type = _ebml_uint(view, fs, fe)
+            elif field_id == _MKV_CODEC_ID:
+                codec_id = bytes(view[fs:fe]).rstrip(b"\x00").decode("ascii", "replace")
+            elif field_id == _MKV_AUDIO:
+                for audio_id, as_, ae, _ in _iter_ebml(view, fs, fe):
+                    if audio_id == _MKV_SAMPLING_FREQUENCY:
+                        sample_rate = int(_ebml_float(view, as_, ae))
+                    elif audio_id == _MKV_CHANNELS:
+                        channels = _ebml_uint(view, as_, ae)
+        if track_type == 2 or codec_id.startswith("A_"):
+            return _MKV_CODECS.get(codec_id, codec_id.lower()), sample_rate, channels
+    return None
+
+
+def _scan_cluster(
+    view: memoryview, start: int, end: int, unknown: bool
+) -> Tuple[int, Optional[int]]:
+    """クラスタ内ブロックの最終時刻を求める。(クラスタ終端, 最終時刻) を返す"""
+    cluster_timecode = 0
+    last: Optional[int] = None
+    offset = start
+    while offset < end:
+        child_id, id_len, _ = _read_vint(view, offset, keep_marker=True)
+        if unknown and child_id not in _MKV_CLUSTER_CHILDREN:
+            # サイズ不定クラスタは次のトップレベル要素の手前で終わる
+            return offset, last
+        size, size_len, _ = _read_vint(view, offset + id_len, False)
+        s = offset + id_len + size_len
+        e = min(end, s + size)
+        if child_id == _MKV_CLUSTER_TIMECODE:
+            cluster_timecode = _ebml_uint(view, s, e)
+        elif child_id in (_MKV_SIMPLE_BLOCK, _MKV_BLOCK_GROUP):
+            block = s
+            if child_id == _MKV_BLOCK_GROUP:
+                block = next(
+                    (bs for bid, bs, _, _ in _iter_ebml(view, s, e) if bid == _MKV_BLOCK),
+                    None,
+                )
+            if block is not None:
+                _, track_len, _ = _read_vint(view, block, keep_marker=False)
+                (relative,) = struct.unpack_from(">h", view, block + track_len)
+                timecode = cluster_timecode + relative
+                last = timecode if last is None else max(last, timecode)
+        offset = e
+    return end, last
+
+
+# ---------------------------------------------------------------------------
+# MP4 / M4A
+# ---------------------------------------------------------------------------
+
+_MP4_CODECS = {b"mp4a": "aac", b"alac": "alac", b"Opus": "opus", b"fLaC": "flac"}
+_MP4_CONTAINERS = {b"moov", b"trak", b"mdia", b"minf", b"stbl"}
+
+
+def _is_mp4(view: memoryview) -> bool:
+    return view[4:8] == b"ftyp"
+
+
+def _iter_boxes(view: memoryview, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    offset = start
+    while offset + 8 <= end:
+        (size,) = struct.unpack_from(">I", view, offset)
+        box_type = bytes(view[offset + 4 : offset + 8])
+        header = 8
+        if size == 1:
+            (size,) = struct.unpack_from(">Q", view, offset + 8)
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header:
+            raise ValueError("MP4 ボックスサイズが不正です")
+        yield box_type, offset + header, min(end, offset + size)
+        offset += size
+
+
+def _probe_mp4(view: memoryview) -> AudioProbe:
+    found: Dict[str, object] = {}
+
+    def _walk(start: int, end: int) -> None:
+        for box_type, s, e in _iter_boxes(view, start, end):
+            if box_type in _MP4_CONTAINERS:
+                _walk(s, e)
+            elif box_type == b"mvhd":
+                version = view[s]
+                if version == 1:
+                    timescale, duration = struct.unpack_from(">IQ", view, s + 20)
+                else:
+                    timescale, duration = struct.unpack_from(">II", view, s + 12)
+                if timescale:
+                    found.setdefault("duration", duration / timescale)
+            elif box_type == b"mdhd" and "track_duration" not in found:
+                version = view[s]
+                if version == 1:
+                    timescale, duration = struct.unpack_from(">IQ", view, s + 20)
+                else:
+                    timescale, duration = struct.unpack_from(">II", view, s + 12)
+                if timescale:
+                    found["track_duration"] = duration / timescale
+            elif box_type == b"stsd" and "codec" not in found:
+                # full box header(4) + entry_count(4) の後に最初のサンプルエントリ
+                entry = s + 8
+                entry_type = bytes(view[entry + 4 : entry + 8])
+                if entry_type in _MP4_CODECS or entry_type.startswith(b"mp4"):
+                    body = entry + 8
+                    channels, _, _, _, rate = struct.unpack_from(">HHHHI", view, body + 16)
+                    found["codec"] = _MP4_CODECS.get(entry_type, entry_type.decode("ascii", "replace"))
+                    found["channels"] = channels
+                    found["sample_rate"] = rate >> 16
+
+    _walk(0, len(view))
+    if "codec" not in found and "duration" not in found:
+        raise ValueError("moov ボックスがありません")
+
+    duration = found.get("track_duration") or found.get("duration")
+    return AudioProbe(
+        container="mp4",
+        codec=str(found.get("codec", "unknown")),
+        sample_rate=found.get("sample_rate"),  # type: ignore[arg-type]
+        channels=found.get("channels"),  # type: ignore[arg-type]
+        duration_seconds=duration,  # type: ignore[arg-type]
+    )
+
+
+# ---------------------------------------------------------------------------
+# MP3
+# ---------------------------------------------------------------------------
+
+# [version][layer] -> ビットレート表（kbps）
+_MP3_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_BITRATES[(2, 3)] = _MP3_BITRATES[(2, 2)]
+_MP3_SAMPLE_RATES = {1: (44100, 48000, 32000), 2: (22050, 24000, 16000), 25: (11025, 12000, 8000)}
+
+
+def _id3_size(view: memoryview) -> int:
+    if view[0:3] != b"ID3":
+        return 0
+    size = 0
+    for byte in view[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    footer = 10 if view[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _is_mp3(view: memoryview) -> bool:
+    offset = _id3_size(view)
+    return (
+        offset + 2 <= len(view)
+        and view[offset] == 0xFF
+        and view[offset + 1] & 0xE0 == 0xE0
+    )
+
+
+def _probe_mp3(view: memoryview) -> AudioProbe:
+    offset = _id3_size(view)
+    (header,) = struct.unpack_from(">I", view, offset)
+    version_bits = (header >> 19) & 0x3
+    layer_bits = (header >> 17) & 0x3
+    version = {3: 1, 2: 2, 0: 25}.get(version_bits)
+    layer = {3: 1, 2: 2, 1: 3}.get(layer_bits)
+    if version is None or layer is None:
+        raise ValueError("MPEG フレームヘッダが不正です")
+
+    bitrate_index = (header >> 12) & 0xF
+    rate_index = (header >> 10) & 0x3
+    if bitrate_index in (0, 15) or rate_index == 3:
+        raise ValueError("MPEG フレームヘッダが不正です")
+    bitrate = _MP3_BITRATES[(1 if version == 1 else 2, layer)][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    channel_mode = (header >> 6) & 0x3
+    channels = 1 if channel_mode == 3 else 2
+
+    if layer == 1:
+        samples_per_frame = 384
+    elif layer == 3 and version != 1:
+        samples_per_frame = 576
+    else:
+        samples_per_frame = 1152
+
+    # VBR: Xing / Info / VBRI ヘッダのフレーム数から正確な長さを求める
+    frames: Optional[int] = None
+    side_info = (17 if channels == 1 else 32) if version == 1 else (9 if channels == 1 else 17)
+    xing = offset + 4 + side_info
+    tag = bytes(view[xing : xing + 4])
+    if tag in (b"Xing", b"Info"):
+        (flags,) = struct.unpack_from(">I", view, xing + 4)
+        if flags & 0x1:
+            (frames,) = struct.unpack_from(">I", view, xing + 8)
+    elif bytes(view[offset + 36 : offset + 40]) == b"VBRI":
+        (frames,) = struct.unpack_from(">I", view, offset + 36 + 14)
+
+    if frames:
+        duration = frames * samples_per_frame / sample_rate
+    else:
+        duration = (len(view) - offset) * 8 / bitrate
+
+    return AudioProbe(
+        container="mp3",
+        codec="mp3",
+        sample_rate=sample_rate,
+        channels=channels,
+        duration_seconds=duration,
+    )
+
+
+_PROBES: Tuple[Tuple[Callable[[memoryview], bool], Callable[[memoryview], AudioProbe]], ...] = (
+    (_is_wav, _probe_wav),
+    (_is_flac, _probe_flac),
+    (_is_ogg, _probe_ogg),
+    (_is_matroska, _probe_matroska),
+    (_is_mp4, _probe_mp4),
+    (_is_mp3, _probe_mp3),
+)
@@ -0,0 +1,188 @@
+"""
+音声認識結果キャッシュ
+
+タイムアウトや通信断の後、クライアントは同じ録音を再送してくる。
+アップロードされた音声バイト列の SHA-256 + 言語 + モデルをキーに認識結果を保持し、
+再送時は STT API を呼ばずに即座に結果を返す。
+
+- プロセス内: 件数上限付きの LRU（TTL付き）
+- ワーカー間共有: transcription_cache テーブル（TRANSCRIPTION_CACHE_SHARED=True のとき）
+- 同一キーの同時リクエストは1回の STT 呼び出しにまとめる
+
+キャッシュの読み書きに失敗しても認識処理自体は継続する。
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from app.db.session import run_db
+from models.database.models import TranscriptionCacheEntry
+
+logger = get_logger(__name__)
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+# 期限切れ行の掃除を行う間隔（秒）
+_PURGE_INTERVAL_SECONDS = 300
+
+_memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+_last_purge = 0.0
+_stats: Dict[str, int] = {"hits": 0, "shared_hits": 0, "misses": 0, "coalesced": 0}
+
+
+def build_cache_key(audio: bytes, language: Optional[str], model: str) -> str:
+    """音声バイト列・言語・モデルからキャッシュキーを生成する"""
+    digest = hashlib.sha256(audio)
+    digest.update(f"|{language or ''}|{model}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """キャッシュのヒット状況を返す"""
+    return {**_stats, "entries": len(_memory)}
+
+
+def clear_transcription_cache() -> None:
+    """プロセス内キャッシュを破棄する（テスト用）"""
+    _memory.clear()
+    _inflight.clear()
+    for key in _stats:
+        _stats[key] = 0
+
+
+async def get_or_transcribe(
+    audio: bytes,
+    language: Optional[str],
+    model: str,
+    transcribe: Callable[[], Awaitable[ResponseT]],
+    response_model: Type[ResponseT],
+    db: Optional[Session] = None,
+) -> ResponseT:
+    """
+    キャッシュにあれば保存済みの認識結果を返し、なければ transcribe() を実行して保存する
+
+    Args:
+        audio: アップロードされた音声バイト列
+        language: 認識言語
+        model: STTモデル名（例: "whisper:whisper-1"）
+        transcribe: キャッシュミス時に呼ぶ認識処理
+        response_model: 返却するレスポンスモデル
+        db: ワーカー間共有キャッシュに使うDBセッション
+    """
+    if not settings.TRANSCRIPTION_CACHE_ENABLED:
+        return await transcribe()
+
+    key = build_cache_key(audio, language, model)
+
+    cached = _get_memory(key)
+    if cached is not None:
+        _stats["hits"] += 1
+        return response_model.model_validate(cached)
+
+    inflight = _inflight.get(key)
+    if inflight is not None:
+        # 同じ録音の再送が処理中: 先行リクエストの結果を待つ
+        _stats["coalesced"] += 1
+        return response_model.model_validate(await asyncio.shield(inflight))
+
+    use_shared = db is not None and settings.TRANSCRIPTION_CACHE_SHARED
+    # 共有キャッシュの参照（スレッドプールで実行）中に届いた再送も合流できるよう、先に登録する
+    future: "asyncio.Future[Dict[str, Any]]" = (
+        asyncio.get_running_loop().create_future()
+    )
+    _inflight[key] = future
+    shared: Optional[Dict[str, Any]] = None
+    try:
+        if use_shared:
+            shared = await run_db(_load_shared, db, key)
+        if shared is not None:
+            _stats["shared_hits"] += 1
+            result = response_model.model_validate(shared)
+        else:
+            _stats["misses"] += 1
+            result = await transcribe()
+    except BaseException as exc:
+        future.set_exception(exc)
+        # 待機者がいない場合の "exception was never retrieved" 警告を抑止
+        future.exception()
+        raise
+    finally:
+        _inflight.pop(key, None)
+
+    payload = shared if shared is not None else result.model_dump(mode="json")
+    future.set_result(payload)
+    _put_memory(key, payload)
+    if use_shared and shared is None:
+        await run_db(_store_shared, db, key, payload)
+    return result
+
+
+def _get_memory(key: str) -> Optional[Dict[str, Any]]:
+    entry = _memory.get(key)
+    if entry is None:
+        return None
+    expires_at, payload = entry
+    if expires_at <= time.monotonic():
+        del _memory[key]
+        return None
+    _memory.move_to_end(key)
+    return payload
+
+
+def _put_memory(key: str, payload: Dict[str, Any]) -> None:
+    _memory[key] = (time.monotonic() + settings.TRANSCRIPTION_CACHE_TTL_SECONDS, payload)
+    _memory.move_to_end(key)
+    while len(_memory) > settings.TRANSCRIPTION_CACHE_MAX_ENTRIES:
+        _memory.popitem(last=False)
+
+
+def _load_shared(db: Session, key: str) -> Optional[Dict[str, Any]]:
+    try:
+        entry = (
+            db.query(TranscriptionCacheEntry)
+            .filter(
+                TranscriptionCacheEntry.cache_key == key,
+                TranscriptionCacheEntry.expires_at > datetime.now(timezone.utc),
+            )
+            .first()
+        )
+        return dict(entry.response) if entry is not None else None
+    except Exception as exc:  # noqa: BLE001
+        db.rollback()
+        logger.warning("Failed to read transcription cache: %s", exc)
+        return None
+
+
+def _store_shared(db: Session, key: str, payload: Dict[str, Any]) -> None:
+    global _last_purge
+
+    now = datetime.now(timezone.utc)
+    try:
+        db.merge(
+            TranscriptionCacheEntry(
+                cache_key=key,
+                response=payload,
+                expires_at=now
+                + timedelta(seconds=settings.TRANSCRIPTION_CACHE_TTL_SECONDS),
+            )
+        )
+        if time.monotonic() - _last_purge > _PURGE_INTERVAL_SECONDS:
+            db.query(TranscriptionCacheEntry).filter(
+                TranscriptionCacheEntry.expires_at <= now
+            ).delete(synchronize_session=False)
+            _last_purge = time.monotonic()
+        db.commit()
+    except Exception as exc:  # noqa: BLE001
+        db.rollback()
+        logger.warning("Failed to write transcription cache: %s", exc)
@@ -0,0 +1,10 @@
+from .catalog import (  # noqa: F401
+    PLACEMENT_QUESTIONS,
+    ContentCatalog,
+    ScenarioEntry,
+    ShadowingEntry,
+    clear_catalog,
+    get_catalog,
+    get_placement_question,
+    reload_catalog,
+)
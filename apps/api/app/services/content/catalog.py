@@ -0,0 +1,260 @@
+"""
+静的コンテンツのインメモリカタログ
+
+シナリオ・シャドーイング文（DB）と、学習ゴール・初期メッセージ・レベル判定問題
+（コード内定義）はデプロイ時にしか変わらないため、プロセスごとに一度だけ読み込み、
+id・カテゴリ・難易度・シナリオ別のインデックスを持つ不変オブジェクトとして共有する。
+
+- content_hash: 全コンテンツから計算したハッシュ（キャッシュ検証・ワーカー間の差異確認用）
+- reload_catalog(): シード投入後などに明示的に再読み込みする
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.logging_config import get_logger
+from app.prompts.placement_questions import QUESTIONS, PlacementQuestionSchema
+from app.prompts.scenario_goals import SCENARIO_GOALS
+from app.prompts.scenario_initial_messages import SCENARIO_INITIAL_MESSAGES
+from models.database.models import Scenario, ShadowingSentence
+
+logger = get_logger(__name__)
+
+
+# コード内定義のレベル判定問題はDB不要なので import 時に索引を作る
+PLACEMENT_QUESTIONS: Tuple[PlacementQuestionSchema, ...] = tuple(QUESTIONS)
+PLACEMENT_QUESTIONS_BY_ID: Mapping[int, PlacementQuestionSchema] = MappingProxyType(
+    {q.id: q for q in PLACEMENT_QUESTIONS}
+)
+
+
+def get_placement_question(question_id: int) -> Optional[PlacementQuestionSchema]:
+    """IDでレベル判定問題を取得（O(1)）"""
+    return PLACEMENT_QUESTIONS_BY_ID.get(question_id)
+
+
+def _enum_value(value):
+    return value.value if hasattr(value, "value") else value
+
+
+@dataclass(frozen=True)
+class ScenarioEntry:
+    """シナリオ（scenarios テーブルの1行）"""
+
+    id: int
+    name: str
+    description: Optional[str]
+    category: str
+    difficulty: str
+    is_active: bool
+    created_at: Optional[datetime]
+
+
+@dataclass(frozen=True)
+class ShadowingEntry:
+    """シャドーイング文（shadowing_sentences テーブルの1行）"""
+
+    id: int
+    scenario_id: int
+    key_phrase: str
+    sentence_en: str
+    sentence_ja: str
+    order_index: int
+    difficulty: str
+    audio_url: Optional[str]
+
+
+def _group(pairs) -> Mapping[object, Tuple[int, ...]]:
+    grouped: Dict[object, List[int]] = {}
+    for key, item_id in pairs:
+        grouped.setdefault(key, []).append(item_id)
+    return MappingProxyType({key: tuple(ids) for key, ids in grouped.items()})
+
+
+class ContentCatalog:
+    """静的コンテンツの不変スナップショット"""
+
+    def __init__(
+        self,
+        scenarios: List[ScenarioEntry],
+        shadowing_sentences: List[ShadowingEntry],
+    ):
+        scenarios = sorted(scenarios, key=lambda s: s.id)
+        shadowing_sentences = sorted(
+            shadowing_sentences, key=lambda s: (s.scenario_id, s.order_index, s.id)
+        )
+
+        self.scenarios: Tuple[ScenarioEntry, ...] = tuple(scenarios)
+        self.scenarios_by_id: Mapping[int, ScenarioEntry] = MappingProxyType(
+            {s.id: s for s in scenarios}
+        )
+        self.scenario_ids_by_category = _group((s.category, s.id) for s in scenarios)
+        self.scenario_ids_by_difficulty = _group((s.difficulty, s.id) for s in scenarios)
+
+        self.shadowing_sentences: Tuple[ShadowingEntry, ...] = tuple(shadowing_sentences)
+        self.shadowing_by_id: Mapping[int, ShadowingEntry] = MappingProxyType(
+            {s.id: s for s in shadowing_sentences}
+        )
+        # order_index 順のシナリオ別シャドーイング文ID
+        self.shadowing_ids_by_scenario = _group(
+            (s.scenario_id, s.id) for s in shadowing_sentences
+        )
+
+        self.goals_by_scenario: Mapping[int, Tuple[str, ...]] = MappingProxyType(
+            {scenario_id: tuple(goals) for scenario_id, goals in SCENARIO_GOALS.items()}
+        )
+        self.initial_messages: Mapping[int, str] = MappingProxyType(
+            dict(SCENARIO_INITIAL_MESSAGES)
+        )
+        self.placement_questions = PLACEMENT_QUESTIONS
+        self.placement_by_id = PLACEMENT_QUESTIONS_BY_ID
+
+        self.content_hash = self._compute_hash()
+        self.loaded_at = datetime.now(timezone.utc)
+
+    @classmethod
+    def load(cls, db: Session) -> "ContentCatalog":
+        """DBのシナリオ・シャドーイング文を読み込んでカタログを作る（2クエリ）"""
+        scenarios = [
+            ScenarioEntry(
+                id=row.id,
+                name=row.name,
+                description=row.description,
+                category=_enum_value(row.category),
+                difficulty=_enum_value(row.difficulty),
+                is_active=bool(row.is_active),
+                created_at=row.created_at,
+            )
+            for row in db.query(Scenario).all()
+        ]
+        shadowing_sentences = [
+            ShadowingEntry(
+                id=row.id,
+                scenario_id=row.scenario_id,
+                key_phrase=row.key_phrase,
+                sentence_en=row.sentence_en,
+                sentence_ja=row.sentence_ja,
+                order_index=row.order_index,
+                difficulty=_enum_value(row.difficulty),
+                audio_url=row.audio_url,
+            )
+            for row in db.query(ShadowingSentence).all()
+        ]
+        return cls(scenarios, shadowing_sentences)
+
+    # --- シナリオ ---
+
+    def get_scenario(self, scenario_id: int, active_only: bool = False) -> Optional[ScenarioEntry]:
+        scenario = self.scenarios_by_id.get(scenario_id)
+        if scenario is None or (active_only and not scenario.is_active):
+            return None
+        return scenario
+
+    def scenarios_by_category(self, category: str) -> List[ScenarioEntry]:
+        return [
+            self.scenarios_by_id[i] for i in self.scenario_ids_by_category.get(category, ())
+        ]
+
+    def scenarios_by_difficulty(self, difficulty: str) -> List[ScenarioEntry]:
+        return [
+            self.scenarios_by_id[i]
+            for i in self.scenario_ids_by_difficulty.get(difficulty, ())
+        ]
+
+    def get_goals(self, scenario_id: int) -> List[str]:
+        return list(self.goals_by_scenario.get(scenario_id, ()))
+
+    def get_initial_message(self, scenario_id: int) -> Optional[str]:
+        return self.initial_messages.get(scenario_id)
+
+    # --- シャドーイング ---
+
+    def get_shadowing_sentence(self, sentence_id: int) -> Optional[ShadowingEntry]:
+        return self.shadowing_by_id.get(sentence_id)
+
+    def shadowing_for_scenario(self, scenario_id: int) -> List[ShadowingEntry]:
+        return [
+            self.shadowing_by_id[i]
+            for i in self.shadowing_ids_by_scenario.get(scenario_id, ())
+        ]
+
+    def scenarios_with_shadowing(self, category: Optional[str] = None) -> List[ScenarioEntry]:
+        """シャドーイング文があるシナリオ（id順）"""
+        return [
+            s
+            for s in self.scenarios
+            if s.id in self.shadowing_ids_by_scenario
+            and (category is None or s.category == category)
+        ]
+
+    # --- レベル判定 ---
+
+    def get_placement_question(self, question_id: int) -> Optional[PlacementQuestionSchema]:
+        return self.placement_by_id.get(question_id)
+
+    def _compute_hash(self) -> str:
+        payload = {
+            "scenarios": [
+                {k: v for k, v in asdict(s).items() if k != "created_at"} for s in self.scenarios
+            ],
+            "shadowing": [asdict(s) for s in self.shadowing_sentences],
+            "goals": {str(k): list(v) for k, v in self.goals_by_scenario.items()},
+            "initial_messages": {str(k): v for k, v in self.initial_messages.items()},
+            "placement": [vars(q) for q in self.placement_questions],
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "content_hash": self.content_hash,
+            "loaded_at": self.loaded_at.isoformat(),
+            "scenarios": len(self.scenarios),
+            "shadowing_sentences": len(self.shadowing_sentences),
+            "placement_questions": len(self.placement_questions),
+        }
+
+
+_catalog: Optional[ContentCatalog] = None
+_lock = threading.Lock()
+
+
+def get_catalog(db: Session) -> ContentCatalog:
+    """カタログを返す（未読み込みなら db から読み込む）"""
+    catalog = _catalog
+    if catalog is not None:
+        return catalog
+    with _lock:
+        if _catalog is None:
+            return _load(db)
+        return _catalog
+
+
+def reload_catalog(db: Session) -> ContentCatalog:
+    """カタログを再読み込みする（シード投入後・起動時に呼ぶ）"""
+    with _lock:
+        return _load(db)
+
+
+def clear_catalog() -> None:
+    """読み込み済みカタログを破棄する（次回 get_catalog で再読み込み）"""
+    global _catalog
+    with _lock:
+        _catalog = None
+
+
+def _load(db: Session) -> ContentCatalog:
+    global _catalog
+    previous = _catalog
+    _catalog = ContentCatalog.load(db)
+    if previous is None or previous.content_hash != _catalog.content_hash:
+        logger.info("Content catalog loaded", extra=_catalog.summary())
+    return _catalog
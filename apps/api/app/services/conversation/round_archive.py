@@ -0,0 +1,148 @@
+"""
+終了済みセッションのラウンドのコールドアーカイブ
+
+session_rounds は発話・AI返答を1ラウンド1行で持ち続けるため、終了から
+SESSION_ARCHIVE_AFTER_DAYS 日を過ぎたセッションのラウンドをセッションごとに
+圧縮JSON 1件（session_round_archives）にまとめ、session_rounds から削除する
+（python -m app.scripts.archive_sessions）。
+
+ラウンドの読み出しは load_rounds を使う。session_rounds に無ければアーカイブから
+SessionRound として復元する（DBセッションには追加しない）ため、呼び出し側は
+どちらにあるかを意識しなくてよい。
+"""
+from __future__ import annotations
+
+import json
+import zlib
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import exists
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from models.database.models import (
+    Session as SessionModel,
+    SessionRound,
+    SessionRoundArchive,
+)
+
+# アーカイブに残す列（id は復元時に不要）
+ARCHIVED_COLUMNS = (
+    "round_index",
+    "user_input",
+    "ai_reply",
+    "feedback_short",
+    "improved_sentence",
+    "tags",
+    "score_pronunciation",
+    "score_grammar",
+)
+
+
+def pack_rounds(rounds: List[SessionRound]) -> bytes:
+    """ラウンドを圧縮JSONにする"""
+    records = []
+    for session_round in rounds:
+        record = {column: getattr(session_round, column) for column in ARCHIVED_COLUMNS}
+        created_at = session_round.created_at
+        record["created_at"] = created_at.isoformat() if created_at else None
+        records.append(record)
+    return zlib.compress(json.dumps(records, ensure_ascii=False).encode("utf-8"))
+
+
+def unpack_rounds(session_id: int, payload: bytes) -> List[SessionRound]:
+    """圧縮JSONから（DBに紐づかない）SessionRound を復元する"""
+    rounds = []
+    for record in json.loads(zlib.decompress(payload).decode("utf-8")):
+        created_at = record.pop("created_at", None)
+        rounds.append(
+            SessionRound(
+                session_id=session_id,
+                created_at=datetime.fromisoformat(created_at) if created_at else None,
+                **record,
+            )
+        )
+    return sorted(rounds, key=lambda r: r.round_index)
+
+
+class SessionArchiveService:
+    """ラウンドの読み出し（アーカイブ済みなら復元）とアーカイブ処理"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def load_rounds(self, session_id: int) -> List[SessionRound]:
+        """セッションのラウンド（ラウンド順）"""
+        rounds = (
+            self.db.query(SessionRound)
+            .filter(SessionRound.session_id == session_id)
+            .order_by(SessionRound.round_index.asc())
+            .all()
+        )
+        if rounds:
+            return rounds
+        archive = self.db.get(SessionRoundArchive, session_id)
+        if archive is None:
+            return []
+        return unpack_rounds(session_id, archive.payload)
+
+    def archive_ended_sessions(
+        self,
+        older_than_days: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> int:
+        """終了から older_than_days 日を過ぎたセッションのラウンドをアーカイブへ移す
+
+        batch_size セッションごとにコミットする。移したセッション数を返す。
+        """
+        if older_than_days is None:
+            older_than_days = settings.SESSION_ARCHIVE_AFTER_DAYS
+        batch_size = batch_size or settings.SESSION_ARCHIVE_BATCH_SIZE
+        cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=older_than_days)
+
+        archived = 0
+        while True:
+            session_ids = [
+                session_id
+                for (session_id,) in self.db.query(SessionModel.id)
+                .filter(
+                    SessionModel.ended_at.isnot(None),
+                    SessionModel.ended_at < cutoff,
+                    exists().where(SessionRound.session_id == SessionModel.id),
+                    # 既にアーカイブがあるセッションは上書きしない
+                    ~exists().where(SessionRoundArchive.session_id == SessionModel.id),
+                )
+                .order_by(SessionModel.id)
+                .limit(batch_size)
+            ]
+            if not session_ids:
+                return archived
+
+            rounds_by_session: Dict[int, List[SessionRound]] = defaultdict(list)
+            for session_round in (
+                self.db.query(SessionRound)
+                .filter(SessionRound.session_id.in_(session_ids))
+                .order_by(SessionRound.session_id, SessionRound.round_index)
+            ):
+                rounds_by_session[session_round.session_id].append(session_round)
+
+            self.db.add_all(
+                SessionRoundArchive(
+                    session_id=session_id,
+                    round_count=len(rounds),
+                    payload=pack_rounds(rounds),
+                )
+                for session_id, rounds in rounds_by_session.items()
+            )
+            self.db.query(SessionRound).filter(
+                SessionRound.session_id.in_(session_ids)
+            ).delete(synchronize_session=False)
+            self.db.commit()
+            # 一括削除した行を識別マップに残さない
+            for rounds in rounds_by_session.values():
+                for session_round in rounds:
+                    self.db.expunge(session_round)
+            archived += len(session_ids)
@@ -1,5 +1,5 @@
-from sqlalchemy.orm import Session
-from typing import Optional, List, Dict, Any
+from sqlalchemy.orm import Session, joinedload
+from typing import Awaitable, Callable, Optional, List, Dict, Any
 from datetime import datetime, timedelta, timezone
 import asyncio
 import logging
@@ -24,6 +24,12 @@ from app.services.ai import generate_conversation_response
 from app.services.ai.goal_progress import evaluate_goal_progress
 from app.services.ai.review_top_phrases import select_top_review_phrases
 from app.prompts.scenario_goals import SCENARIO_GOALS, get_goals_for_scenario
+from app.prompts.scenario_initial_messages import get_initial_message_for_scenario
+from app.services.content import get_catalog
+from app.services.leaderboard import record_points
+from app.services.stats import UserStatsService
+from app.services.conversation.round_archive import SessionArchiveService
+from app.db.session import run_db
 from app.prompts.custom_scenario import (
     get_custom_scenario_prompt,
     get_custom_scenario_initial_message,
@@ -107,10 +113,78 @@ class SessionService:
             )
         return top_phrases
 
+    @staticmethod
+    def _history_entry(session_round: SessionRound) -> Dict[str, Any]:
+        return {
+            "round_index": session_round.round_index,
+            "user_input": session_round.user_input,
+            "ai_reply": session_round.ai_reply,
+        }
+
+    def _load_history_payload(self, session_id: int) -> List[Dict[str, Any]]:
+        """ゴール判定用の会話履歴（時系列順）"""
+        history_rounds = SessionArchiveService(self.db).load_rounds(session_id)
+        return [self._history_entry(r) for r in history_rounds]
+
+    def _load_session(
+        self,
+        session_id: int,
+        user_id: int,
+        active_only: bool = False,
+        options: tuple = (),
+    ):
+        """セッションをシナリオ・カスタムシナリオごと読み込む
+
+        async 処理の途中でリレーションを参照しても遅延ロード（＝イベントループ上での
+        クエリ実行）が起きないよう、joinedload で一度に取得する。
+        options で追加のリレーションも同じクエリで読み込める。
+        """
+        query = (
+            self.db.query(SessionModel)
+            .options(
+                joinedload(SessionModel.scenario),
+                joinedload(SessionModel.custom_scenario),
+                *options,
+            )
+            .filter(
+                SessionModel.id == session_id,
+                SessionModel.user_id == user_id,
+            )
+        )
+        if active_only:
+            query = query.filter(SessionModel.ended_at.is_(None))  # 終了していないセッション
+        return query.first()
+
+    def _commit_and_reload(self, session: SessionModel) -> None:
+        """コミットしてセッションと関連シナリオを読み直す（ワーカースレッドで呼ぶ）"""
+        self.db.commit()
+        self.db.refresh(session)
+        # refresh でリレーションも失効するため、ここで読み直しておく
+        session.scenario  # noqa: B018
+        session.custom_scenario  # noqa: B018
+
+    def _commit_keep_loaded(self) -> None:
+        """読み込み済みの属性を失効させずにコミットする（ワーカースレッドで呼ぶ）
+
+        コミット後の再読み込み（refresh・遅延ロード）のクエリを省く。
+        このトランザクションで書いた値は ORM 側で保持しているものと同じである前提。
+        """
+        expire_on_commit = self.db.expire_on_commit
+        self.db.expire_on_commit = False
+        try:
+            self.db.commit()
+        finally:
+            self.db.expire_on_commit = expire_on_commit
+
     async def _calculate_goal_progress(
-        self, session: SessionModel
+        self,
+        session: SessionModel,
+        history_payload: Optional[List[Dict[str, Any]]] = None,
     ) -> tuple[int, int, List[int]]:
-        """セッション全体の会話履歴から学習ゴール達成率を判定する。"""
+        """セッション全体の会話履歴から学習ゴール達成率を判定する。
+
+        history_payload を渡した場合は会話履歴を読み直さない。
+        """
         # カスタムシナリオの場合はDB保存ゴール優先、NULLならデフォルト
         if session.custom_scenario_id:
             goals = self._get_custom_scenario_goals(session.custom_scenario)
@@ -121,20 +195,8 @@ class SessionService:
             return 0, 0, []
 
         # セッション全体の履歴を取得（時系列順）
-        history_rounds = (
-            self.db.query(SessionRound)
-            .filter(SessionRound.session_id == session.id)
-            .order_by(SessionRound.round_index.asc())
-            .all()
-        )
-        history_payload = [
-            {
-                "round_index": r.round_index,
-                "user_input": r.user_input,
-                "ai_reply": r.ai_reply,
-            }
-            for r in history_rounds
-        ]
+        if history_payload is None:
+            history_payload = await run_db(self._load_history_payload, session.id)
 
         try:
             new_status = await evaluate_goal_progress(goals, history_payload)
@@ -154,7 +216,7 @@ class SessionService:
         return goals_total, goals_achieved, goals_status
 
     async def _build_goals_info_for_prompt(
-        self, session: SessionModel
+        self, session: SessionModel, history_payload: List[Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
         """AI会話プロンプトに注入するゴール情報を構築する。
 
@@ -170,25 +232,10 @@ class SessionService:
             return None
 
         # 会話履歴がまだない（ラウンド1）場合は全て未達成
-        history_rounds = (
-            self.db.query(SessionRound)
-            .filter(SessionRound.session_id == session.id)
-            .order_by(SessionRound.round_index.asc())
-            .all()
-        )
-
-        if not history_rounds:
+        if not history_payload:
             return {"goals": goals, "status": [0] * len(goals)}
 
         # 前回ターンまでの履歴でゴール達成状況を評価
-        history_payload = [
-            {
-                "round_index": r.round_index,
-                "user_input": r.user_input,
-                "ai_reply": r.ai_reply,
-            }
-            for r in history_rounds
-        ]
 
         try:
             status = await evaluate_goal_progress(goals, history_payload)
@@ -203,41 +250,13 @@ class SessionService:
         return {"goals": goals, "status": status}
 
     def _get_initial_message(self, scenario: Scenario) -> Optional[str]:
-        """シナリオIDに応じた初期メッセージを返す（モック実装）。"""
+        """シナリオIDに応じた初期メッセージを返す。"""
         try:
             scenario_id = scenario.id
         except AttributeError:
             return None
 
-        messages = {
-            # 1–5: 既存シナリオ
-            1: "Hi, I'm the airline staff. Let's check you in for your flight. Where are you flying today?",
-            2: "Hi, thanks for joining the meeting. Could you briefly introduce yourself and your role?",
-            3: "Welcome to our restaurant! Are you ready to order, or would you like some recommendations?",
-            4: "Thanks for joining this online business call. What would you like to achieve in this negotiation?",
-            5: "Welcome to our hotel. Do you have a reservation, or would you like to book a room today?",
-            # 6–10: 旅行系シナリオ
-            6: "Let’s plan your perfect vacation together. What kind of trip are you dreaming about?",
-            7: "You’re showing a foreign friend around Japan today. Where would you like to take them first?",
-            8: "You’ve just arrived at immigration. The officer is asking you questions. How will you respond?",
-            9: "You’re talking with a friend about your next trip. Where do you want to go and why?",
-            10: "You’ve lost your wallet while traveling. How would you explain the situation to the police?",
-            # 11–14: 日常会話シナリオ
-            11: "You’re calling customer service about a problem. How would you start the conversation?",
-            12: "You’re chatting with a barista at a stylish cafe. What would you like to order today?",
-            13: "You want to get tickets for a show. How would you ask about available seats?",
-            14: "You’re talking with someone in the park. How would you start a light, friendly conversation?",
-            # 15–21: ビジネスシナリオ
-            15: "You need to reschedule a meeting. How would you politely ask to change the time?",
-            16: "You’re setting up a new meeting. Who would you like to invite and what is the purpose?",
-            17: "You’re leading a meeting. How would you open the session and share the agenda?",
-            18: "You’re negotiating contract terms. What is the most important point you want to discuss first?",
-            19: "You’re presenting customer survey results. What key finding would you like to share first?",
-            20: "Your project is delayed and you must apologize. How would you explain the situation?",
-            21: "You’re calling your manager to say you’re sick. How would you explain your condition and absence?",
-        }
-
-        return messages.get(scenario_id)
+        return get_initial_message_for_scenario(scenario_id)
 
     def start_session(
         self, user_id: int, session_data: SessionCreate
@@ -302,12 +321,8 @@ class SessionService:
 
             # 通常シナリオの場合
             elif session_data.scenario_id:
-                scenario = (
-                    self.db.query(Scenario)
-                    .filter(
-                        Scenario.id == session_data.scenario_id, Scenario.is_active == True
-                    )
-                    .first()
+                scenario = get_catalog(self.db).get_scenario(
+                    session_data.scenario_id, active_only=True
                 )
 
                 if not scenario:
@@ -334,8 +349,8 @@ class SessionService:
                     id=scenario.id,
                     name=scenario.name,
                     description=scenario.description,
-                    category=self._to_str(scenario.category),
-                    difficulty=self._to_str(scenario.difficulty),
+                    category=scenario.category,
+                    difficulty=scenario.difficulty,
                     is_active=scenario.is_active,
                     created_at=scenario.created_at,
                 )
@@ -367,60 +382,119 @@ class SessionService:
             logger.error(f"Failed to start session: {str(e)}")
             raise
 
-    async def process_turn(
-        self, session_id: int, user_input: str, user_id: int
-    ) -> TurnResponse:
-        """セッションのターンを処理する"""
+    def _load_turn_state(
+        self, session_id: int, user_id: int
+    ) -> tuple[SessionModel, List[Dict[str, Any]]]:
+        """ターン処理に必要なセッションとこれまでの会話履歴（時系列順）を読み込む
+
+        シナリオ・カスタムシナリオ・ユーザー・全ラウンドを1クエリで取得する。
+        ラウンド数は round_target（延長込みでも十数件）までなので全件読んでも小さく、
+        AI への文脈（直近2ラウンド）とゴール判定の両方にそのまま使える。
+        """
+        # セッションの存在確認
+        session = self._load_session(
+            session_id,
+            user_id,
+            active_only=True,
+            options=(
+                joinedload(SessionModel.user),
+                joinedload(SessionModel.session_rounds),
+            ),
+        )
+
+        if not session:
+            raise ValueError(
+                f"Active session {session_id} not found for user {user_id}"
+            )
+
+        # ラウンド数上限チェック
+        if session.completed_rounds + 1 > session.round_target:
+            raise ValueError(
+                f"Session {session_id} has reached maximum rounds ({session.round_target})"
+            )
+
+        history = [
+            self._history_entry(record)
+            for record in sorted(session.session_rounds, key=lambda r: r.round_index)
+        ]
+        return session, history
+
+    def _save_turn(
+        self,
+        session: SessionModel,
+        session_round: SessionRound,
+        user_id: int,
+        session_difficulty: str,
+    ) -> None:
+        """ラウンドを保存し、ラウンドポイントを付与してコミットする
+
+        session はユーザーごと _load_turn_state で読み込んだもの。
+        ラウンド・完了ラウンド数・ユーザーのポイントはコミット時の1回の flush で書き込み、
+        コミット後の再読み込みはしない。
+        """
+        self.db.add(session_round)
+
+        # セッションの完了ラウンド数を更新
+        session.completed_rounds = session_round.round_index
+
+        # ポイント付与（1ラウンド完了ごと）
+        round_points = 0
         try:
-            # セッションの存在確認
-            session = (
-                self.db.query(SessionModel)
-                .filter(
-                    SessionModel.id == session_id,
-                    SessionModel.user_id == user_id,
-                    SessionModel.ended_at.is_(None),  # 終了していないセッション
-                )
-                .first()
+            from app.services.points.point_service import (
+                REASON_ROUND,
+                PointAward,
+                PointService,
             )
 
-            if not session:
-                raise ValueError(
-                    f"Active session {session_id} not found for user {user_id}"
+            user = session.user
+            if user:
+                current_streak = user.current_streak or 0
+                point_service = PointService(self.db)
+                round_points = point_service.add_points(
+                    user,
+                    [
+                        PointAward(
+                            point_service.calculate_round_points(
+                                session_difficulty,
+                                current_streak,
+                            ),
+                            REASON_ROUND,
+                            session.id,
+                        )
+                    ],
                 )
+        except Exception as e:
+            # ポイント付与に失敗しても会話自体は継続させる（MVPの堅牢性優先）
+            logger.warning(f"Failed to award round points: {str(e)}")
 
-            # 現在のラウンド数を取得
-            current_round = session.completed_rounds + 1
+        self._commit_keep_loaded()
+        record_points(user_id, round_points)
 
-            # ラウンド数上限チェック
-            if current_round > session.round_target:
-                raise ValueError(
-                    f"Session {session_id} has reached maximum rounds ({session.round_target})"
-                )
+    async def process_turn(
+        self,
+        session_id: int,
+        user_input: str,
+        user_id: int,
+        on_reply: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> TurnResponse:
+        """セッションのターンを処理する
 
-            # AI応答とフィードバック生成
-            context_records = (
-                self.db.query(SessionRound)
-                .filter(SessionRound.session_id == session_id)
-                .order_by(SessionRound.round_index.desc())
-                .limit(2)
-                .all()
+        on_reply を渡すと、AI応答テキストの生成直後（DB保存・ゴール判定の前）に
+        呼び出す。音声ターンでTTSを先行開始するために使用する。
+        """
+        try:
+            session, history = await run_db(
+                self._load_turn_state, session_id, user_id
             )
-
-            context = [
-                {
-                    "round_index": record.round_index,
-                    "user_input": record.user_input,
-                    "ai_reply": record.ai_reply,
-                }
-                for record in reversed(context_records)
-            ]
+            current_round = session.completed_rounds + 1
+            context = history[-2:]
 
             start_time = time.perf_counter()
 
             session_difficulty = self._to_str(session.difficulty)
 
             # AI呼び出し前にゴール情報を準備（未達成ゴールへの誘導に使用）
-            goals_info = await self._build_goals_info_for_prompt(session)
+            goals_info = await self._build_goals_info_for_prompt(session, history)
 
             # カスタムシナリオの場合
             if session.custom_scenario_id and session.custom_scenario:
@@ -462,6 +536,9 @@ class SessionService:
                     provider_name="groq",
                     goals_info=goals_info,
                 )
+            if on_reply is not None:
+                await on_reply(conversation_result.ai_reply)
+
             latency_ms = conversation_result.latency_ms
             if latency_ms is None:
                 latency_ms = int((time.perf_counter() - start_time) * 1000)
@@ -479,29 +556,9 @@ class SessionService:
                 score_grammar=None,  # 将来実装
             )
 
-            self.db.add(session_round)
-
-            # セッションの完了ラウンド数を更新
-            session.completed_rounds = current_round
-
-            # ポイント付与（1ラウンド完了ごと）
-            try:
-                from app.services.points.point_service import PointService
-
-                user = self.db.query(User).filter(User.id == user_id).first()
-                if user:
-                    current_streak = user.current_streak or 0
-                    round_points = PointService(self.db).calculate_round_points(
-                        session_difficulty,
-                        current_streak,
-                    )
-                    user.total_points = (user.total_points or 0) + round_points
-            except Exception as e:
-                # ポイント付与に失敗しても会話自体は継続させる（MVPの堅牢性優先）
-                logger.warning(f"Failed to award round points: {str(e)}")
-
-            self.db.commit()
-            self.db.refresh(session)
+            await run_db(
+                self._save_turn, session, session_round, user_id, session_difficulty
+            )
 
             logger.info(f"Turn {current_round} processed for session {session_id}")
 
@@ -512,7 +569,9 @@ class SessionService:
                 goals_total,
                 goals_achieved,
                 goals_status,
-            ) = await self._calculate_goal_progress(session)
+            ) = await self._calculate_goal_progress(
+                session, history + [self._history_entry(session_round)]
+            )
 
             goals_completed = goals_total > 0 and goals_achieved == goals_total
             round_limit_reached = session.completed_rounds >= session.round_target
@@ -568,7 +627,7 @@ class SessionService:
             )
 
         except Exception as e:
-            self.db.rollback()
+            await run_db(self.db.rollback)
             logger.error(f"Failed to process turn: {str(e)}")
             raise
 
@@ -615,18 +674,91 @@ class SessionService:
             logger.error(f"Failed to extend session: {str(e)}")
             raise
 
-    async def end_session(self, session_id: int, user_id: int) -> SessionEndResponse:
-        """セッションを終了し、トップ3フレーズを抽出する"""
+    def _finalize_end(
+        self,
+        session: SessionModel,
+        user_id: int,
+        top_phrases: List[Dict[str, Any]],
+    ):
+        """復習アイテム作成・ストリーク更新・完了ボーナス付与をまとめてコミットする"""
+        # 復習アイテムを作成
+        next_review_at = self._create_review_items(
+            user_id=user_id,
+            top_phrases=top_phrases,
+            source_session_id=session.id,
+        )
+
+        # 学習統計カウンタ
+        UserStatsService(self.db).increment(
+            user_id,
+            total_sessions=1,
+            total_rounds=session.completed_rounds or 0,
+            review_items_total=len(top_phrases),
+        )
+
+        # ストリーク更新
+        from app.services.streak.streak_service import StreakService
+        import pytz
+
+        jst = pytz.timezone("Asia/Tokyo")
+        activity_date = datetime.now(jst).date()
+        StreakService(self.db).update_streak(user_id, activity_date)
+
+        # セッション完了ボーナス（規定ラウンド到達時のみ）
+        session_bonus = 0
         try:
-            session = (
-                self.db.query(SessionModel)
-                .filter(
-                    SessionModel.id == session_id,
-                    SessionModel.user_id == user_id,
+            if session.completed_rounds >= session.round_target:
+                from app.services.points.point_service import (
+                    REASON_SESSION_COMPLETE,
+                    PointAward,
+                    PointService,
                 )
-                .first()
+
+                user = self.db.query(User).filter(User.id == user_id).first()
+                if user:
+                    current_streak = user.current_streak or 0
+                    point_service = PointService(self.db)
+                    session_bonus = point_service.add_points(
+                        user,
+                        [
+                            PointAward(
+                                point_service.calculate_session_completion_points(
+                                    self._to_str(session.difficulty),
+                                    current_streak,
+                                ),
+                                REASON_SESSION_COMPLETE,
+                                session.id,
+                            )
+                        ],
+                    )
+        except Exception as e:
+            logger.warning(
+                f"Failed to award session completion points: {str(e)}"
             )
 
+        self._commit_and_reload(session)
+        record_points(user_id, session_bonus)
+        return next_review_at
+
+    def _load_stored_summary(
+        self, session: SessionModel, user_id: int
+    ) -> tuple[List[Dict[str, Any]], str, Optional[str], Any]:
+        """終了済みセッションの保存済みフレーズと次回復習日時を読み込む"""
+        top_phrases = self._get_stored_top_phrases(session.id, user_id)
+        selection_mode = "stored"
+        fallback_reason = None
+        if not top_phrases:
+            top_phrases = self._extract_top_phrases_fallback(session.id)
+            selection_mode = "fallback"
+            fallback_reason = "stored_review_items_not_found"
+        next_review_at = self._get_existing_review_due(session, user_id)
+        return top_phrases, selection_mode, fallback_reason, next_review_at
+
+    async def end_session(self, session_id: int, user_id: int) -> SessionEndResponse:
+        """セッションを終了し、トップ3フレーズを抽出する"""
+        try:
+            session = await run_db(self._load_session, session_id, user_id)
+
             if not session:
                 raise ValueError(f"Session {session_id} not found for user {user_id}")
 
@@ -643,11 +775,8 @@ class SessionService:
                     fallback_reason,
                 ) = await self._extract_top_phrases(session_id)
 
-                # 復習アイテムを作成
-                next_review_at = self._create_review_items(
-                    user_id=user_id,
-                    top_phrases=top_phrases,
-                    source_session_id=session_id,
+                next_review_at = await run_db(
+                    self._finalize_end, session, user_id, top_phrases
                 )
                 logger.info(
                     "Review top phrases selected",
@@ -660,50 +789,17 @@ class SessionService:
                     },
                 )
 
-                # ストリーク更新
-                from app.services.streak.streak_service import StreakService
-                import pytz
-
-                jst = pytz.timezone("Asia/Tokyo")
-                activity_date = datetime.now(jst).date()
-                StreakService(self.db).update_streak(user_id, activity_date)
-
-                # セッション完了ボーナス（規定ラウンド到達時のみ）
-                try:
-                    if session.completed_rounds >= session.round_target:
-                        from app.services.points.point_service import PointService
-
-                        user = self.db.query(User).filter(User.id == user_id).first()
-                        if user:
-                            current_streak = user.current_streak or 0
-                            session_bonus = PointService(
-                                self.db
-                            ).calculate_session_completion_points(
-                                self._to_str(session.difficulty),
-                                current_streak,
-                            )
-                            user.total_points = (user.total_points or 0) + session_bonus
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to award session completion points: {str(e)}"
-                    )
-
-                self.db.commit()
-                self.db.refresh(session)
-
                 logger.info(
                     f"Session {session_id} ended with {session.completed_rounds} rounds"
                 )
             else:
                 # 既に終了している場合は、既存データを返却して冪等性を担保
-                top_phrases = self._get_stored_top_phrases(session_id, user_id)
-                selection_mode = "stored"
-                fallback_reason = None
-                if not top_phrases:
-                    top_phrases = self._extract_top_phrases_fallback(session_id)
-                    selection_mode = "fallback"
-                    fallback_reason = "stored_review_items_not_found"
-                next_review_at = self._get_existing_review_due(session, user_id)
+                (
+                    top_phrases,
+                    selection_mode,
+                    fallback_reason,
+                    next_review_at,
+                ) = await run_db(self._load_stored_summary, session, user_id)
 
                 logger.info(
                     "Session %s already ended at %s. Returning stored summary.",
@@ -753,7 +849,7 @@ class SessionService:
             )
 
         except Exception as e:
-            self.db.rollback()
+            await run_db(self.db.rollback)
             logger.error(f"Failed to end session: {str(e)}")
             raise
 
@@ -798,13 +894,8 @@ class SessionService:
 
     def _extract_top_phrases_fallback(self, session_id: int) -> List[Dict[str, Any]]:
         """フォールバックとして最新3ラウンドから復習フレーズを抽出する。"""
-        session_rounds = (
-            self.db.query(SessionRound)
-            .filter(SessionRound.session_id == session_id)
-            .order_by(SessionRound.created_at.desc())
-            .limit(3)
-            .all()
-        )
+        # アーカイブ済みのセッションも読めるよう全ラウンドを読み、新しい順に3件
+        session_rounds = SessionArchiveService(self.db).load_rounds(session_id)[::-1][:3]
 
         top_phrases = []
         for i, round_data in enumerate(session_rounds, 1):
@@ -821,21 +912,10 @@ class SessionService:
 
         return top_phrases
 
-    async def _extract_top_phrases(
-        self, session_id: int
-    ) -> tuple[List[Dict[str, Any]], str, Optional[str]]:
-        """セッション履歴から復習フレーズを抽出する。"""
-        session_rounds = (
-            self.db.query(SessionRound)
-            .filter(SessionRound.session_id == session_id)
-            .order_by(SessionRound.round_index.asc())
-            .all()
-        )
-
-        if not session_rounds:
-            return [], "ai", None
-
-        history = [
+    def _load_review_history(self, session_id: int) -> List[Dict[str, Any]]:
+        """復習フレーズ選定用の会話履歴（時系列順）"""
+        session_rounds = SessionArchiveService(self.db).load_rounds(session_id)
+        return [
             {
                 "round_index": row.round_index,
                 "user_input": row.user_input,
@@ -845,13 +925,23 @@ class SessionService:
             }
             for row in session_rounds
         ]
+
+    async def _extract_top_phrases(
+        self, session_id: int
+    ) -> tuple[List[Dict[str, Any]], str, Optional[str]]:
+        """セッション履歴から復習フレーズを抽出する。"""
+        history = await run_db(self._load_review_history, session_id)
+
+        if not history:
+            return [], "ai", None
+
         selected = await select_top_review_phrases(history)
 
         logger.info(f"selected={selected}")
 
         if selected is None:
             return (
-                self._extract_top_phrases_fallback(session_id),
+                await run_db(self._extract_top_phrases_fallback, session_id),
                 "fallback",
                 "ai_selection_failed",
             )
@@ -0,0 +1,196 @@
+"""音声ターン（STT → 会話生成 → TTS）を1リクエストで処理するパイプライン"""
+
+import asyncio
+import base64
+import logging
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.services.ai.google_tts_provider import GoogleTTSProvider
+from app.services.ai.stt_factory import stt_cache_namespace, transcribe_with_failover
+from app.services.ai.types import SpeechProviderUnavailableError
+from app.services.audio import get_or_transcribe
+from app.services.conversation.session_service import SessionService
+from models.schemas.schemas import TranscriptionResponse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VoiceTurnEvent:
+    """クライアントへ逐次送信するイベント"""
+
+    event: str  # "transcript" | "reply" | "turn" | "audio" | "audio_error" | "error" | "done"
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+class VoiceTurnService:
+    """
+    音声ターンのパイプライン
+
+    文字起こし → SessionService.process_turn を1回のリクエスト内で実行し、
+    AI応答テキストが確定した時点でTTSを並行して開始する（ゴール判定やDB保存と重ねる）。
+    結果は準備できた順に VoiceTurnEvent として返す。
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def run(
+        self,
+        session_id: int,
+        user_id: int,
+        audio: bytes,
+        filename: str,
+        language: Optional[str] = "en",
+        synthesize: bool = True,
+    ) -> AsyncIterator[VoiceTurnEvent]:
+        # 1. 文字起こし
+        async def _transcribe() -> TranscriptionResponse:
+            return await transcribe_with_failover(
+                audio_file=audio, filename=filename, language=language
+            )
+
+        try:
+            transcription = await get_or_transcribe(
+                audio,
+                language,
+                model=stt_cache_namespace(),
+                transcribe=_transcribe,
+                response_model=TranscriptionResponse,
+                db=self.db,
+            )
+        except SpeechProviderUnavailableError as e:
+            logger.error(f"Voice turn transcription unavailable for user {user_id}: {e}")
+            yield VoiceTurnEvent("error", {"status": 503, "detail": str(e)})
+            return
+        except ValueError as e:
+            logger.warning(f"Voice turn transcription failed: {e}")
+            yield VoiceTurnEvent("error", {"status": 400, "detail": str(e)})
+            return
+        except Exception as e:
+            logger.error(f"Voice turn transcription failed for user {user_id}: {e}")
+            yield VoiceTurnEvent(
+                "error", {"status": 500, "detail": "音声認識処理中にエラーが発生しました"}
+            )
+            return
+
+        user_input = transcription.text.strip()
+        yield VoiceTurnEvent(
+            "transcript",
+            {
+                "text": user_input,
+                "confidence": transcription.confidence,
+                "duration": transcription.duration,
+            },
+        )
+        if not user_input:
+            yield VoiceTurnEvent(
+                "error", {"status": 400, "detail": "音声から発話を認識できませんでした"}
+            )
+            return
+
+        # 2. 会話生成（AI応答が出た時点で reply イベント送信 + TTS開始）
+        events: asyncio.Queue = asyncio.Queue()
+        pending: Set[asyncio.Task] = set()
+
+        async def _on_reply(text: str) -> None:
+            await events.put(VoiceTurnEvent("reply", {"text": text}))
+            if synthesize and text.strip():
+                task = asyncio.create_task(self._synthesize(text, events))
+                pending.add(task)
+
+        turn_task = asyncio.create_task(
+            SessionService(self.db).process_turn(
+                session_id, user_input, user_id, on_reply=_on_reply
+            )
+        )
+        pending.add(turn_task)
+
+        try:
+            while pending or not events.empty():
+                if not events.empty():
+                    yield events.get_nowait()
+                    continue
+
+                getter = asyncio.ensure_future(events.get())
+                done, _ = await asyncio.wait(
+                    pending | {getter}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if getter in done:
+                    yield getter.result()
+                else:
+                    getter.cancel()
+                pending.difference_update(done)
+
+                if turn_task in done:
+                    error = self._turn_error(turn_task)
+                    if error is not None:
+                        yield error
+                        return
+                    yield VoiceTurnEvent(
+                        "turn", turn_task.result().model_dump(mode="json")
+                    )
+        finally:
+            # クライアント切断・エラー時は未完了のTTS/ターン処理を打ち切る
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        yield VoiceTurnEvent("done")
+
+    @staticmethod
+    def _turn_error(turn_task: asyncio.Task) -> Optional[VoiceTurnEvent]:
+        exc = turn_task.exception()
+        if exc is None:
+            return None
+        if isinstance(exc, ValueError):
+            logger.warning(f"Voice turn processing failed: {exc}")
+            return VoiceTurnEvent("error", {"status": 400, "detail": str(exc)})
+        if isinstance(exc, TimeoutError):
+            logger.error(f"Voice turn processing timed out: {exc}")
+            return VoiceTurnEvent(
+                "error",
+                {
+                    "status": 504,
+                    "detail": "AI応答がタイムアウトしました。少し待ってからもう一度お試しください。",
+                },
+            )
+        logger.error(f"Unexpected error in voice turn processing: {exc}")
+        return VoiceTurnEvent(
+            "error", {"status": 500, "detail": "Failed to process turn"}
+        )
+
+    @staticmethod
+    async def _synthesize(text: str, events: asyncio.Queue) -> None:
+        """AI応答を読み上げ音声にする。失敗してもターン自体は成功扱いとする。"""
+        try:
+            async with GoogleTTSProvider() as tts_provider:
+                audio_bytes = await tts_provider.synthesize_speech(
+                    text=text,
+                    language_code=settings.GOOGLE_TTS_LANGUAGE,
+                    voice_name=settings.GOOGLE_TTS_VOICE,
+                    speaking_rate=settings.GOOGLE_TTS_SPEAKING_RATE,
+                )
+        except Exception as e:
+            logger.warning(f"Voice turn TTS failed: {e}")
+            await events.put(
+                VoiceTurnEvent(
+                    "audio_error", {"detail": "音声合成処理中にエラーが発生しました"}
+                )
+            )
+            return
+
+        await events.put(
+            VoiceTurnEvent(
+                "audio",
+                {
+                    "content_type": "audio/mpeg",
+                    "data": base64.b64encode(audio_bytes).decode("ascii"),
+                },
+            )
+        )
@@ -0,0 +1,12 @@
+from .leaderboard import (  # noqa: F401
+    BOARDS,
+    Leaderboard,
+    RankIndex,
+    clear_leaderboard,
+    get_leaderboard,
+    period_start,
+    record_points,
+    remove_user,
+    save_snapshots,
+    snapshot_leaderboard,
+)
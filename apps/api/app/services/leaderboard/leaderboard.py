@@ -0,0 +1,272 @@
+"""
+ランキング（リーダーボード）
+
+ユーザーをポイント順に並べた順序統計構造（ソート済み配列 + bisect）をプロセス内に保持し、
+順位・上位N件・次の順位までのポイント差を O(log n) の探索で返す。
+
+- 全期間（all_time）・週間（weekly）・月間（monthly）の3ボード
+- 週間・月間は期間内の獲得ポイント（user_daily_points の合計）で順位付けする（期間の区切りは JST）
+- このプロセスでのポイント付与は record_points で即時反映し、
+  他ワーカーでの付与は LEADERBOARD_REFRESH_SECONDS ごとの再読み込みで取り込む
+- 各ボードの上位 LEADERBOARD_SNAPSHOT_SIZE 件の leaderboard_snapshots への保存は、
+  リクエストとは別に定期ジョブ（python -m app.scripts.snapshot_leaderboard）で1か所から行う
+  （終了した期間の最終順位も、未保存なら DB から集計し直して保存する）
+"""
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pytz
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.logging_config import get_logger
+from models.database.models import LeaderboardSnapshot, User, UserDailyPoints
+
+logger = get_logger(__name__)
+
+JST = pytz.timezone("Asia/Tokyo")
+BOARDS = ("all_time", "weekly", "monthly")
+
+
+class RankIndex:
+    """ポイント順の順序統計構造
+
+    キー (-points, user_id) の昇順に並べた配列を bisect で探索する。
+    ポイント0のユーザーは含めない。同点は同順位（自分より多いユーザー数 + 1）。
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, int]] = ()):
+        self._points: Dict[str, int] = {
+            user_id: points for user_id, points in entries if points and points > 0
+        }
+        self._keys: List[Tuple[int, str]] = sorted(
+            (-points, user_id) for user_id, points in self._points.items()
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._points
+
+    def points(self, user_id: str) -> int:
+        return self._points.get(user_id, 0)
+
+    def set(self, user_id: str, points: int) -> None:
+        old = self._points.pop(user_id, None)
+        if old is not None:
+            del self._keys[bisect_left(self._keys, (-old, user_id))]
+        if points > 0:
+            self._points[user_id] = points
+            insort(self._keys, (-points, user_id))
+
+    def rank_of(self, points: int) -> int:
+        """points より多いユーザー数 + 1"""
+        return bisect_left(self._keys, (-points,)) + 1
+
+    def points_to_next(self, points: int) -> Optional[int]:
+        """1つ上の順位（points より多いユーザーのうち最少ポイント）までの差"""
+        i = bisect_left(self._keys, (-points,))
+        if i == 0:
+            return None
+        return -self._keys[i - 1][0] - points
+
+    def top(self, limit: int) -> List[Tuple[str, int]]:
+        return [(user_id, -neg) for neg, user_id in self._keys[:limit]]
+
+
+def period_start(board: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    """ボードの集計期間の開始時刻（UTC）。全期間は None"""
+    now_jst = (now or datetime.now(timezone.utc)).astimezone(JST)
+    if board == "weekly":
+        start = (now_jst - timedelta(days=now_jst.weekday())).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+    elif board == "monthly":
+        start = now_jst.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    else:
+        return None
+    return start.astimezone(timezone.utc)
+
+
+def _period_key(start: Optional[datetime]) -> str:
+    if start is None:
+        return "all_time"
+    return start.astimezone(JST).date().isoformat()
+
+
+def _current_period_keys(now: Optional[datetime] = None) -> Dict[str, str]:
+    return {board: _period_key(period_start(board, now)) for board in BOARDS}
+
+
+class Leaderboard:
+    """3ボード分の RankIndex と読み込み時刻"""
+
+    def __init__(self, boards: Dict[str, RankIndex], period_keys: Dict[str, str]):
+        self.boards = boards
+        self.period_keys = period_keys
+        self.loaded_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls,
+        db: Session,
+        now: Optional[datetime] = None,
+        boards: Iterable[str] = BOARDS,
+    ) -> "Leaderboard":
+        """now 時点の期間で各ボードを読み込む（過去の now なら終了した期間の最終順位）"""
+        indexes: Dict[str, RankIndex] = {}
+        period_keys: Dict[str, str] = {}
+        for board in boards:
+            start = period_start(board, now)
+            if start is None:
+                query = db.query(User.id, User.total_points).filter(User.total_points > 0)
+            else:
+                # 期間内（開始日〜now の日）の日別獲得ポイントの合計
+                now_jst = (now or datetime.now(timezone.utc)).astimezone(JST)
+                query = (
+                    db.query(UserDailyPoints.user_id, func.sum(UserDailyPoints.points))
+                    .filter(
+                        UserDailyPoints.day >= start.astimezone(JST).date(),
+                        UserDailyPoints.day <= now_jst.date(),
+                    )
+                    .group_by(UserDailyPoints.user_id)
+                )
+            indexes[board] = RankIndex(query.all())
+            period_keys[board] = _period_key(start)
+        return cls(indexes, period_keys)
+
+    def is_stale(self, now: Optional[datetime] = None) -> bool:
+        if time.monotonic() - self.loaded_at >= settings.LEADERBOARD_REFRESH_SECONDS:
+            return True
+        return self.period_keys != _current_period_keys(now)
+
+    def rank_of(self, board: str, points: int) -> Tuple[int, Optional[int], int]:
+        """(順位, 次の順位までのポイント差, 対象ユーザー数)"""
+        with self._lock:
+            index = self.boards[board]
+            return index.rank_of(points), index.points_to_next(points), len(index)
+
+    def top(self, board: str, limit: int) -> List[Tuple[str, int]]:
+        with self._lock:
+            return self.boards[board].top(limit)
+
+    def size(self, board: str) -> int:
+        with self._lock:
+            return len(self.boards[board])
+
+    def add_points(self, user_id: str, delta: int) -> None:
+        with self._lock:
+            for index in self.boards.values():
+                index.set(user_id, index.points(user_id) + delta)
+
+    def remove(self, user_id: str) -> None:
+        with self._lock:
+            for index in self.boards.values():
+                index.set(user_id, 0)
+
+
+_leaderboard: Optional[Leaderboard] = None
+_lock = threading.Lock()
+
+
+def get_leaderboard(db: Session) -> Leaderboard:
+    """ランキングを返す（未読み込み・期限切れ・期間切り替わりなら db から読み込む）"""
+    leaderboard = _leaderboard
+    if leaderboard is not None and not leaderboard.is_stale():
+        return leaderboard
+    with _lock:
+        if _leaderboard is None or _leaderboard.is_stale():
+            return _load(db)
+        return _leaderboard
+
+
+def record_points(user_id: str, delta: int) -> None:
+    """このプロセスで付与したポイントを反映する（付与のコミット後に呼ぶ）"""
+    leaderboard = _leaderboard
+    if leaderboard is not None and delta:
+        leaderboard.add_points(user_id, delta)
+
+
+def remove_user(user_id: str) -> None:
+    """退会したユーザーをランキングから外す"""
+    leaderboard = _leaderboard
+    if leaderboard is not None:
+        leaderboard.remove(user_id)
+
+
+def clear_leaderboard() -> None:
+    """読み込み済みランキングを破棄する（次回 get_leaderboard で再読み込み）"""
+    global _leaderboard
+    with _lock:
+        _leaderboard = None
+
+
+def snapshot_leaderboard(db: Session, leaderboard: Leaderboard) -> None:
+    """各ボードの上位N件を保存する（同じボード・期間の既存スナップショットは置き換える）"""
+    size = settings.LEADERBOARD_SNAPSHOT_SIZE
+    for board, period_key in leaderboard.period_keys.items():
+        db.query(LeaderboardSnapshot).filter(
+            LeaderboardSnapshot.board == board,
+            LeaderboardSnapshot.period_key == period_key,
+        ).delete(synchronize_session=False)
+        top = leaderboard.top(board, size)
+        db.bulk_insert_mappings(
+            LeaderboardSnapshot,
+            [
+                {
+                    "board": board,
+                    "period_key": period_key,
+                    "rank": leaderboard.rank_of(board, points)[0],
+                    "user_id": user_id,
+                    "points": points,
+                }
+                for user_id, points in top
+            ],
+        )
+    db.commit()
+
+
+def save_snapshots(db: Session, now: Optional[datetime] = None) -> List[Tuple[str, str]]:
+    """現在の期間のスナップショットを保存し、直前の期間の最終順位が未保存なら保存する
+
+    プロセス内のランキングではなく DB から集計し直すため、どのワーカーの状態にも依存しない。
+    保存した (ボード, 期間) を返す。
+    """
+    now = now or datetime.now(timezone.utc)
+    current = Leaderboard.load(db, now)
+    snapshot_leaderboard(db, current)
+    saved = list(current.period_keys.items())
+
+    for board in BOARDS:
+        start = period_start(board, now)
+        if start is None:
+            continue
+        # 現在の期間が始まる直前の時点で読み込めば、終了した期間の最終順位になる
+        previous_end = start - timedelta(microseconds=1)
+        previous_key = _period_key(period_start(board, previous_end))
+        exists = (
+            db.query(LeaderboardSnapshot.id)
+            .filter(
+                LeaderboardSnapshot.board == board,
+                LeaderboardSnapshot.period_key == previous_key,
+            )
+            .first()
+        )
+        if exists is None:
+            snapshot_leaderboard(db, Leaderboard.load(db, previous_end, boards=(board,)))
+            saved.append((board, previous_key))
+    return saved
+
+
+def _load(db: Session) -> Leaderboard:
+    global _leaderboard
+    _leaderboard = Leaderboard.load(db)
+    return _leaderboard
@@ -1,11 +1,15 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from typing import Tuple
-from datetime import datetime, timedelta, timezone
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import func, case, update
+from typing import Optional, Sequence, Tuple
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
 import pytz
 import logging
 
-from models.database.models import User, Session as SessionModel, DifficultyLevel
+from app.db.upsert import bulk_upsert
+from app.services.leaderboard import record_points
+from models.database.models import PointEvent, User, UserDailyPoints
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +24,12 @@ DIFFICULTY_MULTIPLIERS = {
     "advanced": 1.5,
 }
 
+# 付与理由（point_events.reason）
+REASON_ROUND = "round"
+REASON_SESSION_COMPLETE = "session_complete"
+
+JST = pytz.timezone("Asia/Tokyo")
+
 # ストリークボーナス（連続日数に応じた追加ボーナス率）
 STREAK_BONUSES = {
     3: 0.10,  # 3日連続: +10%
@@ -28,6 +38,22 @@ STREAK_BONUSES = {
 }
 
 
+@dataclass
+class PointAward:
+    """1回分のポイント付与"""
+
+    points: int
+    reason: str
+    session_id: Optional[int] = None
+
+
+def jst_day(moment: datetime) -> date:
+    """日別集計に使う日付（JST）"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(JST).date()
+
+
 class PointService:
     """ポイント計算・付与サービス"""
 
@@ -108,6 +134,65 @@ class PointService:
 
         return points
 
+    def add_points(
+        self,
+        user: User,
+        awards: Sequence[PointAward],
+        awarded_at: Optional[datetime] = None,
+    ) -> int:
+        """
+        ポイントを付与し、付与履歴と日別集計を同じトランザクションで書き込む
+
+        コミットは呼び出し側で行い、コミット後に record_points でランキングへ反映すること。
+
+        Args:
+            user: 付与先ユーザー
+            awards: 付与内容（0ポイントの付与は記録しない）
+            awarded_at: 付与日時（省略時は現在時刻）
+
+        Returns:
+            int: 付与したポイントの合計
+        """
+        awards = [award for award in awards if award.points]
+        if not awards:
+            return 0
+
+        awarded_at = awarded_at or datetime.now(timezone.utc)
+        total = sum(award.points for award in awards)
+
+        # 読み込み済みの値ではなくDB上の値に加算する（読み込みからコミットまでの間に
+        # 他の付与がコミットされても上書きしない）。インスタンスの値は表示用に合わせるだけ
+        self.db.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(total_points=func.coalesce(User.total_points, 0) + total)
+            .execution_options(synchronize_session=False)
+        )
+        set_committed_value(user, "total_points", (user.total_points or 0) + total)
+        self.db.bulk_insert_mappings(
+            PointEvent,
+            [
+                {
+                    "user_id": user.id,
+                    "points": award.points,
+                    "reason": award.reason,
+                    "session_id": award.session_id,
+                    "awarded_at": awarded_at,
+                }
+                for award in awards
+            ],
+        )
+        bulk_upsert(
+            self.db,
+            UserDailyPoints.__table__,
+            [{"user_id": user.id, "day": jst_day(awarded_at), "points": total}],
+            conflict_columns=("user_id", "day"),
+            update=lambda columns, incoming: {
+                "points": columns.points + incoming.points
+            },
+        )
+        return total
+
     def award_round_points(
         self,
         user_id: int,
@@ -131,9 +216,10 @@ class PointService:
         current_streak = user.current_streak or 0
         points = self.calculate_round_points(difficulty, current_streak)
 
-        user.total_points = (user.total_points or 0) + points
+        self.add_points(user, [PointAward(points, REASON_ROUND)])
         self.db.commit()
         self.db.refresh(user)
+        record_points(user_id, points)
 
         logger.info(
             f"Awarded {points} points to user {user_id} "
@@ -165,9 +251,10 @@ class PointService:
         current_streak = user.current_streak or 0
         points = self.calculate_session_completion_points(difficulty, current_streak)
 
-        user.total_points = (user.total_points or 0) + points
+        self.add_points(user, [PointAward(points, REASON_SESSION_COMPLETE)])
         self.db.commit()
         self.db.refresh(user)
+        record_points(user_id, points)
 
         logger.info(
             f"Awarded {points} points to user {user_id} "
@@ -192,48 +279,24 @@ class PointService:
 
         total_points = user.total_points or 0
 
-        # 今週のポイントを計算（JST基準）
-        jst = pytz.timezone("Asia/Tokyo")
-        now_jst = datetime.now(jst)
-        week_start = (now_jst - timedelta(days=now_jst.weekday())).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        week_start_utc = week_start.astimezone(timezone.utc)
-
-        # 今日のポイントを計算
-        today_start = now_jst.replace(hour=0, minute=0, second=0, microsecond=0)
-        today_start_utc = today_start.astimezone(timezone.utc)
-
-        # 今週のセッションからポイントを計算
-        # 注: 実際のポイント履歴がないため、セッション完了時刻から推定
-        # MVPでは簡易実装として、セッション完了数をベースに推定
-        sessions_this_week = (
-            self.db.query(SessionModel)
-            .filter(
-                and_(
-                    SessionModel.user_id == user_id,
-                    SessionModel.ended_at.is_not(None),
-                    SessionModel.ended_at >= week_start_utc,
-                )
+        # 今週・今日のポイントは日別集計（JST基準）から求める
+        today = jst_day(datetime.now(timezone.utc))
+        week_start = today - timedelta(days=today.weekday())
+        points_this_week, points_today = (
+            self.db.query(
+                func.coalesce(func.sum(UserDailyPoints.points), 0),
+                func.coalesce(
+                    func.sum(
+                        case((UserDailyPoints.day == today, UserDailyPoints.points), else_=0)
+                    ),
+                    0,
+                ),
             )
-            .count()
-        )
-
-        sessions_today = (
-            self.db.query(SessionModel)
             .filter(
-                and_(
-                    SessionModel.user_id == user_id,
-                    SessionModel.ended_at.is_not(None),
-                    SessionModel.ended_at >= today_start_utc,
-                )
+                UserDailyPoints.user_id == user_id,
+                UserDailyPoints.day >= week_start,
             )
-            .count()
+            .one()
         )
 
-        # 簡易計算: セッションあたり平均100ポイントと仮定
-        # 実際の実装ではポイント履歴テーブルを作成することを推奨
-        points_this_week = sessions_this_week * 100
-        points_today = sessions_today * 100
-
-        return total_points, points_this_week, points_today
+        return total_points, int(points_this_week), int(points_today)
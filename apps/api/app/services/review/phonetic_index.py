@@ -0,0 +1,223 @@
+"""
+発音キー（phonetic key）と教材文インデックス
+
+Whisper は同音異義語や綴りの近い語（there/their, check-in/checking）を返しやすい。
+あいまい一致モードでは、ターゲット語と発話語が同音異義語リスト上で同じ発音キーを持つか、
+母音の並びが同じで編集距離が語長に応じた上限以内であれば一致とみなす。
+母音だけが違う語（ship/sheep, live/leave）は学習者の発音ミスなので一致させない。
+
+ターゲット文（シャドーイング文・レベル診断の問題文・復習問題文）は数が限られるため、
+正規化済みトークン列と発音キーを一度だけ計算してインメモリの辞書に保持し、
+採点時は O(1) で引く。
+"""
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.logging_config import get_logger
+from app.services.content import get_catalog
+
+logger = get_logger(__name__)
+
+_PUNCTUATION_RE = re.compile(r'[.,!?;:\'"()-]')
+
+_VOWELS = frozenset("aeiou")
+
+# 同じ発音になる語のグループ（正規化後の綴り）。発音キーが一致するのはここに載っている語同士だけで、
+# 母音だけが違う語（ship/sheep, live/leave）は学習者の発音ミスそのものなので一致させない
+HOMOPHONE_GROUPS: Tuple[Tuple[str, ...], ...] = (
+    ("to", "too", "two"),
+    ("there", "their", "theyre"),
+    ("your", "youre"),
+    ("write", "right", "rite"),
+    ("four", "for", "fore"),
+    ("know", "no"),
+    ("knew", "new"),
+    ("knight", "night"),
+    ("hear", "here"),
+    ("see", "sea"),
+    ("by", "buy", "bye"),
+    ("one", "won"),
+    ("eight", "ate"),
+    ("wait", "weight"),
+    ("way", "weigh"),
+    ("weather", "whether"),
+    ("where", "wear"),
+    ("week", "weak"),
+    ("meet", "meat"),
+    ("hour", "our"),
+    ("flour", "flower"),
+    ("blue", "blew"),
+    ("sun", "son"),
+    ("made", "maid"),
+    ("mail", "male"),
+    ("pair", "pear"),
+    ("peace", "piece"),
+    ("plane", "plain"),
+    ("road", "rode"),
+    ("sale", "sail"),
+    ("tail", "tale"),
+    ("threw", "through"),
+    ("which", "witch"),
+    ("wood", "would"),
+    ("whole", "hole"),
+    ("be", "bee"),
+    ("i", "eye"),
+    ("break", "brake"),
+    ("fair", "fare"),
+    ("sent", "cent", "scent"),
+    ("allowed", "aloud"),
+    ("check", "cheque"),
+)
+
+_HOMOPHONE_KEYS: Dict[str, str] = {
+    word: group[0] for group in HOMOPHONE_GROUPS for word in group
+}
+
+# 動的に追加される復習問題文などでメモリが膨らまないようにする上限
+DEFAULT_MAX_ENTRIES = 20000
+
+
+def normalize_words(text: str) -> List[str]:
+    """小文字化・句読点除去して単語列にする"""
+    return _PUNCTUATION_RE.sub("", text.lower()).split()
+
+
+def phonetic_key(word: str) -> str:
+    """英単語の発音キーを返す
+
+    HOMOPHONE_GROUPS に載っている語はグループの代表語、それ以外は語そのもの。
+    例: there/their -> "there", to/too/two -> "to", ship/sheep -> 別のキー
+    """
+    return _HOMOPHONE_KEYS.get(word, word)
+
+
+def _vowel_pattern(word: str) -> str:
+    return "".join(c for c in word if c in _VOWELS)
+
+
+def max_edit_distance(word: str) -> int:
+    """あいまい一致で許容する編集距離（短い語ほど厳しくする）"""
+    length = len(word)
+    if length < 4:
+        return 0
+    if length < 8:
+        return 1
+    return 2
+
+
+def within_edit_distance(a: str, b: str, limit: int) -> bool:
+    """a と b の編集距離が limit 以下か（上限を超えた時点で打ち切る）"""
+    if a == b:
+        return True
+    if limit <= 0 or abs(len(a) - len(b)) > limit:
+        return False
+
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j, cb in enumerate(b, start=1):
+            current[j] = min(
+                previous[j - 1] + (ca != cb),
+                previous[j] + 1,
+                current[j - 1] + 1,
+            )
+            if current[j] < row_min:
+                row_min = current[j]
+        if row_min > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+
+def words_sound_alike(
+    target_word: str,
+    target_key: str,
+    spoken_word: str,
+    spoken_key: Optional[str] = None,
+) -> bool:
+    """ターゲット語と発話語をあいまい一致で比較する"""
+    if target_word == spoken_word:
+        return True
+    if spoken_key is None:
+        spoken_key = phonetic_key(spoken_word)
+    if target_key and target_key == spoken_key:
+        return True
+    # 綴りの近い語（check-in/checking）は許すが、母音の違い（ship/shop）は発音ミスとして扱う
+    if _vowel_pattern(target_word) != _vowel_pattern(spoken_word):
+        return False
+    return within_edit_distance(target_word, spoken_word, max_edit_distance(target_word))
+
+
+class IndexedSentence:
+    """インデックス済みのターゲット文"""
+
+    __slots__ = ("text", "tokens", "keys")
+
+    def __init__(self, text: str, tokens: Tuple[str, ...], keys: Tuple[str, ...]):
+        self.text = text
+        self.tokens = tokens
+        self.keys = keys
+
+    @classmethod
+    def build(cls, text: str) -> "IndexedSentence":
+        tokens = tuple(normalize_words(text))
+        return cls(text, tokens, tuple(phonetic_key(token) for token in tokens))
+
+
+class PhoneticIndex:
+    """ターゲット文 -> 正規化トークン列・発音キーの事前計算インデックス"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: Dict[str, IndexedSentence] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._entries
+
+    def add(self, text: str) -> IndexedSentence:
+        entry = self._entries.get(text)
+        if entry is None:
+            entry = IndexedSentence.build(text)
+            if len(self._entries) < self.max_entries:
+                self._entries[text] = entry
+        return entry
+
+    def add_many(self, texts: Iterable[Optional[str]]) -> int:
+        """ターゲット文をまとめて登録し、新規に登録した件数を返す"""
+        before = len(self._entries)
+        for text in texts:
+            if text:
+                self.add(text)
+        return len(self._entries) - before
+
+    def lookup(self, text: str) -> IndexedSentence:
+        """ターゲット文のインデックスを引く（未登録なら計算して登録する）"""
+        entry = self._entries.get(text)
+        if entry is not None:
+            return entry
+        return self.add(text)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+phonetic_index = PhoneticIndex()
+
+
+def index_shadowing_sentences(db: Session) -> int:
+    """全シャドーイング文をインデックスに登録する（起動時に呼ぶ）"""
+    sentences = get_catalog(db).shadowing_sentences
+    added = phonetic_index.add_many(s.sentence_en for s in sentences)
+    logger.info(
+        "Phonetic index warmed",
+        extra={"shadowing_sentences": len(sentences), "indexed_total": len(phonetic_index)},
+    )
+    return added
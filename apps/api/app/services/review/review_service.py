@@ -1,42 +1,23 @@
 from __future__ import annotations
 
-import re
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import false, func, true
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.db.pagination import paginate
+from app.services.stats import UserStatsService
 from models.database.models import ReviewItem
-
-
-# スコア閾値（これ以上で「合格」とみなす）
-PASSING_SCORE = 70
-
-
-class WordMatchResult:
-    """単語の一致結果"""
-
-    def __init__(self, word: str, matched: bool, index: int):
-        self.word = word
-        self.matched = matched
-        self.index = index
-
-
-class EvaluationResult:
-    """評価結果"""
-
-    def __init__(
-        self,
-        score: int,
-        is_correct: bool,
-        matching_words: Optional[List[WordMatchResult]] = None,
-        correct_answer: Optional[str] = None,
-    ):
-        self.score = score
-        self.is_correct = is_correct
-        self.matching_words = matching_words or []
-        self.correct_answer = correct_answer
+from .scheduler import MAX_QUALITY, is_mastered, quality_from_score, schedule_next
+from .speech_scoring import (  # noqa: F401
+    PASSING_SCORE,
+    EvaluationResult,
+    WordMatchResult,
+    score_speech,
+    score_speech_batch,
+)
 
 
 class ReviewService:
@@ -45,45 +26,59 @@ class ReviewService:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_due_items(self, user_id: int, limit: int = 100) -> List[ReviewItem]:
-        """復習アイテムを未完了優先・作成日時の降順で取得する"""
+    def get_due_items(
+        self,
+        user_id: int,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ReviewItem], Optional[str]]:
+        """期限が来た未完了の復習アイテムを復習期限の早い順に取得する
 
-        return (
-            self.db.query(ReviewItem)
-            .filter(
-                ReviewItem.user_id == user_id,
-            )
-            .order_by(ReviewItem.is_completed.asc(), ReviewItem.created_at.desc())
-            .limit(limit)
-            .all()
+        (user_id, is_completed, due_at) インデックスの順に読み、次ページのカーソルを返す。
+        合格して次回の復習日が先になったアイテムは、その日まで含めない。
+
+        Raises:
+            InvalidCursorError: cursor を解釈できない場合
+        """
+        query = self.db.query(ReviewItem).filter(
+            ReviewItem.user_id == user_id,
+            ReviewItem.is_completed == false(),
+            ReviewItem.due_at <= datetime.utcnow(),
         )
+        return paginate(query, ReviewItem.due_at, ReviewItem.id, limit, cursor)
 
     def count_due_items(self, user_id: int) -> int:
+        """期限が来た未完了アイテム数（インデックスのみで数えられる条件）"""
         now = datetime.utcnow()
         return (
             self.db.query(func.count(ReviewItem.id))
             .filter(
                 ReviewItem.user_id == user_id,
-                ReviewItem.is_completed.is_(False),
+                ReviewItem.is_completed == false(),
                 ReviewItem.due_at <= now,
             )
             .scalar()
             or 0
         )
 
-    def get_history(self, user_id: int, limit: int = 20) -> List[ReviewItem]:
-        """最近完了した復習アイテム"""
+    def get_history(
+        self,
+        user_id: int,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ReviewItem], Optional[str]]:
+        """最近完了した復習アイテムと次ページのカーソル
 
-        return (
-            self.db.query(ReviewItem)
-            .filter(
-                ReviewItem.user_id == user_id,
-                ReviewItem.is_completed.is_(True),
-                ReviewItem.completed_at.isnot(None),
-            )
-            .order_by(ReviewItem.completed_at.desc())
-            .limit(limit)
-            .all()
+        Raises:
+            InvalidCursorError: cursor を解釈できない場合
+        """
+        query = self.db.query(ReviewItem).filter(
+            ReviewItem.user_id == user_id,
+            ReviewItem.is_completed == true(),
+            ReviewItem.completed_at.isnot(None),
+        )
+        return paginate(
+            query, ReviewItem.completed_at, ReviewItem.id, limit, cursor, descending=True
         )
 
     def get_stats(self, user_id: int) -> Dict[str, float]:
@@ -96,22 +91,10 @@ class ReviewService:
                 "completion_rate": 完了率 (0.0 - 100.0)
             }
         """
-        total_items = (
-            self.db.query(func.count(ReviewItem.id))
-            .filter(ReviewItem.user_id == user_id)
-            .scalar()
-            or 0
-        )
-
-        completed_items = (
-            self.db.query(func.count(ReviewItem.id))
-            .filter(
-                ReviewItem.user_id == user_id,
-                ReviewItem.is_completed.is_(True),
-            )
-            .scalar()
-            or 0
-        )
+        # user_stats のカウンタ（主キー1回の読み込み）
+        counters = UserStatsService(self.db).get(user_id)
+        total_items = counters["review_items_total"]
+        completed_items = counters["review_items_completed"]
 
         completion_rate = 0.0
         if total_items > 0:
@@ -133,29 +116,20 @@ class ReviewService:
             bool: 正解だった場合は True
         """
 
-        item = (
-            self.db.query(ReviewItem)
-            .filter(ReviewItem.id == item_id, ReviewItem.user_id == user_id)
-            .first()
-        )
-
-        if not item:
-            raise ValueError("Review item not found")
-
-        now = datetime.utcnow()
         normalized = result.lower()
         if normalized not in {"correct", "incorrect"}:
             raise ValueError("Invalid review result")
 
-        if normalized == "correct":
-            item.is_completed = True
-            item.completed_at = now
-        else:
-            # 翌日再出題（シンプルな復習間隔）
-            item.is_completed = False
-            item.due_at = now + timedelta(days=1)
-            item.completed_at = None
+        now = datetime.utcnow()
+        item = self._get_due_item(user_id, item_id, now)
+
+        was_completed = bool(item.is_completed)
+
+        # 正解でも間隔が十分に伸びるまでは復習キューに残す。
+        # 不正解なら連続正解回数をリセットして翌日再出題
+        self._reschedule(item, MAX_QUALITY if normalized == "correct" else 0, now)
 
+        self._count_completion(user_id, was_completed, item.is_completed)
         self.db.commit()
         self.db.refresh(item)
 
@@ -165,61 +139,38 @@ class ReviewService:
     def evaluate_speaking(
         target_sentence: str,
         user_transcription: str,
+        mode: Optional[str] = None,
+        fuzzy: Optional[bool] = None,
     ) -> EvaluationResult:
         """スピーキング問題を評価する（単語レベル一致率）
 
         Args:
             target_sentence: ターゲット文（正解）
             user_transcription: ユーザーの発話認識結果
+            mode: 採点モード（"bag" | "alignment"）。省略時は SPEECH_SCORING_MODE
+            fuzzy: 発音・綴りの近い語も一致とみなすか。省略時は SPEECH_FUZZY_MATCHING
 
         Returns:
             EvaluationResult: 評価結果（スコア、一致情報）
         """
+        return score_speech(
+            target_sentence,
+            user_transcription,
+            mode=mode or settings.SPEECH_SCORING_MODE,
+            fuzzy=settings.SPEECH_FUZZY_MATCHING if fuzzy is None else fuzzy,
+        )
 
-        # 正規化: 小文字化、句読点除去
-        def normalize(text: str) -> List[str]:
-            clean = re.sub(r'[.,!?;:\'"()-]', "", text.lower())
-            return clean.split()
-
-        target_words = normalize(target_sentence)
-        user_words = normalize(user_transcription)
-
-        if not target_words:
-            return EvaluationResult(
-                score=0,
-                is_correct=False,
-                matching_words=[],
-                correct_answer=target_sentence,
-            )
-
-        # 各ターゲット単語に対して一致を確認
-        matching_words: List[WordMatchResult] = []
-        matched_count = 0
-
-        for i, target_word in enumerate(target_words):
-            # ユーザーの発話に含まれているかチェック
-            matched = target_word in user_words
-            if matched:
-                matched_count += 1
-                # 一致した単語はユーザーリストから除去（重複カウント防止）
-                user_words.remove(target_word)
-            matching_words.append(
-                WordMatchResult(
-                    word=target_word,
-                    matched=matched,
-                    index=i,
-                )
-            )
-
-        # スコア計算（0-100）
-        score = int((matched_count / len(target_words)) * 100)
-        is_correct = score >= PASSING_SCORE
-
-        return EvaluationResult(
-            score=score,
-            is_correct=is_correct,
-            matching_words=matching_words,
-            correct_answer=target_sentence,
+    @staticmethod
+    def evaluate_speaking_batch(
+        pairs: List[Tuple[str, str]],
+        mode: Optional[str] = None,
+        fuzzy: Optional[bool] = None,
+    ) -> List[EvaluationResult]:
+        """(ターゲット文, 発話認識結果) の組をまとめて評価する"""
+        return score_speech_batch(
+            pairs,
+            mode=mode or settings.SPEECH_SCORING_MODE,
+            fuzzy=settings.SPEECH_FUZZY_MATCHING if fuzzy is None else fuzzy,
         )
 
     @staticmethod
@@ -283,8 +234,8 @@ class ReviewService:
         """評価結果に基づいて復習アイテムを更新する。
 
         Speaking 評価時は DB を更新せずスコアのみ返却する。
-        Listening 評価時に Speaking スコアと Listening スコアの
-        両方が 100 の場合のみ完了とする。
+        Listening 評価時に Speaking スコアと Listening スコアの低い方で
+        SM-2 の次回復習日を決め、間隔が MASTERY_INTERVAL_DAYS に届いたら完了とする。
 
         Args:
             user_id: ユーザーID
@@ -299,38 +250,62 @@ class ReviewService:
             bool: 復習アイテムが完了したかどうか
             datetime: 次回の復習予定日（再出題の場合）
         """
-        item = (
-            self.db.query(ReviewItem)
-            .filter(ReviewItem.id == item_id, ReviewItem.user_id == user_id)
-            .first()
-        )
-
-        if not item:
-            raise ValueError("Review item not found")
-
         if question_type not in {"speaking", "listening"}:
             raise ValueError("Invalid question type")
 
         now = datetime.utcnow()
+        item = self._get_due_item(user_id, item_id, now)
         next_due_at: Optional[datetime] = None
+        was_completed = bool(item.is_completed)
 
         # リスニング問題（最後の問題）の評価時に完了判定
         if question_type == "listening":
-            # Speaking・Listening 両方 100 点で完了
-            both_perfect = (speaking_score == 100) and (score == 100)
-            if both_perfect:
-                item.is_completed = True
-                item.completed_at = now
-            else:
-                # どちらかが 100 未満の場合は翌日再出題
-                item.is_completed = False
-                item.due_at = now + timedelta(days=1)
-                item.completed_at = None
+            # 低い方のスコアで次回の復習日を決める（両方 100 点なら満点扱い）。
+            # 間隔が十分に伸びたら完了、それまでは次回の復習日に再出題
+            self._reschedule(
+                item, quality_from_score(min(speaking_score or 0, score)), now
+            )
+            if not item.is_completed:
                 next_due_at = item.due_at
 
         # Speaking 評価時は DB を更新しない（スコアのみ返却）
 
+        self._count_completion(user_id, was_completed, item.is_completed)
         self.db.commit()
         self.db.refresh(item)
 
         return item, item.is_completed, next_due_at
+
+    def _get_due_item(self, user_id: int, item_id: int, now: datetime) -> ReviewItem:
+        """復習期限が来たアイテムを取得する（期限前の回答で SM-2 の間隔を崩さない）"""
+        item = (
+            self.db.query(ReviewItem)
+            .filter(ReviewItem.id == item_id, ReviewItem.user_id == user_id)
+            .first()
+        )
+
+        if not item:
+            raise ValueError("Review item not found")
+        if item.due_at > now:
+            raise ValueError("Review item is not due yet")
+        return item
+
+    @staticmethod
+    def _reschedule(item: ReviewItem, quality: int, now: datetime) -> None:
+        """SM-2 で次回の復習日時を決め、間隔が十分に伸びていれば完了にする"""
+        schedule = schedule_next(
+            quality, item.ease_factor, item.interval_days, item.repetitions, now
+        )
+        item.ease_factor = schedule.ease_factor
+        item.interval_days = schedule.interval_days
+        item.repetitions = schedule.repetitions
+        item.due_at = schedule.due_at
+        item.is_completed = is_mastered(schedule)
+        item.completed_at = now if item.is_completed else None
+
+    def _count_completion(self, user_id: int, was_completed: bool, is_completed: bool) -> None:
+        """完了状態が変わったら user_stats の完了数を増減する"""
+        if was_completed != bool(is_completed):
+            UserStatsService(self.db).increment(
+                user_id, review_items_completed=1 if is_completed else -1
+            )
@@ -0,0 +1,95 @@
+"""
+復習間隔のスケジューリング（SM-2 方式）
+
+復習アイテムごとに易しさ係数（ease_factor）・間隔（interval_days）・連続正解回数（repetitions）を持ち、
+回答の出来（quality: 0-5）から次回の復習日時を決める。
+
+- quality 3 以上: 1日 → 6日 → 前回間隔 × ease_factor と間隔を伸ばす
+- quality 3 未満: 連続正解回数をリセットして翌日に再出題
+- ease_factor は出来に応じて増減し、MIN_EASE_FACTOR を下回らない
+- 合格しても間隔が MASTERY_INTERVAL_DAYS に届くまでは復習キューに残し、届いたら完了とする
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from .speech_scoring import PASSING_SCORE
+
+DEFAULT_EASE_FACTOR = 2.5
+MIN_EASE_FACTOR = 1.3
+PASSING_QUALITY = 3
+MAX_QUALITY = 5
+# 満点で合格し続けた場合 1 → 6 → 16 → 45 日となり、4回目の合格で完了
+MASTERY_INTERVAL_DAYS = 21
+
+# quality ごとの最低スコア（高い順）。quality 3 の境界は合格点に合わせる
+_QUALITY_THRESHOLDS = (
+    (100, 5),
+    (85, 4),
+    (PASSING_SCORE, PASSING_QUALITY),
+    (50, 2),
+    (25, 1),
+)
+
+
+@dataclass(frozen=True)
+class ReviewSchedule:
+    """スケジューリング結果"""
+
+    ease_factor: float
+    interval_days: int
+    repetitions: int
+    due_at: datetime
+
+
+def quality_from_score(score: Optional[int]) -> int:
+    """0-100点のスコアを quality（0-5）に変換する（PASSING_SCORE 以上で合格）"""
+    if score is None:
+        return 0
+    for threshold, quality in _QUALITY_THRESHOLDS:
+        if score >= threshold:
+            return quality
+    return 0
+
+
+def is_mastered(schedule: ReviewSchedule) -> bool:
+    """復習間隔が十分に伸び、復習キューから外してよいか"""
+    return schedule.interval_days >= MASTERY_INTERVAL_DAYS
+
+
+def schedule_next(
+    quality: int,
+    ease_factor: Optional[float],
+    interval_days: Optional[int],
+    repetitions: Optional[int],
+    now: datetime,
+) -> ReviewSchedule:
+    """回答の出来から次回の復習スケジュールを計算する"""
+    quality = max(0, min(MAX_QUALITY, quality))
+    ease = ease_factor or DEFAULT_EASE_FACTOR
+    interval = interval_days or 0
+    reps = repetitions or 0
+
+    if quality >= PASSING_QUALITY:
+        if reps == 0:
+            interval = 1
+        elif reps == 1:
+            interval = 6
+        else:
+            interval = max(1, round(interval * ease))
+        reps += 1
+    else:
+        reps = 0
+        interval = 1
+
+    miss = MAX_QUALITY - quality
+    ease = max(MIN_EASE_FACTOR, ease + 0.1 - miss * (0.08 + miss * 0.02))
+
+    return ReviewSchedule(
+        ease_factor=round(ease, 2),
+        interval_days=interval,
+        repetitions=reps,
+        due_at=now + timedelta(days=interval),
+    )
@@ -0,0 +1,307 @@
+"""
+スピーキング採点エンジン
+
+復習・シャドーイング・瞬間英作・レベル診断のスピーキング評価で共通に使う。
+
+- bag: 語順を無視した単語一致率（Counter による多重集合マッチング、O(n + m)）
+- alignment: トークン列の編集距離アラインメント。挿入・脱落・置換を報告し、
+  スコアは 1 - WER（語順の誤りや余計な語も減点される）
+
+fuzzy=True ではどちらのモードでも、発音キーの一致または語長に応じた編集距離以内の
+語を一致とみなす（there/their, checkin/checking など）。
+ターゲット文のトークン列・発音キーは phonetic_index から引く。
+"""
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .phonetic_index import (  # noqa: F401
+    IndexedSentence,
+    normalize_words,
+    phonetic_index,
+    phonetic_key,
+    words_sound_alike,
+)
+
+# スコア閾値（これ以上で「合格」とみなす）
+PASSING_SCORE = 70
+
+SCORING_MODES = ("bag", "alignment")
+
+class WordMatchResult:
+    """単語の一致結果"""
+
+    __slots__ = ("word", "matched", "index")
+
+    def __init__(self, word: str, matched: bool, index: int):
+        self.word = word
+        self.matched = matched
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"WordMatchResult(word={self.word!r}, matched={self.matched}, index={self.index})"
+
+
+class AlignmentOp:
+    """アラインメントの1操作
+
+    op: "match" | "substitute" | "delete"（ターゲット語の脱落）| "insert"（余計な発話）
+    """
+
+    __slots__ = ("op", "target_word", "spoken_word", "target_index")
+
+    def __init__(
+        self,
+        op: str,
+        target_word: Optional[str],
+        spoken_word: Optional[str],
+        target_index: Optional[int],
+    ):
+        self.op = op
+        self.target_word = target_word
+        self.spoken_word = spoken_word
+        self.target_index = target_index
+
+    def __repr__(self) -> str:
+        return (
+            f"AlignmentOp(op={self.op!r}, target_word={self.target_word!r}, "
+            f"spoken_word={self.spoken_word!r})"
+        )
+
+
+class EvaluationResult:
+    """評価結果"""
+
+    __slots__ = (
+        "score",
+        "is_correct",
+        "matching_words",
+        "correct_answer",
+        "alignment",
+        "insertions",
+        "deletions",
+        "substitutions",
+    )
+
+    def __init__(
+        self,
+        score: int,
+        is_correct: bool,
+        matching_words: Optional[List[WordMatchResult]] = None,
+        correct_answer: Optional[str] = None,
+        alignment: Optional[List[AlignmentOp]] = None,
+        insertions: int = 0,
+        deletions: int = 0,
+        substitutions: int = 0,
+    ):
+        self.score = score
+        self.is_correct = is_correct
+        self.matching_words = matching_words or []
+        self.correct_answer = correct_answer
+        self.alignment = alignment
+        self.insertions = insertions
+        self.deletions = deletions
+        self.substitutions = substitutions
+
+
+def score_speech(
+    target_sentence: str,
+    user_transcription: str,
+    mode: str = "bag",
+    fuzzy: bool = False,
+) -> EvaluationResult:
+    """ターゲット文と発話認識結果を採点する"""
+    if mode not in SCORING_MODES:
+        raise ValueError(f"Unknown scoring mode: {mode}")
+
+    target = phonetic_index.lookup(target_sentence)
+    target_words = target.tokens
+    user_words = normalize_words(user_transcription)
+
+    if not target_words:
+        return EvaluationResult(
+            score=0,
+            is_correct=False,
+            matching_words=[],
+            correct_answer=target_sentence,
+        )
+
+    if mode == "alignment":
+        return _score_alignment(target_sentence, target, user_words, fuzzy)
+    return _score_bag(target_sentence, target, user_words, fuzzy)
+
+
+def score_speech_batch(
+    pairs: Iterable[Tuple[str, str]],
+    mode: str = "bag",
+    fuzzy: bool = False,
+) -> List[EvaluationResult]:
+    """(ターゲット文, 発話認識結果) の組をまとめて採点する"""
+    return [
+        score_speech(target, transcript, mode, fuzzy) for target, transcript in pairs
+    ]
+
+
+def _score_bag(
+    target_sentence: str,
+    target: IndexedSentence,
+    user_words: Sequence[str],
+    fuzzy: bool,
+) -> EvaluationResult:
+    target_words = target.tokens
+    remaining = Counter(user_words)
+    matched = [False] * len(target_words)
+
+    for i, target_word in enumerate(target_words):
+        # 一致した単語は残数を減らす（重複カウント防止）
+        if remaining[target_word] > 0:
+            remaining[target_word] -= 1
+            matched[i] = True
+
+    if fuzzy and not all(matched):
+        # 完全一致を優先で確定させてから、残った語同士をあいまい一致させる
+        _match_bag_fuzzy(target, remaining, matched)
+
+    matching_words = [
+        WordMatchResult(word=word, matched=matched[i], index=i)
+        for i, word in enumerate(target_words)
+    ]
+    score = int((sum(matched) / len(target_words)) * 100)
+    return EvaluationResult(
+        score=score,
+        is_correct=score >= PASSING_SCORE,
+        matching_words=matching_words,
+        correct_answer=target_sentence,
+    )
+
+
+def _match_bag_fuzzy(
+    target: IndexedSentence,
+    remaining: Counter,
+    matched: List[bool],
+) -> None:
+    by_key: Dict[str, List[str]] = defaultdict(list)
+    for word, count in remaining.items():
+        if count > 0:
+            by_key[phonetic_key(word)].append(word)
+
+    for i, target_word in enumerate(target.tokens):
+        if matched[i]:
+            continue
+        # 発音キーが同じ語は O(1) で引き、無ければ編集距離で探す
+        candidates = [w for w in by_key.get(target.keys[i], ()) if remaining[w] > 0]
+        if not candidates:
+            candidates = [
+                w
+                for w, count in remaining.items()
+                if count > 0 and words_sound_alike(target_word, target.keys[i], w)
+            ]
+        if candidates:
+            remaining[candidates[0]] -= 1
+            matched[i] = True
+
+
+def _score_alignment(
+    target_sentence: str,
+    target: IndexedSentence,
+    user_words: Sequence[str],
+    fuzzy: bool,
+) -> EvaluationResult:
+    target_words = target.tokens
+    equal = None
+    if fuzzy:
+        spoken_keys = [phonetic_key(word) for word in user_words]
+
+        def equal(i: int, j: int) -> bool:
+            return words_sound_alike(
+                target_words[i], target.keys[i], user_words[j], spoken_keys[j]
+            )
+
+    alignment = align_tokens(target_words, user_words, equal)
+
+    matched_indexes = set()
+    insertions = deletions = substitutions = 0
+    for op in alignment:
+        if op.op == "match":
+            matched_indexes.add(op.target_index)
+        elif op.op == "insert":
+            insertions += 1
+        elif op.op == "delete":
+            deletions += 1
+        else:
+            substitutions += 1
+
+    errors = insertions + deletions + substitutions
+    score = max(0, int((1 - errors / len(target_words)) * 100))
+    return EvaluationResult(
+        score=score,
+        is_correct=score >= PASSING_SCORE,
+        matching_words=[
+            WordMatchResult(word=word, matched=i in matched_indexes, index=i)
+            for i, word in enumerate(target_words)
+        ],
+        correct_answer=target_sentence,
+        alignment=alignment,
+        insertions=insertions,
+        deletions=deletions,
+        substitutions=substitutions,
+    )
+
+
+def align_tokens(
+    target: Sequence[str],
+    spoken: Sequence[str],
+    equal: Optional[Callable[[int, int], bool]] = None,
+) -> List[AlignmentOp]:
+    """トークン列の編集距離（Levenshtein）アラインメントを求める
+
+    equal(i, j) を渡すと target[i] と spoken[j] の一致判定に使う（省略時は完全一致）。
+    """
+    if equal is None:
+
+        def equal(i: int, j: int) -> bool:
+            return target[i] == spoken[j]
+
+    n, m = len(target), len(spoken)
+    width = m + 1
+    # 1次元配列で (n+1) x (m+1) の距離表を持つ
+    dist = list(range(width)) + [0] * (n * width)
+    for i in range(1, n + 1):
+        row = i * width
+        prev = row - width
+        dist[row] = i
+        for j in range(1, width):
+            cost = 0 if equal(i - 1, j - 1) else 1
+            dist[row + j] = min(
+                dist[prev + j - 1] + cost,  # 一致 / 置換
+                dist[prev + j] + 1,  # 脱落
+                dist[row + j - 1] + 1,  # 挿入
+            )
+
+    ops: List[AlignmentOp] = []
+    i, j = n, m
+    while i > 0 or j > 0:
+        here = dist[i * width + j]
+        if i > 0 and j > 0:
+            same = equal(i - 1, j - 1)
+            if dist[(i - 1) * width + j - 1] + (0 if same else 1) == here:
+                ops.append(
+                    AlignmentOp(
+                        "match" if same else "substitute",
+                        target[i - 1],
+                        spoken[j - 1],
+                        i - 1,
+                    )
+                )
+                i -= 1
+                j -= 1
+                continue
+        if i > 0 and dist[(i - 1) * width + j] + 1 == here:
+            ops.append(AlignmentOp("delete", target[i - 1], None, i - 1))
+            i -= 1
+        else:
+            ops.append(AlignmentOp("insert", None, spoken[j - 1], None))
+            j -= 1
+    ops.reverse()
+    return ops
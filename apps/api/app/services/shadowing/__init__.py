@@ -0,0 +1,6 @@
+from .progress_service import (  # noqa: F401
+    COMPLETION_SCORE,
+    ScenarioProgress,
+    ShadowingProgressService,
+    ShadowingSentenceNotFoundError,
+)
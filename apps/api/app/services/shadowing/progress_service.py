@@ -0,0 +1,299 @@
+"""
+シャドーイング・瞬間英作の練習結果の一括記録
+
+1回の練習（シナリオ内の数文〜十数文）をまとめて受け取り、
+採点はメモリ上で一括、進捗はモードごとに1文の UPSERT で反映する。
+進捗の集計（ホーム画面・シナリオ一覧）はシナリオ単位の GROUP BY 1クエリで行う。
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import case, func, or_
+from sqlalchemy.orm import Session
+
+from app.db.upsert import bulk_upsert
+from app.services.content import get_catalog
+from app.services.review.review_service import ReviewService
+from app.services.stats import UserStatsService
+from models.database.models import (
+    ShadowingSentence,
+    UserInstantTranslationProgress,
+    UserShadowingProgress,
+)
+from models.schemas.schemas import (
+    ShadowingBatchAttempt,
+    ShadowingBatchAttemptResult,
+    ShadowingWordMatch,
+)
+
+# 80点以上で完了とみなす
+COMPLETION_SCORE = 80
+
+
+class ShadowingSentenceNotFoundError(LookupError):
+    """シナリオに属するシャドーイング文が見つからない"""
+
+PROGRESS_MODELS = {
+    "shadowing": UserShadowingProgress,
+    "instant_translation": UserInstantTranslationProgress,
+}
+
+
+@dataclass(frozen=True)
+class ScenarioProgress:
+    """1シナリオ分のシャドーイング進捗の集計"""
+
+    scenario_id: int
+    practiced_sentences: int
+    completed_sentences: int
+    practiced_since: int
+    last_practiced_at: Optional[datetime]
+
+
+class _ProgressState:
+    """1文・1モード分の進捗（既存値 + 今回の練習分）"""
+
+    __slots__ = (
+        "attempt_count",
+        "best_score",
+        "is_completed",
+        "was_completed",
+        "added_attempts",
+        "batch_best",
+        "last_practiced_at",
+    )
+
+    def __init__(self, attempt_count: int, best_score: Optional[int], is_completed: bool):
+        self.attempt_count = attempt_count
+        self.best_score = best_score
+        self.is_completed = is_completed
+        self.was_completed = is_completed
+        self.added_attempts = 0
+        self.batch_best: Optional[int] = None
+        self.last_practiced_at: Optional[datetime] = None
+
+    def apply(self, score: int, practiced_at: datetime) -> bool:
+        """練習1回分を反映し、ベストスコア更新かどうかを返す"""
+        self.attempt_count += 1
+        self.added_attempts += 1
+        is_new_best = self.best_score is None or score > self.best_score
+        if is_new_best:
+            self.best_score = score
+        if self.batch_best is None or score > self.batch_best:
+            self.batch_best = score
+        if score >= COMPLETION_SCORE:
+            self.is_completed = True
+        if self.last_practiced_at is None or practiced_at > self.last_practiced_at:
+            self.last_practiced_at = practiced_at
+        return is_new_best
+
+
+def _merge_progress(columns, incoming) -> Dict[str, object]:
+    # 各列は自分自身の既存値のみを参照する（MySQL の SET 評価順に依存しないため）
+    return {
+        "attempt_count": columns.attempt_count + incoming.attempt_count,
+        "best_score": case(
+            (
+                or_(
+                    columns.best_score.is_(None),
+                    incoming.best_score > columns.best_score,
+                ),
+                incoming.best_score,
+            ),
+            else_=columns.best_score,
+        ),
+        "is_completed": or_(columns.is_completed, incoming.is_completed),
+        "last_practiced_at": case(
+            (
+                or_(
+                    columns.last_practiced_at.is_(None),
+                    incoming.last_practiced_at > columns.last_practiced_at,
+                ),
+                incoming.last_practiced_at,
+            ),
+            else_=columns.last_practiced_at,
+        ),
+    }
+
+
+def _normalize_practiced_at(value: Optional[datetime], now: datetime) -> datetime:
+    """クライアント時刻をUTC naiveに揃え、未来時刻は受信時刻に丸める"""
+    if value is None:
+        return now
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return min(value, now)
+
+
+class ShadowingProgressService:
+    """シャドーイング・瞬間英作の進捗更新サービス"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record_attempts(
+        self,
+        user_id: str,
+        scenario_id: int,
+        attempts: Sequence[ShadowingBatchAttempt],
+    ) -> List[ShadowingBatchAttemptResult]:
+        """練習結果をまとめて採点・記録し、送信順に結果を返す
+
+        Raises:
+            ShadowingSentenceNotFoundError: シナリオに属さないシャドーイング文が含まれる場合
+        """
+        catalog = get_catalog(self.db)
+        sentence_ids = {a.shadowing_sentence_id for a in attempts}
+        sentences = {
+            entry.id: entry.sentence_en
+            for entry in map(catalog.get_shadowing_sentence, sentence_ids)
+            if entry is not None and entry.scenario_id == scenario_id
+        }
+        missing = sentence_ids - sentences.keys()
+        if missing:
+            raise ShadowingSentenceNotFoundError(
+                f"Shadowing sentences not found in scenario: {sorted(missing)}"
+            )
+
+        # 発話認識結果はまとめて採点する
+        spoken = [i for i, a in enumerate(attempts) if a.user_transcription is not None]
+        evaluations = dict(
+            zip(
+                spoken,
+                ReviewService.evaluate_speaking_batch(
+                    [
+                        (
+                            sentences[attempts[i].shadowing_sentence_id],
+                            attempts[i].user_transcription,
+                        )
+                        for i in spoken
+                    ]
+                ),
+            )
+        )
+
+        states = self._load_states(user_id, attempts)
+        now = datetime.utcnow()
+        results: List[ShadowingBatchAttemptResult] = []
+        for i, attempt in enumerate(attempts):
+            evaluation = evaluations.get(i)
+            score = evaluation.score if evaluation is not None else attempt.score
+            state = states[(attempt.mode, attempt.shadowing_sentence_id)]
+            is_new_best = state.apply(score, _normalize_practiced_at(attempt.practiced_at, now))
+            results.append(
+                ShadowingBatchAttemptResult(
+                    shadowing_sentence_id=attempt.shadowing_sentence_id,
+                    mode=attempt.mode,
+                    score=score,
+                    attempt_count=state.attempt_count,
+                    best_score=state.best_score,
+                    is_completed=state.is_completed,
+                    is_new_best=is_new_best,
+                    matching_words=[
+                        ShadowingWordMatch(word=m.word, matched=m.matched, index=m.index)
+                        for m in evaluation.matching_words
+                    ]
+                    if evaluation is not None
+                    else [],
+                )
+            )
+
+        for mode, model in PROGRESS_MODELS.items():
+            rows = [
+                {
+                    "user_id": user_id,
+                    "shadowing_sentence_id": sentence_id,
+                    "attempt_count": state.added_attempts,
+                    "best_score": state.batch_best,
+                    "is_completed": state.batch_best >= COMPLETION_SCORE,
+                    "last_practiced_at": state.last_practiced_at,
+                }
+                for (state_mode, sentence_id), state in states.items()
+                if state_mode == mode
+            ]
+            bulk_upsert(
+                self.db,
+                model.__table__,
+                rows,
+                conflict_columns=("user_id", "shadowing_sentence_id"),
+                update=_merge_progress,
+            )
+        UserStatsService(self.db).increment(
+            user_id,
+            shadowing_completed=sum(
+                1
+                for (mode, _sentence_id), state in states.items()
+                if mode == "shadowing" and state.is_completed and not state.was_completed
+            ),
+        )
+        self.db.commit()
+        return results
+
+    def _load_states(
+        self,
+        user_id: str,
+        attempts: Sequence[ShadowingBatchAttempt],
+    ) -> Dict[Tuple[str, int], _ProgressState]:
+        """モードごとに既存進捗を1クエリで読み込む"""
+        states: Dict[Tuple[str, int], _ProgressState] = {}
+        for mode, model in PROGRESS_MODELS.items():
+            ids = {a.shadowing_sentence_id for a in attempts if a.mode == mode}
+            if not ids:
+                continue
+            rows = (
+                self.db.query(
+                    model.shadowing_sentence_id,
+                    model.attempt_count,
+                    model.best_score,
+                    model.is_completed,
+                )
+                .filter(model.user_id == user_id, model.shadowing_sentence_id.in_(ids))
+                .all()
+            )
+            existing = {row[0]: row[1:] for row in rows}
+            for sentence_id in ids:
+                attempt_count, best_score, is_completed = existing.get(
+                    sentence_id, (0, None, False)
+                )
+                states[(mode, sentence_id)] = _ProgressState(
+                    attempt_count, best_score, bool(is_completed)
+                )
+        return states
+
+    def scenario_progress(
+        self,
+        user_id: str,
+        since: datetime,
+    ) -> Dict[int, ScenarioProgress]:
+        """ユーザーのシャドーイング進捗をシナリオごとに集計する（1クエリ）
+
+        practiced_since は since 以降に練習した文の数。
+        練習していないシナリオは含まない。
+        """
+        progress = UserShadowingProgress
+        rows = (
+            self.db.query(
+                ShadowingSentence.scenario_id,
+                func.count(progress.id),
+                func.sum(case((progress.is_completed.is_(True), 1), else_=0)),
+                func.sum(case((progress.last_practiced_at >= since, 1), else_=0)),
+                func.max(progress.last_practiced_at),
+            )
+            .join(ShadowingSentence, ShadowingSentence.id == progress.shadowing_sentence_id)
+            .filter(progress.user_id == user_id)
+            .group_by(ShadowingSentence.scenario_id)
+            .all()
+        )
+        return {
+            scenario_id: ScenarioProgress(
+                scenario_id=scenario_id,
+                practiced_sentences=practiced,
+                completed_sentences=int(completed or 0),
+                practiced_since=int(practiced_since or 0),
+                last_practiced_at=last_practiced_at,
+            )
+            for scenario_id, practiced, completed, practiced_since, last_practiced_at in rows
+        }
@@ -0,0 +1 @@
+from .user_stats_service import COUNTERS, UserStatsService  # noqa: F401
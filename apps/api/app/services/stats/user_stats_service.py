@@ -0,0 +1,161 @@
+"""
+ユーザーごとの学習統計カウンタ
+
+プロフィール・ホーム画面の統計（セッション数・ラウンド数・復習・シャドーイングの完了数）を
+user_stats の1行に持ち、主キー1回の読み込みで返す。
+
+カウンタは各更新処理（セッション終了・復習の評価・シャドーイングの練習記録）が
+自身のトランザクション内で increment する。ずれた場合は reconcile で実データから再計算する
+（python -m app.scripts.reconcile_user_stats）。
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.db.upsert import bulk_upsert
+from models.database.models import (
+    ReviewItem,
+    Session as SessionModel,
+    User,
+    UserShadowingProgress,
+    UserStats,
+)
+
+COUNTERS = (
+    "total_sessions",
+    "total_rounds",
+    "review_items_total",
+    "review_items_completed",
+    "shadowing_completed",
+)
+
+# reconcile で一度に再計算するユーザー数
+RECONCILE_BATCH_SIZE = 500
+
+
+class UserStatsService:
+    """学習統計カウンタの読み書き"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, user_id: str) -> Dict[str, int]:
+        """カウンタを返す（行が無ければすべて0）"""
+        row = self.db.get(UserStats, user_id)
+        return {name: (getattr(row, name) or 0) if row else 0 for name in COUNTERS}
+
+    def increment(self, user_id: str, **deltas: int) -> None:
+        """カウンタを加算する（UPSERT 1文。コミットは呼び出し側）
+
+        Raises:
+            ValueError: 存在しないカウンタ名が指定された場合
+        """
+        unknown = set(deltas) - set(COUNTERS)
+        if unknown:
+            raise ValueError(f"Unknown user stats counters: {sorted(unknown)}")
+        deltas = {name: value for name, value in deltas.items() if value}
+        if not deltas:
+            return
+        bulk_upsert(
+            self.db,
+            UserStats.__table__,
+            [{"user_id": user_id, **{name: deltas.get(name, 0) for name in COUNTERS}}],
+            conflict_columns=("user_id",),
+            update=lambda columns, incoming: {
+                name: getattr(columns, name) + getattr(incoming, name) for name in deltas
+            },
+        )
+
+    def compute(self, user_ids: Sequence[str]) -> Dict[str, Dict[str, int]]:
+        """実データからカウンタを集計する（ユーザーIDごと）"""
+        result = {user_id: dict.fromkeys(COUNTERS, 0) for user_id in user_ids}
+        if not result:
+            return result
+
+        sessions = (
+            self.db.query(
+                SessionModel.user_id,
+                func.count(SessionModel.id),
+                func.coalesce(func.sum(SessionModel.completed_rounds), 0),
+            )
+            .filter(
+                SessionModel.user_id.in_(user_ids),
+                SessionModel.ended_at.is_not(None),
+            )
+            .group_by(SessionModel.user_id)
+        )
+        for user_id, count, rounds in sessions:
+            result[user_id]["total_sessions"] = count
+            result[user_id]["total_rounds"] = int(rounds)
+
+        reviews = (
+            self.db.query(ReviewItem.user_id, ReviewItem.is_completed, func.count(ReviewItem.id))
+            .filter(ReviewItem.user_id.in_(user_ids))
+            .group_by(ReviewItem.user_id, ReviewItem.is_completed)
+        )
+        for user_id, is_completed, count in reviews:
+            result[user_id]["review_items_total"] += count
+            if is_completed:
+                result[user_id]["review_items_completed"] += count
+
+        shadowing = (
+            self.db.query(UserShadowingProgress.user_id, func.count(UserShadowingProgress.id))
+            .filter(
+                UserShadowingProgress.user_id.in_(user_ids),
+                UserShadowingProgress.is_completed.is_(True),
+            )
+            .group_by(UserShadowingProgress.user_id)
+        )
+        for user_id, count in shadowing:
+            result[user_id]["shadowing_completed"] = count
+
+        return result
+
+    def reconcile(
+        self,
+        user_ids: Optional[Iterable[str]] = None,
+        fix: bool = True,
+    ) -> List[Tuple[str, Dict[str, int], Dict[str, int]]]:
+        """カウンタを実データと突き合わせ、ずれていれば上書きする（行が無ければ作成）
+
+        Args:
+            user_ids: 対象ユーザー（省略時は全ユーザー）
+            fix: False なら差分の報告のみ
+
+        Returns:
+            (ユーザーID, 保存値, 実データの値) のうち差分があったもの
+        """
+        if user_ids is None:
+            user_ids = [row[0] for row in self.db.query(User.id).order_by(User.id)]
+        user_ids = list(user_ids)
+
+        mismatches: List[Tuple[str, Dict[str, int], Dict[str, int]]] = []
+        for start in range(0, len(user_ids), RECONCILE_BATCH_SIZE):
+            batch = user_ids[start : start + RECONCILE_BATCH_SIZE]
+            expected = self.compute(batch)
+            stored = {
+                row.user_id: {name: getattr(row, name) for name in COUNTERS}
+                for row in self.db.query(UserStats).filter(UserStats.user_id.in_(batch))
+            }
+            rows = []
+            for user_id in batch:
+                actual = stored.get(user_id)
+                if actual == expected[user_id]:
+                    continue
+                mismatches.append((user_id, actual or {}, expected[user_id]))
+                rows.append({"user_id": user_id, **expected[user_id]})
+            if fix and rows:
+                bulk_upsert(
+                    self.db,
+                    UserStats.__table__,
+                    rows,
+                    conflict_columns=("user_id",),
+                    update=lambda columns, incoming: {
+                        name: getattr(incoming, name) for name in COUNTERS
+                    },
+                )
+                self.db.commit()
+        return mismatches
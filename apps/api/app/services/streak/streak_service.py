@@ -1,11 +1,11 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from typing import Optional
 from datetime import date, datetime, timedelta
 import pytz
 import logging
 
-from models.database.models import User, Session as SessionModel
+from app.services.stats import UserStatsService
+from models.database.models import User
 from models.schemas.schemas import UserStatsResponse
 
 logger = logging.getLogger(__name__)
@@ -75,31 +75,14 @@ class StreakService:
         if not user:
             raise ValueError(f"User {user_id} not found")
 
-        # セッション数の集計
-        total_sessions = (
-            self.db.query(SessionModel)
-            .filter(
-                SessionModel.user_id == user_id,
-                SessionModel.ended_at.is_not(None),
-            )
-            .count()
-        )
-
-        # ラウンド数の集計
-        total_rounds_result = (
-            self.db.query(func.sum(SessionModel.completed_rounds))
-            .filter(
-                SessionModel.user_id == user_id,
-                SessionModel.ended_at.is_not(None),
-            )
-            .scalar()
-        )
-        total_rounds = int(total_rounds_result) if total_rounds_result else 0
+        # セッション数・ラウンド数は user_stats のカウンタ（主キー1回の読み込み）
+        counters = UserStatsService(self.db).get(user_id)
 
         return UserStatsResponse(
             current_streak=user.current_streak or 0,
             longest_streak=user.longest_streak or 0,
             last_activity_date=user.last_activity_date,
-            total_sessions=total_sessions,
-            total_rounds=total_rounds,
+            total_sessions=counters["total_sessions"],
+            total_rounds=counters["total_rounds"],
+            shadowing_completed=counters["shadowing_completed"],
         )
@@ -1,6 +1,7 @@
 from sqlalchemy import (
     Column,
     Integer,
+    Float,
     String,
     Text,
     DateTime,
@@ -10,6 +11,8 @@ from sqlalchemy import (
     Enum,
     Date,
     Index,
+    LargeBinary,
+    UniqueConstraint,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -71,7 +74,7 @@ class User(Base):
     last_activity_date = Column(Date, nullable=True)
 
     # Points fields
-    total_points = Column(Integer, default=0)
+    total_points = Column(Integer, default=0, index=True)
 
     # Subscription / plan fields
     # NOTE: In MVP we gate features using this flag.
@@ -139,6 +142,11 @@ class Session(Base):
     )
     saved_phrases = relationship("SavedPhrase", back_populates="session")
 
+    __table_args__ = (
+        Index("ix_sessions_user_ended", "user_id", "ended_at"),
+        Index("ix_sessions_ended_user", "ended_at", "user_id"),
+    )
+
 
 class SessionRound(Base):
     __tablename__ = "session_rounds"
@@ -159,7 +167,25 @@ class SessionRound(Base):
     session = relationship("Session", back_populates="session_rounds")
 
     # Unique constraint
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        UniqueConstraint(
+            "session_id",
+            "round_index",
+            name="uq_session_rounds_session_id_round_index",
+        ),
+        {"extend_existing": True},
+    )
+
+
+class SessionRoundArchive(Base):
+    """終了から一定期間経ったセッションのラウンド（zlib 圧縮した JSON 1件にまとめて session_rounds から移す）"""
+
+    __tablename__ = "session_round_archives"
+
+    session_id = Column(Integer, ForeignKey("sessions.id", ondelete="CASCADE"), primary_key=True)
+    round_count = Column(Integer, nullable=False)
+    payload = Column(LargeBinary(length=2**24), nullable=False)  # MySQL では MEDIUMBLOB
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
 class ReviewItem(Base):
@@ -178,12 +204,26 @@ class ReviewItem(Base):
     selection_reason = Column(String(255), nullable=True)
     selection_score = Column(Integer, nullable=True)
 
+    # 復習間隔のスケジューリング（SM-2）
+    ease_factor = Column(Float, nullable=False, default=2.5, server_default="2.5")
+    interval_days = Column(Integer, nullable=False, default=0, server_default="0")
+    repetitions = Column(Integer, nullable=False, default=0, server_default="0")
+
     # Relationships
     user = relationship("User", back_populates="review_items")
     source_session = relationship("Session")
 
     __table_args__ = (
         Index("ix_review_items_user_session", "user_id", "source_session_id"),
+        Index(
+            "ix_review_items_user_completed_due", "user_id", "is_completed", "due_at"
+        ),
+        Index(
+            "ix_review_items_user_completed_at",
+            "user_id",
+            "is_completed",
+            "completed_at",
+        ),
     )
 
 
@@ -209,6 +249,10 @@ class SavedPhrase(Base):
     session = relationship("Session", back_populates="saved_phrases")
     converted_review = relationship("ReviewItem")
 
+    __table_args__ = (
+        Index("ix_saved_phrases_user_created", "user_id", "created_at"),
+    )
+
 
 class ShadowingSentence(Base):
     """シナリオごとのシャドーイング文"""
@@ -257,6 +301,14 @@ class UserShadowingProgress(Base):
     user = relationship("User", back_populates="shadowing_progress")
     shadowing_sentence = relationship("ShadowingSentence", back_populates="user_progress")
 
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "shadowing_sentence_id",
+            name="uq_user_shadowing_progress_user_sentence",
+        ),
+    )
+
 
 class UserInstantTranslationProgress(Base):
     """ユーザーの瞬間英作進捗"""
@@ -276,6 +328,14 @@ class UserInstantTranslationProgress(Base):
     user = relationship("User", back_populates="instant_translation_progress")
     shadowing_sentence = relationship("ShadowingSentence", back_populates="instant_translation_progress")
 
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "shadowing_sentence_id",
+            name="uq_instant_translation_user_sentence",
+        ),
+    )
+
 
 class CustomScenario(Base):
     """ユーザーが作成したオリジナルシナリオ"""
@@ -296,3 +356,94 @@ class CustomScenario(Base):
     # Relationships
     user = relationship("User", back_populates="custom_scenarios")
     sessions = relationship("Session", back_populates="custom_scenario")
+
+    __table_args__ = (
+        Index("ix_custom_scenarios_user_active_created", "user_id", "is_active", "created_at"),
+    )
+
+
+class TranscriptionCacheEntry(Base):
+    """音声認識結果のキャッシュ（音声バイト列のハッシュ + 言語 + モデルをキーとする）"""
+
+    __tablename__ = "transcription_cache"
+
+    cache_key = Column(String(64), primary_key=True)
+    response = Column(JSON, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class PointEvent(Base):
+    """ポイント付与履歴（ラウンド完了・セッション完了ボーナスなど1付与1行）"""
+
+    __tablename__ = "point_events"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    points = Column(Integer, nullable=False)
+    reason = Column(String(32), nullable=False)  # round / session_complete
+    session_id = Column(Integer, ForeignKey("sessions.id", ondelete="SET NULL"), nullable=True)
+    awarded_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_point_events_user_awarded", "user_id", "awarded_at"),
+        {"extend_existing": True},
+    )
+
+
+class UserDailyPoints(Base):
+    """ユーザー・日（JST）ごとの獲得ポイント（point_events と同じトランザクションで加算）"""
+
+    __tablename__ = "user_daily_points"
+
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    points = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # 期間ランキング（期間内の日の合計をユーザーごとに集計）
+        Index("ix_user_daily_points_day_user", "day", "user_id"),
+        {"extend_existing": True},
+    )
+
+
+class UserStats(Base):
+    """ユーザーごとの学習統計カウンタ（各更新処理と同じトランザクションで加算）"""
+
+    __tablename__ = "user_stats"
+
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    total_sessions = Column(Integer, nullable=False, default=0)  # 終了したセッション数
+    total_rounds = Column(Integer, nullable=False, default=0)  # 終了したセッションの完了ラウンド数
+    review_items_total = Column(Integer, nullable=False, default=0)
+    review_items_completed = Column(Integer, nullable=False, default=0)
+    shadowing_completed = Column(Integer, nullable=False, default=0)  # 完了したシャドーイング文数
+
+
+class SeedState(Base):
+    """適用済みシードデータのハッシュ（同じ内容の再適用をスキップする）"""
+
+    __tablename__ = "seed_states"
+
+    name = Column(String(64), primary_key=True)
+    content_hash = Column(String(64), nullable=False)
+    applied_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class LeaderboardSnapshot(Base):
+    """ランキングの定期スナップショット（ボード・期間ごとの上位N件）"""
+
+    __tablename__ = "leaderboard_snapshots"
+
+    id = Column(Integer, primary_key=True, index=True)
+    board = Column(String(16), nullable=False)  # all_time / weekly / monthly
+    period_key = Column(String(16), nullable=False)  # 期間開始日（JST）、全期間は "all_time"
+    rank = Column(Integer, nullable=False)
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    points = Column(Integer, nullable=False)
+    captured_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_leaderboard_snapshots_board_period_rank", "board", "period_key", "rank"),
+        {"extend_existing": True},
+    )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime, date
 from enum import Enum
@@ -62,6 +62,7 @@ class UserStatsResponse(BaseModel):
     last_activity_date: Optional[date] = None
     total_sessions: int
     total_rounds: int
+    shadowing_completed: int = 0  # 完了したシャドーイング文数
 
 
 # Scenario schemas
@@ -118,7 +119,9 @@ class CustomScenario(CustomScenarioBase):
 class CustomScenarioListResponse(BaseModel):
     """オリジナルシナリオ一覧レスポンス"""
     custom_scenarios: List[CustomScenario]
-    total_count: int
+    # 先頭ページ（cursor なし）でのみ返す
+    total_count: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class CustomScenarioLimitResponse(BaseModel):
@@ -444,6 +447,7 @@ class SessionEndResponse(BaseModel):
 class ReviewNextResponse(BaseModel):
     review_items: List[ReviewItem]
     total_count: int
+    next_cursor: Optional[str] = None
 
 
 # SavedPhrase schemas
@@ -473,7 +477,9 @@ class SavedPhrase(SavedPhraseBase):
 
 class SavedPhrasesListResponse(BaseModel):
     saved_phrases: List[SavedPhrase]
-    total_count: int
+    # 先頭ページ（cursor なし）でのみ返す
+    total_count: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class ConvertToReviewResponse(BaseModel):
@@ -490,6 +496,21 @@ class ReviewStatsResponse(BaseModel):
     completion_rate: float  # 0.0 - 100.0
 
 
+# Speech-to-Text schemas
+class TranscriptionAlternative(BaseModel):
+    text: str
+    confidence: Optional[float] = None
+
+
+class TranscriptionResponse(BaseModel):
+    text: str
+    confidence: Optional[float] = None
+    language: Optional[str] = "en"
+    duration: Optional[float] = None
+    alternatives: List[TranscriptionAlternative] = Field(default_factory=list)
+    provider: Optional[str] = None  # 実際に認識したSTTプロバイダ（フェイルオーバー時の確認用）
+
+
 # Error schemas
 class ErrorResponse(BaseModel):
     detail: str
@@ -584,6 +605,48 @@ class InstantTranslateSpeakResponse(BaseModel):
     matching_words: List[ShadowingWordMatch]
 
 
+class ShadowingBatchAttempt(BaseModel):
+    """一括送信する練習結果1件
+
+    発話認識結果（サーバー側で採点）か自己採点スコアのどちらか一方を指定する。
+    practiced_at はオフライン練習の同期用（省略時はサーバー受信時刻）。
+    """
+    shadowing_sentence_id: int
+    mode: Literal["shadowing", "instant_translation"] = "shadowing"
+    user_transcription: Optional[str] = Field(None, min_length=1, max_length=1000)
+    score: Optional[int] = Field(None, ge=0, le=100)
+    practiced_at: Optional[datetime] = None
+
+    @model_validator(mode="after")
+    def _require_transcription_or_score(self) -> "ShadowingBatchAttempt":
+        if (self.user_transcription is None) == (self.score is None):
+            raise ValueError("Specify exactly one of user_transcription or score")
+        return self
+
+
+class ShadowingBatchRequest(BaseModel):
+    """シャドーイング・瞬間英作の練習結果一括送信リクエスト"""
+    attempts: List[ShadowingBatchAttempt] = Field(..., min_length=1, max_length=100)
+
+
+class ShadowingBatchAttemptResult(BaseModel):
+    """一括送信した練習結果1件ごとの評価・進捗"""
+    shadowing_sentence_id: int
+    mode: Literal["shadowing", "instant_translation"]
+    score: int
+    attempt_count: int
+    best_score: int
+    is_completed: bool
+    is_new_best: bool
+    matching_words: List[ShadowingWordMatch] = []
+
+
+class ShadowingBatchResponse(BaseModel):
+    """練習結果一括送信レスポンス（送信順）"""
+    scenario_id: int
+    results: List[ShadowingBatchAttemptResult]
+
+
 class ScenarioProgressSummary(BaseModel):
     """シナリオごとの進捗サマリー"""
     scenario_id: int
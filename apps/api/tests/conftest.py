@@ -13,3 +13,48 @@ os.environ.setdefault("ENVIRONMENT", "development")
 API_ROOT = Path(__file__).resolve().parents[1]
 if str(API_ROOT) not in sys.path:
     sys.path.insert(0, str(API_ROOT))
+
+
+from contextlib import contextmanager  # noqa: E402
+
+import pytest  # noqa: E402
+
+from app.db.query_stats import install_query_hooks, track_queries  # noqa: E402
+from app.services.content import clear_catalog  # noqa: E402
+from app.services.leaderboard import clear_leaderboard  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _fresh_content_catalog():
+    """テストごとにDB内容が異なるため、静的コンテンツカタログを毎回読み直す"""
+    clear_catalog()
+    yield
+    clear_catalog()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_leaderboard():
+    """プロセス内ランキングもテストごとに読み直す"""
+    clear_leaderboard()
+    yield
+    clear_leaderboard()
+
+
+@pytest.fixture()
+def max_queries():
+    """ブロック内のSQL発行数の上限を検証する
+
+    with max_queries(3):
+        client.get("/api/v1/...")
+    """
+    install_query_hooks()
+
+    @contextmanager
+    def _max_queries(limit: int):
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= limit, (
+            f"Expected at most {limit} queries\n{stats.describe()}"
+        )
+
+    return _max_queries
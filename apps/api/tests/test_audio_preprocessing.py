@@ -0,0 +1,115 @@
+"""音声前処理（モノラル化・16kHz化・無音トリム）のテスト"""
+
+import io
+import math
+import struct
+import wave
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.core.config import settings
+from app.services.audio import preprocessing
+from app.services.audio.preprocessing import _preprocess_sync, preprocess_audio
+
+
+def _make_wav(
+    silence_s: float = 1.0,
+    tone_s: float = 1.0,
+    rate: int = 44100,
+    channels: int = 2,
+) -> bytes:
+    """無音 → 440Hzトーン → 無音 のステレオWAVを生成する"""
+    frames = []
+    total = int((silence_s * 2 + tone_s) * rate)
+    tone_start = int(silence_s * rate)
+    tone_end = tone_start + int(tone_s * rate)
+    for i in range(total):
+        value = 0
+        if tone_start <= i < tone_end:
+            value = int(12000 * math.sin(2 * math.pi * 440 * i / rate))
+        frames.append(struct.pack("<" + "h" * channels, *([value] * channels)))
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(rate)
+        wav_file.writeframes(b"".join(frames))
+    return buffer.getvalue()
+
+
+def test_preprocess_sync_downmixes_resamples_and_trims() -> None:
+    audio = _make_wav()
+
+    output = _preprocess_sync(
+        audio, sample_rate=16000, codec="wav", threshold_db=-45.0, padding_ms=100
+    )
+
+    assert output is not None
+    encoded, extension, original_duration, processed_duration = output
+    assert extension == ".wav"
+    assert original_duration == pytest.approx(3.0, abs=0.01)
+    # 1秒のトーン + 前後パディング（フレーム境界分の誤差を許容）
+    assert 1.0 <= processed_duration <= 1.3
+
+    with wave.open(io.BytesIO(encoded)) as wav_file:
+        assert wav_file.getnchannels() == 1
+        assert wav_file.getframerate() == 16000
+        assert wav_file.getsampwidth() == 2
+
+    assert len(encoded) < len(audio) / 5
+
+
+def test_preprocess_sync_returns_none_for_silence() -> None:
+    audio = _make_wav(silence_s=0.5, tone_s=0.0)
+
+    assert (
+        _preprocess_sync(
+            audio, sample_rate=16000, codec="wav", threshold_db=-45.0, padding_ms=100
+        )
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_preprocess_audio_disabled_passes_through(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "AUDIO_PREPROCESS_ENABLED", False)
+    audio = _make_wav()
+
+    result = await preprocess_audio(audio, "recording.wav")
+
+    assert result.applied is False
+    assert result.audio is audio
+    assert result.filename == "recording.wav"
+
+
+@pytest.mark.asyncio
+async def test_preprocess_audio_records_bytes_saved(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "AUDIO_PREPROCESS_ENABLED", True)
+    monkeypatch.setattr(settings, "AUDIO_PREPROCESS_CODEC", "wav")
+    monkeypatch.setattr(settings, "AUDIO_PREPROCESS_WORKERS", 0)
+    before = preprocessing.get_preprocess_stats()["bytes_saved"]
+    audio = _make_wav()
+
+    result = await preprocess_audio(audio, "recording.webm")
+
+    assert result.applied is True
+    assert result.filename == "recording.wav"
+    assert result.sample_rate == 16000
+    assert result.bytes_saved == len(audio) - len(result.audio)
+    assert preprocessing.get_preprocess_stats()["bytes_saved"] - before == result.bytes_saved
+
+
+@pytest.mark.asyncio
+async def test_preprocess_audio_passes_through_undecodable_input(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "AUDIO_PREPROCESS_ENABLED", True)
+    monkeypatch.setattr(settings, "AUDIO_PREPROCESS_WORKERS", 0)
+    monkeypatch.setattr(preprocessing.shutil, "which", lambda _: None)
+    audio = b"\x1aE\xdf\xa3" + b"\x00" * 4096  # WebMヘッダ（ffmpeg 無しではデコード不可）
+
+    result = await preprocess_audio(audio, "recording.webm")
+
+    assert result.applied is False
+    assert result.audio is audio
@@ -0,0 +1,243 @@
+"""音声コンテナのヘッダ解析（probe）のテスト"""
+
+import io
+import struct
+import wave
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.cost_tracker import calculate_google_stt_cost, calculate_whisper_cost
+from app.services.ai.google_speech_provider import GoogleSpeechProvider
+from app.services.ai.whisper_provider import WhisperProvider
+from app.services.audio.probe import AudioProbeError, probe_audio
+
+
+def _wav(seconds: float = 2.0, rate: int = 16000, channels: int = 1) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(rate)
+        wav_file.writeframes(b"\x00\x00" * channels * int(seconds * rate))
+    return buffer.getvalue()
+
+
+def _flac(rate: int = 44100, channels: int = 2, total_samples: int = 441000) -> bytes:
+    packed = (rate << 44) | ((channels - 1) << 41) | (15 << 36) | total_samples
+    streaminfo = struct.pack(">HH", 4096, 4096) + b"\x00" * 6 + packed.to_bytes(8, "big")
+    streaminfo += b"\x00" * 16  # MD5
+    return b"fLaC" + bytes([0x80]) + len(streaminfo).to_bytes(3, "big") + streaminfo
+
+
+def _ogg_page(payload: bytes, granule: int, sequence: int) -> bytes:
+    header = b"OggS" + bytes([0, 0]) + struct.pack("<qIII", granule, 1, sequence, 0)
+    return header + bytes([1, len(payload)]) + payload
+
+
+def _ogg_opus(seconds: float = 3.0, pre_skip: int = 312) -> bytes:
+    head = b"OpusHead" + bytes([1, 1]) + struct.pack("<HIhB", pre_skip, 16000, 0, 0)
+    granule = int(seconds * 48000) + pre_skip
+    return (
+        _ogg_page(head, 0, 0)
+        + _ogg_page(b"OpusTags" + b"\x00" * 8, 0, 1)
+        + _ogg_page(b"\x00" * 200, granule, 2)
+    )
+
+
+def _ebml(element_id: int, payload: bytes, unknown_size: bool = False) -> bytes:
+    id_bytes = element_id.to_bytes((element_id.bit_length() + 7) // 8, "big")
+    if unknown_size:
+        size = b"\x01\xff\xff\xff\xff\xff\xff\xff"
+    else:
+        size = (0x01 << 56 | len(payload)).to_bytes(8, "big")
+    return id_bytes + size + payload
+
+
+def _webm(cluster_timecodes=(0, 1000, 2000), duration_ms=None) -> bytes:
+    """MediaRecorder 相当（サイズ不定Segment/Cluster、Duration 無し）のWebM"""
+    info = _ebml(0x2AD7B1, (1_000_000).to_bytes(3, "big"))
+    if duration_ms is not None:
+        info += _ebml(0x4489, struct.pack(">d", float(duration_ms)))
+    track = _ebml(
+        0xAE,
+        _ebml(0x83, b"\x02")
+        + _ebml(0x86, b"A_OPUS")
+        + _ebml(0xE1, _ebml(0xB5, struct.pack(">f", 48000.0)) + _ebml(0x9F, b"\x01")),
+    )
+    clusters = b""
+    for timecode in cluster_timecodes:
+        blocks = b""
+        for relative in (0, 20, 980):
+            block = b"\x81" + struct.pack(">h", relative) + b"\x80" + b"\x00" * 200
+            blocks += _ebml(0xA3, block)
+        clusters += _ebml(
+            0x1F43B675,
+            _ebml(0xE7, timecode.to_bytes(2, "big")) + blocks,
+            unknown_size=True,
+        )
+    segment = _ebml(0x1549A966, info) + _ebml(0x1654AE6B, track) + clusters
+    return _ebml(0x1A45DFA3, _ebml(0x4282, b"webm")) + _ebml(
+        0x18538067, segment, unknown_size=True
+    )
+
+
+def _box(box_type: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I", len(payload) + 8) + box_type + payload
+
+
+def _m4a(seconds: float = 4.0, rate: int = 44100) -> bytes:
+    mdhd = b"\x00" * 4 + struct.pack(">IIII", 0, 0, rate, int(seconds * rate)) + b"\x00" * 4
+    mp4a = (
+        b"\x00" * 6 + struct.pack(">H", 1) + b"\x00" * 8
+        + struct.pack(">HHHHI", 2, 16, 0, 0, rate << 16)
+    )
+    stsd = b"\x00" * 4 + struct.pack(">I", 1) + _box(b"mp4a", mp4a)
+    trak = _box(
+        b"trak",
+        _box(
+            b"mdia",
+            _box(b"mdhd", mdhd)
+            + _box(b"minf", _box(b"stbl", _box(b"stsd", stsd))),
+        ),
+    )
+    mvhd = b"\x00" * 4 + struct.pack(">IIII", 0, 0, 1000, int(seconds * 1000)) + b"\x00" * 80
+    # moov が mdat の後ろにある（faststart されていない）ファイル
+    return (
+        _box(b"ftyp", b"M4A \x00\x00\x00\x00")
+        + _box(b"mdat", b"\x00" * 4096)
+        + _box(b"moov", _box(b"mvhd", mvhd) + trak)
+    )
+
+
+def _mp3_cbr(seconds: float = 2.0, bitrate_kbps: int = 128) -> bytes:
+    # MPEG1 Layer3, 128kbps, 44.1kHz, mono
+    header = struct.pack(">I", 0xFFFB9000 | 0xC0)
+    body_size = int(seconds * bitrate_kbps * 1000 / 8) - 4
+    return b"ID3\x03\x00\x00\x00\x00\x00\x0a" + b"\x00" * 10 + header + b"\x00" * body_size
+
+
+def test_probe_wav() -> None:
+    probe = probe_audio(_wav(seconds=2.0, rate=16000))
+
+    assert (probe.container, probe.codec) == ("wav", "pcm")
+    assert probe.sample_rate == 16000
+    assert probe.channels == 1
+    assert probe.duration_seconds == pytest.approx(2.0)
+
+
+def test_probe_flac_streaminfo() -> None:
+    probe = probe_audio(_flac())
+
+    assert (probe.container, probe.codec) == ("flac", "flac")
+    assert probe.sample_rate == 44100
+    assert probe.channels == 2
+    assert probe.duration_seconds == pytest.approx(10.0)
+
+
+def test_probe_ogg_opus_uses_last_granule_and_pre_skip() -> None:
+    probe = probe_audio(_ogg_opus(seconds=3.0))
+
+    assert (probe.container, probe.codec) == ("ogg", "opus")
+    assert probe.sample_rate == 16000
+    assert probe.duration_seconds == pytest.approx(3.0)
+
+
+def test_probe_webm_without_duration_uses_last_block() -> None:
+    probe = probe_audio(_webm())
+
+    assert (probe.container, probe.codec) == ("webm", "opus")
+    assert probe.sample_rate == 48000
+    assert probe.channels == 1
+    assert probe.duration_seconds == pytest.approx(2.98)
+
+
+def test_probe_webm_with_duration_element() -> None:
+    probe = probe_audio(_webm(duration_ms=5230))
+
+    assert probe.duration_seconds == pytest.approx(5.23)
+
+
+def test_probe_m4a_with_moov_at_end() -> None:
+    probe = probe_audio(_m4a(seconds=4.0))
+
+    assert (probe.container, probe.codec) == ("mp4", "aac")
+    assert probe.sample_rate == 44100
+    assert probe.channels == 2
+    assert probe.duration_seconds == pytest.approx(4.0)
+    assert probe.extension == ".m4a"
+
+
+def test_probe_mp3_cbr_skips_id3() -> None:
+    probe = probe_audio(_mp3_cbr(seconds=2.0))
+
+    assert (probe.container, probe.codec) == ("mp3", "mp3")
+    assert probe.sample_rate == 44100
+    assert probe.channels == 1
+    assert probe.duration_seconds == pytest.approx(2.0, abs=0.01)
+
+
+def test_probe_accepts_memoryview_and_rejects_unknown() -> None:
+    assert probe_audio(memoryview(_wav())).container == "wav"
+
+    with pytest.raises(AudioProbeError):
+        probe_audio(b"<html>not audio</html>" + b"\x00" * 2048)
+    with pytest.raises(AudioProbeError):
+        probe_audio(b"RIFF\x00\x00\x00\x00WAVE")
+
+
+def test_google_provider_rejects_mislabeled_aac_before_upload() -> None:
+    fake_client = MagicMock()
+    with patch(
+        "app.services.ai.google_speech_provider.speech.SpeechClient",
+        return_value=fake_client,
+    ):
+        provider = GoogleSpeechProvider()
+
+    with pytest.raises(ValueError, match="mp4/aac"):
+        provider._validate_audio_file("recording.webm", _m4a())
+    fake_client.recognize.assert_not_called()
+
+    probe = provider._validate_audio_file("recording.m4a", _webm())
+    assert provider._detect_encoding(probe).name == "WEBM_OPUS"
+    assert provider._estimate_audio_duration(b"", probe) == pytest.approx(2.98)
+
+
+def test_whisper_provider_fixes_extension_from_content() -> None:
+    provider = WhisperProvider()
+
+    probe = provider._validate_audio_file("recording.m4a", _webm())
+
+    assert provider._normalize_filename("recording.m4a", probe) == "recording.webm"
+    assert provider._normalize_filename("recording.webm", probe) == "recording.webm"
+    with pytest.raises(ValueError):
+        provider._validate_audio_file("recording.wav", b"\x00" * 2048)
+
+
+@pytest.mark.asyncio
+async def test_providers_reject_invalid_audio_before_preprocessing() -> None:
+    with patch(
+        "app.services.ai.google_speech_provider.speech.SpeechClient",
+        return_value=MagicMock(),
+    ):
+        google = GoogleSpeechProvider()
+    whisper = WhisperProvider()
+
+    for module, provider in (
+        ("google_speech_provider", google),
+        ("whisper_provider", whisper),
+    ):
+        with patch(
+            f"app.services.ai.{module}.preprocess_audio", new=AsyncMock()
+        ) as preprocess:
+            for audio in (b"\x00" * 512, b"<html>not audio</html>" + b"\x00" * 2048):
+                with pytest.raises(ValueError):
+                    await provider.transcribe_audio(audio, "recording.wav")
+        # デコード・再エンコードを伴う前処理は検証を通った音声にだけ行う
+        preprocess.assert_not_called()
+
+
+def test_billable_units_round_up_partial_intervals() -> None:
+    assert calculate_google_stt_cost(15.0).details["billable_units_15sec"] == 1
+    assert calculate_google_stt_cost(15.4).details["billable_units_15sec"] == 2
+    assert calculate_whisper_cost(61.2).details["billable_seconds"] == 62
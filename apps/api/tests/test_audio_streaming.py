@@ -0,0 +1,199 @@
+"""WebSocketストリーミング音声認識のテスト"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import deps
+from app.core.config import settings
+from app.core.deps import get_current_user_ws
+from app.core.security import create_access_token
+from app.routers.audio import router as audio_router
+from app.routers.audio.audio import stream_transcription
+from app.services.ai.google_speech_provider import GoogleSpeechProvider
+from models.database.models import Base, User
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "STT_STREAMING_PROVIDER", "mock")
+    app = FastAPI()
+    app.include_router(audio_router, prefix="/audio")
+    app.dependency_overrides[get_current_user_ws] = lambda: SimpleNamespace(id=1)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_stream_sends_partials_then_final(client) -> None:
+    with client.websocket_connect("/audio/stream") as ws:
+        ws.send_json({"type": "start", "language": "en-US", "encoding": "linear16"})
+        ws.send_bytes(b"\x00" * 320)
+        first = ws.receive_json()
+        ws.send_bytes(b"\x00" * 320)
+        second = ws.receive_json()
+        ws.send_json({"type": "stop"})
+        final = ws.receive_json()
+        end = ws.receive_json()
+
+    assert first["type"] == "partial"
+    assert second["type"] == "partial"
+    assert len(second["text"]) > len(first["text"])
+    assert final["type"] == "final"
+    assert final["words"][0]["start_seconds"] == 0.0
+    assert end == {"type": "end", "text": final["text"]}
+
+
+def test_stream_without_audio_ends_empty(client) -> None:
+    with client.websocket_connect("/audio/stream") as ws:
+        ws.send_json({"type": "stop"})
+        assert ws.receive_json() == {"type": "end", "text": ""}
+
+
+def test_stream_rejects_invalid_start_message(client) -> None:
+    with client.websocket_connect("/audio/stream") as ws:
+        ws.send_text("not-json")
+        message = ws.receive_json()
+
+    assert message["type"] == "error"
+
+
+class _ScriptedWebSocket:
+    """受信メッセージを順に返し、送信・close を記録する WebSocket"""
+
+    def __init__(self, messages):
+        self._messages = list(messages)
+        self.sent = []
+        self.closed = False
+
+    async def accept(self):
+        pass
+
+    async def receive(self):
+        return self._messages.pop(0)
+
+    async def send_json(self, data):
+        self.sent.append(data["type"])
+
+    async def close(self, code=1000):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_stream_stops_sending_after_client_disconnect(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "STT_STREAMING_PROVIDER", "mock")
+    websocket = _ScriptedWebSocket(
+        [
+            {"type": "websocket.receive", "text": '{"type": "start"}'},
+            {"type": "websocket.receive", "bytes": b"\x00" * 320},
+            {"type": "websocket.disconnect", "code": 1001},
+        ]
+    )
+
+    await stream_transcription(websocket, current_user=SimpleNamespace(id=1))
+
+    # 切断後は確定結果・end を送らず、close もしない
+    assert websocket.sent == ["partial"]
+    assert websocket.closed is False
+
+
+def test_ws_auth_releases_db_session(monkeypatch, tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'ws.db'}")
+    Base.metadata.create_all(engine)
+    sessions = sessionmaker(bind=engine)
+    with sessions() as db:
+        db.add(User(id="user-1", sub="sub-1", name="User", email="u@example.com"))
+        db.commit()
+    monkeypatch.setattr(deps, "SessionLocal", sessions)
+    websocket = SimpleNamespace(
+        query_params={"token": create_access_token({"sub": "sub-1"})}, headers={}
+    )
+
+    user = get_current_user_ws(websocket)
+
+    assert user.id == "user-1"
+    # 接続中ずっとプールの接続を握らない
+    assert engine.pool.checkedout() == 0
+
+
+def _fake_result(text, is_final, end_seconds):
+    words = [
+        SimpleNamespace(
+            word=word,
+            start_time=timedelta(seconds=i * 0.5),
+            end_time=timedelta(seconds=(i + 1) * 0.5),
+        )
+        for i, word in enumerate(text.split())
+    ]
+    return SimpleNamespace(
+        alternatives=[
+            SimpleNamespace(transcript=text, confidence=0.92, words=words)
+        ],
+        is_final=is_final,
+        stability=0.8,
+        result_end_time=timedelta(seconds=end_seconds),
+    )
+
+
+@pytest.mark.asyncio
+async def test_google_stream_transcribe_bridges_grpc_stream() -> None:
+    received_chunks = []
+
+    def _streaming_recognize(config, requests):
+        for request in requests:
+            received_chunks.append(request.audio_content)
+        return [
+            SimpleNamespace(results=[_fake_result("hello", False, 0.5)]),
+            SimpleNamespace(results=[_fake_result("hello world", True, 1.2)]),
+        ]
+
+    fake_client = MagicMock()
+    fake_client.streaming_recognize.side_effect = _streaming_recognize
+
+    async def _chunks():
+        yield b"chunk-1"
+        yield b""
+        yield b"chunk-2"
+
+    with patch(
+        "app.services.ai.google_speech_provider.speech.SpeechClient",
+        return_value=fake_client,
+    ), patch(
+        "app.services.ai.google_speech_provider.calculate_google_stt_cost"
+    ) as mock_cost:
+        provider = GoogleSpeechProvider()
+        transcripts = [
+            t
+            async for t in provider.stream_transcribe(
+                _chunks(), encoding="linear16", sample_rate_hz=16000
+            )
+        ]
+
+    assert received_chunks == [b"chunk-1", b"chunk-2"]
+    assert [t.is_final for t in transcripts] == [False, True]
+    assert transcripts[0].words == []
+    assert transcripts[1].confidence == pytest.approx(0.92)
+    assert [w.word for w in transcripts[1].words] == ["hello", "world"]
+    _, kwargs = mock_cost.call_args
+    assert kwargs["audio_duration_seconds"] == pytest.approx(1.2)
+
+
+@pytest.mark.asyncio
+async def test_google_stream_transcribe_rejects_unknown_encoding() -> None:
+    with patch(
+        "app.services.ai.google_speech_provider.speech.SpeechClient",
+        return_value=MagicMock(),
+    ):
+        provider = GoogleSpeechProvider()
+
+    async def _chunks():
+        yield b"chunk"
+
+    with pytest.raises(ValueError, match="サポートされていないエンコーディング"):
+        async for _ in provider.stream_transcribe(_chunks(), encoding="aac"):
+            pass
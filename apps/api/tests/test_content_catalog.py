@@ -0,0 +1,137 @@
+"""静的コンテンツカタログのテスト"""
+
+import dataclasses
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.services.content import (
+    get_catalog,
+    get_placement_question,
+    reload_catalog,
+)
+from models.database.models import (
+    Base,
+    DifficultyLevel,
+    Scenario,
+    ScenarioCategory,
+    ShadowingSentence,
+)
+
+
+@pytest.fixture()
+def db_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    db.add_all(
+        [
+            Scenario(
+                id=1,
+                name="Airport Check-in",
+                description="",
+                category=ScenarioCategory.TRAVEL.value,
+                difficulty=DifficultyLevel.BEGINNER.value,
+                is_active=True,
+            ),
+            Scenario(
+                id=2,
+                name="Business Meeting",
+                description="",
+                category=ScenarioCategory.BUSINESS.value,
+                difficulty=DifficultyLevel.INTERMEDIATE.value,
+                is_active=False,
+            ),
+            ShadowingSentence(
+                id=10,
+                scenario_id=1,
+                key_phrase="check in",
+                sentence_en="I'd like to check in.",
+                sentence_ja="チェックインしたいです。",
+                order_index=2,
+                difficulty=DifficultyLevel.BEGINNER.value,
+            ),
+            ShadowingSentence(
+                id=11,
+                scenario_id=1,
+                key_phrase="window seat",
+                sentence_en="Could I have a window seat?",
+                sentence_ja="窓側の席にできますか？",
+                order_index=1,
+                difficulty=DifficultyLevel.BEGINNER.value,
+            ),
+        ]
+    )
+    db.commit()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def test_catalog_indexes_rows(db_session):
+    catalog = get_catalog(db_session)
+
+    assert catalog.get_scenario(1).category == "travel"
+    assert catalog.get_scenario(2, active_only=True) is None
+    assert [s.id for s in catalog.scenarios_by_category("business")] == [2]
+    assert [s.id for s in catalog.scenarios_by_difficulty("beginner")] == [1]
+    # order_index 順
+    assert [s.id for s in catalog.shadowing_for_scenario(1)] == [11, 10]
+    assert [s.id for s in catalog.scenarios_with_shadowing()] == [1]
+    assert catalog.get_shadowing_sentence(10).sentence_en == "I'd like to check in."
+    assert catalog.get_goals(1)
+    assert catalog.get_initial_message(1).startswith("Hi, I'm the airline staff")
+    assert get_placement_question(2).type == "speaking"
+
+
+def test_catalog_is_loaded_once_and_immutable(db_session):
+    statements = []
+    engine = db_session.get_bind()
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        first = get_catalog(db_session)
+        second = get_catalog(db_session)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert first is second
+    assert len(statements) == 2
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.get_scenario(1).name = "changed"
+    with pytest.raises(TypeError):
+        first.scenarios_by_id[3] = None
+
+
+def test_reload_picks_up_new_content_and_changes_hash(db_session):
+    before = get_catalog(db_session)
+
+    db_session.add(
+        ShadowingSentence(
+            id=12,
+            scenario_id=1,
+            key_phrase="boarding",
+            sentence_en="When does boarding start?",
+            sentence_ja="搭乗はいつ始まりますか？",
+            order_index=3,
+            difficulty=DifficultyLevel.BEGINNER.value,
+        )
+    )
+    db_session.commit()
+
+    assert get_catalog(db_session).get_shadowing_sentence(12) is None
+    after = reload_catalog(db_session)
+
+    assert after.get_shadowing_sentence(12) is not None
+    assert after.content_hash != before.content_hash
+    assert reload_catalog(db_session).content_hash == after.content_hash
@@ -297,6 +297,39 @@ class TestListCustomScenarios:
         assert len(data["custom_scenarios"]) == 1
         assert data["custom_scenarios"][0]["name"] == "自分のシナリオ"
 
+    def test_list_pages_with_cursor(self, client, db_session, test_user):
+        """cursor で新しい順に続きを取得でき、total_count は先頭ページのみ"""
+        for i in range(3):
+            db_session.add(
+                CustomScenario(
+                    user_id=test_user.id,
+                    name=f"シナリオ{i}",
+                    description="説明",
+                    user_role="役割",
+                    ai_role="AI役割",
+                    created_at=datetime(2024, 1, 1 + i),
+                )
+            )
+        db_session.commit()
+
+        first = client.get("/api/v1/custom-scenarios", params={"limit": 2}).json()
+        assert [s["name"] for s in first["custom_scenarios"]] == ["シナリオ2", "シナリオ1"]
+        assert first["total_count"] == 3
+        assert first["next_cursor"]
+
+        second = client.get(
+            "/api/v1/custom-scenarios",
+            params={"limit": 2, "cursor": first["next_cursor"]},
+        ).json()
+        assert [s["name"] for s in second["custom_scenarios"]] == ["シナリオ0"]
+        assert second["total_count"] is None
+        assert second["next_cursor"] is None
+
+    def test_list_rejects_invalid_cursor(self, client):
+        res = client.get("/api/v1/custom-scenarios", params={"cursor": "broken"})
+
+        assert res.status_code == 400
+
 
 class TestGetCustomScenario:
     """GET /custom-scenarios/{id} のテスト"""
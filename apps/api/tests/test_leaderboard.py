@@ -0,0 +1,194 @@
+"""ランキング（プロセス内リーダーボード）のテスト"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.routers.rankings.rankings import get_my_ranking, get_rankings
+from app.services.leaderboard.leaderboard import JST
+from app.services.leaderboard import (
+    RankIndex,
+    get_leaderboard,
+    period_start,
+    record_points,
+    remove_user,
+    save_snapshots,
+)
+from app.services.points.point_service import jst_day
+from models.database.models import Base, LeaderboardSnapshot, User, UserDailyPoints
+
+
+@pytest.fixture()
+def db_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    _seed(db)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _seed(db):
+    """全期間: alice 300 / bob 200 / carol 200 / dave 0、今週: carol 150 / alice 120"""
+    for user_id, points in (("alice", 300), ("bob", 200), ("carol", 200), ("dave", 0)):
+        db.add(
+            User(
+                id=user_id,
+                sub=f"sub-{user_id}",
+                name=user_id.title(),
+                email=f"{user_id}@example.com",
+                total_points=points,
+            )
+        )
+    db.flush()
+    today = jst_day(datetime.now(timezone.utc))
+    for user_id, day, points in (
+        ("alice", today, 120),
+        ("carol", today, 150),
+        ("bob", today - timedelta(days=400), 200),
+    ):
+        db.add(UserDailyPoints(user_id=user_id, day=day, points=points))
+    db.commit()
+
+
+def _user(db, user_id):
+    return db.query(User).filter(User.id == user_id).one()
+
+
+class TestRankIndex:
+    def test_rank_ties_and_points_to_next(self):
+        index = RankIndex([("a", 300), ("b", 200), ("c", 200), ("d", 0)])
+
+        assert len(index) == 3
+        assert "d" not in index
+        assert index.rank_of(300) == 1
+        assert index.rank_of(200) == 2
+        assert index.rank_of(0) == 4
+        assert index.points_to_next(300) is None
+        assert index.points_to_next(200) == 100
+        assert index.points_to_next(150) == 50
+        assert index.top(2) == [("a", 300), ("b", 200)]
+
+    def test_set_moves_and_removes_users(self):
+        index = RankIndex([("a", 300), ("b", 200)])
+
+        index.set("b", 350)
+        assert index.top(2) == [("b", 350), ("a", 300)]
+
+        index.set("a", 0)
+        assert len(index) == 1
+        assert index.points("a") == 0
+        assert index.top(5) == [("b", 350)]
+
+
+def test_period_start_uses_jst_boundaries():
+    # 2026-10-18 (日) 16:00 UTC = 2026-10-19 (月) 01:00 JST
+    now = datetime(2026, 10, 18, 16, 0, tzinfo=timezone.utc)
+
+    assert period_start("all_time", now) is None
+    assert period_start("weekly", now) == datetime(2026, 10, 18, 15, 0, tzinfo=timezone.utc)
+    assert period_start("monthly", now) == datetime(2026, 9, 30, 15, 0, tzinfo=timezone.utc)
+
+
+def test_rankings_by_period(db_session):
+    all_time = get_rankings(limit=10, period="all_time", current_user=None, db=db_session)
+    weekly = get_rankings(limit=10, period="weekly", current_user=None, db=db_session)
+
+    assert [(e.user_id, e.rank, e.total_points) for e in all_time.rankings] == [
+        ("alice", 1, 300),
+        ("bob", 2, 200),
+        ("carol", 3, 200),
+    ]
+    assert all_time.total_users == 3
+    # 期間ボードは期間内の獲得ポイント順
+    assert [(e.user_id, e.total_points) for e in weekly.rankings] == [
+        ("carol", 150),
+        ("alice", 120),
+    ]
+    assert weekly.rankings[0].user_name == "Carol"
+
+
+def test_my_ranking_is_served_from_memory(db_session, max_queries):
+    get_leaderboard(db_session)
+    dave = _user(db_session, "dave")
+    carol = _user(db_session, "carol")
+
+    with max_queries(0):
+        mine = get_my_ranking(current_user=carol, db=db_session)
+        last = get_my_ranking(current_user=dave, db=db_session)
+
+    assert (mine.rank, mine.points_to_next_rank, mine.total_users) == (2, 100, 3)
+    assert (last.rank, last.points_to_next_rank) == (4, 200)
+
+
+def test_recorded_points_update_boards_without_reload(db_session):
+    leaderboard = get_leaderboard(db_session)
+
+    record_points("bob", 150)
+    record_points("dave", 10)
+    remove_user("carol")
+
+    assert leaderboard.top("all_time", 3) == [("bob", 350), ("alice", 300), ("dave", 10)]
+    assert leaderboard.top("weekly", 3) == [("bob", 150), ("alice", 120), ("dave", 10)]
+    assert get_leaderboard(db_session) is leaderboard
+
+
+def test_reload_after_refresh_interval(db_session, monkeypatch):
+    leaderboard = get_leaderboard(db_session)
+    monkeypatch.setattr(settings, "LEADERBOARD_REFRESH_SECONDS", 0)
+
+    assert get_leaderboard(db_session) is not leaderboard
+
+
+def test_snapshots_are_saved_by_job_not_on_load(db_session):
+    today = jst_day(datetime.now(timezone.utc))
+    db_session.add(UserDailyPoints(user_id="bob", day=today - timedelta(days=7), points=70))
+    db_session.commit()
+
+    # リクエスト経路での読み込みではスナップショットを書かない
+    get_leaderboard(db_session)
+    record_points("alice", 500)
+    assert db_session.query(LeaderboardSnapshot).count() == 0
+
+    now = datetime.now(timezone.utc)
+    saved = save_snapshots(db_session, now)
+
+    current_key = period_start("weekly", now).astimezone(JST).date().isoformat()
+    previous_key = (
+        period_start("weekly", now - timedelta(days=7)).astimezone(JST).date().isoformat()
+    )
+    assert ("weekly", current_key) in saved
+    assert ("weekly", previous_key) in saved
+
+    def _weekly(period_key):
+        return [
+            (r.user_id, r.rank, r.points)
+            for r in db_session.query(LeaderboardSnapshot)
+            .filter(
+                LeaderboardSnapshot.board == "weekly",
+                LeaderboardSnapshot.period_key == period_key,
+            )
+            .order_by(LeaderboardSnapshot.rank)
+        ]
+
+    # プロセス内のランキング（alice +500）ではなく DB の集計から保存する
+    assert _weekly(current_key) == [("carol", 1, 150), ("alice", 2, 120)]
+    # 終了した期間の最終順位は当週分を含めない
+    assert _weekly(previous_key) == [("bob", 1, 70)]
+
+    # 再実行では現在の期間を置き換えるだけで、終了した期間は保存し直さない
+    again = save_snapshots(db_session, now)
+    assert ("weekly", previous_key) not in again
+    assert _weekly(current_key) == [("carol", 1, 150), ("alice", 2, 120)]
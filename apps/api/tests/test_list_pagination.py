@@ -0,0 +1,96 @@
+"""保存フレーズ一覧・復習履歴のキーセットページネーションのテスト"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.routers.saved_phrases.saved_phrases import list_saved_phrases
+from app.services.review.review_service import ReviewService
+from models.database.models import Base, ReviewItem, SavedPhrase, User
+
+USER_ID = "user-1"
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+@pytest.fixture()
+def db_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(User(id=USER_ID, sub="sub-1", name="User", email="u@example.com"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def _user(db):
+    return db.get(User, USER_ID)
+
+
+def test_saved_phrases_pages_newest_first_with_tied_created_at(db_session):
+    # 同じ created_at の行がページ境界をまたいでも重複・欠落しない
+    for i in range(5):
+        created_at = NOW if i < 4 else NOW - timedelta(days=1)
+        db_session.add(
+            SavedPhrase(
+                user_id=USER_ID, phrase=f"p{i}", explanation="-", created_at=created_at
+            )
+        )
+    db_session.commit()
+
+    pages, cursor = [], None
+    while True:
+        response = list_saved_phrases(
+            limit=2, cursor=cursor, current_user=_user(db_session), db=db_session
+        )
+        pages.append(response)
+        cursor = response.next_cursor
+        if cursor is None:
+            break
+
+    phrases = [sp.phrase for page in pages for sp in page.saved_phrases]
+    assert phrases == ["p3", "p2", "p1", "p0", "p4"]
+    assert [page.total_count for page in pages] == [5, None, None]
+
+
+def test_saved_phrases_rejects_invalid_cursor(db_session):
+    with pytest.raises(HTTPException) as exc_info:
+        list_saved_phrases(
+            limit=2, cursor="broken", current_user=_user(db_session), db=db_session
+        )
+
+    assert exc_info.value.status_code == 400
+
+
+def test_review_history_pages_by_completed_at(db_session):
+    for i in range(3):
+        db_session.add(
+            ReviewItem(
+                user_id=USER_ID,
+                phrase=f"r{i}",
+                explanation="-",
+                due_at=NOW,
+                is_completed=True,
+                completed_at=NOW + timedelta(hours=i),
+            )
+        )
+    db_session.add(
+        ReviewItem(user_id=USER_ID, phrase="open", explanation="-", due_at=NOW)
+    )
+    db_session.commit()
+    service = ReviewService(db_session)
+
+    first, cursor = service.get_history(USER_ID, limit=2)
+    second, last_cursor = service.get_history(USER_ID, limit=2, cursor=cursor)
+
+    assert [item.phrase for item in first] == ["r2", "r1"]
+    assert [item.phrase for item in second] == ["r0"]
+    assert last_cursor is None
@@ -0,0 +1,77 @@
+"""イベントループのブロッキング検知のテスト"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.logging_config import request_id_var
+from app.core.loop_monitor import (
+    LoopMonitorMiddleware,
+    get_loop_monitor_stats,
+    reset_loop_monitor_stats,
+    start_loop_monitor,
+    stop_loop_monitor,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    reset_loop_monitor_stats()
+    yield
+    reset_loop_monitor_stats()
+
+
+def blocking_handler():
+    time.sleep(0.3)
+
+
+async def turn_endpoint():
+    blocking_handler()
+
+
+@pytest.mark.asyncio
+async def test_reports_blocking_call_with_request_context():
+    async def app(scope, receive, send):
+        request_id_var.set("req-123")
+        scope["endpoint"] = turn_endpoint
+        await turn_endpoint()
+
+    await start_loop_monitor(interval_ms=20, threshold_ms=100)
+    try:
+        await asyncio.sleep(0.05)
+        await LoopMonitorMiddleware(app)(
+            {"type": "http", "method": "POST", "path": "/api/v1/sessions/1/turn"},
+            None,
+            None,
+        )
+        await asyncio.sleep(0.1)
+    finally:
+        await stop_loop_monitor()
+
+    stats = get_loop_monitor_stats()
+    assert stats["stalls"] >= 1
+    assert stats["max_blocked_ms"] >= 200
+    assert stats["top_offenders"][0]["location"].endswith("blocking_handler")
+    assert "tests/test_loop_monitor.py" in stats["top_offenders"][0]["location"]
+
+    stall = max(stats["recent"], key=lambda r: r["blocked_ms"])
+    assert stall["request_id"] == "req-123"
+    assert stall["path"] == "/api/v1/sessions/1/turn"
+    assert stall["endpoint"] == "turn_endpoint"
+
+
+@pytest.mark.asyncio
+async def test_short_pauses_are_not_reported():
+    await start_loop_monitor(interval_ms=20, threshold_ms=200)
+    try:
+        for _ in range(5):
+            time.sleep(0.01)
+            await asyncio.sleep(0.02)
+    finally:
+        await stop_loop_monitor()
+
+    stats = get_loop_monitor_stats()
+    assert stats["stalls"] == 0
+    assert stats["top_offenders"] == []
+    assert stats["enabled"] is False
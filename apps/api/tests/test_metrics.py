@@ -0,0 +1,166 @@
+"""Prometheus 形式メトリクス（/metrics）のテスト"""
+
+import json
+import os
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import metrics as metrics_module
+from app.core.config import settings
+from app.core.cost_tracker import calculate_groq_cost, calculate_whisper_cost
+from app.core.metrics import (
+    MetricsRegistry,
+    format_text,
+    merge_snapshots,
+    read_snapshots,
+    write_snapshot,
+)
+from app.core.middleware import RequestLoggingMiddleware
+from app.services.ai.stt_registry import STTProviderRegistry
+
+
+def _sample(text: str, line_prefix: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(line_prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{line_prefix} not found in\n{text}")
+
+
+def _value(metric, *labels) -> float:
+    return metric.labels(*labels).get()
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.labels("/a").observe(value)
+
+    text = format_text(registry.snapshot())
+
+    assert _sample(text, 'latency_seconds_bucket{route="/a",le="0.1"}') == 2
+    assert _sample(text, 'latency_seconds_bucket{route="/a",le="1.0"}') == 3
+    assert _sample(text, 'latency_seconds_bucket{route="/a",le="+Inf"}') == 4
+    assert _sample(text, 'latency_seconds_count{route="/a"}') == 4
+    assert _sample(text, 'latency_seconds_sum{route="/a"}') == pytest.approx(3.65)
+    assert "# TYPE latency_seconds histogram" in text
+
+
+def test_labels_must_match_label_names():
+    counter = MetricsRegistry().counter("errors_total", "Errors", ("service",))
+
+    with pytest.raises(ValueError):
+        counter.labels("a", "b")
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.counter("c_total", "C", ("path",)).labels('a"b\\c').inc()
+
+    assert 'c_total{path="a\\"b\\\\c"} 1' in format_text(registry.snapshot())
+
+
+def test_middleware_records_route_template_and_in_flight():
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware)
+    seen_in_flight = []
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        seen_in_flight.append(metrics_module.HTTP_REQUESTS_IN_FLIGHT.labels().get())
+        return {"id": item_id}
+
+    duration = metrics_module.HTTP_REQUEST_DURATION
+    before = duration.labels("GET", "/items/{item_id}", "200").get()[0]
+    in_flight = metrics_module.HTTP_REQUESTS_IN_FLIGHT.labels().get()
+    client = TestClient(app)
+
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/missing")
+
+    after = duration.labels("GET", "/items/{item_id}", "200").get()[0]
+    assert sum(after) - sum(before) == 2
+    assert sum(duration.labels("GET", "unmatched", "404").get()[0]) >= 1
+    assert seen_in_flight == [in_flight + 1, in_flight + 1]
+    assert metrics_module.HTTP_REQUESTS_IN_FLIGHT.labels().get() == in_flight
+
+
+def test_cost_tracker_records_usage_and_latency():
+    tokens = metrics_module.LLM_TOKENS
+    model = "llama3-8b-8192"
+    before_in = _value(tokens, "groq", model, "input")
+    before_audio = _value(metrics_module.STT_AUDIO_SECONDS, "whisper")
+    before_latency = metrics_module.UPSTREAM_REQUEST_DURATION.labels("groq").get()[0]
+
+    calculate_groq_cost(model, input_tokens=120, output_tokens=30, latency_ms=400)
+    calculate_whisper_cost(audio_duration_seconds=2.5)
+
+    assert _value(tokens, "groq", model, "input") - before_in == 120
+    assert _value(metrics_module.STT_AUDIO_SECONDS, "whisper") - before_audio == 2.5
+    after_latency = metrics_module.UPSTREAM_REQUEST_DURATION.labels("groq").get()[0]
+    assert sum(after_latency) - sum(before_latency) == 1
+
+
+def test_stt_failures_count_as_upstream_errors(monkeypatch):
+    monkeypatch.setattr(STTProviderRegistry, "_health", {})
+    errors = metrics_module.UPSTREAM_ERRORS
+    before = _value(errors, "google_stt")
+
+    STTProviderRegistry.record_failure("google")
+
+    assert _value(errors, "google_stt") - before == 1
+
+
+def test_metrics_endpoint_renders_prometheus_text():
+    from app.main import app
+
+    res = TestClient(app).get("/metrics")
+
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE http_request_duration_seconds histogram" in res.text
+    assert "# TYPE transcription_cache_requests_total counter" in res.text
+
+
+def _worker_snapshot(directory, pid, written_at, requests, in_flight, ratio):
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests").inc(requests)
+    registry.gauge("in_flight", "In flight").set(in_flight)
+    registry.gauge("hit_ratio", "Ratio", aggregate="per_worker").set(ratio)
+    path = os.path.join(directory, f"metrics-{pid}.json")
+    with open(path, "w") as f:
+        json.dump({"written_at": written_at, "metrics": registry.snapshot()}, f)
+
+
+def test_multiprocess_snapshots_are_merged(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_FLUSH_SECONDS", 15)
+    now = time.time()
+    _worker_snapshot(tmp_path, 101, now, requests=3, in_flight=2, ratio=0.5)
+    _worker_snapshot(tmp_path, 102, now, requests=4, in_flight=1, ratio=0.25)
+    # 終了したワーカー: カウンタは残し、ゲージは捨てる
+    _worker_snapshot(tmp_path, 103, now - 600, requests=5, in_flight=9, ratio=1.0)
+
+    text = format_text(merge_snapshots(read_snapshots(str(tmp_path))))
+
+    assert _sample(text, "requests_total") == 12
+    assert _sample(text, "in_flight") == 3
+    assert _sample(text, 'hit_ratio{pid="101"}') == 0.5
+    assert _sample(text, 'hit_ratio{pid="102"}') == 0.25
+    assert 'hit_ratio{pid="103"}' not in text
+
+
+def test_render_includes_own_snapshot_in_multiprocess_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_MULTIPROC_DIR", str(tmp_path))
+    _worker_snapshot(tmp_path, 999999, time.time(), requests=1, in_flight=0, ratio=0)
+
+    text = metrics_module.registry.render()
+
+    assert os.path.exists(tmp_path / f"metrics-{os.getpid()}.json")
+    assert _sample(text, "requests_total") == 1
+    assert "http_requests_in_flight" in text
+    write_snapshot(str(tmp_path))
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,145 @@
+"""ポイント付与履歴（point_events）と日別集計（user_daily_points）のテスト"""
+
+from datetime import datetime, time, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.services.points.point_service import (
+    JST,
+    REASON_ROUND,
+    REASON_SESSION_COMPLETE,
+    PointAward,
+    PointService,
+    jst_day,
+)
+from models.database.models import Base, PointEvent, User, UserDailyPoints
+
+USER_ID = "user-1"
+
+
+@pytest.fixture()
+def db_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    db.add(
+        User(
+            id=USER_ID,
+            sub="sub-1",
+            name="Tester",
+            email="tester@example.com",
+            total_points=0,
+        )
+    )
+    db.commit()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _user(db):
+    return db.query(User).filter(User.id == USER_ID).one()
+
+
+def test_add_points_writes_events_and_daily_bucket(db_session, max_queries):
+    service = PointService(db_session)
+    user = _user(db_session)
+
+    # 合計の加算・付与履歴・日別集計
+    with max_queries(3):
+        added = service.add_points(
+            user,
+            [
+                PointAward(12, REASON_ROUND, None),
+                PointAward(0, REASON_ROUND, None),
+                PointAward(60, REASON_SESSION_COMPLETE, None),
+            ],
+        )
+    service.add_points(user, [PointAward(10, REASON_ROUND)])
+    db_session.commit()
+
+    assert added == 72
+    assert _user(db_session).total_points == 82
+    events = db_session.query(PointEvent).order_by(PointEvent.id).all()
+    assert [(e.points, e.reason) for e in events] == [
+        (12, REASON_ROUND),
+        (60, REASON_SESSION_COMPLETE),
+        (10, REASON_ROUND),
+    ]
+    buckets = db_session.query(UserDailyPoints).all()
+    assert [(b.day, b.points) for b in buckets] == [
+        (jst_day(datetime.now(timezone.utc)), 82)
+    ]
+
+
+def test_add_points_does_not_overwrite_concurrent_awards(db_session):
+    service = PointService(db_session)
+    user = _user(db_session)
+    assert user.total_points == 0
+
+    # 読み込み後に別のリクエストが付与をコミットした状態
+    db_session.execute(
+        User.__table__.update()
+        .where(User.__table__.c.id == USER_ID)
+        .values(total_points=50)
+    )
+    service.add_points(user, [PointAward(10, REASON_ROUND)])
+    db_session.commit()
+
+    db_session.expire_all()
+    assert _user(db_session).total_points == 60
+
+
+def test_jst_day_boundary():
+    # 15:00 UTC = 翌日 0:00 JST
+    assert jst_day(datetime(2026, 10, 18, 14, 59, tzinfo=timezone.utc)).isoformat() == "2026-10-18"
+    assert jst_day(datetime(2026, 10, 18, 15, 0, tzinfo=timezone.utc)).isoformat() == "2026-10-19"
+    assert jst_day(datetime(2026, 10, 18, 15, 0)).isoformat() == "2026-10-19"
+
+
+def test_points_summary_reads_daily_buckets(db_session):
+    service = PointService(db_session)
+    user = _user(db_session)
+    now = datetime.now(timezone.utc)
+    today = jst_day(now)
+    week_start = today - timedelta(days=today.weekday())
+
+    service.add_points(user, [PointAward(30, REASON_ROUND)], awarded_at=now)
+    # 今週の初日（月曜 0:00 JST）
+    service.add_points(
+        user,
+        [PointAward(7, REASON_ROUND)],
+        awarded_at=JST.localize(datetime.combine(week_start, time())),
+    )
+    # 先週分は今週に含めない
+    service.add_points(
+        user,
+        [PointAward(500, REASON_ROUND)],
+        awarded_at=JST.localize(datetime.combine(week_start, time())) - timedelta(seconds=1),
+    )
+    db_session.commit()
+
+    total, this_week, today_points = service.get_user_points_summary(USER_ID)
+
+    assert total == 537
+    assert this_week == 37
+    assert today_points == (37 if week_start == today else 30)
+
+
+def test_award_round_points_records_ledger(db_session):
+    points = PointService(db_session).award_round_points(USER_ID, "intermediate")
+
+    assert points == 12
+    event = db_session.query(PointEvent).one()
+    assert (event.user_id, event.points, event.reason) == (USER_ID, 12, REASON_ROUND)
+    assert db_session.query(UserDailyPoints).one().points == 12
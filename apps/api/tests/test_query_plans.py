@@ -0,0 +1,207 @@
+"""
+ホットパスのクエリプランのテスト
+
+実際のサービス・ルーターのコードを実行して発行されたSQLを記録し、
+EXPLAIN QUERY PLAN でユーザー数・セッション数に比例して伸びるテーブルを
+フルスキャンしていないことを確認する（SQLite のプランで判定）。
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.pagination import encode_cursor
+from app.routers.custom_scenarios.custom_scenarios import list_custom_scenarios
+from app.routers.rankings.rankings import get_my_ranking, get_rankings
+from app.routers.saved_phrases.saved_phrases import list_saved_phrases
+from app.services.conversation.session_service import SessionService
+from app.services.points.point_service import PointService
+from app.services.review.review_service import ReviewService
+from app.services.shadowing.progress_service import ShadowingProgressService
+from app.services.streak.streak_service import StreakService
+from models.database.models import (
+    Base,
+    DifficultyLevel,
+    ReviewItem,
+    SavedPhrase,
+    Scenario,
+    ScenarioCategory,
+    Session as SessionModel,
+    SessionMode,
+    SessionRound,
+    User,
+)
+from models.schemas.schemas import ShadowingBatchAttempt
+
+# 利用量に比例して伸びるテーブル
+GROWING_TABLES = {
+    "users",
+    "sessions",
+    "session_rounds",
+    "review_items",
+    "saved_phrases",
+    "custom_scenarios",
+    "user_shadowing_progress",
+    "user_instant_translation_progress",
+}
+
+# "SCAN sessions" はフルスキャン、"SCAN users USING INDEX ..." はインデックス走査
+_FULL_SCAN_RE = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+
+USER_ID = "00000000-0000-0000-0000-000000000001"
+# 2ページ目以降の取得（キーセット条件付き）
+NEXT_PAGE = encode_cursor(datetime(2100, 1, 1), 1_000_000)
+
+
+@pytest.fixture()
+def db_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    _seed(db)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _seed(db):
+    user = User(
+        id=USER_ID,
+        sub="sub-1",
+        name="Tester",
+        email="tester@example.com",
+        total_points=120,
+    )
+    db.add(user)
+    scenario = Scenario(
+        name="Airport Check-in",
+        description="test",
+        category=ScenarioCategory.TRAVEL,
+        difficulty=DifficultyLevel.BEGINNER,
+        is_active=True,
+    )
+    db.add(scenario)
+    db.flush()
+    session = SessionModel(
+        user_id=user.id,
+        scenario_id=scenario.id,
+        round_target=4,
+        completed_rounds=1,
+        difficulty=DifficultyLevel.BEGINNER,
+        mode=SessionMode.STANDARD,
+    )
+    db.add(session)
+    db.flush()
+    db.add(
+        SessionRound(
+            session_id=session.id,
+            round_index=1,
+            user_input="hello",
+            ai_reply="hi",
+            feedback_short="ok",
+            improved_sentence="Hello.",
+        )
+    )
+    db.add(
+        ReviewItem(
+            user_id=user.id,
+            phrase="Hello.",
+            explanation="ok",
+            due_at=datetime.now(timezone.utc) + timedelta(days=1),
+        )
+    )
+    db.add(SavedPhrase(user_id=user.id, phrase="Hello.", explanation="ok"))
+    db.commit()
+
+
+def _capture_statements(db, fn):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    return statements
+
+
+def _full_scans(db, statements):
+    scans = []
+    for statement, parameters in statements:
+        plan = db.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", tuple(parameters)
+        )
+        for row in plan:
+            match = _FULL_SCAN_RE.match(row[-1])
+            if match and match.group(1) in GROWING_TABLES:
+                scans.append((match.group(1), statement))
+    return scans
+
+
+def _user(db):
+    return db.query(User).filter(User.id == USER_ID).one()
+
+
+HOT_PATHS = {
+    "points_summary": lambda db: PointService(db).get_user_points_summary(USER_ID),
+    "user_stats": lambda db: StreakService(db).get_user_stats(USER_ID),
+    "turn_context": lambda db: SessionService(db)._load_turn_state(1, USER_ID),
+    "goal_history": lambda db: SessionService(db)._load_history_payload(1),
+    "review_due_count": lambda db: ReviewService(db).count_due_items(USER_ID),
+    "review_due_queue": lambda db: ReviewService(db).get_due_items(USER_ID),
+    "review_history": lambda db: ReviewService(db).get_history(
+        USER_ID, cursor=NEXT_PAGE
+    ),
+    "rankings_all_time": lambda db: get_rankings(
+        limit=20, period="all_time", current_user=_user(db), db=db
+    ),
+    "rankings_weekly": lambda db: get_rankings(
+        limit=20, period="weekly", current_user=_user(db), db=db
+    ),
+    "my_ranking": lambda db: get_my_ranking(current_user=_user(db), db=db),
+    "saved_phrases": lambda db: list_saved_phrases(
+        limit=50, cursor=None, current_user=_user(db), db=db
+    ),
+    "saved_phrases_next_page": lambda db: list_saved_phrases(
+        limit=50, cursor=NEXT_PAGE, current_user=_user(db), db=db
+    ),
+    "custom_scenarios": lambda db: list_custom_scenarios(
+        limit=50, cursor=None, current_user=_user(db), db=db
+    ),
+    "shadowing_progress": lambda db: ShadowingProgressService(db)._load_states(
+        USER_ID,
+        [
+            ShadowingBatchAttempt(shadowing_sentence_id=1, mode="shadowing", score=90),
+            ShadowingBatchAttempt(
+                shadowing_sentence_id=1, mode="instant_translation", score=90
+            ),
+        ],
+    ),
+    "shadowing_scenario_progress": lambda db: ShadowingProgressService(
+        db
+    ).scenario_progress(USER_ID, since=datetime(2024, 1, 1)),
+}
+
+
+@pytest.mark.parametrize("name", sorted(HOT_PATHS))
+def test_hot_path_queries_do_not_full_scan(db_session, name):
+    statements = _capture_statements(db_session, lambda: HOT_PATHS[name](db_session))
+
+    assert statements, f"{name} issued no queries"
+    assert _full_scans(db_session, statements) == []
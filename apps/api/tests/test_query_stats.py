@@ -0,0 +1,132 @@
+"""リクエストごとのSQL集計・N+1検知・遅いクエリログのテスト"""
+
+import logging
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.core.middleware import RequestLoggingMiddleware
+from app.db.query_stats import (
+    QueryStats,
+    _redact,
+    finish_request_stats,
+    install_query_hooks,
+    track_queries,
+)
+
+
+@pytest.fixture()
+def engine():
+    install_query_hooks()
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        conn.execute(text("INSERT INTO items (id, name) VALUES (1, 'a'), (2, 'b')"))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def client(engine):
+    app = FastAPI()
+    app.add_middleware(RequestLoggingMiddleware)
+
+    def get_conn():
+        with engine.connect() as conn:
+            yield conn
+
+    @app.get("/items")
+    def list_items(conn=Depends(get_conn)):
+        ids = [row.id for row in conn.execute(text("SELECT id FROM items"))]
+        # 1件ずつ取り直す（N+1）
+        return [
+            conn.execute(text("SELECT name FROM items WHERE id = :id"), {"id": i}).scalar()
+            for i in ids
+        ]
+
+    return TestClient(app)
+
+
+def test_response_headers_report_request_queries(client):
+    res = client.get("/items")
+
+    assert res.status_code == 200
+    assert res.json() == ["a", "b"]
+    assert res.headers["X-DB-Query-Count"] == "3"
+    assert float(res.headers["X-DB-Time-Ms"]) >= 0
+
+
+def test_headers_are_omitted_in_production(client, monkeypatch):
+    monkeypatch.setattr(settings, "ENVIRONMENT", "production")
+
+    res = client.get("/items")
+
+    assert res.status_code == 200
+    assert "X-DB-Query-Count" not in res.headers
+
+
+def test_repeated_statements_are_reported_as_n_plus_one(client, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "SQL_N_PLUS_ONE_THRESHOLD", 2)
+
+    with caplog.at_level(logging.WARNING, logger="app.db.query_stats"):
+        client.get("/items")
+
+    warnings = [r for r in caplog.records if r.getMessage() == "Probable N+1 query"]
+    assert len(warnings) == 1
+    assert warnings[0].repeat_count == 2
+    assert warnings[0].path == "/items"
+    assert "WHERE id = ?" in warnings[0].statement
+
+
+def test_n_plus_one_detection_can_be_disabled(monkeypatch, caplog):
+    monkeypatch.setattr(settings, "SQL_N_PLUS_ONE_THRESHOLD", 0)
+    stats = QueryStats()
+    for _ in range(10):
+        stats.record("SELECT 1", 0.1)
+
+    with caplog.at_level(logging.WARNING, logger="app.db.query_stats"):
+        finish_request_stats(stats, "GET", "/items")
+
+    assert caplog.records == []
+
+
+def test_slow_query_log_redacts_parameters(engine, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "SQL_SLOW_QUERY_MS", 0)
+
+    with caplog.at_level(logging.WARNING, logger="app.db.query_stats"):
+        with engine.connect() as conn:
+            conn.execute(
+                text("SELECT id FROM items WHERE name = :name"),
+                {"name": "secret@example.com"},
+            )
+
+    slow = [r for r in caplog.records if r.getMessage() == "Slow query"]
+    assert len(slow) == 1
+    assert "secret@example.com" not in str(slow[0].parameters)
+    assert slow[0].parameters == ["str"]
+
+
+def test_redact_keeps_only_types():
+    assert _redact({"email": "a@example.com", "id": 1}) == {"email": "str", "id": "int"}
+    assert _redact(("a@example.com", 1)) == ["str", "int"]
+    assert _redact([("a", 1), ("b", 2)]) == "<2 parameter sets>"
+
+
+def test_track_queries_counts_only_inside_block(engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            conn.execute(text("SELECT 2"))
+            conn.execute(text("SELECT 2"))
+        conn.execute(text("SELECT 3"))
+
+    assert stats.count == 2
+    assert stats.repeated(2) == [("SELECT 2", 2)]
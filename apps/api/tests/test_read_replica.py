@@ -0,0 +1,121 @@
+"""読み取りレプリカへの振り分け（get_read_db）のテスト"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.core.deps import get_read_db
+from app.db import session as session_module
+from app.db.session import (
+    clear_recent_writes,
+    mark_user_write,
+    open_replica_session,
+    set_session_user,
+    write_bind,
+)
+from models.database.models import Base, User
+
+USER_ID = "user-1"
+
+
+def _engine():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture(autouse=True)
+def _fresh_recent_writes():
+    clear_recent_writes()
+    yield
+    clear_recent_writes()
+
+
+@pytest.fixture()
+def primary():
+    db = sessionmaker(bind=_engine())()
+    db.add(User(id=USER_ID, sub="sub-1", name="User", email="u@example.com"))
+    db.commit()
+    yield db
+    db.close()
+
+
+@pytest.fixture()
+def replica_engine(monkeypatch):
+    engine = _engine()
+    monkeypatch.setattr(
+        session_module, "ReplicaSessionLocal", sessionmaker(bind=engine)
+    )
+    return engine
+
+
+def _read_db(user, db):
+    dependency = get_read_db(current_user=user, db=db)
+    return dependency, next(dependency)
+
+
+def test_without_replica_reads_from_primary(primary):
+    user = primary.get(User, USER_ID)
+
+    _dependency, db = _read_db(user, primary)
+
+    assert db is primary
+
+
+def test_routes_reads_to_replica_and_releases_primary(primary, replica_engine):
+    user = primary.get(User, USER_ID)
+
+    dependency, db = _read_db(user, primary)
+
+    assert db is not primary
+    assert db.get_bind() is replica_engine
+    # 読み込み済みのユーザー属性はプライマリを閉じた後も使える
+    assert user.name == "User"
+    # レプリカで読んだデータの書き戻し先はプライマリ
+    assert write_bind(db) is session_module.engine
+    assert write_bind(primary) is primary.get_bind()
+    dependency.close()
+
+
+def test_recent_writer_reads_from_primary(primary, replica_engine):
+    user = primary.get(User, USER_ID)
+    set_session_user(primary, USER_ID)
+    user.name = "Renamed"
+    primary.commit()
+
+    _dependency, db = _read_db(user, primary)
+
+    assert db is primary
+
+
+def test_read_only_commit_does_not_pin_to_primary(primary, replica_engine):
+    set_session_user(primary, USER_ID)
+    primary.get(User, USER_ID)
+    primary.commit()
+
+    assert open_replica_session(USER_ID) is not None
+
+
+def test_write_window_expires(replica_engine, monkeypatch):
+    monkeypatch.setattr(settings, "READ_YOUR_WRITES_SECONDS", 0)
+    mark_user_write(USER_ID)
+
+    assert open_replica_session(USER_ID) is not None
+
+
+def test_unreachable_replica_falls_back_to_primary(primary, monkeypatch):
+    broken = create_engine("sqlite+pysqlite:////nonexistent-dir/replica.db")
+    monkeypatch.setattr(
+        session_module, "ReplicaSessionLocal", sessionmaker(bind=broken)
+    )
+    user = primary.get(User, USER_ID)
+
+    _dependency, db = _read_db(user, primary)
+
+    assert db is primary
@@ -54,14 +54,35 @@ def review_item(db_session, user):
     return item
 
 
+def _make_due(db_session, item):
+    """次回の復習日が来たことにする"""
+    item.due_at = datetime.utcnow() - timedelta(seconds=1)
+    db_session.commit()
+
+
 class TestEvaluateAndUpdate:
     """evaluate_and_update の完了判定テスト"""
 
-    def test_both_100_marks_completed(self, db_session, user, review_item):
-        """Speaking 100 + Listening 100 → 完了"""
+    def test_both_100_marks_completed_once_mastered(self, db_session, user, review_item):
+        """Speaking 100 + Listening 100 を間隔が十分に伸びるまで続けると完了"""
         service = ReviewService(db_session)
+        # 1 → 6 → 16 日の間は再出題される
+        for _ in range(3):
+            _make_due(db_session, review_item)
+            item, is_completed, next_due = service.evaluate_and_update(
+                user_id=user.id,
+                item_id=review_item.id,
+                question_type="listening",
+                score=100,
+                is_correct=True,
+                speaking_score=100,
+            )
+            assert is_completed is False
+            assert item.completed_at is None
+            assert next_due == item.due_at
 
         # Speaking 評価（DB 変更なし）
+        _make_due(db_session, review_item)
         item, is_completed, next_due = service.evaluate_and_update(
             user_id=user.id,
             item_id=review_item.id,
@@ -72,7 +93,7 @@ class TestEvaluateAndUpdate:
         assert not is_completed
         assert item.is_completed is False
 
-        # Listening 評価（両方 100 → 完了）
+        # Listening 評価（両方 100 で間隔 45 日 → 完了）
         item, is_completed, next_due = service.evaluate_and_update(
             user_id=user.id,
             item_id=review_item.id,
@@ -86,6 +107,33 @@ class TestEvaluateAndUpdate:
         assert item.completed_at is not None
         assert next_due is None
 
+    def test_item_not_yet_due_is_rejected(self, db_session, user, review_item):
+        """次回の復習日前の回答は受け付けず、スケジュールを変えない"""
+        service = ReviewService(db_session)
+        service.evaluate_and_update(
+            user_id=user.id,
+            item_id=review_item.id,
+            question_type="listening",
+            score=100,
+            is_correct=True,
+            speaking_score=100,
+        )
+        db_session.refresh(review_item)
+        scheduled = (review_item.due_at, review_item.repetitions)
+
+        for question_type in ("speaking", "listening"):
+            with pytest.raises(ValueError, match="not due"):
+                service.evaluate_and_update(
+                    user_id=user.id,
+                    item_id=review_item.id,
+                    question_type=question_type,
+                    score=100,
+                    is_correct=True,
+                    speaking_score=100,
+                )
+        db_session.refresh(review_item)
+        assert (review_item.due_at, review_item.repetitions) == scheduled
+
     def test_speaking_100_listening_partial_reschedules(
         self, db_session, user, review_item
     ):
@@ -176,14 +224,13 @@ class TestEvaluateAndUpdate:
 
 
 class TestGetDueItemsSortOrder:
-    """get_due_items のソート順テスト: 未完了優先 + created_at DESC"""
+    """get_due_items のソート順テスト: 未完了のみ + due_at ASC"""
 
-    def test_incomplete_items_come_first(self, db_session, user):
-        """未完了アイテムが完了アイテムより先に表示される"""
+    def test_completed_items_are_excluded(self, db_session, user):
+        """完了アイテムはキューに含まれない"""
         service = ReviewService(db_session)
         now = datetime.utcnow()
 
-        # 完了アイテム（古い）
         completed = ReviewItem(
             user_id=user.id,
             phrase="completed phrase",
@@ -193,7 +240,6 @@ class TestGetDueItemsSortOrder:
             completed_at=now - timedelta(days=1),
             created_at=now - timedelta(days=3),
         )
-        # 未完了アイテム（新しい）
         incomplete = ReviewItem(
             user_id=user.id,
             phrase="incomplete phrase",
@@ -205,36 +251,42 @@ class TestGetDueItemsSortOrder:
         db_session.add_all([completed, incomplete])
         db_session.commit()
 
-        items = service.get_due_items(user.id)
-        assert len(items) == 2
-        assert items[0].is_completed is False
-        assert items[1].is_completed is True
+        items, next_cursor = service.get_due_items(user.id)
+        assert [item.phrase for item in items] == ["incomplete phrase"]
+        assert next_cursor is None
 
-    def test_same_status_sorted_by_created_at_desc(self, db_session, user):
-        """同じステータス内では created_at の降順"""
+    def test_sorted_by_due_at_asc(self, db_session, user):
+        """復習期限の早い順（作成日時には依存しない）。期限前のアイテムは含めない"""
         service = ReviewService(db_session)
         now = datetime.utcnow()
 
-        older = ReviewItem(
+        later = ReviewItem(
             user_id=user.id,
-            phrase="older",
-            explanation="older item",
-            due_at=now,
+            phrase="later",
+            explanation="due later",
+            due_at=now - timedelta(minutes=1),
             is_completed=False,
             created_at=now - timedelta(days=5),
         )
-        newer = ReviewItem(
+        upcoming = ReviewItem(
             user_id=user.id,
-            phrase="newer",
-            explanation="newer item",
-            due_at=now,
+            phrase="upcoming",
+            explanation="not due yet",
+            due_at=now + timedelta(days=3),
+            is_completed=False,
+            created_at=now - timedelta(days=6),
+        )
+        sooner = ReviewItem(
+            user_id=user.id,
+            phrase="sooner",
+            explanation="due sooner",
+            due_at=now - timedelta(hours=1),
             is_completed=False,
             created_at=now - timedelta(days=1),
         )
-        db_session.add_all([older, newer])
+        db_session.add_all([later, sooner, upcoming])
         db_session.commit()
 
-        items = service.get_due_items(user.id)
-        assert len(items) == 2
-        assert items[0].phrase == "newer"
-        assert items[1].phrase == "older"
+        items, _ = service.get_due_items(user.id)
+        assert [item.phrase for item in items] == ["sooner", "later"]
+        assert service.count_due_items(user.id) == 2
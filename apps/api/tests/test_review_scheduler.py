@@ -0,0 +1,206 @@
+"""復習スケジューリング（SM-2）と復習キューのキーセットページネーションのテスト"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.deps import get_db, require_pro_user
+from app.db.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.routers.reviews import router as reviews_router
+from app.services.review.review_service import ReviewService
+from app.services.review.speech_scoring import PASSING_SCORE
+from app.services.review.scheduler import (
+    DEFAULT_EASE_FACTOR,
+    MASTERY_INTERVAL_DAYS,
+    MIN_EASE_FACTOR,
+    PASSING_QUALITY,
+    quality_from_score,
+    schedule_next,
+)
+from models.database.models import Base, ReviewItem, User
+
+USER_ID = "user-1"
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+@pytest.fixture()
+def db_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(User(id=USER_ID, sub="sub-1", name="User", email="u@example.com"))
+    session.commit()
+    yield session
+    session.close()
+
+
+def _item(db, phrase, due_at, **kwargs):
+    item = ReviewItem(
+        user_id=USER_ID, phrase=phrase, explanation="-", due_at=due_at, **kwargs
+    )
+    db.add(item)
+    db.commit()
+    return item
+
+
+def _make_due(db, item):
+    """次回の復習日が来たことにする"""
+    item.due_at = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+
+
+def test_passing_reviews_grow_interval():
+    intervals = []
+    ease, interval, reps = DEFAULT_EASE_FACTOR, 0, 0
+    for _ in range(4):
+        schedule = schedule_next(5, ease, interval, reps, NOW)
+        ease, interval, reps = (
+            schedule.ease_factor,
+            schedule.interval_days,
+            schedule.repetitions,
+        )
+        intervals.append(interval)
+
+    assert intervals == [1, 6, 16, 45]
+    assert reps == 4
+    assert schedule.due_at == NOW + timedelta(days=45)
+
+
+def test_failed_review_resets_repetitions_and_lowers_ease():
+    schedule = schedule_next(1, 2.5, 16, 3, NOW)
+
+    assert schedule.repetitions == 0
+    assert schedule.interval_days == 1
+    assert schedule.ease_factor < 2.5
+    assert schedule.due_at == NOW + timedelta(days=1)
+
+
+def test_ease_factor_has_floor():
+    ease = DEFAULT_EASE_FACTOR
+    for _ in range(10):
+        ease = schedule_next(0, ease, 1, 0, NOW).ease_factor
+
+    assert ease == MIN_EASE_FACTOR
+
+
+def test_quality_from_score():
+    assert quality_from_score(None) == 0
+    assert quality_from_score(0) == 0
+    assert quality_from_score(49) == 1
+    assert quality_from_score(50) == 2
+    assert quality_from_score(60) == 2
+    assert quality_from_score(99) == 4
+    assert quality_from_score(100) == 5
+
+
+def test_quality_passes_exactly_at_passing_score():
+    assert quality_from_score(PASSING_SCORE - 1) < PASSING_QUALITY
+    assert quality_from_score(PASSING_SCORE) == PASSING_QUALITY
+    assert all(
+        (quality_from_score(score) >= PASSING_QUALITY) == (score >= PASSING_SCORE)
+        for score in range(0, 101)
+    )
+
+
+def test_complete_review_item_updates_schedule(db_session):
+    item = _item(db_session, "p", NOW)
+    service = ReviewService(db_session)
+
+    service.complete_review_item(USER_ID, item.id, "incorrect")
+    db_session.refresh(item)
+    assert item.repetitions == 0
+    assert item.interval_days == 1
+    assert item.ease_factor < DEFAULT_EASE_FACTOR
+
+    _make_due(db_session, item)
+    service.complete_review_item(USER_ID, item.id, "correct")
+    db_session.refresh(item)
+    assert item.is_completed is False
+    assert item.repetitions == 1
+
+
+def test_correct_reviews_stay_queued_until_mastered(db_session):
+    item = _item(db_session, "p", NOW)
+    service = ReviewService(db_session)
+
+    intervals = []
+    while not item.is_completed:
+        _make_due(db_session, item)
+        service.complete_review_item(USER_ID, item.id, "correct")
+        db_session.refresh(item)
+        intervals.append(item.interval_days)
+
+    assert intervals == [1, 6, 16, 45]
+    assert intervals[-2] < MASTERY_INTERVAL_DAYS <= intervals[-1]
+    assert item.completed_at is not None
+
+    # 不正解なら再びキューに戻る
+    _make_due(db_session, item)
+    service.complete_review_item(USER_ID, item.id, "incorrect")
+    db_session.refresh(item)
+    assert item.is_completed is False
+    assert item.completed_at is None
+
+
+def test_passed_item_leaves_next_queue_until_due(db_session):
+    item = _item(db_session, "p", NOW)
+    app = FastAPI()
+    app.include_router(reviews_router, prefix="/reviews")
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[require_pro_user] = lambda: db_session.get(User, USER_ID)
+
+    with TestClient(app) as client:
+        assert [r["id"] for r in client.get("/reviews/next").json()["review_items"]] == [
+            item.id
+        ]
+        assert client.post(
+            f"/reviews/{item.id}/complete", json={"result": "correct"}
+        ).status_code == 200
+
+        # 次回の復習日（1日後）までは出題せず、回答も受け付けない
+        body = client.get("/reviews/next").json()
+        assert body == {"review_items": [], "total_count": 0, "next_cursor": None}
+        assert client.post(
+            f"/reviews/{item.id}/complete", json={"result": "correct"}
+        ).status_code == 400
+
+        _make_due(db_session, item)
+        body = client.get("/reviews/next").json()
+        assert [r["id"] for r in body["review_items"]] == [item.id]
+        assert body["total_count"] == 1
+
+
+def test_due_queue_pages_through_tied_due_at(db_session):
+    due = NOW - timedelta(hours=1)
+    for i in range(5):
+        _item(db_session, f"tied-{i}", due)
+    _item(db_session, "earliest", due - timedelta(days=1))
+    _item(db_session, "done", due - timedelta(days=2), is_completed=True)
+    service = ReviewService(db_session)
+
+    phrases, cursor = [], None
+    while True:
+        items, cursor = service.get_due_items(USER_ID, limit=2, cursor=cursor)
+        phrases.extend(item.phrase for item in items)
+        if cursor is None:
+            break
+
+    assert phrases == ["earliest"] + [f"tied-{i}" for i in range(5)]
+
+
+def test_invalid_cursor_is_rejected(db_session):
+    with pytest.raises(InvalidCursorError):
+        ReviewService(db_session).get_due_items(USER_ID, cursor="not-a-cursor")
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(NOW, 42)) == (NOW, 42)
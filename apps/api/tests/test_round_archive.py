@@ -0,0 +1,138 @@
+"""終了済みセッションのラウンドのアーカイブと復元のテスト"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.services.conversation.round_archive import SessionArchiveService
+from app.services.conversation.session_service import SessionService
+from models.database.models import (
+    Base,
+    DifficultyLevel,
+    Scenario,
+    ScenarioCategory,
+    Session as SessionModel,
+    SessionMode,
+    SessionRound,
+    SessionRoundArchive,
+    User,
+)
+
+USER_ID = "user-1"
+NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture()
+def db_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    db.add(User(id=USER_ID, sub="sub-1", name="User", email="u@example.com"))
+    db.add(
+        Scenario(
+            id=1,
+            name="Airport Check-in",
+            description="test",
+            category=ScenarioCategory.TRAVEL,
+            difficulty=DifficultyLevel.BEGINNER,
+            is_active=True,
+        )
+    )
+    db.commit()
+    yield db
+    db.close()
+
+
+def _session(db, ended_days_ago, round_count=4):
+    session = SessionModel(
+        user_id=USER_ID,
+        scenario_id=1,
+        round_target=6,
+        completed_rounds=round_count,
+        difficulty=DifficultyLevel.BEGINNER,
+        mode=SessionMode.STANDARD,
+        ended_at=None if ended_days_ago is None else NOW - timedelta(days=ended_days_ago),
+    )
+    db.add(session)
+    db.flush()
+    for i in range(1, round_count + 1):
+        db.add(
+            SessionRound(
+                session_id=session.id,
+                round_index=i,
+                user_input=f"こんにちは input-{i}",
+                ai_reply=f"reply-{i}",
+                feedback_short=f"feedback-{i}",
+                improved_sentence=f"improved-{i}",
+                tags=["conversation", f"round_{i}"],
+                score_grammar=80 + i,
+                created_at=NOW - timedelta(days=60, minutes=-i),
+            )
+        )
+    db.commit()
+    return session.id
+
+
+def test_archives_only_sessions_ended_before_cutoff(db_session):
+    old = _session(db_session, ended_days_ago=45)
+    recent = _session(db_session, ended_days_ago=5)
+    active = _session(db_session, ended_days_ago=None)
+
+    archived = SessionArchiveService(db_session).archive_ended_sessions(
+        older_than_days=30, now=NOW
+    )
+
+    assert archived == 1
+    remaining = {
+        session_id for (session_id,) in db_session.query(SessionRound.session_id).distinct()
+    }
+    assert remaining == {recent, active}
+    archive = db_session.get(SessionRoundArchive, old)
+    assert archive.round_count == 4
+
+
+def test_archived_rounds_are_rehydrated(db_session):
+    session_id = _session(db_session, ended_days_ago=45)
+    before = [
+        (r.round_index, r.user_input, r.tags, r.score_grammar, r.created_at)
+        for r in SessionArchiveService(db_session).load_rounds(session_id)
+    ]
+
+    SessionArchiveService(db_session).archive_ended_sessions(older_than_days=30, now=NOW)
+    db_session.expire_all()
+    rounds = SessionArchiveService(db_session).load_rounds(session_id)
+
+    assert [
+        (r.round_index, r.user_input, r.tags, r.score_grammar, r.created_at) for r in rounds
+    ] == before
+    # 復元したラウンドはDBセッションに追加されない
+    assert all(r not in db_session for r in rounds)
+    db_session.commit()
+    assert db_session.query(SessionRound).count() == 0
+
+
+def test_archive_runs_in_batches_and_is_idempotent(db_session):
+    for _ in range(5):
+        _session(db_session, ended_days_ago=40, round_count=2)
+    service = SessionArchiveService(db_session)
+
+    assert service.archive_ended_sessions(older_than_days=30, batch_size=2, now=NOW) == 5
+    assert service.archive_ended_sessions(older_than_days=30, batch_size=2, now=NOW) == 0
+    assert db_session.query(SessionRoundArchive).count() == 5
+
+
+def test_summary_fallback_reads_archived_rounds(db_session):
+    session_id = _session(db_session, ended_days_ago=45)
+    SessionArchiveService(db_session).archive_ended_sessions(older_than_days=30, now=NOW)
+
+    phrases = SessionService(db_session)._extract_top_phrases_fallback(session_id)
+
+    assert [p["round_index"] for p in phrases] == [4, 3, 2]
+    assert phrases[0]["phrase"] == "improved-4"
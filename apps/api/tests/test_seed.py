@@ -0,0 +1,111 @@
+"""シードデータ投入（apply_seed）のテスト"""
+
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.seed import SEED_PATH, apply_seed
+from models.database.models import (
+    Base,
+    DifficultyLevel,
+    Scenario,
+    SeedState,
+    ShadowingSentence,
+)
+
+
+@pytest.fixture()
+def db_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield db
+    db.close()
+
+
+@pytest.fixture()
+def seed_data():
+    return json.loads(SEED_PATH.read_text(encoding="utf-8"))
+
+
+def _write(tmp_path, data):
+    path = tmp_path / "seed_content.json"
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def test_initial_seed_inserts_everything_in_few_statements(db_session, seed_data, max_queries):
+    # 状態の読み込み + 既存行の読み込み2回 + INSERT 2回 + 状態の UPSERT
+    with max_queries(6):
+        result = apply_seed(db_session)
+
+    assert not result.skipped
+    scenario_count = len(seed_data["scenarios"]["rows"])
+    sentence_count = len(seed_data["shadowing_sentences"]["rows"])
+    assert result.inserted == {
+        "scenarios": scenario_count,
+        "shadowing_sentences": sentence_count,
+    }
+    assert db_session.query(Scenario).count() == scenario_count
+    assert db_session.query(ShadowingSentence).count() == sentence_count
+    airport = db_session.get(Scenario, 1)
+    assert airport.name == "Airport Check-in" and airport.is_active is True
+    assert db_session.get(SeedState, "content").content_hash == result.content_hash
+
+
+def test_unchanged_seed_is_skipped_with_one_query(db_session, max_queries):
+    apply_seed(db_session)
+
+    with max_queries(1):
+        result = apply_seed(db_session)
+
+    assert result.skipped
+
+
+def test_changed_seed_applies_only_the_diff(db_session, seed_data, tmp_path):
+    apply_seed(db_session)
+    sentence = db_session.query(ShadowingSentence).filter_by(scenario_id=1, order_index=1).one()
+    sentence_id = sentence.id
+
+    seed_data["shadowing_sentences"]["rows"][0][3] = "I'm about to board the flight to Boston."
+    seed_data["scenarios"]["rows"].append([62, "New Scenario", "daily", "beginner", "New."])
+    seed_data["shadowing_sentences"]["rows"].append(
+        [62, 1, "new phrase", "A new phrase.", "新しいフレーズ。", "beginner"]
+    )
+    # 存在しないシナリオの文は入れない
+    seed_data["shadowing_sentences"]["rows"].append(
+        [999, 1, "orphan", "Orphan.", "孤立。", "beginner"]
+    )
+    result = apply_seed(db_session, path=_write(tmp_path, seed_data))
+
+    assert result.inserted == {"scenarios": 1, "shadowing_sentences": 1}
+    assert result.updated == {"scenarios": 0, "shadowing_sentences": 1}
+    db_session.expire_all()
+    updated = db_session.get(ShadowingSentence, sentence_id)
+    assert updated.sentence_en == "I'm about to board the flight to Boston."
+    assert updated.difficulty == DifficultyLevel.BEGINNER
+    assert db_session.query(ShadowingSentence).filter_by(scenario_id=999).count() == 0
+
+
+def test_force_repairs_drift_without_touching_operational_columns(db_session):
+    apply_seed(db_session)
+    scenario = db_session.get(Scenario, 2)
+    scenario.name = "Edited by hand"
+    scenario.is_active = False
+    db_session.commit()
+
+    assert apply_seed(db_session).skipped
+    result = apply_seed(db_session, force=True)
+
+    assert result.updated["scenarios"] == 1
+    db_session.expire_all()
+    scenario = db_session.get(Scenario, 2)
+    assert scenario.name == "Hotel Reservation"
+    assert scenario.is_active is False
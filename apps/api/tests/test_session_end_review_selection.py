@@ -1,7 +1,8 @@
+import threading
 from datetime import datetime, timedelta, timezone
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -219,3 +220,43 @@ async def test_end_session_falls_back_when_ai_selection_fails(db_session, monkey
         .all()
     )
     assert len(stored) == 3
+
+
+@pytest.mark.asyncio
+async def test_end_session_runs_queries_off_event_loop(db_session, monkeypatch):
+    user, session = _seed_session_data(db_session, round_count=5)
+    session_id, user_id = session.id, user.id
+    db_session.expire_all()
+
+    async def fake_selector(_history):
+        return None
+
+    monkeypatch.setattr(
+        "app.services.conversation.session_service.select_top_review_phrases",
+        fake_selector,
+    )
+    monkeypatch.setattr(
+        "app.services.conversation.session_service.evaluate_goal_progress",
+        lambda goals, history: _async_value([1] * len(goals)),
+    )
+
+    loop_thread = threading.get_ident()
+    query_threads = []
+
+    def _record(*_args):
+        query_threads.append(threading.get_ident())
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        result = await SessionService(db_session).end_session(session_id, user_id)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert result.scenario_name == "Airport Check-in"
+    assert query_threads
+    assert loop_thread not in query_threads
+
+
+async def _async_value(value):
+    return value
@@ -10,14 +10,17 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from app.core.config import settings
 from app.routers.shadowing import router as shadowing_router
 from app.core.deps import get_db, get_current_user
+from app.services.content import get_catalog
 from models.database.models import (
     Base,
     User,
     Scenario,
     ShadowingSentence,
     UserShadowingProgress,
+    UserInstantTranslationProgress,
     ScenarioCategory,
     DifficultyLevel,
 )
@@ -389,6 +392,37 @@ class TestGetShadowingProgress:
         assert recent["completed_sentences"] == 1
         assert recent["progress_percent"] == 33  # 1/3 = 33%
 
+    def test_get_progress_query_count_does_not_grow_with_practice(
+        self,
+        client,
+        db_session,
+        test_user,
+        test_scenario,
+        test_shadowing_sentences,
+        max_queries,
+    ):
+        """練習した文・シナリオが増えても発行するSQLは進捗の1クエリのみ"""
+        get_catalog(db_session)
+        for sentence in test_shadowing_sentences:
+            db_session.add(
+                UserShadowingProgress(
+                    user_id=test_user.id,
+                    shadowing_sentence_id=sentence.id,
+                    attempt_count=1,
+                    best_score=90,
+                    is_completed=True,
+                    last_practiced_at=datetime.utcnow(),
+                )
+            )
+        db_session.commit()
+        db_session.refresh(test_user)
+
+        with max_queries(1):
+            res = client.get("/api/v1/shadowing/progress")
+
+        assert res.status_code == 200
+        assert res.json()["completed_sentences"] == 3
+
 
 class TestGetAllScenariosWithProgress:
     """GET /shadowing/scenarios のテスト"""
@@ -458,6 +492,75 @@ class TestGetAllScenariosWithProgress:
         assert data[0]["progress_percent"] == 33
         assert data[0]["last_practiced_at"] is not None
 
+    def test_scenarios_progress_is_one_grouped_query(
+        self,
+        client,
+        db_session,
+        test_user,
+        test_scenario,
+        test_shadowing_sentences,
+        max_queries,
+    ):
+        """シナリオが増えても進捗はシナリオ単位の集計1クエリで取得する"""
+        for scenario_id in (2, 3):
+            db_session.add(
+                Scenario(
+                    id=scenario_id,
+                    name=f"シナリオ{scenario_id}",
+                    description="test",
+                    category=ScenarioCategory.TRAVEL.value,
+                    difficulty=DifficultyLevel.BEGINNER.value,
+                    is_active=True,
+                )
+            )
+            for i in range(2):
+                db_session.add(
+                    ShadowingSentence(
+                        id=scenario_id * 10 + i,
+                        scenario_id=scenario_id,
+                        key_phrase="test",
+                        sentence_en=f"Sentence {i}.",
+                        sentence_ja=f"文{i}",
+                        order_index=i,
+                        difficulty=DifficultyLevel.BEGINNER.value,
+                    )
+                )
+        db_session.flush()
+        rows = [(1, 90, datetime(2024, 1, 1)), (20, 90, datetime(2024, 2, 1)), (21, 50, None)]
+        for sentence_id, score, practiced_at in rows:
+            db_session.add(
+                UserShadowingProgress(
+                    user_id=test_user.id,
+                    shadowing_sentence_id=sentence_id,
+                    attempt_count=1,
+                    best_score=score,
+                    is_completed=score >= 80,
+                    last_practiced_at=practiced_at,
+                )
+            )
+        db_session.commit()
+        db_session.refresh(test_user)
+        get_catalog(db_session)
+
+        with max_queries(1):
+            res = client.get("/api/v1/shadowing/scenarios")
+
+        assert res.status_code == 200
+        by_id = {s["scenario_id"]: s for s in res.json()}
+        assert by_id[1]["completed_sentences"] == 1
+        assert by_id[1]["progress_percent"] == 33
+        assert by_id[2]["completed_sentences"] == 1
+        assert by_id[2]["progress_percent"] == 50
+        assert by_id[2]["last_practiced_at"].startswith("2024-02-01")
+        assert by_id[3]["completed_sentences"] == 0
+        assert by_id[3]["last_practiced_at"] is None
+
+        progress = client.get("/api/v1/shadowing/progress").json()
+        assert progress["practiced_scenarios"] == 2
+        assert progress["completed_sentences"] == 2
+        assert progress["today_practice_count"] == 0
+        assert [s["scenario_id"] for s in progress["recent_scenarios"]] == [2, 1]
+
 
 class TestEvaluateShadowingSpeech:
     """POST /shadowing/{sentence_id}/speak のテスト"""
@@ -550,3 +653,173 @@ class TestEvaluateShadowingSpeech:
         )
 
         assert res.status_code == 422
+
+
+class TestRecordAttemptsBatch:
+    """POST /shadowing/scenarios/{scenario_id}/attempts のテスト"""
+
+    def test_batch_scores_and_upserts_both_modes(
+        self, client, db_session, test_user, test_shadowing_sentences
+    ):
+        """発話・自己採点・瞬間英作をまとめて記録できる"""
+        first, second, _ = test_shadowing_sentences
+        db_session.add(
+            UserShadowingProgress(
+                user_id=test_user.id,
+                shadowing_sentence_id=first.id,
+                attempt_count=2,
+                best_score=70,
+                is_completed=False,
+            )
+        )
+        db_session.commit()
+
+        res = client.post(
+            f"/api/v1/shadowing/scenarios/{first.scenario_id}/attempts",
+            json={
+                "attempts": [
+                    {"shadowing_sentence_id": first.id, "user_transcription": "I'm about to board"},
+                    {"shadowing_sentence_id": first.id, "user_transcription": first.sentence_en},
+                    {"shadowing_sentence_id": second.id, "score": 60},
+                    {
+                        "shadowing_sentence_id": second.id,
+                        "mode": "instant_translation",
+                        "user_transcription": second.sentence_en,
+                    },
+                ]
+            },
+        )
+
+        assert res.status_code == 200
+        results = res.json()["results"]
+        assert [r["attempt_count"] for r in results] == [3, 4, 1, 1]
+        assert [r["is_new_best"] for r in results] == [False, True, True, True]
+        assert results[1]["best_score"] == 100
+        assert results[1]["is_completed"] is True
+        assert results[2]["matching_words"] == []
+        assert len(results[3]["matching_words"]) > 0
+
+        db_session.expire_all()
+        progress = {
+            p.shadowing_sentence_id: p
+            for p in db_session.query(UserShadowingProgress).all()
+        }
+        assert progress[first.id].attempt_count == 4
+        assert progress[first.id].best_score == 100
+        assert progress[first.id].is_completed is True
+        assert progress[second.id].best_score == 60
+        assert progress[second.id].is_completed is False
+        it_progress = db_session.query(UserInstantTranslationProgress).one()
+        assert (it_progress.shadowing_sentence_id, it_progress.best_score) == (second.id, 100)
+
+    def test_batch_keeps_existing_best_and_completion(
+        self, client, db_session, test_user, test_shadowing_sentences
+    ):
+        """低いスコアで既存のベスト・完了状態を上書きしない"""
+        sentence = test_shadowing_sentences[0]
+        db_session.add(
+            UserShadowingProgress(
+                user_id=test_user.id,
+                shadowing_sentence_id=sentence.id,
+                attempt_count=5,
+                best_score=95,
+                is_completed=True,
+                last_practiced_at=datetime(2030, 1, 1),
+            )
+        )
+        db_session.commit()
+
+        res = client.post(
+            f"/api/v1/shadowing/scenarios/{sentence.scenario_id}/attempts",
+            json={
+                "attempts": [
+                    {
+                        "shadowing_sentence_id": sentence.id,
+                        "score": 40,
+                        "practiced_at": "2024-05-01T09:00:00+09:00",
+                    }
+                ]
+            },
+        )
+
+        assert res.status_code == 200
+        db_session.expire_all()
+        progress = db_session.query(UserShadowingProgress).one()
+        assert progress.attempt_count == 6
+        assert progress.best_score == 95
+        assert progress.is_completed is True
+        assert progress.last_practiced_at.replace(tzinfo=None) == datetime(2030, 1, 1)
+
+    def test_batch_uses_constant_number_of_statements(
+        self, client, db_session, test_user, test_shadowing_sentences
+    ):
+        """文数に関係なく発行するSQL文数は一定"""
+        from sqlalchemy import event
+
+        db_session.refresh(test_user)
+        get_catalog(db_session)
+        url = f"/api/v1/shadowing/scenarios/{test_shadowing_sentences[0].scenario_id}/attempts"
+        payload = {
+            "attempts": [
+                {"shadowing_sentence_id": s.id, "user_transcription": s.sentence_en}
+                for s in test_shadowing_sentences
+            ]
+        }
+        statements = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            res = client.post(url, json=payload)
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+
+        assert res.status_code == 200
+        # 文の確認はカタログで行うため、既存進捗の読み込み + 進捗の UPSERT
+        # + 完了数カウンタ（user_stats）の UPSERT のみ
+        assert len(statements) == 3
+
+    def test_batch_rejects_sentence_from_other_scenario(
+        self, client, test_shadowing_sentences
+    ):
+        """シナリオに属さない文が含まれる場合は何も記録せず404"""
+        res = client.post(
+            "/api/v1/shadowing/scenarios/999/attempts",
+            json={"attempts": [{"shadowing_sentence_id": 1, "score": 90}]},
+        )
+
+        assert res.status_code == 404
+
+    def test_batch_scoring_misconfiguration_is_server_error(
+        self, client, test_shadowing_sentences, monkeypatch
+    ):
+        """採点モードの設定不正は404ではなく500"""
+        monkeypatch.setattr(settings, "SPEECH_SCORING_MODE", "unknown")
+        sentence = test_shadowing_sentences[0]
+        with TestClient(client.app, raise_server_exceptions=False) as server_error_client:
+            res = server_error_client.post(
+                f"/api/v1/shadowing/scenarios/{sentence.scenario_id}/attempts",
+                json={
+                    "attempts": [
+                        {"shadowing_sentence_id": sentence.id, "user_transcription": "hi"}
+                    ]
+                },
+            )
+
+        assert res.status_code == 500
+
+    def test_batch_requires_transcription_or_score(self, client, test_shadowing_sentences):
+        """発話認識結果とスコアはどちらか一方のみ指定する"""
+        res = client.post(
+            "/api/v1/shadowing/scenarios/1/attempts",
+            json={
+                "attempts": [
+                    {"shadowing_sentence_id": 1, "score": 90, "user_transcription": "hi"}
+                ]
+            },
+        )
+
+        assert res.status_code == 422
@@ -0,0 +1,216 @@
+"""スピーキング採点エンジンのテスト"""
+
+import pytest
+
+from app.core.config import settings
+from app.services.review.review_service import ReviewService
+from app.services.review.phonetic_index import (
+    PhoneticIndex,
+    phonetic_index,
+    phonetic_key,
+    words_sound_alike,
+    within_edit_distance,
+)
+from app.services.review.speech_scoring import (
+    align_tokens,
+    score_speech,
+    score_speech_batch,
+)
+
+
+class TestBagMode:
+    """語順を問わない単語一致率"""
+
+    def test_perfect_match_ignores_case_and_punctuation(self):
+        result = score_speech("I'd like to check in, please.", "id LIKE to check in please")
+
+        assert result.score == 100
+        assert result.is_correct is True
+        assert [m.word for m in result.matching_words] == [
+            "id", "like", "to", "check", "in", "please",
+        ]
+
+    def test_duplicate_words_are_counted_once_each(self):
+        result = score_speech("the cat and the dog", "the cat and dog")
+
+        assert [m.matched for m in result.matching_words] == [True, True, True, False, True]
+        assert result.score == 80
+
+    def test_word_order_is_ignored(self):
+        assert score_speech("one two three", "three two one").score == 100
+
+    def test_empty_target_scores_zero(self):
+        result = score_speech("?!", "hello")
+
+        assert result.score == 0
+        assert result.is_correct is False
+
+    def test_result_objects_use_slots(self):
+        result = score_speech("hello world", "hello")
+
+        with pytest.raises(AttributeError):
+            result.unexpected = True
+        with pytest.raises(AttributeError):
+            result.matching_words[0].unexpected = True
+
+
+class TestAlignmentMode:
+    """編集距離アラインメント（1 - WER）"""
+
+    def test_reports_substitution_deletion_and_insertion(self):
+        result = score_speech(
+            "I would like a window seat",
+            "I like an window seat please",
+            mode="alignment",
+        )
+
+        ops = [(op.op, op.target_word, op.spoken_word) for op in result.alignment]
+        assert ops == [
+            ("match", "i", "i"),
+            ("delete", "would", None),
+            ("match", "like", "like"),
+            ("substitute", "a", "an"),
+            ("match", "window", "window"),
+            ("match", "seat", "seat"),
+            ("insert", None, "please"),
+        ]
+        assert (result.insertions, result.deletions, result.substitutions) == (1, 1, 1)
+        assert result.score == 50
+        assert [m.matched for m in result.matching_words] == [
+            True, False, True, False, True, True,
+        ]
+
+    def test_word_order_errors_are_penalised(self):
+        bag = score_speech("one two three four", "four three two one")
+        aligned = score_speech("one two three four", "four three two one", mode="alignment")
+
+        assert bag.score == 100
+        assert aligned.score < bag.score
+
+    def test_score_never_negative(self):
+        result = score_speech("yes", "no no no no", mode="alignment")
+
+        assert result.score == 0
+
+    def test_align_empty_sequences(self):
+        assert [op.op for op in align_tokens(["a", "b"], [])] == ["delete", "delete"]
+        assert [op.op for op in align_tokens([], ["a"])] == ["insert"]
+
+
+def test_batch_matches_individual_scores():
+    pairs = [
+        ("Could you help me?", "could you help me"),
+        ("Where is the station?", "where station"),
+        ("Thank you very much.", "thanks very much"),
+    ]
+
+    batch = score_speech_batch(pairs, mode="alignment")
+
+    assert [r.score for r in batch] == [
+        score_speech(t, u, mode="alignment").score for t, u in pairs
+    ]
+
+
+def test_unknown_mode_raises():
+    with pytest.raises(ValueError):
+        score_speech("hello", "hello", mode="phonetic-magic")
+
+
+def test_review_service_uses_configured_mode(monkeypatch):
+    monkeypatch.setattr(settings, "SPEECH_SCORING_MODE", "alignment")
+
+    result = ReviewService.evaluate_speaking("one two three", "three two one")
+
+    assert result.alignment is not None
+    assert ReviewService.evaluate_speaking("one two three", "three two one", mode="bag").score == 100
+
+
+class TestFuzzyMatching:
+    """発音キー・編集距離によるあいまい一致"""
+
+    @pytest.mark.parametrize(
+        "a, b",
+        [("there", "their"), ("write", "right"), ("to", "too"), ("four", "for"), ("know", "no")],
+    )
+    def test_homophones_share_phonetic_key(self, a, b):
+        assert phonetic_key(a) == phonetic_key(b)
+
+    def test_distinct_words_keep_distinct_keys(self):
+        assert phonetic_key("in") != phonetic_key("on")
+        assert phonetic_key("a") != phonetic_key("i")
+
+    @pytest.mark.parametrize(
+        "a, b",
+        [
+            ("ship", "sheep"),
+            ("ship", "shop"),
+            ("live", "leave"),
+            ("live", "love"),
+            ("his", "has"),
+            ("has", "house"),
+            ("cat", "cut"),
+            ("cat", "coat"),
+            ("big", "bag"),
+            ("full", "fool"),
+        ],
+    )
+    def test_vowel_minimal_pairs_do_not_match(self, a, b):
+        assert phonetic_key(a) != phonetic_key(b)
+        assert not words_sound_alike(a, phonetic_key(a), b)
+        assert not words_sound_alike(b, phonetic_key(b), a)
+
+    def test_vowel_errors_are_not_forgiven(self):
+        target = "I live in a big house"
+        transcript = "I leave in a bag his"
+
+        assert score_speech(target, transcript, fuzzy=True).score == 50
+        assert score_speech(target, transcript, mode="alignment", fuzzy=True).score == 50
+
+    def test_edit_distance_is_bounded(self):
+        assert within_edit_distance("checkin", "checking", 1)
+        assert not within_edit_distance("station", "stadium", 1)
+
+    def test_bag_mode_accepts_homophones_and_near_misses(self):
+        target = "Put their bags at check-in."
+        transcript = "put there bags at checking"
+
+        assert score_speech(target, transcript).score == 60
+        assert score_speech(target, transcript, fuzzy=True).score == 100
+
+    def test_exact_matches_take_priority_over_fuzzy(self):
+        result = score_speech("their there", "there", fuzzy=True)
+
+        assert [m.matched for m in result.matching_words] == [False, True]
+
+    def test_alignment_mode_uses_fuzzy_predicate(self):
+        result = score_speech(
+            "I want to go there", "I want too go their", mode="alignment", fuzzy=True
+        )
+
+        assert result.score == 100
+        assert result.substitutions == 0
+        assert result.alignment[2].spoken_word == "too"
+
+    def test_short_words_are_not_edit_distance_matched(self):
+        assert score_speech("a cat", "a cap", fuzzy=True).score == 50
+
+
+def test_target_sentences_are_served_from_index():
+    index = PhoneticIndex(max_entries=1)
+    index.add_many(["Where is the gate?", "Thank you."])
+
+    assert len(index) == 1
+    assert index.lookup("Where is the gate?") is index.lookup("Where is the gate?")
+    assert index.lookup("Thank you.").tokens == ("thank", "you")
+    assert len(index) == 1
+
+    score_speech("Could I get a receipt?", "could I get a receipt")
+    assert "Could I get a receipt?" in phonetic_index
+
+
+def test_placement_targets_are_indexed_at_import():
+    from app.routers.placement.placement import QUESTIONS
+
+    targets = [q.target_sentence for q in QUESTIONS if q.target_sentence]
+    assert targets
+    assert all(target in phonetic_index for target in targets)
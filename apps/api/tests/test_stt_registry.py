@@ -0,0 +1,153 @@
+"""STTプロバイダレジストリ（フェイルオーバー・レイテンシルーティング）のテスト"""
+
+import asyncio
+import io
+import wave
+
+import pytest
+
+from app.core.config import settings
+from app.services.ai import stt_factory
+from app.services.ai.stt_factory import transcribe_with_failover
+from app.services.ai.stt_registry import STTProviderRegistry
+from app.services.ai.types import SpeechProviderUnavailableError
+from models.schemas.schemas import TranscriptionResponse
+
+
+def _wav(seconds: float) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(b"\x00\x00" * int(seconds * 16000))
+    return buffer.getvalue()
+
+
+def _fake_provider(name: str, calls: list, error: Exception = None, delay: float = 0.0):
+    class _Provider:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb) -> None:
+            return None
+
+        async def transcribe_audio(self, audio_file, filename, language=None):
+            calls.append(name)
+            if delay:
+                await asyncio.sleep(delay)
+            if error is not None:
+                raise error
+            return TranscriptionResponse(text=f"from {name}", language=language)
+
+    return _Provider
+
+
+@pytest.fixture(autouse=True)
+def _registry(monkeypatch):
+    monkeypatch.setattr(settings, "STT_PROVIDER_ORDER", ["primary", "secondary"])
+    monkeypatch.setattr(settings, "STT_LATENCY_ROUTING_MAX_SECONDS", 0.0)
+    monkeypatch.setattr(settings, "STT_FAILURE_THRESHOLD", 2)
+    monkeypatch.setattr(settings, "STT_PROVIDER_TIMEOUT_SECONDS", 1.0)
+    STTProviderRegistry.clear()
+    yield
+    STTProviderRegistry.clear()
+    stt_factory.initialize_stt_providers()
+
+
+@pytest.mark.asyncio
+async def test_fails_over_on_rate_limit() -> None:
+    calls = []
+    STTProviderRegistry.register(
+        "primary",
+        _fake_provider("primary", calls, SpeechProviderUnavailableError("429")),
+    )
+    STTProviderRegistry.register("secondary", _fake_provider("secondary", calls))
+
+    result = await transcribe_with_failover(_wav(1.0), "a.wav", "en")
+
+    assert calls == ["primary", "secondary"]
+    assert result.text == "from secondary"
+    assert result.provider == "secondary"
+    snapshot = STTProviderRegistry.health_snapshot()
+    assert snapshot["primary"]["failures"] == 1
+    assert snapshot["secondary"]["successes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fails_over_on_timeout(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "STT_PROVIDER_TIMEOUT_SECONDS", 0.01)
+    calls = []
+    STTProviderRegistry.register("primary", _fake_provider("primary", calls, delay=1.0))
+    STTProviderRegistry.register("secondary", _fake_provider("secondary", calls))
+
+    result = await transcribe_with_failover(_wav(1.0), "a.wav")
+
+    assert result.provider == "secondary"
+
+
+@pytest.mark.asyncio
+async def test_input_errors_do_not_fail_over() -> None:
+    calls = []
+    STTProviderRegistry.register(
+        "primary", _fake_provider("primary", calls, ValueError("形式不正"))
+    )
+    STTProviderRegistry.register("secondary", _fake_provider("secondary", calls))
+
+    with pytest.raises(ValueError, match="形式不正"):
+        await transcribe_with_failover(_wav(1.0), "a.wav")
+    assert calls == ["primary"]
+
+
+@pytest.mark.asyncio
+async def test_all_providers_down_raises_unavailable() -> None:
+    calls = []
+    for name in ("primary", "secondary"):
+        STTProviderRegistry.register(
+            name, _fake_provider(name, calls, SpeechProviderUnavailableError("503"))
+        )
+
+    with pytest.raises(SpeechProviderUnavailableError):
+        await transcribe_with_failover(_wav(1.0), "a.wav")
+
+
+@pytest.mark.asyncio
+async def test_repeatedly_failing_provider_is_rested() -> None:
+    calls = []
+    STTProviderRegistry.register(
+        "primary",
+        _fake_provider("primary", calls, SpeechProviderUnavailableError("503")),
+    )
+    STTProviderRegistry.register("secondary", _fake_provider("secondary", calls))
+
+    for _ in range(2):
+        await transcribe_with_failover(_wav(1.0), "a.wav")
+    calls.clear()
+    await transcribe_with_failover(_wav(1.0), "a.wav")
+
+    # しきい値（2回）に達した primary は休止中のため後回しになる
+    assert calls == ["secondary"]
+    assert STTProviderRegistry.route() == ["secondary", "primary"]
+
+
+def test_short_clips_route_to_fastest_provider(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "STT_LATENCY_ROUTING_MAX_SECONDS", 10.0)
+    STTProviderRegistry.register("primary", _fake_provider("primary", []))
+    STTProviderRegistry.register("secondary", _fake_provider("secondary", []))
+    STTProviderRegistry.record_success("primary", 2400)
+    STTProviderRegistry.record_success("secondary", 800)
+
+    assert STTProviderRegistry.route(3.0) == ["secondary", "primary"]
+    assert STTProviderRegistry.route(30.0) == ["primary", "secondary"]
+    assert STTProviderRegistry.route(None) == ["primary", "secondary"]
+
+
+def test_google_is_registered_only_with_credentials(monkeypatch) -> None:
+    monkeypatch.delenv("GOOGLE_APPLICATION_CREDENTIALS", raising=False)
+    monkeypatch.delenv("K_SERVICE", raising=False)
+    stt_factory.initialize_stt_providers()
+    assert "google" not in STTProviderRegistry.registered()
+
+    monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", "/secrets/sa.json")
+    stt_factory.initialize_stt_providers()
+    assert "google" in STTProviderRegistry.registered()
@@ -0,0 +1,183 @@
+"""音声認識結果キャッシュのテスト"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.services.audio import transcription_cache
+from app.services.audio.transcription_cache import (
+    build_cache_key,
+    clear_transcription_cache,
+    get_cache_stats,
+    get_or_transcribe,
+)
+from models.database.models import Base, TranscriptionCacheEntry
+from models.schemas.schemas import TranscriptionResponse
+
+
+@pytest.fixture()
+def db_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache(monkeypatch):
+    monkeypatch.setattr(settings, "TRANSCRIPTION_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "TRANSCRIPTION_CACHE_SHARED", True)
+    clear_transcription_cache()
+    yield
+    clear_transcription_cache()
+
+
+class _CountingTranscriber:
+    def __init__(self, text: str = "hello world", delay: float = 0.0):
+        self.calls = 0
+        self.text = text
+        self.delay = delay
+
+    async def __call__(self) -> TranscriptionResponse:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return TranscriptionResponse(text=self.text, language="en", duration=2.5)
+
+
+def test_cache_key_depends_on_language_and_model() -> None:
+    audio = b"\x01" * 2048
+
+    key = build_cache_key(audio, "en", "whisper:whisper-1")
+
+    assert key == build_cache_key(audio, "en", "whisper:whisper-1")
+    assert key != build_cache_key(audio, "ja", "whisper:whisper-1")
+    assert key != build_cache_key(audio, "en", "google:latest_long")
+    assert key != build_cache_key(audio + b"\x00", "en", "whisper:whisper-1")
+
+
+@pytest.mark.asyncio
+async def test_resubmitted_audio_is_served_from_cache(db_session) -> None:
+    transcriber = _CountingTranscriber()
+    audio = b"\x02" * 4096
+
+    first = await get_or_transcribe(
+        audio, "en", "whisper:whisper-1", transcriber, TranscriptionResponse, db_session
+    )
+    second = await get_or_transcribe(
+        audio, "en", "whisper:whisper-1", transcriber, TranscriptionResponse, db_session
+    )
+
+    assert transcriber.calls == 1
+    assert second == first
+    assert get_cache_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_table_serves_other_workers(db_session) -> None:
+    transcriber = _CountingTranscriber()
+    audio = b"\x03" * 4096
+
+    await get_or_transcribe(
+        audio, "en", "whisper:whisper-1", transcriber, TranscriptionResponse, db_session
+    )
+    # 別ワーカー（プロセス内キャッシュが空）を想定
+    transcription_cache._memory.clear()
+    result = await get_or_transcribe(
+        audio, "en", "whisper:whisper-1", transcriber, TranscriptionResponse, db_session
+    )
+
+    assert transcriber.calls == 1
+    assert result.text == "hello world"
+    assert get_cache_stats()["shared_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_shared_entry_is_ignored(db_session) -> None:
+    audio = b"\x04" * 4096
+    key = build_cache_key(audio, "en", "whisper:whisper-1")
+    db_session.add(
+        TranscriptionCacheEntry(
+            cache_key=key,
+            response={"text": "stale"},
+            expires_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+        )
+    )
+    db_session.commit()
+    transcriber = _CountingTranscriber(text="fresh")
+
+    result = await get_or_transcribe(
+        audio, "en", "whisper:whisper-1", transcriber, TranscriptionResponse, db_session
+    )
+
+    assert result.text == "fresh"
+    assert transcriber.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call() -> None:
+    transcriber = _CountingTranscriber(delay=0.05)
+    audio = b"\x05" * 4096
+
+    results = await asyncio.gather(
+        *(
+            get_or_transcribe(
+                audio, "en", "whisper:whisper-1", transcriber, TranscriptionResponse
+            )
+            for _ in range(3)
+        )
+    )
+
+    assert transcriber.calls == 1
+    assert {r.text for r in results} == {"hello world"}
+    assert get_cache_stats()["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_is_bounded(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "TRANSCRIPTION_CACHE_MAX_ENTRIES", 2)
+    transcriber = _CountingTranscriber()
+
+    for i in range(3):
+        await get_or_transcribe(
+            bytes([i]) * 2048, "en", "whisper:whisper-1", transcriber, TranscriptionResponse
+        )
+    await get_or_transcribe(
+        bytes([0]) * 2048, "en", "whisper:whisper-1", transcriber, TranscriptionResponse
+    )
+
+    assert get_cache_stats()["entries"] == 2
+    # 最も古いエントリは追い出されているため再度認識される
+    assert transcriber.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached() -> None:
+    calls = 0
+
+    async def _failing() -> TranscriptionResponse:
+        nonlocal calls
+        calls += 1
+        raise ValueError("APIの利用制限に達しました")
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await get_or_transcribe(
+                b"\x06" * 2048, "en", "whisper:whisper-1", _failing, TranscriptionResponse
+            )
+
+    assert calls == 2
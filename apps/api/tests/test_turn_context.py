@@ -0,0 +1,155 @@
+"""ターン処理（process_turn）のDBアクセスのテスト"""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.services.conversation import session_service as session_service_module
+from app.services.conversation.session_service import SessionService
+from models.database.models import (
+    Base,
+    DifficultyLevel,
+    PointEvent,
+    Scenario,
+    ScenarioCategory,
+    Session as SessionModel,
+    SessionMode,
+    SessionRound,
+    User,
+)
+
+USER_ID = "00000000-0000-0000-0000-000000000001"
+
+
+@pytest.fixture()
+def db_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture()
+def ai_calls(monkeypatch):
+    """AI 呼び出しを差し替え、渡された文脈・履歴を記録する"""
+    calls = {"context": [], "history": []}
+
+    async def fake_conversation(**kwargs):
+        calls["context"].append(kwargs["context"])
+        return SimpleNamespace(
+            ai_reply=f"reply-{kwargs['round_index']}",
+            feedback_short="ok",
+            improved_sentence="Better.",
+            tags=["conversation"],
+            latency_ms=10,
+            provider="fake",
+            should_end_session=False,
+        )
+
+    async def fake_goal_progress(goals, history):
+        calls["history"].append([entry["round_index"] for entry in history])
+        return [1] + [0] * (len(goals) - 1)
+
+    monkeypatch.setattr(
+        session_service_module, "generate_conversation_response", fake_conversation
+    )
+    monkeypatch.setattr(
+        session_service_module, "evaluate_goal_progress", fake_goal_progress
+    )
+    monkeypatch.setattr(
+        session_service_module, "get_goals_for_scenario", lambda _id: ["a", "b"]
+    )
+    return calls
+
+
+def _seed(db, round_count: int):
+    db.add(User(id=USER_ID, sub="sub-1", name="Tester", email="t@example.com"))
+    scenario = Scenario(
+        name="Airport Check-in",
+        description="test",
+        category=ScenarioCategory.TRAVEL,
+        difficulty=DifficultyLevel.BEGINNER,
+        is_active=True,
+    )
+    db.add(scenario)
+    db.flush()
+    session = SessionModel(
+        user_id=USER_ID,
+        scenario_id=scenario.id,
+        round_target=6,
+        completed_rounds=round_count,
+        difficulty=DifficultyLevel.BEGINNER,
+        mode=SessionMode.STANDARD,
+    )
+    db.add(session)
+    db.flush()
+    for i in range(1, round_count + 1):
+        db.add(
+            SessionRound(
+                session_id=session.id,
+                round_index=i,
+                user_input=f"input-{i}",
+                ai_reply=f"reply-{i}",
+                feedback_short="ok",
+                improved_sentence="Better.",
+            )
+        )
+    db.commit()
+    session_id = session.id
+    db.expunge_all()
+    return session_id
+
+
+@pytest.mark.asyncio
+async def test_process_turn_reads_once_and_writes_in_one_flush(
+    db_session, ai_calls, max_queries
+):
+    session_id = _seed(db_session, round_count=3)
+    service = SessionService(db_session)
+
+    # 読み込み1回 + ポイント履歴・日別集計 + flush（ラウンド・セッション・ユーザー）
+    with max_queries(6) as stats:
+        response = await service.process_turn(session_id, "input-4", USER_ID)
+
+    selects = [shape for shape in stats.shapes if shape.lstrip().startswith("SELECT")]
+    assert len(selects) == 1 and stats.shapes[selects[0]] == 1
+    assert response.round_index == 4
+    assert response.session_status.completed_rounds == 4
+    assert response.goals_achieved == 1
+    assert [entry["round_index"] for entry in ai_calls["context"][0]] == [2, 3]
+    # プロンプト用は前回ターンまで、達成判定は今回のラウンドを含む
+    assert ai_calls["history"] == [[1, 2, 3], [1, 2, 3, 4]]
+
+    db_session.expire_all()
+    session = db_session.get(SessionModel, session_id)
+    user = db_session.get(User, USER_ID)
+    assert session.completed_rounds == 4
+    assert user.total_points > 0
+    assert db_session.query(SessionRound).filter_by(session_id=session_id).count() == 4
+    assert db_session.query(PointEvent).filter_by(user_id=USER_ID).count() == 1
+
+
+@pytest.mark.asyncio
+async def test_first_turn_has_no_context(db_session, ai_calls):
+    session_id = _seed(db_session, round_count=0)
+
+    response = await SessionService(db_session).process_turn(
+        session_id, "input-1", USER_ID
+    )
+
+    assert response.round_index == 1
+    assert ai_calls["context"] == [[]]
+    # ラウンド1のプロンプト用ゴール情報は評価しない
+    assert ai_calls["history"] == [[1]]
@@ -0,0 +1,225 @@
+"""学習統計カウンタ（user_stats）のテスト"""
+
+import importlib.util
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.services.conversation.session_service import SessionService
+from app.services.review.review_service import ReviewService
+from app.services.shadowing import ShadowingProgressService
+from app.services.stats import COUNTERS, UserStatsService
+from app.services.streak.streak_service import StreakService
+from models.database.models import (
+    Base,
+    DifficultyLevel,
+    ReviewItem,
+    Scenario,
+    ScenarioCategory,
+    Session as SessionModel,
+    SessionMode,
+    ShadowingSentence,
+    User,
+    UserStats,
+)
+from models.schemas.schemas import ShadowingBatchAttempt
+
+USER_ID = "user-1"
+MIGRATION = (
+    Path(__file__).resolve().parents[1] / "alembic/versions/p10000000001_add_user_stats.py"
+)
+
+
+@pytest.fixture()
+def db_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSessionLocal()
+    db.add(User(id=USER_ID, sub="sub-1", name="Tester", email="tester@example.com"))
+    scenario = Scenario(
+        id=1,
+        name="Airport",
+        description="test",
+        category=ScenarioCategory.TRAVEL,
+        difficulty=DifficultyLevel.BEGINNER,
+        is_active=True,
+    )
+    db.add(scenario)
+    db.flush()
+    for i in (1, 2):
+        db.add(
+            ShadowingSentence(
+                id=i,
+                scenario_id=1,
+                key_phrase="test",
+                sentence_en=f"Sentence {i}.",
+                sentence_ja=f"文{i}",
+                order_index=i,
+                difficulty=DifficultyLevel.BEGINNER,
+            )
+        )
+    db.commit()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _add_session(db, ended=True, rounds=3):
+    session = SessionModel(
+        user_id=USER_ID,
+        scenario_id=1,
+        round_target=4,
+        completed_rounds=rounds,
+        difficulty=DifficultyLevel.BEGINNER,
+        mode=SessionMode.STANDARD,
+        ended_at=datetime.now(timezone.utc) if ended else None,
+    )
+    db.add(session)
+    db.commit()
+    return session
+
+
+def _add_review_item(db, completed=False):
+    item = ReviewItem(
+        user_id=USER_ID,
+        phrase="Hello.",
+        explanation="ok",
+        due_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        is_completed=completed,
+    )
+    db.add(item)
+    db.commit()
+    return item
+
+
+def test_session_end_increments_counters(db_session):
+    session = _add_session(db_session, rounds=4)
+
+    SessionService(db_session)._finalize_end(
+        session,
+        USER_ID,
+        [
+            {"phrase": "Could I have a window seat?", "explanation": "依頼"},
+            {"phrase": "I'd like to check in.", "explanation": "依頼"},
+        ],
+    )
+
+    counters = UserStatsService(db_session).get(USER_ID)
+    assert counters["total_sessions"] == 1
+    assert counters["total_rounds"] == 4
+    assert counters["review_items_total"] == 2
+    assert counters["review_items_completed"] == 0
+
+
+def test_review_completion_is_counted_once(db_session):
+    item = _add_review_item(db_session)
+    service = ReviewService(db_session)
+
+    def _answer(result):
+        # 次回の復習日まで回答できないため、期限が来たことにする
+        item.due_at = datetime.utcnow() - timedelta(seconds=1)
+        db_session.commit()
+        service.complete_review_item(USER_ID, item.id, result)
+
+    # 間隔が十分に伸びる4回目の正解で完了し、以降の正解では数えない
+    for _ in range(3):
+        _answer("correct")
+    assert service.get_stats(USER_ID)["completed_items"] == 0
+    _answer("correct")
+    _answer("correct")
+    assert service.get_stats(USER_ID)["completed_items"] == 1
+
+    # 完了済みを不正解にすると未完了に戻る
+    _answer("incorrect")
+    assert service.get_stats(USER_ID)["completed_items"] == 0
+
+    for _ in range(4):
+        item.due_at = datetime.utcnow() - timedelta(seconds=1)
+        db_session.commit()
+        service.evaluate_and_update(
+            USER_ID, item.id, "listening", 100, True, speaking_score=100
+        )
+    assert service.get_stats(USER_ID)["completed_items"] == 1
+
+
+def test_shadowing_batch_counts_newly_completed_sentences(db_session):
+    service = ShadowingProgressService(db_session)
+    attempts = [
+        ShadowingBatchAttempt(shadowing_sentence_id=1, score=90),
+        ShadowingBatchAttempt(shadowing_sentence_id=1, score=95),
+        ShadowingBatchAttempt(shadowing_sentence_id=2, score=40),
+        ShadowingBatchAttempt(shadowing_sentence_id=2, mode="instant_translation", score=90),
+    ]
+
+    service.record_attempts(USER_ID, 1, attempts)
+    service.record_attempts(USER_ID, 1, attempts[:1])
+
+    assert UserStatsService(db_session).get(USER_ID)["shadowing_completed"] == 1
+
+
+def test_user_stats_is_primary_key_reads(db_session, max_queries):
+    _add_session(db_session)
+    UserStatsService(db_session).reconcile()
+    db_session.expire_all()
+
+    with max_queries(2):
+        stats = StreakService(db_session).get_user_stats(USER_ID)
+
+    assert (stats.total_sessions, stats.total_rounds) == (1, 3)
+
+
+def test_reconcile_fixes_drift(db_session):
+    _add_session(db_session, rounds=2)
+    _add_session(db_session, ended=False)
+    _add_review_item(db_session, completed=True)
+    service = UserStatsService(db_session)
+    service.increment(USER_ID, total_sessions=5)
+    db_session.commit()
+
+    report = service.reconcile(fix=False)
+    assert [user_id for user_id, _stored, _expected in report] == [USER_ID]
+    assert service.get(USER_ID)["total_sessions"] == 5
+
+    service.reconcile()
+    assert service.get(USER_ID) == {
+        "total_sessions": 1,
+        "total_rounds": 2,
+        "review_items_total": 1,
+        "review_items_completed": 1,
+        "shadowing_completed": 0,
+    }
+    assert service.reconcile() == []
+
+
+def test_increment_rejects_unknown_counter(db_session):
+    with pytest.raises(ValueError):
+        UserStatsService(db_session).increment(USER_ID, total_points=1)
+
+
+def test_migration_backfill_matches_reconcile(db_session):
+    spec = importlib.util.spec_from_file_location("user_stats_migration", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    _add_session(db_session, rounds=2)
+    _add_review_item(db_session, completed=True)
+    _add_review_item(db_session)
+
+    db_session.execute(migration.BACKFILL)
+    db_session.commit()
+
+    row = db_session.get(UserStats, USER_ID)
+    assert {name: getattr(row, name) for name in COUNTERS} == UserStatsService(
+        db_session
+    ).compute([USER_ID])[USER_ID]
+    assert row.review_items_completed == 1
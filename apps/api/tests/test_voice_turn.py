@@ -0,0 +1,153 @@
+"""音声ターン（STT → ターン処理 → TTS）一括エンドポイントのテスト"""
+
+import asyncio
+import base64
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.deps import get_current_user, get_db
+from app.routers.sessions import router as sessions_router
+from models.schemas.schemas import TranscriptionResponse, TurnResponse
+
+
+def _parse_sse(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def _provider_cm(provider):
+    cm = MagicMock()
+    cm.return_value.__aenter__ = AsyncMock(return_value=provider)
+    cm.return_value.__aexit__ = AsyncMock(return_value=None)
+    return cm
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(sessions_router, prefix="/sessions")
+    app.dependency_overrides[get_db] = lambda: MagicMock()
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=1)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def providers(monkeypatch):
+    monkeypatch.setattr(settings, "TRANSCRIPTION_CACHE_ENABLED", False)
+    stt = AsyncMock(
+        return_value=TranscriptionResponse(
+            text=" I'd like a coffee ", confidence=0.9, duration=1.5
+        )
+    )
+    tts = MagicMock()
+    tts.synthesize_speech = AsyncMock(return_value=b"mp3-bytes")
+    module = "app.services.conversation.voice_turn_service"
+    with patch(f"{module}.transcribe_with_failover", stt), patch(
+        f"{module}.GoogleTTSProvider", _provider_cm(tts)
+    ):
+        yield stt, tts
+
+
+def _turn_response() -> TurnResponse:
+    return TurnResponse(
+        round_index=1,
+        ai_reply="Sure, hot or iced?",
+        feedback_short="Good",
+        improved_sentence="I'd like a coffee, please.",
+    )
+
+
+def test_voice_turn_streams_transcript_reply_turn_and_audio(client, providers) -> None:
+    stt, tts = providers
+    tts_started_before_turn_finished = []
+
+    async def _process_turn(self, session_id, user_input, user_id, on_reply=None):
+        assert user_input == "I'd like a coffee"
+        await on_reply("Sure, hot or iced?")
+        # ゴール判定などの後続処理中にTTSが並行して走っていること
+        await asyncio.sleep(0)
+        tts_started_before_turn_finished.append(tts.synthesize_speech.await_count)
+        return _turn_response()
+
+    with patch(
+        "app.services.conversation.session_service.SessionService.process_turn",
+        _process_turn,
+    ):
+        response = client.post(
+            "/sessions/7/voice-turn",
+            files={"audio_file": ("turn.webm", b"\x00" * 2048, "audio/webm")},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(response.text)
+    names = [name for name, _ in events]
+
+    assert names[:2] == ["transcript", "reply"]
+    assert set(names[2:4]) == {"turn", "audio"}
+    assert names[-1] == "done"
+    data = dict(events)
+    assert data["transcript"]["text"] == "I'd like a coffee"
+    assert data["turn"]["round_index"] == 1
+    assert base64.b64decode(data["audio"]["data"]) == b"mp3-bytes"
+    assert tts_started_before_turn_finished == [1]
+    assert tts.synthesize_speech.await_args.kwargs["text"] == "Sure, hot or iced?"
+
+
+def test_voice_turn_reports_turn_error_and_skips_done(client, providers) -> None:
+    async def _process_turn(self, session_id, user_input, user_id, on_reply=None):
+        raise ValueError("Active session 7 not found for user 1")
+
+    with patch(
+        "app.services.conversation.session_service.SessionService.process_turn",
+        _process_turn,
+    ):
+        response = client.post(
+            "/sessions/7/voice-turn",
+            files={"audio_file": ("turn.webm", b"\x00" * 2048, "audio/webm")},
+        )
+
+    events = _parse_sse(response.text)
+    assert [name for name, _ in events] == ["transcript", "error"]
+    assert events[-1][1]["status"] == 400
+
+
+def test_voice_turn_tts_failure_keeps_turn(client, providers) -> None:
+    _, tts = providers
+    tts.synthesize_speech.side_effect = ValueError("quota exceeded")
+
+    async def _process_turn(self, session_id, user_input, user_id, on_reply=None):
+        await on_reply("Sure, hot or iced?")
+        return _turn_response()
+
+    with patch(
+        "app.services.conversation.session_service.SessionService.process_turn",
+        _process_turn,
+    ):
+        response = client.post(
+            "/sessions/7/voice-turn",
+            files={"audio_file": ("turn.webm", b"\x00" * 2048, "audio/webm")},
+        )
+
+    names = [name for name, _ in _parse_sse(response.text)]
+    assert "turn" in names and "audio_error" in names
+    assert names[-1] == "done"
+
+
+def test_voice_turn_rejects_empty_audio(client, providers) -> None:
+    response = client.post(
+        "/sessions/7/voice-turn",
+        files={"audio_file": ("turn.webm", b"", "audio/webm")},
+    )
+
+    assert response.status_code == 400